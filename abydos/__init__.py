@@ -19,12 +19,13 @@
 Abydos NLP/IR library by Christopher C. Little
 
 
-There are nine major packages that make up Abydos:
+There are ten major packages that make up Abydos:
 
     - :py:mod:`.compression` for string compression classes
     - :py:mod:`.corpus` for document corpus classes
     - :py:mod:`.distance` for string distance measure & metric classes
     - :py:mod:`.fingerprint` for string fingerprint classes
+    - :py:mod:`.index` for string similarity search index classes
     - :py:mod:`.phones` for functions relating to phones and phonemes
     - :py:mod:`.phonetic` for phonetic algorithm classes
     - :py:mod:`.stats` for statistical functions and a confusion table class
@@ -32,8 +33,8 @@ There are nine major packages that make up Abydos:
     - :py:mod:`.tokenizer` for tokenizer classes
 
 Classes with each package have consistent method names, as discussed below.
-A tenth package, :py:mod:`.util`, contains functions not intended for end-user
-use.
+An eleventh package, :py:mod:`.util`, contains functions not intended for
+end-user use.
 
 ----
 
@@ -47,6 +48,7 @@ __all__ = [
     'corpus',
     'distance',
     'fingerprint',
+    'index',
     'phones',
     'phonetic',
     'stats',
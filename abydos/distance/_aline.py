@@ -22,12 +22,24 @@ ALINE alignment, similarity, and distance
 from copy import deepcopy
 from typing import Any, Callable, Dict, List, Tuple, Union, cast
 
-from numpy import inf, zeros
+from numpy import (
+    array,
+    empty,
+    intp,
+    ix_,
+    maximum,
+    ndarray,
+    newaxis,
+    zeros,
+)
 
 from ._distance import _Distance
 
 __all__ = ['ALINE']
 
+# The greatest number of words whose segments an ALINE instance caches
+_SEGMENT_CACHE_SIZE = 65536
+
 
 class ALINE(_Distance):
     r"""ALINE alignment, similarity, and distance.
@@ -1231,6 +1243,282 @@ class ALINE(_Distance):
             self._phones = self.phones_kondrak
         self._normalizer = normalizer
 
+        # interned segments: the id of each segment (a phone & its
+        # supplemental marks), the weighted features & vowel cost of each id,
+        # the deltas of pairs of ids (a table filled for the first
+        # _delta_count ids), and the segments of recent words
+        self._segment_ids = {}  # type: Dict[str, int]
+        self._segment_feats = []  # type: List[Dict[str, float]]
+        self._segment_vwl = []  # type: List[float]
+        self._delta_table = zeros((0, 0), dtype=float)
+        self._delta_count = 0
+        self._segment_cache = (
+            {}
+        )  # type: Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...]]]
+
+    def _segments(self, word: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        """Return the segments of a word and their ids.
+
+        Each segment is a phone followed by any supplemental marks, which
+        modify its features; supplemental marks that follow no phone and
+        symbols that are not in the phone set are dropped. Results are
+        cached.
+
+        Parameters
+        ----------
+        word : str
+            The word to segment
+
+        Returns
+        -------
+        tuple(tuple(str), tuple(int))
+            The segments and their ids
+
+        Examples
+        --------
+        >>> cmp = ALINE()
+        >>> cmp._segments('tAak')[0]
+        ('tA', 'a', 'k')
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        segments = self._segment_cache.get(word)
+        if segments is not None:
+            return segments
+
+        tokens = []  # type: List[str]
+        for ch in word:
+            if ch in self._phones:
+                if 'supplemental' not in self._phones[ch]:
+                    tokens.append(ch)
+                elif tokens:
+                    tokens[-1] += ch
+
+        seg_ids = []
+        for tok in tokens:
+            seg_id = self._segment_ids.get(tok)
+            if seg_id is None:
+                features = dict(self._phones[tok[0]])
+                for ch in tok[1:]:
+                    for key, value in self._phones[ch].items():
+                        if key != 'supplemental':
+                            features[key] = value
+                seg_feat_wt = {
+                    key: self.feature_weights[value]
+                    for key, value in features.items()
+                }
+                seg_id = len(self._segment_feats)
+                self._segment_ids[tok] = seg_id
+                self._segment_feats.append(seg_feat_wt)
+                self._segment_vwl.append(
+                    0.0
+                    if seg_feat_wt['manner']
+                    > self.feature_weights['high vowel']
+                    else self._c_vwl
+                )
+            seg_ids.append(seg_id)
+
+        if len(self._segment_cache) >= _SEGMENT_CACHE_SIZE:
+            self._segment_cache.clear()
+        segments = tuple(tokens), tuple(seg_ids)
+        self._segment_cache[word] = segments
+        return segments
+
+    def _delta(self, seg_id1: int, seg_id2: int) -> float:
+        """Return the feature difference of two segments.
+
+        Parameters
+        ----------
+        seg_id1 : int
+            The id of a segment
+        seg_id2 : int
+            The id of a segment
+
+        Returns
+        -------
+        float
+            The salience-weighted difference of their features
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        seg1 = self._segment_feats[seg_id1]
+        seg2 = self._segment_feats[seg_id2]
+        features = (
+            self.c_features
+            if max(seg1['manner'], seg2['manner'])
+            > self.feature_weights['high vowel']
+            else self.v_features
+        )
+        # summed in a fixed order: a set's iteration order, and so the
+        # rounding of the sum, may differ from process to process
+        diff = 0.0
+        for f in sorted(features):
+            diff += abs(seg1.get(f, 0.0) - seg2.get(f, 0.0)) * self.salience[f]
+        return diff
+
+    def _delta_matrix(
+        self, src_ids: Tuple[int, ...], tar_ids: Tuple[int, ...]
+    ) -> ndarray:
+        """Return the feature differences of two sequences of segments.
+
+        Differences are looked up in a table over the interned segments,
+        which is extended as segments are interned.
+
+        Parameters
+        ----------
+        src_ids : tuple(int)
+            The ids of the source segments
+        tar_ids : tuple(int)
+            The ids of the target segments
+
+        Returns
+        -------
+        numpy.ndarray
+            The difference of each pair of source & target segments
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        count = len(self._segment_feats)
+        known = self._delta_count
+        if known < count:
+            if len(self._delta_table) < count:
+                table = zeros((max(count, 2 * len(self._delta_table)),) * 2)
+                table[:known, :known] = self._delta_table[:known, :known]
+                self._delta_table = table
+            for seg_id1 in range(known, count):
+                for seg_id2 in range(seg_id1 + 1):
+                    diff = self._delta(seg_id2, seg_id1)
+                    self._delta_table[seg_id1, seg_id2] = diff
+                    self._delta_table[seg_id2, seg_id1] = diff
+            self._delta_count = count
+        return self._delta_table[
+            ix_(array(src_ids, dtype=intp), array(tar_ids, dtype=intp))
+        ]
+
+    def _score_matrices(
+        self, src_ids: Tuple[int, ...], tar_ids: Tuple[int, ...]
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Return the substitution & expansion scores of two segment sequences.
+
+        Parameters
+        ----------
+        src_ids : tuple(int)
+            The ids of the source segments
+        tar_ids : tuple(int)
+            The ids of the target segments
+
+        Returns
+        -------
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            The scores sub, expand, & contract, where sub[i, j] substitutes
+            target segment j for source segment i, expand[i, j] expands source
+            segment i into target segments j - 1 & j, and contract[i, j]
+            contracts source segments i - 1 & i into target segment j (the
+            first column of expand and the first row of contract are unused)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len = len(src_ids)
+        tar_len = len(tar_ids)
+        deltas = self._delta_matrix(src_ids, tar_ids)
+        src_vwl = array([self._segment_vwl[_] for _ in src_ids], dtype=float)
+        tar_vwl = array([self._segment_vwl[_] for _ in tar_ids], dtype=float)
+
+        sub = self._c_sub - deltas - src_vwl[:, newaxis] - tar_vwl[newaxis, :]
+        expand = zeros((src_len, tar_len), dtype=float)
+        expand[:, 1:] = (
+            self._c_exp
+            - deltas[:, :-1]
+            - deltas[:, 1:]
+            - src_vwl[:, newaxis]
+            - maximum(tar_vwl[:-1], tar_vwl[1:])[newaxis, :]
+        )
+        contract = zeros((src_len, tar_len), dtype=float)
+        contract[1:, :] = (
+            self._c_exp
+            - deltas[:-1, :]
+            - deltas[1:, :]
+            - tar_vwl[newaxis, :]
+            - maximum(src_vwl[:-1], src_vwl[1:])[:, newaxis]
+        )
+        return sub, expand, contract
+
+    def _score_matrix(
+        self, sub: ndarray, expand: ndarray, contract: ndarray
+    ) -> ndarray:
+        """Return the ALINE DP matrix.
+
+        The matrix is filled a row at a time. Each row's scores from the
+        previous two rows (a skip of a source segment, substitution,
+        expansion, & contraction) are computed by array operations, after
+        which skips of target segments, which depend on the row's own
+        scores, are relaxed until no score improves. The result is identical
+        to filling the matrix cell by cell.
+
+        Parameters
+        ----------
+        sub : numpy.ndarray
+            Substitution scores, as returned by _score_matrices
+        expand : numpy.ndarray
+            Expansion scores, as returned by _score_matrices
+        contract : numpy.ndarray
+            Contraction scores, as returned by _score_matrices
+
+        Returns
+        -------
+        numpy.ndarray
+            The DP matrix
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len, tar_len = sub.shape
+        c_skip = self._c_skip
+
+        s_mat = zeros((src_len + 1, tar_len + 1), dtype=float)
+        if self._mode == 'global':
+            for i in range(1, src_len + 1):
+                s_mat[i, 0] = s_mat[i - 1, 0] + c_skip
+            for j in range(1, tar_len + 1):
+                s_mat[0, j] = s_mat[0, j - 1] + c_skip
+        floor = self._mode in {'local', 'half-local'}
+
+        for i in range(1, src_len + 1):
+            prev = s_mat[i - 1]
+            row = s_mat[i]
+            scores = row[1:]
+            scores[:] = prev[1:] + c_skip
+            maximum(scores, prev[:-1] + sub[i - 1], out=scores)
+            if tar_len > 1:
+                maximum(
+                    scores[1:], prev[:-2] + expand[i - 1, 1:], out=scores[1:]
+                )
+            if i > 1:
+                maximum(
+                    scores, s_mat[i - 2, :-1] + contract[i - 1], out=scores
+                )
+            if floor:
+                maximum(scores, 0.0, out=scores)
+
+            skipped = empty(tar_len, dtype=float)
+            while True:
+                skipped[:] = row[:-1]
+                skipped += c_skip
+                if not (skipped > scores).any():
+                    break
+                maximum(scores, skipped, out=scores)
+
+        return s_mat
+
     def alignment(self, src: str, tar: str) -> Tuple[float, str, str]:
         """Return the top ALINE alignment of two strings.
 
@@ -1280,7 +1568,7 @@ class ALINE(_Distance):
         tar : str
             Target string for comparison
         score_only : bool
-            Return the score only, not the alignments
+            Return the best score only, without enumerating the alignments
 
         Returns
         -------
@@ -1304,54 +1592,15 @@ class ALINE(_Distance):
         .. versionadded:: 0.4.0
         .. versionchanged:: 0.4.1
             Renamed from .alignment to .alignments
+        .. versionchanged:: 0.6.0
+            Segments are interned, their scores are precomputed as arrays,
+            and the DP matrix is filled by array operations on its rows
 
         """
 
         def _sig_skip(*args: Any) -> float:
             return self._c_skip
 
-        def _sig_sub(seg1: Dict[str, float], seg2: Dict[str, float]) -> float:
-            return (
-                self._c_sub
-                - _delta(seg1, seg2)
-                - _sig_vwl(seg1)
-                - _sig_vwl(seg2)
-            )
-
-        def _sig_exp(
-            seg1: Dict[str, float],
-            seg2a: Dict[str, float],
-            seg2b: Dict[str, float],
-        ) -> float:
-            return (
-                self._c_exp
-                - _delta(seg1, seg2a)
-                - _delta(seg1, seg2b)
-                - _sig_vwl(seg1)
-                - max(_sig_vwl(seg2a), _sig_vwl(seg2b))
-            )
-
-        def _sig_vwl(seg1: Dict[str, float]) -> float:
-            return (
-                0.0
-                if seg1['manner'] > self.feature_weights['high vowel']
-                else self._c_vwl
-            )
-
-        def _delta(seg1: Dict[str, float], seg2: Dict[str, float]) -> float:
-            features = (
-                self.c_features
-                if max(seg1['manner'], seg2['manner'])
-                > self.feature_weights['high vowel']
-                else self.v_features
-            )
-            diff = 0.0
-            for f in features:
-                diff += (
-                    abs(seg1.get(f, 0.0) - seg2.get(f, 0.0)) * self.salience[f]
-                )
-            return diff
-
         def _retrieve(
             i: int, j: int, score: float, out: List[Tuple[str, str]]
         ) -> None:
@@ -1417,20 +1666,12 @@ class ALINE(_Distance):
                 if (
                     i > 0
                     and j > 0
-                    and s_mat[i - 1, j - 1]
-                    + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1])
-                    + score
+                    and s_mat[i - 1, j - 1] + sub[i - 1][j - 1] + score
                     >= threshold
                 ):
                     loc_out = deepcopy(out)
                     loc_out.append((src_tok[i - 1], tar_tok[j - 1]))
-                    _retrieve(
-                        i - 1,
-                        j - 1,
-                        score
-                        + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1]),
-                        loc_out,
-                    )
+                    _retrieve(i - 1, j - 1, score + sub[i - 1][j - 1], loc_out)
                     loc_out.pop()
 
                 if (
@@ -1448,13 +1689,7 @@ class ALINE(_Distance):
                 if (
                     i > 0
                     and j > 1
-                    and s_mat[i - 1, j - 2]
-                    + _sig_exp(
-                        src_feat_wt[i - 1],
-                        tar_feat_wt[j - 2],
-                        tar_feat_wt[j - 1],
-                    )
-                    + score
+                    and s_mat[i - 1, j - 2] + expand[i - 1][j - 1] + score
                     >= threshold
                 ):
                     loc_out = deepcopy(out)
@@ -1462,15 +1697,7 @@ class ALINE(_Distance):
                         (src_tok[i - 1], tar_tok[j - 2] + tar_tok[j - 1],)
                     )
                     _retrieve(
-                        i - 1,
-                        j - 2,
-                        score
-                        + _sig_exp(
-                            src_feat_wt[i - 1],
-                            tar_feat_wt[j - 2],
-                            tar_feat_wt[j - 1],
-                        ),
-                        loc_out,
+                        i - 1, j - 2, score + expand[i - 1][j - 1], loc_out
                     )
                     loc_out.pop()
 
@@ -1489,13 +1716,7 @@ class ALINE(_Distance):
                 if (
                     i > 1
                     and j > 0
-                    and s_mat[i - 2, j - 1]
-                    + _sig_exp(
-                        tar_feat_wt[j - 1],
-                        src_feat_wt[i - 2],
-                        src_feat_wt[i - 1],
-                    )
-                    + score
+                    and s_mat[i - 2, j - 1] + contract[i - 1][j - 1] + score
                     >= threshold
                 ):
                     loc_out = deepcopy(out)
@@ -1503,136 +1724,19 @@ class ALINE(_Distance):
                         (src_tok[i - 2] + src_tok[i - 1], tar_tok[j - 1],)
                     )
                     _retrieve(
-                        i - 2,
-                        j - 1,
-                        score
-                        + _sig_exp(
-                            tar_feat_wt[j - 1],
-                            src_feat_wt[i - 2],
-                            src_feat_wt[i - 1],
-                        ),
-                        loc_out,
+                        i - 2, j - 1, score + contract[i - 1][j - 1], loc_out
                     )
                     loc_out.pop()
 
-        sg_max = 0.0
-
-        src_tok = []  # type: List[str]
-        src_feat = []  # type: List[Dict[str, str]]
-        tar_tok = []  # type: List[str]
-        tar_feat = []  # type: List[Dict[str, str]]
-
-        for ch in src:
-            if ch in self._phones:
-                src_tok.append(ch)
-                src_feat.append(dict(self._phones[ch]))
-        for ch in tar:
-            if ch in self._phones:
-                tar_tok.append(ch)
-                tar_feat.append(dict(self._phones[ch]))
-
-        for i in range(1, len(src_feat)):
-            if 'supplemental' in src_feat[i]:
-                j = i - 1
-                while j > -1:
-                    if 'supplemental' not in src_feat[j]:
-                        src_tok[j] += src_tok[i]
-                        for key, value in src_feat[i].items():
-                            if key != 'supplemental':
-                                src_feat[j][key] = value
-                        j = 0
-                    j -= 1
-
-        zipped = [
-            fb for fb in zip(src_feat, src_tok) if 'supplemental' not in fb[0]
-        ]
-        if zipped:
-            src_feat, src_tok = zip(*zipped)  # type: ignore
-        else:
-            src_feat, src_tok = [], []
-
-        src_feat_wt = []  # type: List[Dict[str, float]]
-        for f_dict in src_feat:
-            src_feat_wt.append(
-                {
-                    key: self.feature_weights[f_dict[key]]
-                    for key in f_dict.keys()
-                }
-            )
-
+        src_tok, src_ids = self._segments(src)
+        tar_tok, tar_ids = self._segments(tar)
         src_len = len(src_tok)
-
-        for i in range(1, len(tar_feat)):
-            if 'supplemental' in tar_feat[i]:
-                j = i - 1
-                while j > -1:
-                    if 'supplemental' not in tar_feat[j]:
-                        tar_tok[j] += tar_tok[i]
-                        for key, value in tar_feat[i].items():
-                            if key != 'supplemental':
-                                tar_feat[j][key] = value
-                        j = 0
-                    j -= 1
-
-        zipped = [
-            fb for fb in zip(tar_feat, tar_tok) if 'supplemental' not in fb[0]
-        ]
-        if zipped:
-            tar_feat, tar_tok = zip(*zipped)  # type: ignore
-        else:
-            tar_feat, tar_tok = [], []
-
-        tar_feat_wt = []  # type: List[Dict[str, float]]
-        for f_dict in tar_feat:
-            tar_feat_wt.append(
-                {
-                    key: self.feature_weights[f_dict[key]]
-                    for key in f_dict.keys()
-                }
-            )
-
         tar_len = len(tar_tok)
 
-        s_mat = zeros((src_len + 1, tar_len + 1), dtype=float)
-
-        if self._mode == 'global':
-            for i in range(1, src_len + 1):
-                s_mat[i, 0] = s_mat[i - 1, 0] + _sig_skip(src_tok[i - 1])
-            for j in range(1, tar_len + 1):
-                s_mat[0, j] = s_mat[0, j - 1] + _sig_skip(tar_tok[j - 1])
-
-        for i in range(1, src_len + 1):
-            for j in range(1, tar_len + 1):
-                s_mat[i, j] = max(
-                    s_mat[i - 1, j] + _sig_skip(src_feat_wt[i - 1]),
-                    s_mat[i, j - 1] + _sig_skip(tar_feat_wt[j - 1]),
-                    s_mat[i - 1, j - 1]
-                    + _sig_sub(src_feat_wt[i - 1], tar_feat_wt[j - 1]),
-                    s_mat[i - 1, j - 2]
-                    + _sig_exp(
-                        src_feat_wt[i - 1],
-                        tar_feat_wt[j - 2],
-                        tar_feat_wt[j - 1],
-                    )
-                    if j > 1
-                    else -inf,
-                    s_mat[i - 2, j - 1]
-                    + _sig_exp(
-                        tar_feat_wt[j - 1],
-                        src_feat_wt[i - 2],
-                        src_feat_wt[i - 1],
-                    )
-                    if i > 1
-                    else -inf,
-                    0 if self._mode in {'local', 'half-local'} else -inf,
-                )
-
-                if s_mat[i, j] > sg_max:
-                    if self._mode == 'semi-global':
-                        if i == src_len or j == tar_len:
-                            sg_max = s_mat[i, j]
-                    else:
-                        sg_max = s_mat[i, j]
+        sub_arr, expand_arr, contract_arr = self._score_matrices(
+            src_ids, tar_ids
+        )
+        s_mat = self._score_matrix(sub_arr, expand_arr, contract_arr)
 
         if self._mode in {'global', 'half-local'}:
             dp_score = s_mat[src_len, tar_len]
@@ -1642,6 +1746,10 @@ class ALINE(_Distance):
         if score_only:
             return cast(float, dp_score)
 
+        sub = sub_arr.tolist()
+        expand = expand_arr.tolist()
+        contract = contract_arr.tolist()
+
         threshold = (1 - self._epsilon) * dp_score
 
         alignments = []  # type: List[Tuple[float, str, str]]
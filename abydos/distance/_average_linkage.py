@@ -42,6 +42,8 @@ class AverageLinkage(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -107,6 +109,9 @@ class AverageLinkage(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
+        src = self._orig_string(src)
+        tar = self._orig_string(tar)
+
         if not src and not tar:
             return 0.0
 
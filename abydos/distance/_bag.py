@@ -123,9 +123,9 @@ class Bag(_TokenDistance):
         if tar == src:
             return 0
         elif not src:
-            return len(tar)
+            return len(self._orig_string(tar))
         elif not tar:
-            return len(src)
+            return len(self._orig_string(src))
 
         self._tokenize(src, tar)
 
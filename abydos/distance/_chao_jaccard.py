@@ -45,6 +45,8 @@ class ChaoJaccard(_TokenDistance):
     .. versionadded:: 0.4.1
     """
 
+    _batch_tokenize = False
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize ChaoJaccard instance.
 
@@ -161,8 +163,16 @@ class ChaoJaccard(_TokenDistance):
         src_card = self._src_card()  # n
         tar_card = self._tar_card()  # m
 
-        src_token_list = self.params['tokenizer'].tokenize(src).get_list()
-        tar_token_list = self.params['tokenizer'].tokenize(tar).get_list()
+        src_token_list = (
+            self.params['tokenizer']
+            .tokenize(self._orig_string(src))
+            .get_list()
+        )
+        tar_token_list = (
+            self.params['tokenizer']
+            .tokenize(self._orig_string(tar))
+            .get_list()
+        )
 
         src_sampled = Counter(choices(src_token_list, k=int(src_card)))
         tar_sampled = Counter(choices(tar_token_list, k=int(tar_card)))
@@ -20,7 +20,7 @@ Damerau-Levenshtein distance
 """
 
 from sys import maxsize
-from typing import Any, Callable, List, Tuple, cast
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
@@ -39,12 +39,16 @@ class DamerauLevenshtein(_Distance):
     Damerau-Levenshtein code is based on Java code by Kevin L. Stern
     :cite:`Stern:2014`, under the MIT license:
     https://github.com/KevinStern/software-and-algorithms/blob/master/src/main/java/blogspot/software_and_algorithms/stern_library/string/DamerauLevenshteinAlgorithm.java
+
+    .. versionchanged:: 0.6.0
+        Added max_distance option
     """
 
     def __init__(
         self,
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
+        max_distance: Optional[float] = None,
         **kwargs: Any
     ):
         """Initialize Levenshtein instance.
@@ -59,16 +63,54 @@ class DamerauLevenshtein(_Distance):
             A function that takes an list and computes a normalization term
             by which the edit distance is divided (max by default). Another
             good option is the sum function.
+        max_distance : int or float
+            If set, computation stops as soon as the distance is known to
+            exceed this bound. In that case, dist_abs returns max_distance + 1
+            and dist returns 1.0, rather than the exact distance.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(DamerauLevenshtein, self).__init__(**kwargs)
         self._cost = cost
         self._normalizer = normalizer
+        self._max_distance = max_distance
+
+    def is_metric(self) -> bool:
+        """Return whether the absolute distance is a metric.
+
+        Damerau-Levenshtein distance is a metric if inserts & deletes cost the
+        same, all costs are positive, two transpositions cost no less than an
+        insert plus a delete, and max_distance is not set.
+
+        Returns
+        -------
+        bool
+            True if dist_abs is a metric
+
+        Examples
+        --------
+        >>> DamerauLevenshtein().is_metric()
+        True
+        >>> DamerauLevenshtein(max_distance=2).is_metric()
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        return (
+            self._max_distance is None
+            and ins_cost == del_cost
+            and min(self._cost) > 0
+            and 2 * trans_cost >= ins_cost + del_cost
+        )
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the Damerau-Levenshtein distance between two strings.
@@ -107,16 +149,21 @@ class DamerauLevenshtein(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Supports max_distance
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        max_distance = self._max_distance
 
         if src == tar:
             return 0
-        if not src:
-            return len(tar) * ins_cost
-        if not tar:
-            return len(src) * del_cost
+
+        if not src or not tar:
+            distance = len(tar) * ins_cost if not src else len(src) * del_cost
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
 
         if 2 * trans_cost < ins_cost + del_cost:
             raise ValueError(
@@ -124,6 +171,15 @@ class DamerauLevenshtein(_Distance):
                 + 'must not be less than the cost of an insert plus a delete.'
             )
 
+        # Every character by which the lengths differ must be inserted or
+        # deleted.
+        if (
+            max_distance is not None
+            and abs(len(src) - len(tar)) * min(ins_cost, del_cost)
+            > max_distance
+        ):
+            return max_distance + 1
+
         d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
 
         if src[0] != tar[0]:
@@ -146,6 +202,15 @@ class DamerauLevenshtein(_Distance):
             )
             d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
+        # A transposition may skip over any number of rows (by deleting the
+        # characters in between), so the early exit bound must consider both
+        # the minimum of the current row and the cheapest such jump.
+        if max_distance is not None:
+            row_min = d_mat[0].min()
+            if min(row_min, trans_cost, del_cost) > max_distance:
+                return max_distance + 1
+            jump_bound = row_min + trans_cost
+
         for i in range(1, len(src)):
             max_src_letter_match_index = 0 if src[i] == tar[0] else -1
             for j in range(1, len(tar)):
@@ -186,6 +251,17 @@ class DamerauLevenshtein(_Distance):
                 )
             src_index_by_character[src[i]] = i
 
+            if max_distance is not None:
+                row_min = d_mat[i].min()
+                if min(row_min, jump_bound, (i + 1) * del_cost) > max_distance:
+                    return max_distance + 1
+                jump_bound = min(jump_bound + del_cost, row_min + trans_cost)
+
+        if (
+            max_distance is not None
+            and d_mat[len(src) - 1, len(tar) - 1] > max_distance
+        ):
+            return max_distance + 1
         return cast(float, d_mat[len(src) - 1, len(tar) - 1])
 
     def dist(self, src: str, tar: str) -> float:
@@ -233,7 +309,10 @@ class DamerauLevenshtein(_Distance):
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / (
             self._normalizer([len(src) * del_cost, len(tar) * ins_cost])
         )
 
@@ -18,7 +18,9 @@
 
 The distance._distance module implements abstract class _Distance.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
+
+import numpy as np
 
 __all__ = ['_Distance']
 
@@ -122,6 +124,166 @@ class _Distance:
         """
         return self.dist(src, tar)
 
+    def is_metric(self) -> bool:
+        """Return whether the absolute distance is a metric.
+
+        A metric is non-negative, symmetric, and satisfies the triangle
+        inequality, which metric indexes, such as
+        :py:class:`abydos.index.BKTree`, rely on to prune their searches.
+        Measures that are metrics for some settings only return True for
+        those settings.
+
+        Returns
+        -------
+        bool
+            True if dist_abs is a metric
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> Levenshtein().is_metric()
+        True
+        >>> Levenshtein(mode='osa').is_metric()
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return False
+
+    def sim_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the similarities of a query to each of several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of query to each of the choices
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_many('cat', ['hat', 'cat', 'dog'])
+        array([0.66666667, 1.        , 0.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.array([self.sim(query, tar) for tar in choices], dtype=float)
+
+    def dist_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the distances of a query to each of several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of query to each of the choices
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_many('cat', ['hat', 'cat', 'dog'])
+        array([0.33333333, 0.        , 1.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.array(
+            [self.dist(query, tar) for tar in choices], dtype=float
+        )
+
+    def sim_cdist(
+        self, srcs: Iterable[str], tars: Iterable[str]
+    ) -> np.ndarray:
+        """Return the matrix of similarities between two collections.
+
+        Parameters
+        ----------
+        srcs : Iterable[str]
+            Source strings for comparison
+        tars : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the similarity of the
+            i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_cdist(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.66666667, 1.        , 0.        ],
+               [1.        , 0.66666667, 0.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        srcs = list(srcs)
+        tars = list(tars)
+        matrix = np.zeros((len(srcs), len(tars)), dtype=float)
+        for i, src in enumerate(srcs):
+            matrix[i] = self.sim_many(src, tars)
+        return matrix
+
+    def dist_cdist(
+        self, srcs: Iterable[str], tars: Iterable[str]
+    ) -> np.ndarray:
+        """Return the matrix of distances between two collections.
+
+        Parameters
+        ----------
+        srcs : Iterable[str]
+            Source strings for comparison
+        tars : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the distance of the
+            i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_cdist(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.33333333, 0.        , 1.        ],
+               [0.        , 0.33333333, 1.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        srcs = list(srcs)
+        tars = list(tars)
+        matrix = np.zeros((len(srcs), len(tars)), dtype=float)
+        for i, src in enumerate(srcs):
+            matrix[i] = self.dist_many(src, tars)
+        return matrix
+
 
 if __name__ == '__main__':
     import doctest
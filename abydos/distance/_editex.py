@@ -20,7 +20,7 @@ editex
 """
 
 from sys import float_info
-from typing import Any, Tuple, cast
+from typing import Any, Optional, Tuple, cast
 from unicodedata import normalize as unicode_normalize
 
 from numpy import zeros as np_zeros
@@ -40,6 +40,8 @@ class Editex(_Distance):
     .. versionadded:: 0.3.6
     .. versionchanged:: 0.4.0
         Added taper option
+    .. versionchanged:: 0.6.0
+        Added max_distance option
     """
 
     _letter_groups = (
@@ -61,6 +63,7 @@ class Editex(_Distance):
         cost: Tuple[int, int, int] = (0, 1, 2),
         local: bool = False,
         taper: bool = False,
+        max_distance: Optional[float] = None,
         **kwargs: Any
     ) -> None:
         """Initialize Editex instance.
@@ -77,17 +80,26 @@ class Editex(_Distance):
             edits at the start of the string to "just [exceed] twice the
             minimum penalty for replacement or deletion at the end of the
             string".
+        max_distance : int or float
+            If set, computation stops as soon as the distance is known to
+            exceed this bound. In that case, dist_abs returns max_distance + 1
+            and dist returns 1.0, rather than the exact distance. If all costs
+            are positive, only the cells within max_distance edits of the
+            diagonal are computed.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(Editex, self).__init__(**kwargs)
         self._cost = cost
         self._local = local
         self._taper_enabled = taper
+        self._max_distance = max_distance
 
     def _taper(self, pos: int, length: int) -> float:
         return (
@@ -129,9 +141,12 @@ class Editex(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Supports max_distance
 
         """
         match_cost, group_cost, mismatch_cost = self._cost
+        max_distance = self._max_distance
 
         def r_cost(ch1: str, ch2: str) -> int:
             """Return r(a,b) according to Zobel & Dart's definition.
@@ -191,18 +206,41 @@ class Editex(_Distance):
 
         if src == tar:
             return 0.0
-        if not src:
-            return sum(
+        if not src or not tar:
+            distance = sum(
                 mismatch_cost * self._taper(pos, max_len)
-                for pos in range(tar_len)
+                for pos in range(max_len)
             )
-        if not tar:
-            return sum(
-                mismatch_cost * self._taper(pos, max_len)
-                for pos in range(src_len)
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
+
+        # Every insert or delete costs at least the lesser of the group &
+        # mismatch costs, except that of a letter repeating the one before
+        # it, which costs the match cost. So a path that strays k cells from
+        # the diagonal costs at least (k - repeats) * min_cost, and paths
+        # further than max_distance / min_cost + repeats need not be
+        # computed. (The local variant's free initial deletes preclude this.)
+        band = max_len
+        min_cost = min(group_cost, mismatch_cost)
+        if (
+            max_distance is not None
+            and min_cost > 0
+            and match_cost >= 0
+            and not self._local
+        ):
+            repeats = max(
+                sum(ch1 == ch2 for ch1, ch2 in zip(' ' + src, src)),
+                sum(ch1 == ch2 for ch1, ch2 in zip(' ' + tar, tar)),
             )
+            if (abs(src_len - tar_len) - repeats) * min_cost > max_distance:
+                return max_distance + 1
+            band = int(max_distance / min_cost) + repeats
 
         d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=float)
+        if band < max_len:
+            d_mat.fill(float('inf'))
+            d_mat[0, 0] = 0
         src = ' ' + src
         tar = ' ' + tar
 
@@ -217,7 +255,7 @@ class Editex(_Distance):
             ) * self._taper(j, max_len)
 
         for i in range(1, src_len + 1):
-            for j in range(1, tar_len + 1):
+            for j in range(max(1, i - band), min(tar_len, i + band) + 1):
                 d_mat[i, j] = min(
                     d_mat[i - 1, j]
                     + d_cost(src[i - 1], src[i])
@@ -228,7 +266,11 @@ class Editex(_Distance):
                     d_mat[i - 1, j - 1]
                     + r_cost(src[i], tar[j]) * self._taper(max(i, j), max_len),
                 )
+            if max_distance is not None and d_mat[i].min() > max_distance:
+                return max_distance + 1
 
+        if max_distance is not None and d_mat[src_len, tar_len] > max_distance:
+            return max_distance + 1
         if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
             return int(d_mat[src_len, tar_len])
         else:
@@ -298,7 +340,11 @@ class Editex(_Distance):
             normalize_term = max(
                 src_len * mismatch_cost, tar_len * mismatch_cost
             )
-        return self.dist_abs(src, tar) / normalize_term
+
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / normalize_term
 
 
 if __name__ == '__main__':
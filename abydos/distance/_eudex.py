@@ -30,11 +30,20 @@ from typing import (
     cast,
 )
 
+import numpy as np
+
 from ._distance import _Distance
 from ..phonetic import Eudex as EudexPhonetic
 
 __all__ = ['Eudex']
 
+# The number of set bits in each byte value
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], np.uint8)
+
+# The greatest number of XORed hashes processed at once by the vectorized
+# methods, bounding their temporary arrays
+_CHUNK = 1 << 20
+
 
 class Eudex(_Distance):
     """Distance between the Eudex hashes of two terms.
@@ -143,6 +152,42 @@ class Eudex(_Distance):
         self._max_length = max_length
         self._phonetic_alg = EudexPhonetic(max_length=max_length)
 
+    def is_metric(self) -> bool:
+        """Return whether the absolute distance is a metric.
+
+        Eudex distance, a weighted Hamming distance between Eudex hashes, is a
+        metric between hashes if no weight is negative. (Distinct strings may
+        share a hash, and so be at distance 0.)
+
+        Returns
+        -------
+        bool
+            True if dist_abs is a metric
+
+        Examples
+        --------
+        >>> Eudex().is_metric()
+        True
+        >>> Eudex(weights=[1, -1, 1, 1, 1, 1, 1, 1]).is_metric()
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._weights:
+            return True
+        if isinstance(self._weights, str):
+            return self._weights in {'exponential', 'fibonacci'}
+        if hasattr(self._weights, '__iter__'):
+            weights = list(cast(Iterable[float], self._weights))
+        elif callable(self._weights):
+            weights_gen = self._weights()
+            weights = [next(weights_gen) for _ in range(self._max_length)]
+        else:
+            return False
+        return all(weight >= 0 for weight in weights)
+
     def dist_abs(self, src: str, tar: str, normalized: bool = False) -> float:
         """Calculate the distance between the Eudex hashes of two terms.
 
@@ -223,27 +268,7 @@ class Eudex(_Distance):
                 return distance / (len(binary) - 2)
             return distance
 
-        # If self._weights is a function, it should create a generator,
-        # which we now use to populate a list
-        weights_list = []  # List[float]
-        if hasattr(self._weights, '__iter__') and not isinstance(
-            self._weights, str
-        ):
-            weights_list = cast(List[float], self._weights)[::-1]
-            weights_gen = None
-        elif callable(self._weights):
-            weights_gen = self._weights()
-        elif self._weights == 'exponential':
-            weights_gen = Eudex.gen_exponential()
-        elif self._weights == 'fibonacci':
-            weights_gen = Eudex.gen_fibonacci()
-        else:
-            raise ValueError('Unrecognized weights value or type.')
-
-        if isinstance(weights_gen, Generator):
-            weights_list = [
-                next(weights_gen) for _ in range(self._max_length)
-            ][::-1]
+        weights_list = cast(List[float], self._weights_list())[::-1]
 
         # Sum the weighted hamming distance
         distance = 0
@@ -258,6 +283,41 @@ class Eudex(_Distance):
 
         return distance
 
+    def _weights_list(self) -> Optional[List[float]]:
+        """Return the weight of each byte, from least to most significant.
+
+        Returns
+        -------
+        list or None
+            The weights, or None for a simple Hamming distance
+
+        Raises
+        ------
+        ValueError
+            Unrecognized weights value or type.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._weights:
+            return None
+        # If self._weights is a function, it should create a generator,
+        # which we now use to populate a list
+        if hasattr(self._weights, '__iter__') and not isinstance(
+            self._weights, str
+        ):
+            return list(cast(Iterable[float], self._weights))
+        elif callable(self._weights):
+            weights_gen = self._weights()
+        elif self._weights == 'exponential':
+            weights_gen = Eudex.gen_exponential()
+        elif self._weights == 'fibonacci':
+            weights_gen = Eudex.gen_fibonacci()
+        else:
+            raise ValueError('Unrecognized weights value or type.')
+        return [next(weights_gen) for _ in range(self._max_length)]
+
     def dist(self, src: str, tar: str) -> float:
         """Return normalized distance between the Eudex hashes of two terms.
 
@@ -295,6 +355,323 @@ class Eudex(_Distance):
         """
         return self.dist_abs(src, tar, True)
 
+    def _hashes(self, strings: Union[Iterable[str], np.ndarray]) -> np.ndarray:
+        """Return the Eudex hashes of strings as an array.
+
+        Parameters
+        ----------
+        strings : Iterable[str] or numpy.ndarray
+            Strings, or an array of their hashes, as from
+            :py:meth:`abydos.phonetic.Eudex.encode_array`
+
+        Returns
+        -------
+        numpy.ndarray
+            The hashes, as numpy.uint64
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(strings, np.ndarray):
+            return strings.astype(np.uint64, copy=False).reshape(-1)
+        return self._phonetic_alg.encode_array(strings)
+
+    def _dist_abs_xored(
+        self, xored: np.ndarray, normalized: bool
+    ) -> np.ndarray:
+        """Return the distances encoded by XORed pairs of hashes.
+
+        Parameters
+        ----------
+        xored : numpy.ndarray
+            The XOR of pairs of hashes, as a 1-dimensional numpy.uint64 array
+        normalized : bool
+            Normalizes to [0, 1] if True
+
+        Returns
+        -------
+        numpy.ndarray
+            The Eudex distances
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # the popcount of each byte, least significant byte first
+        counts = _POPCOUNT[
+            xored.astype('<u8', copy=False).view(np.uint8).reshape(-1, 8)
+        ]
+        weights = self._weights_list()
+
+        # Simple hamming distance (all bits are equal)
+        if weights is None:
+            distance = counts.sum(axis=1, dtype=np.int64)
+            if not normalized:
+                return distance
+            # normalized by the bit length of the XOR, computed exactly from
+            # its two 32-bit halves
+            high = np.frexp((xored >> np.uint64(32)).astype(np.float64))[1]
+            low = np.frexp(
+                (xored & np.uint64(0xFFFFFFFF)).astype(np.float64)
+            )[1]
+            bit_length = np.where(high > 0, high + 32, low)
+            return distance / np.maximum(bit_length, 1)
+
+        dtype = (
+            np.int64
+            if all(isinstance(weight, int) for weight in weights)
+            else np.float64
+        )
+        byte_weights = np.zeros(8, dtype=dtype)
+        byte_weights[: min(len(weights), 8)] = weights[:8]
+        distance = counts.astype(dtype) @ byte_weights
+        if normalized:
+            return distance / (8 * sum(weights))
+        return distance
+
+    def dist_abs_many(
+        self,
+        query: Union[str, int],
+        choices: Union[Iterable[str], np.ndarray],
+        normalized: bool = False,
+    ) -> np.ndarray:
+        """Return the distances between the Eudex hashes of a query & choices.
+
+        The hashes of the choices are XORed with the query's and the weighted
+        popcounts of their bytes are summed, across the whole array at once.
+
+        Parameters
+        ----------
+        query : str or int
+            Source string for comparison, or its hash
+        choices : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes, as
+            from :py:meth:`abydos.phonetic.Eudex.encode_array`, which may be
+            memory-mapped
+        normalized : bool
+            Normalizes to [0, 1] if True
+
+        Returns
+        -------
+        numpy.ndarray
+            The Eudex distance of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_abs_many('Niall', ['Neil', 'Colin', 'Niall'])
+        array([  2, 524,   0])
+
+        >>> from abydos.phonetic import Eudex as EudexPhonetic
+        >>> hashes = EudexPhonetic().encode_array(['cat', 'hat'])
+        >>> cmp.dist_abs_many('hat', hashes)
+        array([128,   0])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(query, str):
+            query = int(self._phonetic_alg.encode(query))
+        query_hash = np.uint64(query)
+        hashes = self._hashes(choices)
+
+        dtype = np.float64 if normalized else np.int64
+        weights = self._weights_list()
+        if weights is not None and not all(
+            isinstance(weight, int) for weight in weights
+        ):
+            dtype = np.float64
+        distances = np.empty(len(hashes), dtype=dtype)
+        for start in range(0, len(hashes), _CHUNK):
+            distances[start : start + _CHUNK] = self._dist_abs_xored(
+                hashes[start : start + _CHUNK] ^ query_hash, normalized
+            )
+        return distances
+
+    def dist_many(
+        self,
+        query: Union[str, int],
+        choices: Union[Iterable[str], np.ndarray],
+    ) -> np.ndarray:
+        """Return the normalized Eudex distances of a query to choices.
+
+        Parameters
+        ----------
+        query : str or int
+            Source string for comparison, or its hash
+        choices : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex distance of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_many('Niall', ['Neil', 'Colin', 'Niall'])
+        array([0.00098039, 0.25686275, 0.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.dist_abs_many(query, choices, True)
+
+    def sim_many(
+        self,
+        query: Union[str, int],
+        choices: Union[Iterable[str], np.ndarray],
+    ) -> np.ndarray:
+        """Return the normalized Eudex similarities of a query to choices.
+
+        Parameters
+        ----------
+        query : str or int
+            Source string for comparison, or its hash
+        choices : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex similarity of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.sim_many('Niall', ['Neil', 'Colin', 'Niall'])
+        array([0.99901961, 0.74313725, 1.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_many(query, choices)
+
+    def dist_abs_cdist(
+        self,
+        srcs: Union[Iterable[str], np.ndarray],
+        tars: Union[Iterable[str], np.ndarray],
+        normalized: bool = False,
+    ) -> np.ndarray:
+        """Return the matrix of Eudex distances between two collections.
+
+        Parameters
+        ----------
+        srcs : Iterable[str] or numpy.ndarray
+            Source strings for comparison, or an array of their hashes
+        tars : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes
+        normalized : bool
+            Normalizes to [0, 1] if True
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the distance of the
+            i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_abs_cdist(['Niall', 'Neil'], ['Neil', 'Colin'])
+        array([[  2, 524],
+               [  0, 526]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_hashes = self._hashes(srcs)
+        tar_hashes = self._hashes(tars)
+        rows = max(1, _CHUNK // max(1, len(tar_hashes)))
+
+        matrix = None  # type: Optional[np.ndarray]
+        for start in range(0, len(src_hashes), rows):
+            block = src_hashes[start : start + rows]
+            distances = self._dist_abs_xored(
+                (block[:, None] ^ tar_hashes[None, :]).reshape(-1),
+                normalized,
+            ).reshape(len(block), len(tar_hashes))
+            if matrix is None:
+                matrix = np.empty(
+                    (len(src_hashes), len(tar_hashes)), dtype=distances.dtype
+                )
+            matrix[start : start + rows] = distances
+        if matrix is None:
+            return np.zeros((0, len(tar_hashes)))
+        return matrix
+
+    def dist_cdist(
+        self,
+        srcs: Union[Iterable[str], np.ndarray],
+        tars: Union[Iterable[str], np.ndarray],
+    ) -> np.ndarray:
+        """Return the matrix of normalized Eudex distances.
+
+        Parameters
+        ----------
+        srcs : Iterable[str] or numpy.ndarray
+            Source strings for comparison, or an array of their hashes
+        tars : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the normalized distance
+            of the i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_cdist(['Niall', 'Neil'], ['Neil', 'Colin'])
+        array([[0.00098039, 0.25686275],
+               [0.        , 0.25784314]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.dist_abs_cdist(srcs, tars, True)
+
+    def sim_cdist(
+        self,
+        srcs: Union[Iterable[str], np.ndarray],
+        tars: Union[Iterable[str], np.ndarray],
+    ) -> np.ndarray:
+        """Return the matrix of normalized Eudex similarities.
+
+        Parameters
+        ----------
+        srcs : Iterable[str] or numpy.ndarray
+            Source strings for comparison, or an array of their hashes
+        tars : Iterable[str] or numpy.ndarray
+            Target strings for comparison, or an array of their hashes
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the normalized
+            similarity of the i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.sim_cdist(['Niall', 'Neil'], ['Neil', 'Colin'])
+        array([[0.99901961, 0.74313725],
+               [1.        , 0.74215686]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_cdist(srcs, tars)
+
 
 if __name__ == '__main__':
     import doctest
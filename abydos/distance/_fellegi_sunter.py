@@ -38,6 +38,8 @@ class FellegiSunter(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -181,6 +183,8 @@ class FellegiSunter(_TokenDistance):
         score = self.sim_score(src, tar)
         if score == 0.0:
             return 0.0
+        src = self._orig_string(src)
+        tar = self._orig_string(tar)
         if self._simplified:
             return max(0.0, score / (len(src) + len(tar)))
         return max(0.0, score / max(len(src), len(tar)))
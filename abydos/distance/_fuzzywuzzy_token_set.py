@@ -39,6 +39,8 @@ class FuzzyWuzzyTokenSet(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self, tokenizer: Optional[_Tokenizer] = None, **kwargs: Any
     ) -> None:
@@ -99,6 +101,9 @@ class FuzzyWuzzyTokenSet(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
+        src = self._orig_string(src)
+        tar = self._orig_string(tar)
+
         src_tok = self.params['tokenizer'].tokenize(src).get_set()
         tar_tok = self.params['tokenizer'].tokenize(tar).get_set()
 
@@ -39,6 +39,8 @@ class FuzzyWuzzyTokenSort(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self, tokenizer: Optional[_Tokenizer] = None, **kwargs: Any
     ) -> None:
@@ -101,6 +103,9 @@ class FuzzyWuzzyTokenSort(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
+        src = self._orig_string(src)
+        tar = self._orig_string(tar)
+
         src = ' '.join(
             sorted(self.params['tokenizer'].tokenize(src).get_list())
         )
@@ -19,7 +19,9 @@
 Hamming distance
 """
 
-from typing import Any
+from typing import Any, Iterable, Optional
+
+import numpy as np
 
 from ._distance import _Distance
 
@@ -36,9 +38,16 @@ class Hamming(_Distance):
     strings' lengths and adds to this the difference in string lengths.
 
     .. versionadded:: 0.3.6
+    .. versionchanged:: 0.6.0
+        Added max_distance option
     """
 
-    def __init__(self, diff_lens: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        diff_lens: bool = True,
+        max_distance: Optional[float] = None,
+        **kwargs: Any
+    ) -> None:
         """Initialize Hamming instance.
 
         Parameters
@@ -50,15 +59,43 @@ class Hamming(_Distance):
             the shorter string with obligatorily non-matching characters. If
             False, an exception is raised in the case of strings of unequal
             lengths.
+        max_distance : int or float
+            If set, computation stops as soon as the distance is known to
+            exceed this bound. In that case, dist_abs returns max_distance + 1
+            and dist returns 1.0, rather than the exact distance.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(Hamming, self).__init__(**kwargs)
         self._diff_lens = diff_lens
+        self._max_distance = max_distance
+
+    def is_metric(self) -> bool:
+        """Return whether the absolute distance is a metric.
+
+        Hamming distance is a metric unless max_distance is set.
+
+        Returns
+        -------
+        bool
+            True if dist_abs is a metric
+
+        Examples
+        --------
+        >>> Hamming().is_metric()
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._max_distance is None
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the Hamming distance between two strings.
@@ -97,6 +134,8 @@ class Hamming(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Supports max_distance
 
         """
         if not self._diff_lens and len(src) != len(tar):
@@ -109,7 +148,19 @@ class Hamming(_Distance):
         hdist = 0
         if self._diff_lens:
             hdist += abs(len(src) - len(tar))
-        hdist += sum(c1 != c2 for c1, c2 in zip(src, tar))
+
+        max_distance = self._max_distance
+        if max_distance is None:
+            hdist += sum(c1 != c2 for c1, c2 in zip(src, tar))
+            return hdist
+
+        if hdist > max_distance:
+            return max_distance + 1
+        for c1, c2 in zip(src, tar):
+            if c1 != c2:
+                hdist += 1
+                if hdist > max_distance:
+                    return max_distance + 1
 
         return hdist
 
@@ -156,7 +207,146 @@ class Hamming(_Distance):
         """
         if src == tar:
             return 0.0
-        return self.dist_abs(src, tar) / max(len(src), len(tar))
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / max(len(src), len(tar))
+
+    def dist_abs_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the Hamming distances of a query to several choices.
+
+        The choices are packed into a single array of code points, so that
+        all of the distances are computed by one comparison against the
+        query.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Hamming distance of query to each of the choices
+
+        Raises
+        ------
+        ValueError
+            Undefined for sequences of unequal length; set diff_lens to True
+            for Hamming distance between strings of unequal lengths.
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.dist_abs_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([3, 2, 0])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        choices = list(choices)
+        query_len = len(query)
+        tar_lens = np.array([len(tar) for tar in choices], dtype=np.int64)
+        if not self._diff_lens and (tar_lens != query_len).any():
+            raise ValueError(
+                'Undefined for sequences of unequal length; set diff_lens '
+                + 'to True for Hamming distance between strings of unequal '
+                + 'lengths.'
+            )
+        if not choices:
+            return np.zeros(0, dtype=np.int64)
+
+        # Positions past the end of a string hold a padding value that can
+        # never match, so each position past the shorter string's end counts
+        # as a mismatch. Positions past the end of both are then subtracted.
+        width = max(query_len, int(tar_lens.max()))
+        tar_codes = np.full((len(choices), width), -1, dtype=np.int64)
+        for i, tar in enumerate(choices):
+            tar_codes[i, : len(tar)] = self._code_points(tar)
+        query_codes = np.full(width, -2, dtype=np.int64)
+        query_codes[:query_len] = self._code_points(query)
+
+        hdist = (tar_codes != query_codes).sum(axis=1) - (
+            width - np.maximum(tar_lens, query_len)
+        )
+        if self._max_distance is not None:
+            hdist = np.where(
+                hdist > self._max_distance, self._max_distance + 1, hdist
+            )
+        return hdist
+
+    def dist_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the normalized Hamming distances to several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Hamming distance of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.6, 0.4, 0. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        choices = list(choices)
+        hdist = self.dist_abs_many(query, choices)
+        norm = np.maximum(
+            np.array([len(tar) for tar in choices], dtype=np.int64),
+            len(query),
+        )
+        dist = np.where(norm > 0, hdist / np.maximum(norm, 1), 0.0)
+        if self._max_distance is not None:
+            dist[hdist > self._max_distance] = 1.0
+        return dist
+
+    def sim_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the normalized Hamming similarities to several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Hamming similarity of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.sim_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.4, 0.6, 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_many(query, choices)
+
+    @staticmethod
+    def _code_points(string: str) -> np.ndarray:
+        """Return the code points of a string as an array."""
+        return np.frombuffer(
+            string.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32
+        )
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Indel distance
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from ._levenshtein import Levenshtein
 
@@ -36,20 +36,31 @@ class Indel(Levenshtein):
 
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self, max_distance: Optional[float] = None, **kwargs: Any
+    ) -> None:
         """Initialize Levenshtein instance.
 
         Parameters
         ----------
+        max_distance : int or float
+            If set, computation stops as soon as the distance is known to
+            exceed this bound. In that case, dist_abs returns max_distance + 1
+            and dist returns 1.0, rather than the exact distance.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(Indel, self).__init__(
-            mode='lev', cost=(1, 1, float('inf'), float('inf')), **kwargs
+            mode='lev',
+            cost=(1, 1, float('inf'), float('inf')),
+            max_distance=max_distance,
+            **kwargs
         )
 
     def dist(self, src: str, tar: str) -> float:
@@ -88,7 +99,10 @@ class Indel(Levenshtein):
         """
         if src == tar:
             return 0.0
-        return self.dist_abs(src, tar) / (len(src) + len(tar))
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / (len(src) + len(tar))
 
 
 if __name__ == '__main__':
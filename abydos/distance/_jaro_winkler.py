@@ -23,7 +23,9 @@ The distance._JaroWinkler module implements distance metrics based on
     - Jaro-Winkler distance
 """
 
-from typing import Any
+from typing import Any, Iterable, List
+
+import numpy as np
 
 from ._distance import _Distance
 from ..tokenizer import QGrams
@@ -144,6 +146,98 @@ class JaroWinkler(_Distance):
         .. versionchanged:: 0.3.6
             Encapsulated in class
 
+        """
+        self._check_params()
+
+        if src == tar:
+            return 1.0
+
+        tokenizer = QGrams(self._qval)
+        tokenizer.tokenize(src.strip())
+        src_list = tokenizer.get_list()
+        tokenizer.tokenize(tar.strip())
+        tar_list = tokenizer.get_list()
+
+        return self._sim_tokens(src_list, tar_list)
+
+    def sim_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the Jaro or Jaro-Winkler similarities to several choices.
+
+        The query is tokenized only once, and the parameters are checked only
+        once, for all of the choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Jaro or Jaro-Winkler similarity of query to each of the
+            choices
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.sim_many('Niall', ['Neil', 'Niall', 'Nigel'])
+        array([0.805     , 1.        , 0.78666667])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_params()
+
+        tokenizer = QGrams(self._qval)
+        query_list = tokenizer.tokenize(query.strip()).get_list()
+
+        sims = []
+        for tar in choices:
+            if tar == query:
+                sims.append(1.0)
+            else:
+                sims.append(
+                    self._sim_tokens(
+                        query_list, tokenizer.tokenize(tar.strip()).get_list()
+                    )
+                )
+        return np.array(sims, dtype=float)
+
+    def dist_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the Jaro or Jaro-Winkler distances to several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Jaro or Jaro-Winkler distance of query to each of the choices
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.dist_many('Niall', ['Neil', 'Niall', 'Nigel'])
+        array([0.195     , 0.        , 0.21333333])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.sim_many(query, choices)
+
+    def _check_params(self) -> None:
+        """Raise ValueError if the Winkler parameters are out of range.
+
+        .. versionadded:: 0.6.0
+
         """
         if self._mode == 'winkler':
             if self._boost_threshold > 1 or self._boost_threshold < 0:
@@ -157,15 +251,25 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
-        if src == tar:
-            return 1.0
+    def _sim_tokens(self, src_list: List[str], tar_list: List[str]) -> float:
+        """Return the Jaro or Jaro-Winkler similarity of two token lists.
 
-        tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
+        Parameters
+        ----------
+        src_list : list
+            Source q-grams for comparison
+        tar_list : list
+            Target q-grams for comparison
 
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
+
+
+        .. versionadded:: 0.6.0
+
+        """
         lens = len(src_list)
         lent = len(tar_list)
 
@@ -24,7 +24,17 @@ based on Levenshtein distance, including:
 """
 
 from sys import float_info
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 
@@ -44,7 +54,10 @@ class Levenshtein(_Distance):
 
     The ordinary Levenshtein & Optimal String Alignment distance both
     employ the Wagner-Fischer dynamic programming algorithm
-    :cite:`Wagner:1974`.
+    :cite:`Wagner:1974`. When all edit costs are 1 and tapering is disabled,
+    the distance is instead computed with Myers' bit-vector algorithm
+    :cite:`Myers:1999` or, for Optimal String Alignment, Hyyrö's extension of
+    it :cite:`Hyyro:2003`.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
     substitution costs.
@@ -52,6 +65,8 @@ class Levenshtein(_Distance):
     .. versionadded:: 0.3.6
     .. versionchanged:: 0.4.0
         Added taper option
+    .. versionchanged:: 0.6.0
+        Added bit-parallel computation for unit costs & max_distance option
     """
 
     def __init__(
@@ -60,6 +75,7 @@ class Levenshtein(_Distance):
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
         taper: bool = False,
+        max_distance: Optional[float] = None,
         **kwargs: Any
     ) -> None:
         """Initialize Levenshtein instance.
@@ -89,11 +105,18 @@ class Levenshtein(_Distance):
             edits at the start of the string to "just [exceed] twice the
             minimum penalty for replacement or deletion at the end of the
             string".
+        max_distance : int or float
+            If set, computation stops as soon as the distance is known to
+            exceed this bound. In that case, dist_abs returns max_distance + 1
+            and dist returns 1.0, rather than the exact distance. Only the
+            cells within max_distance edits of the diagonal are computed.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(Levenshtein, self).__init__(**kwargs)
@@ -101,6 +124,7 @@ class Levenshtein(_Distance):
         self._cost = cost
         self._normalizer = normalizer
         self._taper_enabled = taper
+        self._max_distance = max_distance
 
     def _taper(self, pos: int, length: int) -> float:
         return (
@@ -109,6 +133,271 @@ class Levenshtein(_Distance):
             else 1
         )
 
+    def _unit_cost(self) -> bool:
+        """Return True if the bit-parallel algorithm is applicable.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._taper_enabled:
+            return False
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        return (
+            ins_cost == 1
+            and del_cost == 1
+            and sub_cost == 1
+            and (self._mode != 'osa' or trans_cost == 1)
+        )
+
+    def is_metric(self) -> bool:
+        """Return whether the absolute distance is a metric.
+
+        Levenshtein distance is a metric if inserts & deletes cost the same,
+        all costs are positive, and neither taper nor max_distance is set.
+        Optimal String Alignment distance is not a metric.
+
+        Returns
+        -------
+        bool
+            True if dist_abs is a metric
+
+        Examples
+        --------
+        >>> Levenshtein().is_metric()
+        True
+        >>> Levenshtein(cost=(1, 2, 1, 1)).is_metric()
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, _ = self._cost
+        return (
+            self._mode == 'lev'
+            and not self._taper_enabled
+            and self._max_distance is None
+            and ins_cost == del_cost
+            and ins_cost > 0
+            and sub_cost > 0
+        )
+
+    @staticmethod
+    def _match_vectors(pattern: str) -> Dict[str, int]:
+        """Return the match bit-vector of each character in a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The pattern string
+
+        Returns
+        -------
+        dict
+            A dict mapping each character to a bit-vector with the bits set
+            at the positions where the character occurs in pattern
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        peq = {}  # type: Dict[str, int]
+        for i, char in enumerate(pattern):
+            peq[char] = peq.get(char, 0) | (1 << i)
+        return peq
+
+    def _bit_parallel(
+        self,
+        src: str,
+        tar: str,
+        max_distance: Optional[float] = None,
+        src_peq: Optional[Dict[str, int]] = None,
+    ) -> float:
+        """Return the unit-cost distance by bit-parallel computation.
+
+        This is Myers' algorithm :cite:`Myers:1999`, as reformulated by
+        Hyyrö :cite:`Hyyro:2003`, including Hyyrö's extension for
+        transpositions in the Optimal String Alignment mode. Bit-vectors are
+        Python ints, so there is no limit on the length of the strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int or float
+            If set, the computation is abandoned once the distance is known
+            to exceed this bound
+        src_peq : dict
+            The match vectors of src (see _match_vectors), if already computed
+
+        Returns
+        -------
+        int
+            The Levenshtein (or OSA) distance between src & tar, or
+            max_distance + 1 if it exceeds max_distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if src_peq is None:
+            # Both measures are symmetric, so the shorter string is used as
+            # the pattern in order to keep the bit-vectors short.
+            if len(src) > len(tar):
+                src, tar = tar, src
+            src_peq = self._match_vectors(src)
+        peq = src_peq
+
+        src_len = len(src)
+        tar_len = len(tar)
+        if max_distance is not None and abs(tar_len - src_len) > max_distance:
+            return max_distance + 1
+        if not src_len:
+            return tar_len
+
+        mask = (1 << src_len) - 1
+        last = 1 << (src_len - 1)
+        osa = self._mode == 'osa'
+
+        vp = mask
+        vn = 0
+        d0 = 0
+        prev_eq = 0
+        distance = src_len
+
+        for pos, char in enumerate(tar, 1):
+            eq = peq.get(char, 0)
+            if osa:
+                trans = ((~d0 & eq) << 1) & prev_eq
+                prev_eq = eq
+            d0 = ((((eq & vp) + vp) ^ vp) | eq | vn) & mask
+            if osa:
+                d0 |= trans
+            hp = vn | ~(d0 | vp)
+            hn = d0 & vp
+            if hp & last:
+                distance += 1
+            elif hn & last:
+                distance -= 1
+            hp = (hp << 1) | 1
+            hn <<= 1
+            vp = (hn | ~(d0 | hp)) & mask
+            vn = hp & d0
+
+            # Each remaining character of tar can lower the distance by at
+            # most 1.
+            if (
+                max_distance is not None
+                and distance - (tar_len - pos) > max_distance
+            ):
+                return max_distance + 1
+
+        return distance
+
+    def _banded_dist_abs(
+        self, src: str, tar: str, max_distance: float
+    ) -> float:
+        """Return the Levenshtein distance, bounded by max_distance.
+
+        Only the cells of the DP matrix within a band around the diagonal are
+        computed :cite:`Ukkonen:1985`, and the computation stops as soon as
+        no path through the rows computed so far can stay within
+        max_distance.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int or float
+            The bound on the distance
+
+        Returns
+        -------
+        int or float
+            The Levenshtein distance between src & tar, or max_distance + 1 if
+            it exceeds max_distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+
+        src_len = len(src)
+        tar_len = len(tar)
+        max_len = max(src_len, tar_len)
+        exceeded = max_distance + 1
+
+        # Every character by which the lengths differ must be inserted or
+        # deleted, and tapering never reduces a cost.
+        if tar_len >= src_len:
+            lower_bound = (tar_len - src_len) * ins_cost
+        else:
+            lower_bound = (src_len - tar_len) * del_cost
+        if lower_bound > max_distance:
+            return exceeded
+
+        # A path leaving the band would require more than max_distance
+        # inserts or deletes.
+        min_indel = min(ins_cost, del_cost)
+        if min_indel > 0:
+            band = min(int(max_distance / min_indel), max_len)
+        else:
+            band = max_len
+
+        inf = float('inf')
+        prev_row = [inf] * (tar_len + 1)
+        for j in range(min(band, tar_len) + 1):
+            prev_row[j] = j * self._taper(j, max_len) * ins_cost
+        prev_prev_row = prev_row
+        prev_row_min = 0.0
+
+        for i in range(src_len):
+            cur_row = [inf] * (tar_len + 1)
+            if i + 1 <= band:
+                cur_row[0] = (i + 1) * self._taper(i + 1, max_len) * del_cost
+            row_min = cur_row[0]
+
+            for j in range(max(0, i - band), min(tar_len, i + band + 1)):
+                taper = self._taper(1 + max(i, j), max_len)
+                cell = min(
+                    cur_row[j] + ins_cost * taper,  # ins
+                    prev_row[j + 1] + del_cost * taper,  # del
+                    prev_row[j]
+                    + (sub_cost * taper if src[i] != tar[j] else 0),  # sub/==
+                )
+                if (
+                    self._mode == 'osa'
+                    and i > 0
+                    and j > 0
+                    and src[i] == tar[j - 1]
+                    and src[i - 1] == tar[j]
+                ):
+                    # transposition
+                    cell = min(cell, prev_prev_row[j - 1] + trans_cost * taper)
+                cur_row[j + 1] = cell
+                if cell < row_min:
+                    row_min = cell
+
+            # In OSA mode, a transposition can skip over the current row.
+            if row_min > max_distance and (
+                self._mode != 'osa' or prev_row_min + trans_cost > max_distance
+            ):
+                return exceeded
+            prev_prev_row, prev_row = prev_row, cur_row
+            prev_row_min = row_min
+
+        distance = prev_row[tar_len]
+        if distance > max_distance:
+            return exceeded
+        if int(distance) == distance:
+            return int(distance)
+        return distance
+
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
@@ -302,8 +591,14 @@ class Levenshtein(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Uses bit-parallel computation for unit costs & supports
+            max_distance
 
         """
+        if self._unit_cost():
+            return self._bit_parallel(src, tar, self._max_distance)
+
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
 
         src_len = len(src)
@@ -312,14 +607,26 @@ class Levenshtein(_Distance):
 
         if src == tar:
             return 0
-        if not src:
-            return sum(
-                ins_cost * self._taper(pos, max_len) for pos in range(tar_len)
-            )
-        if not tar:
-            return sum(
-                del_cost * self._taper(pos, max_len) for pos in range(src_len)
-            )
+        if not src or not tar:
+            if not src:
+                distance = sum(
+                    ins_cost * self._taper(pos, max_len)
+                    for pos in range(tar_len)
+                )
+            else:
+                distance = sum(
+                    del_cost * self._taper(pos, max_len)
+                    for pos in range(src_len)
+                )
+            if (
+                self._max_distance is not None
+                and distance > self._max_distance
+            ):
+                return self._max_distance + 1
+            return distance
+
+        if self._max_distance is not None:
+            return self._banded_dist_abs(src, tar, self._max_distance)
 
         d_mat = cast(
             np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
@@ -395,7 +702,95 @@ class Levenshtein(_Distance):
                 [src_len * del_cost, tar_len * ins_cost]
             )
 
-        return self.dist_abs(src, tar) / normalize_term
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / normalize_term
+
+    def dist_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the normalized Levenshtein distances to several choices.
+
+        With unit costs, the match vectors of query are computed only once
+        and reused for every choice.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein distance of query to each of the
+            choices
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.6, 0.4, 0. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # Subclasses that redefine dist (e.g. with another normalization)
+        # must use the generic path.
+        if not self._unit_cost() or type(self).dist is not Levenshtein.dist:
+            return super(Levenshtein, self).dist_many(query, choices)
+
+        query_peq = self._match_vectors(query)
+        query_len = len(query)
+        distances = []
+        for tar in choices:
+            if tar == query:
+                distances.append(0.0)
+                continue
+            distance = self._bit_parallel(
+                query, tar, self._max_distance, query_peq
+            )
+            if (
+                self._max_distance is not None
+                and distance > self._max_distance
+            ):
+                distances.append(1.0)
+            else:
+                distances.append(
+                    distance / self._normalizer([query_len, len(tar)])
+                )
+        return np.array(distances, dtype=float)
+
+    def sim_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the normalized Levenshtein similarities to several choices.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein similarity of query to each of the
+            choices
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.4, 0.6, 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if type(self).sim is not _Distance.sim:
+            return super(Levenshtein, self).sim_many(query, choices)
+        return 1.0 - self.dist_many(query, choices)
 
 
 if __name__ == '__main__':
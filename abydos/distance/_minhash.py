@@ -20,7 +20,8 @@ MinHash similarity
 """
 
 from hashlib import sha512
-from typing import Any, Optional, cast
+from typing import Any, Dict, Optional, cast
+from zlib import crc32
 
 import numpy as np
 
@@ -33,6 +34,10 @@ __all__ = ['MinHash']
 _MININT = np.iinfo(np.int64).min
 _MAXINT = np.iinfo(np.int64).max
 
+# The number of hash functions in a signature, if k is not set
+_SIGNATURE_SIZE = 128
+_MAXHASH = np.uint64(0xFFFFFFFF)
+
 
 class MinHash(_Distance):
     r"""MinHash similarity.
@@ -42,6 +47,8 @@ class MinHash(_Distance):
     :cite:`Kula:2015`.
 
     .. versionadded:: 0.4.0
+    .. versionchanged:: 0.6.0
+        Added signature & sim_signatures methods
     """
 
     def __init__(
@@ -77,6 +84,8 @@ class MinHash(_Distance):
         """
         self._k = k
         self._seed = seed
+        self._masks = {}  # type: Dict[int, np.ndarray]
+        self._signature_params = None  # type: Optional[np.ndarray]
         super(MinHash, self).__init__(tokenizer=tokenizer, **kwargs)
 
         qval = 2 if 'qval' not in self.params else self.params['qval']
@@ -127,9 +136,12 @@ class MinHash(_Distance):
 
         k = self._k if self._k else max(len(src_tokens), len(tar_tokens))
 
-        masks = np.random.RandomState(seed=self._seed).randint(
-            _MININT, _MAXINT, k, dtype=np.int64
-        )
+        masks = self._masks.get(k)
+        if masks is None:
+            masks = np.random.RandomState(seed=self._seed).randint(
+                _MININT, _MAXINT, k, dtype=np.int64
+            )
+            self._masks[k] = masks
 
         hashes_src = np.full(k, _MAXINT, dtype=np.int64)
         hashes_tar = np.full(k, _MAXINT, dtype=np.int64)
@@ -152,6 +164,108 @@ class MinHash(_Distance):
 
         return cast(float, (hashes_src == hashes_tar).sum() / k)
 
+    def signature(self, string: str) -> np.ndarray:
+        """Return the MinHash signature of a string.
+
+        A signature holds, for each of k hash functions (or 128, if k is not
+        set), the least hash of the string's tokens. Each token is hashed
+        once, with CRC-32, and the hash functions are drawn from a
+        multiply-add-shift family :cite:`Dietzfelbinger:1996`, so signatures
+        are quick to compute and may be stored for later comparison with
+        sim_signatures. The proportion of positions at which two signatures
+        agree estimates the Jaccard similarity of the strings' token sets.
+
+        Signatures are not comparable to the hashes compared by sim, which
+        hashes tokens with SHA-512.
+
+        Parameters
+        ----------
+        string : str
+            The string to sign
+
+        Returns
+        -------
+        numpy.ndarray
+            The signature, an array of k unsigned 32-bit ints
+
+        Examples
+        --------
+        >>> cmp = MinHash(k=8)
+        >>> cmp.signature('Niall')
+        array([  75202867, 1521331673,  151895309,  728740337,  612918792,
+                162500824,  369815495, 1524835886], dtype=uint32)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._signature_params is None:
+            self._signature_params = np.random.RandomState(
+                seed=self._seed
+            ).randint(
+                0,
+                np.iinfo(np.uint64).max,
+                (2, self._k or _SIGNATURE_SIZE),
+                dtype=np.uint64,
+            )
+            self._signature_params[0] |= np.uint64(1)
+        mult, add = self._signature_params
+
+        tokens = np.fromiter(
+            (
+                crc32(tok.encode('utf-8'))
+                for tok in self.params['tokenizer'].tokenize(string).get_set()
+            ),
+            dtype=np.uint64,
+        )
+        if not len(tokens):
+            return np.full(len(mult), _MAXHASH, dtype=np.uint32)
+        return (
+            (
+                (np.multiply.outer(mult, tokens) + add[:, np.newaxis])
+                >> np.uint64(32)
+            )
+            .min(axis=1)
+            .astype(np.uint32)
+        )
+
+    @staticmethod
+    def sim_signatures(src: np.ndarray, tar: np.ndarray) -> float:
+        """Return the similarity estimated from two MinHash signatures.
+
+        Parameters
+        ----------
+        src : numpy.ndarray
+            Source signature for comparison
+        tar : numpy.ndarray
+            Target signature for comparison
+
+        Returns
+        -------
+        float
+            The proportion of positions at which the signatures agree
+
+        Raises
+        ------
+        ValueError
+            Signatures must be of equal length
+
+        Examples
+        --------
+        >>> cmp = MinHash(k=64)
+        >>> cmp.sim_signatures(cmp.signature('Niall'), cmp.signature('Neil'))
+        0.234375
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(src) != len(tar):
+            raise ValueError('Signatures must be of equal length')
+        if not len(src):
+            return 1.0
+        return float(np.count_nonzero(src == tar) / len(src))
+
 
 if __name__ == '__main__':
     import doctest
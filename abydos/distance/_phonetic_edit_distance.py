@@ -26,7 +26,6 @@ from typing import (
     Iterable,
     List,
     Optional,
-    Sequence,
     Tuple,
     Union,
     cast,
@@ -35,7 +34,11 @@ from typing import (
 import numpy as np
 
 from ._levenshtein import Levenshtein
-from ..phones._phones import _FEATURE_MASK, cmp_features, ipa_to_features
+from ..phones._phones import (
+    _feature_table,
+    _ipa_to_segment_ids,
+    _normalize_weights,
+)
 
 __all__ = ['PhoneticEditDistance']
 
@@ -105,16 +108,10 @@ class PhoneticEditDistance(Levenshtein):
         self._cost = cost
         self._normalizer = normalizer
 
-        if isinstance(weights, dict):
-            weights = [
-                weights[feature] if feature in weights else 0
-                for feature in sorted(
-                    _FEATURE_MASK, key=_FEATURE_MASK.get, reverse=True
-                )
-            ]
-        elif isinstance(weights, (list, tuple)):
-            weights = list(weights) + [0] * (len(_FEATURE_MASK) - len(weights))
-        self._weights = weights
+        self._weights = _normalize_weights(weights)
+        # build the feature comparison table of the weighting once, here,
+        # rather than on the first comparison
+        _feature_table(self._weights)
 
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
@@ -137,6 +134,9 @@ class PhoneticEditDistance(Levenshtein):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Substitution costs are looked up in a precomputed feature
+            comparison table
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
@@ -144,62 +144,57 @@ class PhoneticEditDistance(Levenshtein):
         src_len = len(src)
         tar_len = len(tar)
 
-        src_list = ipa_to_features(src)
-        tar_list = ipa_to_features(tar)
-
-        d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=float)
-        if backtrace:
-            trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
+        src_ids = _ipa_to_segment_ids(src)
+        tar_ids = _ipa_to_segment_ids(tar)
+
+        # the substitution cost of each pair of segments, looked up in the
+        # feature comparison table of the weighting
+        src_arr = np.array(src_ids, dtype=np.intp)[:, None]
+        tar_arr = np.array(tar_ids, dtype=np.intp)[None, :]
+        sub_costs = np.where(
+            src_arr == tar_arr,
+            0.0,
+            sub_cost * (1.0 - _feature_table(self._weights)[src_arr, tar_arr]),
+        ).tolist()
+
+        d_rows = [[0.0] * (tar_len + 1) for _ in range(src_len + 1)]
+        trace_rows = [[0] * (tar_len + 1) for _ in range(src_len + 1)]
         for i in range(1, src_len + 1):
-            d_mat[i, 0] = i * del_cost
-            if backtrace:
-                trace_mat[i, 0] = 0
+            d_rows[i][0] = float(i * del_cost)
         for j in range(1, tar_len + 1):
-            d_mat[0, j] = j * ins_cost
-            if backtrace:
-                trace_mat[0, j] = 1
+            d_rows[0][j] = float(j * ins_cost)
+            trace_rows[0][j] = 1
 
         for i in range(src_len):
+            prev_row = d_rows[i]
+            row = d_rows[i + 1]
+            trace_row = trace_rows[i + 1]
             for j in range(tar_len):
-                traces = ((i + 1, j), (i, j + 1), (i, j))
                 opts = (
-                    d_mat[traces[0]] + ins_cost,  # ins
-                    d_mat[traces[1]] + del_cost,  # del
-                    d_mat[traces[2]]
-                    + (
-                        sub_cost
-                        * (
-                            1.0
-                            - cmp_features(
-                                src_list[i],
-                                tar_list[j],
-                                cast(Sequence[float], self._weights),
-                            )
-                        )
-                        if src_list[i] != tar_list[j]
-                        else 0
-                    ),  # sub/==
+                    row[j] + ins_cost,  # ins
+                    prev_row[j + 1] + del_cost,  # del
+                    prev_row[j] + sub_costs[i][j],  # sub/==
                 )
-                d_mat[i + 1, j + 1] = min(opts)
-                if backtrace:
-                    trace_mat[i + 1, j + 1] = int(np.argmin(opts))
+                row[j + 1] = min(opts)
+                trace_row[j + 1] = opts.index(row[j + 1])
 
                 if self._mode == 'osa':
                     if (
                         i + 1 > 1
                         and j + 1 > 1
-                        and src_list[i] == tar_list[j - 1]
-                        and src_list[i - 1] == tar_list[j]
+                        and src_ids[i] == tar_ids[j - 1]
+                        and src_ids[i - 1] == tar_ids[j]
                     ):
                         # transposition
-                        d_mat[i + 1, j + 1] = min(
-                            d_mat[i + 1, j + 1],
-                            d_mat[i - 1, j - 1] + trans_cost,
+                        row[j + 1] = min(
+                            row[j + 1],
+                            d_rows[i - 1][j - 1] + trans_cost,
                         )
-                        if backtrace:
-                            trace_mat[i + 1, j + 1] = 2
+                        trace_row[j + 1] = 2
+
+        d_mat = np.array(d_rows, dtype=float)
         if backtrace:
-            return d_mat, trace_mat
+            return d_mat, np.array(trace_rows, dtype=np.int8)
         return d_mat
 
     def dist_abs(self, src: str, tar: str) -> float:
@@ -64,6 +64,8 @@ class SoftTFIDF(_TokenDistance):
 
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -143,8 +145,8 @@ class SoftTFIDF(_TokenDistance):
 
         if self._corpus is None:
             corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
+            corpus.add_document(self._orig_string(src))
+            corpus.add_document(self._orig_string(tar))
         else:
             corpus = self._corpus
 
@@ -32,6 +32,11 @@ class SSK(_TokenDistance):
 
     This is based on :cite:`Lodhi:2002`.
 
+    With its default tokenizer (or another QSkipgrams tokenizer with the
+    'SSK' scaler), the similarity of two strings is computed by the dynamic
+    programme of :cite:`Lodhi:2002`, in memory proportional to the product
+    of their lengths and without enumerating their q-skipgrams.
+
 
     .. versionadded:: 0.4.1
     """
@@ -80,6 +85,40 @@ class SSK(_TokenDistance):
             )
         )
 
+        tokenizer = self.params['tokenizer']
+        self._ssk_dp = (
+            isinstance(tokenizer, QSkipgrams)
+            and getattr(tokenizer, '_scaler', None) == 'SSK'
+            and tokenizer.max_span is None
+        )
+        if self._ssk_dp:
+            # The dynamic programme takes strings, not their tokens
+            self._batch_tokenize = False
+
+    def _kernel(self, src: str, tar: str) -> Optional[float]:
+        """Return the SSK of two strings by dynamic programming, if possible.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float or None
+            The kernel, or None if the tokenizer or arguments require the
+            kernel to be computed from the strings' tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._ssk_dp and isinstance(src, str) and isinstance(tar, str):
+            return self.params['tokenizer'].ssk_kernel(src, tar)
+        return None
+
     def sim_score(self, src: str, tar: str) -> float:
         """Return the SSK similarity of two strings.
 
@@ -101,16 +140,22 @@ class SSK(_TokenDistance):
         >>> cmp.dist_abs('cat', 'hat')
         0.6441281138790036
         >>> cmp.dist_abs('Niall', 'Neil')
-        0.5290992177869402
+        0.5290992177869401
         >>> cmp.dist_abs('aluminum', 'Catalan')
         0.862398428061774
         >>> cmp.dist_abs('ATCG', 'TAGC')
-        0.38591004719395017
+        0.38591004719394995
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Computed by dynamic programming with the SSK tokenizer
 
         """
+        kernel = self._kernel(src, tar)
+        if kernel is not None:
+            return kernel
+
         self._tokenize(src, tar)
 
         src_wts = self._src_tokens
@@ -143,19 +188,29 @@ class SSK(_TokenDistance):
         >>> cmp.sim('cat', 'hat')
         0.3558718861209964
         >>> cmp.sim('Niall', 'Neil')
-        0.4709007822130597
+        0.47090078221305987
         >>> cmp.sim('aluminum', 'Catalan')
         0.13760157193822603
         >>> cmp.sim('ATCG', 'TAGC')
-        0.6140899528060498
+        0.61408995280605
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Computed by dynamic programming with the SSK tokenizer
 
         """
         if src == tar:
             return 1.0
 
+        score = self._kernel(src, tar)
+        if score is not None:
+            if not score:
+                return 0.0
+            src_self = self._kernel(src, src)  # type: float
+            tar_self = self._kernel(tar, tar)  # type: float
+            return score / (src_self * tar_self) ** 0.5
+
         self._tokenize(src, tar)
 
         src_wts = self._src_tokens
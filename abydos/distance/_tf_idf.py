@@ -53,6 +53,8 @@ class TFIDF(_TokenDistance):
 
     """
 
+    _batch_tokenize = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -122,8 +124,8 @@ class TFIDF(_TokenDistance):
 
         if self._corpus is None:
             corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
+            corpus.add_document(self._orig_string(src))
+            corpus.add_document(self._orig_string(tar))
         else:
             corpus = self._corpus
 
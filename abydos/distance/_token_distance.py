@@ -23,10 +23,15 @@ _TokenDistance.
 from collections import Counter, OrderedDict
 from itertools import product
 from math import exp, log1p
+from operator import attrgetter
+from threading import local
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
+    Dict,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -40,11 +45,105 @@ from ._distance import _Distance
 from ._lcprefix import LCPrefix
 from ._levenshtein import Levenshtein
 from ..stats import ConfusionTable
-from ..tokenizer import QGrams, QSkipgrams, WhitespaceTokenizer, _Tokenizer
+from ..tokenizer import (
+    QGrams,
+    QSkipgrams,
+    TokenProfile,
+    WhitespaceTokenizer,
+    _Tokenizer,
+)
+from ..tokenizer._token_profile import _profile_cache
 
 __all__ = ['_TokenDistance']
 
 
+class _TokenContext:
+    """The state of a single _TokenDistance comparison.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = (
+        'src_orig',
+        'tar_orig',
+        'src_tokens',
+        'tar_tokens',
+        'population_card_value',
+        'normalizer',
+        'intersection_type',
+        'soft_intersection_precalc',
+        'soft_src_only',
+        'soft_tar_only',
+    )
+
+    def __init__(
+        self,
+        src_orig: Union[str, TCounter[str]],
+        tar_orig: Union[str, TCounter[str]],
+        src_tokens: TCounter[str],
+        tar_tokens: TCounter[str],
+        intersection_type: str,
+    ) -> None:
+        """Initialize _TokenContext.
+
+        Parameters
+        ----------
+        src_orig : str or Counter
+            Source string (or Counter) for comparison
+        tar_orig : str or Counter
+            Target string (or Counter) for comparison
+        src_tokens : Counter
+            Source tokens
+        tar_tokens : Counter
+            Target tokens
+        intersection_type : str
+            The intersection type of the comparison
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.src_orig = src_orig
+        self.tar_orig = tar_orig
+        self.src_tokens = src_tokens
+        self.tar_tokens = tar_tokens
+        self.population_card_value = 0  # type: float
+        self.normalizer = (
+            _TokenDistance._norm_none
+        )  # type: Callable[[float, int, float], float]
+        self.intersection_type = intersection_type
+        self.soft_intersection_precalc = Counter()  # type: TCounter[str]
+        self.soft_src_only = Counter()  # type: TCounter[str]
+        self.soft_tar_only = Counter()  # type: TCounter[str]
+
+
+def _context_attribute(name: str) -> Any:
+    """Return a property that reads & writes an attribute of the context.
+
+    Parameters
+    ----------
+    name : str
+        The name of the _TokenContext attribute
+
+
+    .. versionadded:: 0.6.0
+
+    """
+
+    get_value = attrgetter(name)
+
+    def _get(self: '_TokenDistance') -> Any:
+        try:
+            return get_value(self._local.context)
+        except AttributeError:
+            return get_value(self._context)
+
+    def _set(self: '_TokenDistance', value: Any) -> None:
+        setattr(self._context, name, value)
+
+    return property(_get, _set)
+
+
 class _TokenDistance(_Distance):
     r"""Abstract Token Distance class.
 
@@ -76,6 +175,27 @@ class _TokenDistance(_Distance):
     .. versionadded:: 0.3.6
     """
 
+    # Whether sim & dist give the same results when passed token Counters in
+    # place of strings, permitting the batch methods to tokenize each string
+    # only once. Measures that use the original strings must set this False.
+    _batch_tokenize = True
+
+    # Each call to _tokenize starts a new _TokenContext, held per thread, so
+    # that a single instance may be shared among threads. These attributes
+    # read & write the current thread's context.
+    _src_orig = _context_attribute('src_orig')
+    _tar_orig = _context_attribute('tar_orig')
+    _src_tokens = _context_attribute('src_tokens')
+    _tar_tokens = _context_attribute('tar_tokens')
+    _population_card_value = _context_attribute('population_card_value')
+    normalizer = _context_attribute('normalizer')
+    _intersection_type = _context_attribute('intersection_type')
+    _soft_intersection_precalc = _context_attribute(
+        'soft_intersection_precalc'
+    )
+    _soft_src_only = _context_attribute('soft_src_only')
+    _soft_tar_only = _context_attribute('soft_tar_only')
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -235,14 +355,7 @@ class _TokenDistance(_Distance):
         else:
             self._intersection = self._crisp_intersection  # type: ignore
 
-        self._src_tokens = Counter()  # type: TCounter[str]
-        self._tar_tokens = Counter()  # type: TCounter[str]
-        self._population_card_value = 0  # type: float
-
-        # initialize normalizer
-        self.normalizer = (
-            self._norm_none
-        )  # type: Callable[[float, int, float], float]  # noqa: E501
+        self._local = local()
 
         self._norm_dict = {
             'proportional': self._norm_proportional,
@@ -253,10 +366,46 @@ class _TokenDistance(_Distance):
             'complement': self._norm_complement,
         }
 
-        # initialize values for soft intersection
-        self._soft_intersection_precalc = Counter()  # type: TCounter[str]
-        self._soft_src_only = Counter()  # type: TCounter[str]
-        self._soft_tar_only = Counter()  # type: TCounter[str]
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the measure's configuration for pickling.
+
+        The per-thread comparison state is not pickled.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the measure's configuration from a pickle.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._local = local()
+
+    @property
+    def _context(self) -> _TokenContext:
+        """Return the current thread's comparison context.
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            return cast(_TokenContext, self._local.context)
+        except AttributeError:
+            context = _TokenContext(
+                '',
+                '',
+                Counter(),
+                Counter(),
+                self.params['intersection_type'],
+            )
+            self._local.context = context
+            return context
 
     @staticmethod
     def _norm_none(x: float, _squares: int, _pop: float) -> float:
@@ -286,6 +435,55 @@ class _TokenDistance(_Distance):
     def _norm_complement(x: float, _squares: int, pop: float) -> float:
         return pop - x
 
+    def prepare(self, string: str) -> TokenProfile:
+        """Return the token profile of a string.
+
+        The profile may be passed to this measure's methods (and those of
+        other measures using an identically configured tokenizer) in place of
+        the string, sparing them from tokenizing it again. Profiles are kept
+        in a bounded, least-recently-used cache shared by all measures, keyed
+        by the tokenizer's configuration and the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to profile
+
+        Returns
+        -------
+        TokenProfile
+            The string's tokens, their counts, cardinality, & norm
+
+        Examples
+        --------
+        >>> cmp = _TokenDistance()
+        >>> profile = cmp.prepare('AT')
+        >>> profile
+        TokenProfile('AT', {'$A': 1, 'AT': 1, 'T#': 1})
+        >>> profile.cardinality
+        3
+        >>> cmp.prepare('AT') is profile
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, TokenProfile):
+            return string
+        return _profile_cache.profile(self.params['tokenizer'], string)
+
+    @staticmethod
+    def _orig_string(src: Union[str, TCounter[str]]) -> Any:
+        """Return the string of a TokenProfile, or src itself otherwise.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(src, TokenProfile):
+            return src.string
+        return src
+
     def _tokenize(
         self, src: Union[str, TCounter[str]], tar: Union[str, TCounter[str]]
     ) -> '_TokenDistance':
@@ -316,23 +514,20 @@ class _TokenDistance(_Distance):
             Encapsulated in class
 
         """
-        self._src_orig = src
-        self._tar_orig = tar
-
-        if isinstance(src, Counter):
-            self._src_tokens = src
-        else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
-            )
-        if isinstance(tar, Counter):
-            self._tar_tokens = tar
-        else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
-            )
+        context = _TokenContext(
+            src,
+            tar,
+            src
+            if isinstance(src, Counter)
+            else self.params['tokenizer'].tokenize(src).get_counter(),
+            tar
+            if isinstance(tar, Counter)
+            else self.params['tokenizer'].tokenize(tar).get_counter(),
+            self.params['intersection_type'],
+        )
+        self._local.context = context
 
-        self._population_card_value = self._calc_population_card()
+        context.population_card_value = self._calc_population_card()
 
         # Set up the normalizer, a function of two variables:
         # x is the value in the contingency table square(s)
@@ -341,12 +536,7 @@ class _TokenDistance(_Distance):
             'normalizer' in self.params
             and self.params['normalizer'] in self._norm_dict
         ):
-            self.normalizer = self._norm_dict[self.params['normalizer']]
-
-        # clear values for soft intersection
-        self._soft_intersection_precalc = Counter()
-        self._soft_src_only = Counter()
-        self._soft_tar_only = Counter()
+            context.normalizer = self._norm_dict[self.params['normalizer']]
 
         return self
 
@@ -356,7 +546,7 @@ class _TokenDistance(_Distance):
 
     def _src_card(self) -> float:
         r"""Return the cardinality of the tokens in the source set."""
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self.normalizer(
@@ -369,8 +559,11 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        src_tokens = self._src_tokens
         return self.normalizer(
-            sum(abs(val) for val in self._src_tokens.values()),
+            src_tokens.cardinality
+            if isinstance(src_tokens, TokenProfile)
+            else sum(abs(val) for val in src_tokens.values()),
             2,
             self._population_card_value,
         )
@@ -380,12 +573,12 @@ class _TokenDistance(_Distance):
 
         For (multi-)sets S and T, this is :math:`S \setminus T`.
         """
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self._soft_src_only
         src_only = self._src_tokens - self._intersection()
-        if self.params['intersection_type'] != 'crisp':
+        if self._intersection_type != 'crisp':
             src_only -= self._intersection() - self._crisp_intersection()
         return src_only
 
@@ -399,7 +592,7 @@ class _TokenDistance(_Distance):
 
     def _tar_card(self) -> float:
         r"""Return the cardinality of the tokens in the target set."""
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self.normalizer(
@@ -412,8 +605,11 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        tar_tokens = self._tar_tokens
         return self.normalizer(
-            sum(abs(val) for val in self._tar_tokens.values()),
+            tar_tokens.cardinality
+            if isinstance(tar_tokens, TokenProfile)
+            else sum(abs(val) for val in tar_tokens.values()),
             2,
             self._population_card_value,
         )
@@ -423,12 +619,12 @@ class _TokenDistance(_Distance):
 
         For (multi-)sets S and T, this is :math:`T \setminus S`.
         """
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self._soft_tar_only
         tar_only = self._tar_tokens - self._intersection()
-        if self.params['intersection_type'] != 'crisp':
+        if self._intersection_type != 'crisp':
             tar_only -= self._intersection() - self._crisp_intersection()
         return tar_only
 
@@ -463,7 +659,7 @@ class _TokenDistance(_Distance):
         In the case of multisets, this counts values in the interesection
         twice. In the case of sets, this is identical to the union.
         """
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return (
@@ -508,13 +704,14 @@ class _TokenDistance(_Distance):
 
     def _calc_population_card(self) -> float:
         """Return the cardinality of the population."""
-        save_normalizer = self.normalizer
-        self.normalizer = self._norm_none
-        save_intersection = self.params['intersection_type']
-        self.params['intersection_type'] = 'crisp'
+        context = self._context
+        save_normalizer = context.normalizer
+        context.normalizer = self._norm_none
+        save_intersection = context.intersection_type
+        context.intersection_type = 'crisp'
         pop = self._total_card() + self._total_complement_card()
-        self.normalizer = save_normalizer
-        self.params['intersection_type'] = save_intersection
+        context.normalizer = save_normalizer
+        context.intersection_type = save_intersection
         return pop
 
     def _population_card(self) -> float:
@@ -536,7 +733,7 @@ class _TokenDistance(_Distance):
 
         For (multi-)sets S and T, this is :math:`S \cup T`.
         """
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return (
@@ -545,7 +742,7 @@ class _TokenDistance(_Distance):
                 + self._soft_intersection_precalc
             )
         union = self._total() - self._intersection()
-        if self.params['intersection_type'] != 'crisp':
+        if self._intersection_type != 'crisp':
             union -= self._intersection() - self._crisp_intersection()
         return union
 
@@ -559,7 +756,7 @@ class _TokenDistance(_Distance):
 
     def _difference(self) -> TCounter[str]:
         """Return the difference of the tokens, supporting negative values."""
-        if self.params['intersection_type'] == 'soft':
+        if self._intersection_type == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             _src_copy = Counter(self._soft_src_only)
@@ -989,6 +1186,154 @@ member function, such as Levenshtein."
             self._tar_only_card(),
         )
 
+    def _tokenize_many(
+        self, strings: Iterable[str]
+    ) -> List[Union[str, TCounter[str]]]:
+        """Return the token Counters of several strings.
+
+        If the measure does not accept Counters in place of strings, the
+        strings themselves are returned.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._batch_tokenize:
+            return list(strings)
+        return [
+            self.params['tokenizer'].tokenize(string).get_counter()
+            for string in strings
+        ]
+
+    def sim_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the similarities of a query to each of several choices.
+
+        Each string is tokenized only once.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of query to each of the choices
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.sim_cdist([query], choices)[0]
+
+    def dist_many(self, query: str, choices: Iterable[str]) -> np.ndarray:
+        """Return the distances of a query to each of several choices.
+
+        Each string is tokenized only once.
+
+        Parameters
+        ----------
+        query : str
+            Source string for comparison
+        choices : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of query to each of the choices
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.dist_cdist([query], choices)[0]
+
+    def sim_cdist(
+        self, srcs: Iterable[str], tars: Iterable[str]
+    ) -> np.ndarray:
+        """Return the matrix of similarities between two collections.
+
+        Each string is tokenized only once.
+
+        Parameters
+        ----------
+        srcs : Iterable[str]
+            Source strings for comparison
+        tars : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the similarity of the
+            i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> cmp.sim_cdist(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.33333333, 1.        , 0.        ],
+               [1.        , 0.33333333, 0.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_tokens = self._tokenize_many(srcs)
+        tar_tokens = self._tokenize_many(tars)
+        return np.array(
+            [
+                [self.sim(src, tar) for tar in tar_tokens]  # type: ignore
+                for src in src_tokens
+            ],
+            dtype=float,
+        ).reshape(len(src_tokens), len(tar_tokens))
+
+    def dist_cdist(
+        self, srcs: Iterable[str], tars: Iterable[str]
+    ) -> np.ndarray:
+        """Return the matrix of distances between two collections.
+
+        Each string is tokenized only once.
+
+        Parameters
+        ----------
+        srcs : Iterable[str]
+            Source strings for comparison
+        tars : Iterable[str]
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix, in which the value at [i, j] is the distance of the
+            i-th member of srcs to the j-th member of tars
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> cmp.dist_cdist(['cat', 'hat'], ['hat', 'cat', 'dog'])
+        array([[0.66666667, 0.        , 1.        ],
+               [0.        , 0.66666667, 1.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_tokens = self._tokenize_many(srcs)
+        tar_tokens = self._tokenize_many(tars)
+        return np.array(
+            [
+                [self.dist(src, tar) for tar in tar_tokens]  # type: ignore
+                for src in src_tokens
+            ],
+            dtype=float,
+        ).reshape(len(src_tokens), len(tar_tokens))
+
 
 if __name__ == '__main__':
     import doctest
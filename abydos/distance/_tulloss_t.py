@@ -103,9 +103,21 @@ class TullossT(_TokenDistance):
         super(TullossT, self).__init__(
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
-        self._r = TullossR()
-        self._s = TullossS()
-        self._u = TullossU()
+        self._r = TullossR(
+            tokenizer=self.params['tokenizer'],
+            intersection_type=intersection_type,
+            **kwargs
+        )
+        self._s = TullossS(
+            tokenizer=self.params['tokenizer'],
+            intersection_type=intersection_type,
+            **kwargs
+        )
+        self._u = TullossU(
+            tokenizer=self.params['tokenizer'],
+            intersection_type=intersection_type,
+            **kwargs
+        )
 
     def sim(self, src: str, tar: str) -> float:
         """Return Tulloss' T similarity of two strings.
@@ -0,0 +1,81 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+r"""abydos.index.
+
+The index package includes classes for searching collections of strings for
+those similar to a query, without comparing the query to every string:
+
+- :py:class:`QGramIndex`, an inverted q-gram index supporting top-k and range
+  queries for the Jaccard, Dice, Overlap, and Cosine measures
+- :py:class:`BKTree`, a Burkhard-Keller tree supporting nearest neighbor and
+  radius queries for integer-valued metrics, such as Levenshtein distance
+- :py:class:`VPTree`, a vantage-point tree supporting nearest neighbor and
+  radius queries for any metric
+- :py:class:`MinHashLSH`, a MinHash locality-sensitive hashing index
+  supporting approximate Jaccard similarity threshold queries
+- :py:class:`PhoneticBlockIndex`, a blocking index grouping records by the
+  phonetic codes of their names, for generating candidate pairs for record
+  linkage
+
+
+As a quick example of :py:class:`.QGramIndex`:
+
+>>> index = QGramIndex(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+>>> index.top_k('Neale', 2)
+[('Neal', 0.5714285714285714), ('Kneale', 0.4444444444444444)]
+>>> index.range('Neale', 0.5)
+[('Neal', 0.5714285714285714)]
+
+And of :py:class:`.BKTree`:
+
+>>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+>>> tree.nearest('Neale', 2)
+[('Neal', 1), ('Niall', 2)]
+>>> tree.within('Neale', 2)
+[('Neal', 1), ('Niall', 2), ('Neil', 2), ('Kneale', 2)]
+
+And of :py:class:`.PhoneticBlockIndex`, with Soundex & Double Metaphone:
+
+>>> from abydos.phonetic import DoubleMetaphone, Soundex
+>>> index = PhoneticBlockIndex([Soundex(), DoubleMetaphone()])
+>>> index.insert_many(enumerate(['Niall', 'Nigel', 'Schmidt', 'Smith']))
+>>> list(index.pairs())
+[(2, 3)]
+
+----
+
+"""
+
+from ._bk_tree import BKTree
+from ._minhash_lsh import MinHashLSH
+from ._phonetic_block_index import PhoneticBlockIndex
+from ._qgram_index import QGramIndex
+from ._vp_tree import VPTree
+
+__all__ = [
+    'BKTree',
+    'MinHashLSH',
+    'PhoneticBlockIndex',
+    'QGramIndex',
+    'VPTree',
+]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,246 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._bk_tree.
+
+Burkhard-Keller tree metric index
+"""
+
+from heapq import heappop, heappush
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ._metric_tree import _MetricTree
+from ..distance._distance import _Distance
+
+__all__ = ['BKTree']
+
+# A node holds the ids of one string & its duplicates (strings at distance 0
+# from it) and its children, keyed by their distance from it.
+_BKNode = Tuple[List[int], Dict[int, Any]]
+
+
+class BKTree(_MetricTree):
+    """Burkhard-Keller tree.
+
+    A BK-tree :cite:`Burkhard:1973` indexes strings under a metric with
+    integer values, such as :py:class:`abydos.distance.Levenshtein`,
+    :py:class:`abydos.distance.DamerauLevenshtein`,
+    :py:class:`abydos.distance.Hamming`, or
+    :py:class:`abydos.distance.Eudex` distance. Each child of a node holds the
+    strings at one distance from the node's string, so a search within a
+    radius r of a query at distance d from the node's string need only visit
+    the children at distances d-r through d+r.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, strings: Iterable[str] = (), metric: Optional[_Distance] = None
+    ) -> None:
+        """Initialize BKTree.
+
+        Parameters
+        ----------
+        strings : Iterable
+            Strings to add to the index
+        metric : _Distance
+            A distance measure whose absolute distance is a metric with
+            integer values, such as :py:class:`abydos.distance.Levenshtein`
+            (the default)
+
+        Raises
+        ------
+        ValueError
+            The measure is not a metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(BKTree, self).__init__(metric)
+        self._root = None  # type: Optional[_BKNode]
+
+        for string in strings:
+            self.insert(string)
+
+    def _distance(self, src: str, tar: str) -> int:
+        """Return the distance between two strings, as an int.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int
+            The absolute distance between src & tar
+
+        Raises
+        ------
+        ValueError
+            BKTree requires a metric with integer values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        dist = self._metric.dist_abs(src, tar)
+        if dist != int(dist):
+            raise ValueError(
+                'BKTree requires a metric with integer values; use VPTree '
+                + 'for real-valued metrics'
+            )
+        return int(dist)
+
+    def insert(self, string: str) -> int:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add
+
+        Returns
+        -------
+        int
+            The id of the string in the index
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neil'])
+        >>> tree.insert('Nigel')
+        2
+        >>> len(tree)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rec_id = len(self._strings)
+        if self._root is None:
+            self._root = ([rec_id], {})
+        else:
+            node = self._root
+            while True:
+                dist = self._distance(string, self._strings[node[0][0]])
+                if not dist:
+                    node[0].append(rec_id)
+                    break
+                child = node[1].get(dist)
+                if child is None:
+                    node[1][dist] = ([rec_id], {})
+                    break
+                node = child
+        self._strings.append(string)
+        return rec_id
+
+    def within(self, query: str, radius: float) -> List[Tuple[str, float]]:
+        """Return the indexed strings within radius of query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        radius : float
+            The greatest (absolute) distance of the results
+
+        Returns
+        -------
+        list
+            (string, distance) pairs, in order of increasing distance (and in
+            the order they were added for equal distances)
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> tree.within('Nell', 2)
+        [('Neil', 1), ('Neal', 1), ('Niall', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []  # type: List[Tuple[float, int]]
+        if self._root is None:
+            return []
+        stack = [self._root]
+        while stack:
+            rec_ids, children = stack.pop()
+            dist = self._distance(query, self._strings[rec_ids[0]])
+            if dist <= radius:
+                found.extend((dist, rec_id) for rec_id in rec_ids)
+            for child_dist, child in children.items():
+                if dist - radius <= child_dist <= dist + radius:
+                    stack.append(child)
+        return self._results(found)
+
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k indexed strings nearest to query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        k : int
+            The number of results to return
+
+        Returns
+        -------
+        list
+            Up to k (string, distance) pairs, in order of increasing distance
+            (and in the order they were added for equal distances)
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> tree.nearest('Nell', 3)
+        [('Neil', 1), ('Neal', 1), ('Niall', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._root is None or k < 1:
+            return []
+
+        # a heap of the k best (-distance, -id) pairs found so far
+        best = []  # type: List[Tuple[float, int]]
+        # nodes to visit, by the least distance their strings may have from
+        # the query
+        queue = [(0, 0, self._root)]  # type: List[Tuple[int, int, _BKNode]]
+        pushed = 1
+        while queue:
+            bound, _, (rec_ids, children) = heappop(queue)
+            if len(best) == k and bound > -best[0][0]:
+                break
+            dist = self._distance(query, self._strings[rec_ids[0]])
+            self._offer(best, k, dist, rec_ids)
+            for child_dist, child in children.items():
+                bound = abs(child_dist - dist)
+                if len(best) < k or bound <= -best[0][0]:
+                    heappush(queue, (bound, pushed, child))
+                    pushed += 1
+        return self._results((-dist, -rec_id) for dist, rec_id in best)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,229 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._metric_tree.
+
+The _MetricTree class: the base class for metric tree indexes
+"""
+
+from abc import ABC, abstractmethod
+from heapq import heappush, heappushpop
+from typing import Iterable, List, Optional, Tuple
+
+from ..distance import Levenshtein
+from ..distance._distance import _Distance
+
+__all__ = ['_MetricTree']
+
+
+class _MetricTree(ABC):
+    """Abstract metric tree index.
+
+    Metric trees use the triangle inequality to skip the strings that cannot
+    be within a given distance of the query, so they accept only measures
+    whose absolute distance (dist_abs) is a metric, as reported by their
+    is_metric method. Subclasses implement insert, within, & nearest.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, metric: Optional[_Distance] = None) -> None:
+        """Initialize _MetricTree.
+
+        Parameters
+        ----------
+        metric : _Distance
+            A distance measure whose absolute distance is a metric, such as
+            :py:class:`abydos.distance.Levenshtein` (the default)
+
+        Raises
+        ------
+        ValueError
+            The measure is not a metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            metric = Levenshtein()
+        if not metric.is_metric():
+            raise ValueError(
+                '{} is not a metric with these settings'.format(
+                    type(metric).__name__
+                )
+            )
+        self._metric = metric
+        self._strings = []  # type: List[str]
+
+    def __len__(self) -> int:
+        """Return the number of indexed strings.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._strings)
+
+    def __getitem__(self, index: int) -> str:
+        """Return the indexed string with the given id.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._strings[index]
+
+    def _distance(self, src: str, tar: str) -> float:
+        """Return the distance between two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            The absolute distance between src & tar
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._metric.dist_abs(src, tar)
+
+    @abstractmethod
+    def insert(self, string: str) -> int:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add
+
+        Returns
+        -------
+        int
+            The id of the string in the index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    @abstractmethod
+    def within(self, query: str, radius: float) -> List[Tuple[str, float]]:
+        """Return the indexed strings within radius of query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        radius : float
+            The greatest (absolute) distance of the results
+
+        Returns
+        -------
+        list
+            (string, distance) pairs, in order of increasing distance (and in
+            the order they were added for equal distances)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    @abstractmethod
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k indexed strings nearest to query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        k : int
+            The number of results to return
+
+        Returns
+        -------
+        list
+            Up to k (string, distance) pairs, in order of increasing distance
+            (and in the order they were added for equal distances)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    @staticmethod
+    def _offer(
+        best: List[Tuple[float, int]],
+        k: int,
+        dist: float,
+        rec_ids: Iterable[int],
+    ) -> None:
+        """Add the strings with the given ids to the k best, if they qualify.
+
+        Parameters
+        ----------
+        best : list
+            A heap of (-distance, -id) pairs, the worst first
+        k : int
+            The number of results wanted
+        dist : float
+            The distance of the strings from the query
+        rec_ids : Iterable[int]
+            The ids of the strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for rec_id in rec_ids:
+            if len(best) < k:
+                heappush(best, (-dist, -rec_id))
+            elif (-dist, -rec_id) > best[0]:
+                heappushpop(best, (-dist, -rec_id))
+
+    def _results(
+        self, found: Iterable[Tuple[float, int]]
+    ) -> List[Tuple[str, float]]:
+        """Return (string, distance) pairs, nearest first.
+
+        Parameters
+        ----------
+        found : Iterable
+            (distance, id) pairs
+
+        Returns
+        -------
+        list
+            (string, distance) pairs, in order of increasing distance & id
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [
+            (self._strings[rec_id], dist) for dist, rec_id in sorted(found)
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,333 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._minhash_lsh.
+
+MinHash locality-sensitive hashing index
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..distance import MinHash
+
+__all__ = ['MinHashLSH']
+
+
+def _collision_probability(
+    sims: np.ndarray, bands: int, rows: int
+) -> np.ndarray:
+    """Return the probability that strings become candidates.
+
+    Parameters
+    ----------
+    sims : numpy.ndarray
+        The Jaccard similarities of pairs of strings
+    bands : int
+        The number of bands
+    rows : int
+        The number of rows in each band
+
+    Returns
+    -------
+    numpy.ndarray
+        The probability that at least one band of their signatures matches
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return 1.0 - (1.0 - sims**rows) ** bands
+
+
+def _trapezoid(y: np.ndarray, x: np.ndarray) -> float:
+    """Return the integral of y over x by the trapezoidal rule.
+
+    (numpy.trapz is deprecated in NumPy 2.0, and numpy.trapezoid is absent
+    before it.)
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        The values of the function
+    x : numpy.ndarray
+        The points at which the function takes those values
+
+    Returns
+    -------
+    float
+        The integral
+
+    Examples
+    --------
+    >>> _trapezoid(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0]))
+    2.0
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return float((np.diff(x) * (y[1:] + y[:-1]) / 2.0).sum())
+
+
+def _optimal_bands(
+    threshold: float, size: int, weights: Tuple[float, float]
+) -> Tuple[int, int]:
+    """Return the bands & rows that best separate pairs at a threshold.
+
+    Parameters
+    ----------
+    threshold : float
+        The target Jaccard similarity
+    size : int
+        The length of the signatures
+    weights : tuple
+        The weights of the false positive & false negative probabilities
+
+    Returns
+    -------
+    tuple
+        The number of bands & the number of rows in each band
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    below = np.linspace(0.0, threshold, 101)
+    above = np.linspace(threshold, 1.0, 101)
+    best = (float('inf'), 1, 1)
+    for bands in range(1, size + 1):
+        for rows in range(1, size // bands + 1):
+            false_pos = _trapezoid(
+                _collision_probability(below, bands, rows), below
+            )
+            false_neg = _trapezoid(
+                1.0 - _collision_probability(above, bands, rows), above
+            )
+            error = weights[0] * false_pos + weights[1] * false_neg
+            if error < best[0]:
+                best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHashLSH:
+    """MinHash locality-sensitive hashing index.
+
+    The index finds the indexed strings whose token sets are likely to have a
+    Jaccard similarity of at least a threshold to a query's, without comparing
+    the query to every string :cite:`Leskovec:2014`. The MinHash signature of
+    each string is cut into bands of rows, and strings whose signatures agree
+    on every row of at least one band are candidates. Two strings with
+    Jaccard similarity s become candidates with probability
+    :math:`1-(1-s^r)^b` for b bands of r rows, which rises steeply around
+    :math:`(1/b)^{1/r}`.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        minhash: Optional[MinHash] = None,
+        bands: Optional[int] = None,
+        rows: Optional[int] = None,
+        weights: Tuple[float, float] = (0.5, 0.5),
+    ) -> None:
+        """Initialize MinHashLSH.
+
+        Parameters
+        ----------
+        threshold : float
+            The Jaccard similarity that candidates should reach
+        minhash : MinHash
+            The MinHash instance with which to compute signatures (by default,
+            one of 128 hash functions over bigrams)
+        bands : int
+            The number of bands
+        rows : int
+            The number of rows in each band. If either bands or rows is not
+            set, they are chosen to minimize the weighted sum of the
+            probabilities of false positives (candidates less similar than the
+            threshold) and false negatives (non-candidates at least as similar
+            as the threshold).
+        weights : tuple
+            The weights of the false positive & false negative probabilities,
+            used to choose bands & rows
+
+        Raises
+        ------
+        ValueError
+            Threshold must be in the range [0, 1]
+        ValueError
+            The bands do not fit in the signatures
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH(0.5)
+        >>> lsh.bands, lsh.rows
+        (25, 5)
+        >>> lsh = MinHashLSH(0.8)
+        >>> lsh.bands, lsh.rows
+        (9, 13)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError('Threshold must be in the range [0, 1]')
+        if minhash is None:
+            minhash = MinHash(k=128)
+        self._minhash = minhash
+        size = len(minhash.signature(''))
+
+        if bands is None or rows is None:
+            bands, rows = _optimal_bands(threshold, size, weights)
+        if bands < 1 or rows < 1 or bands * rows > size:
+            raise ValueError(
+                '{} bands of {} rows do not fit in signatures of length '
+                '{}'.format(bands, rows, size)
+            )
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+
+        self._keys = []  # type: List[Hashable]
+        self._ids = {}  # type: Dict[Hashable, int]
+        self._tables = [
+            {} for _ in range(bands)
+        ]  # type: List[Dict[bytes, List[int]]]
+
+    def __len__(self) -> int:
+        """Return the number of indexed strings.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        """Return whether a key has been inserted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return key in self._ids
+
+    def _bands(self, string: Union[str, np.ndarray]) -> List[bytes]:
+        """Return the bands of a string's signature.
+
+        Parameters
+        ----------
+        string : str or numpy.ndarray
+            A string, or its signature
+
+        Returns
+        -------
+        list
+            The bands, as bytes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, str):
+            signature = self._minhash.signature(string)
+        else:
+            signature = np.asarray(string, dtype=np.uint32)
+        rows = self.rows
+        return [
+            signature[band * rows : (band + 1) * rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: Hashable, string: Union[str, np.ndarray]) -> None:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        key : Hashable
+            A key identifying the string, such as a record id, which queries
+            return
+        string : str or numpy.ndarray
+            The string, or its signature from the index's MinHash instance
+
+        Raises
+        ------
+        ValueError
+            The key is already in the index
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH()
+        >>> lsh.insert(1, 'Christopher')
+        >>> len(lsh), 1 in lsh
+        (1, True)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if key in self._ids:
+            raise ValueError('Key {!r} is already in the index'.format(key))
+        rec_id = len(self._keys)
+        for table, band in zip(self._tables, self._bands(string)):
+            table.setdefault(band, []).append(rec_id)
+        self._ids[key] = rec_id
+        self._keys.append(key)
+
+    def query(self, string: Union[str, np.ndarray]) -> List[Hashable]:
+        """Return the keys of the candidates similar to a string.
+
+        Candidates are likely, but not certain, to have a Jaccard similarity
+        of at least the threshold to the string; verify them with a
+        similarity measure if needed.
+
+        Parameters
+        ----------
+        string : str or numpy.ndarray
+            The query string, or its signature from the index's MinHash
+            instance
+
+        Returns
+        -------
+        list
+            The keys of the candidates, in the order they were inserted
+
+        Examples
+        --------
+        >>> lsh = MinHashLSH(0.6)
+        >>> lsh.insert('a', 'Christopher')
+        >>> lsh.insert('b', 'Christophe')
+        >>> lsh.insert('c', 'Kristof')
+        >>> lsh.query('Christoph')
+        ['a', 'b']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        candidates = set()
+        for table, band in zip(self._tables, self._bands(string)):
+            candidates.update(table.get(band, ()))
+        return [self._keys[rec_id] for rec_id in sorted(candidates)]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
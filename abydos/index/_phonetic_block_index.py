@@ -0,0 +1,507 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._phonetic_block_index.
+
+Phonetic-key blocking index
+"""
+
+from collections import namedtuple
+from itertools import tee
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..phonetic._phonetic import _Phonetic
+
+__all__ = ['PhoneticBlockIndex']
+
+BlockStats = namedtuple(
+    'BlockStats',
+    [
+        'records',
+        'blocks',
+        'largest',
+        'mean_size',
+        'comparisons',
+        'reduction_ratio',
+    ],
+)
+
+# A block key: the position of the encoder in the index's list of encoders
+# and a code it returned
+_BlockKey = Tuple[int, str]
+
+
+class PhoneticBlockIndex:
+    """Phonetic-key blocking index.
+
+    The index groups records into blocks by the phonetic codes of their
+    names, so that record linkage need only compare the records within each
+    block, rather than every pair of records :cite:`Christen:2012`. Each
+    record is placed in a block for each code that each encoder returns for
+    its name: encoders that return several codes, separated by commas (such
+    as DaitchMokotoff, BeiderMorse, and DoubleMetaphone), place a record in
+    several blocks, and the codes of different encoders form separate blocks.
+
+    Candidate pairs are generated lazily, and each pair of records sharing
+    more than one block is generated only once, from the first block they
+    share, so the pairs are never collected in memory.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        encoders: Union[_Phonetic, Sequence[_Phonetic]],
+        max_block_size: Optional[int] = None,
+    ) -> None:
+        """Initialize PhoneticBlockIndex.
+
+        Parameters
+        ----------
+        encoders : _Phonetic or list
+            The phonetic algorithm, or algorithms, whose codes form the blocks
+        max_block_size : int or None
+            The greatest size of a block from which candidate pairs are
+            generated; larger blocks, such as that of a very common surname,
+            are skipped when generating pairs and querying
+
+        Raises
+        ------
+        ValueError
+            At least one encoder is required
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert_many(enumerate(['Niall', 'Neil', 'Nigel', 'Neal']))
+        >>> list(index.pairs())
+        [(0, 1), (0, 3), (1, 3)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(encoders, _Phonetic):
+            encoders = [encoders]
+        if not encoders:
+            raise ValueError('At least one encoder is required')
+        self._encoders = list(encoders)
+        self.max_block_size = max_block_size
+
+        self._keys = []  # type: List[Hashable]
+        self._ids = {}  # type: Dict[Hashable, int]
+        # the block id of each block key, and the inverse
+        self._block_ids = {}  # type: Dict[_BlockKey, int]
+        self._block_keys = []  # type: List[_BlockKey]
+        # the record ids in each block, in the order they were inserted
+        self._members = []  # type: List[List[int]]
+        # the block ids of each record, in ascending order
+        self._blocks_of = []  # type: List[Tuple[int, ...]]
+
+    def __len__(self) -> int:
+        """Return the number of indexed records.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        """Return whether a key has been inserted.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return key in self._ids
+
+    def block_keys(self, name: str) -> List[_BlockKey]:
+        """Return the keys of the blocks of a name.
+
+        Parameters
+        ----------
+        name : str
+            The name
+
+        Returns
+        -------
+        list
+            The distinct (encoder position, code) pairs of the name
+
+        Examples
+        --------
+        >>> from abydos.phonetic import DoubleMetaphone, Soundex
+        >>> index = PhoneticBlockIndex([Soundex(), DoubleMetaphone()])
+        >>> index.block_keys('Schmidt')
+        [(0, 'S530'), (1, 'XMT'), (1, 'SMT')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._block_keys_of(
+            [encoder.encode(name) for encoder in self._encoders]
+        )
+
+    @staticmethod
+    def _block_keys_of(encodings: List[str]) -> List[_BlockKey]:
+        """Return the distinct block keys of a name's encodings.
+
+        Parameters
+        ----------
+        encodings : list
+            The name's encoding by each encoder
+
+        Returns
+        -------
+        list
+            The distinct (encoder position, code) pairs, without empty codes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        keys = {}  # type: Dict[_BlockKey, None]
+        for position, encoding in enumerate(encodings):
+            for code in encoding.split(','):
+                if code:
+                    keys[(position, code)] = None
+        return list(keys)
+
+    def _insert(self, key: Hashable, block_keys: List[_BlockKey]) -> None:
+        """Add a record to the blocks with the given keys.
+
+        Parameters
+        ----------
+        key : Hashable
+            A key identifying the record
+        block_keys : list
+            The keys of its blocks
+
+        Raises
+        ------
+        ValueError
+            The key is already in the index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if key in self._ids:
+            raise ValueError('Key {!r} is already in the index'.format(key))
+        rec_id = len(self._keys)
+        block_ids = []
+        for block_key in block_keys:
+            block_id = self._block_ids.get(block_key)
+            if block_id is None:
+                block_id = self._block_ids[block_key] = len(self._members)
+                self._block_keys.append(block_key)
+                self._members.append([])
+            self._members[block_id].append(rec_id)
+            block_ids.append(block_id)
+        self._blocks_of.append(tuple(sorted(block_ids)))
+        self._ids[key] = rec_id
+        self._keys.append(key)
+
+    def insert(self, key: Hashable, name: str) -> None:
+        """Add a record to the index.
+
+        Parameters
+        ----------
+        key : Hashable
+            A key identifying the record, such as a record id, which pairs
+            and queries return
+        name : str
+            The name by whose codes the record is blocked
+
+        Raises
+        ------
+        ValueError
+            The key is already in the index
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert('a', 'Niall')
+        >>> len(index), 'a' in index
+        (1, True)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._insert(key, self.block_keys(name))
+
+    def insert_many(
+        self,
+        records: Iterable[Tuple[Hashable, str]],
+        n_jobs: Optional[int] = None,
+        chunksize: int = 1000,
+    ) -> None:
+        """Add a stream of records to the index.
+
+        The names are encoded in chunks, with each encoder's encode_many, so
+        each distinct name in a chunk is encoded once. Each encoder reads the
+        whole stream, so with n_jobs set, each starts one pool of workers.
+
+        Parameters
+        ----------
+        records : Iterable
+            (key, name) pairs
+        n_jobs : int or None
+            The number of worker processes with which to encode the names
+            (-1 for one per CPU). By default, the names are encoded in the
+            calling process.
+        chunksize : int
+            The greatest number of records in a chunk
+
+        Raises
+        ------
+        ValueError
+            A key is already in the index
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert_many([(10, 'Niall'), (11, 'Neil')])
+        >>> len(index)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        keyed, named = tee(records)
+        # each encoder encodes the whole stream of names, with a single pool
+        # of workers; the encoders are read in step, so only their chunks in
+        # flight are buffered
+        encodings = [
+            encoder.encode_many(names, n_jobs, chunksize)
+            for encoder, names in zip(
+                self._encoders,
+                tee((name for _, name in named), len(self._encoders)),
+            )
+        ]
+        for (key, _), encoding in zip(keyed, zip(*encodings)):
+            self._insert(key, self._block_keys_of(list(encoding)))
+
+    def _eligible(self, block_id: int) -> bool:
+        """Return whether a block is no larger than the greatest block size.
+
+        Parameters
+        ----------
+        block_id : int
+            The block id
+
+        Returns
+        -------
+        bool
+            True if pairs are generated from the block
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            self.max_block_size is None
+            or len(self._members[block_id]) <= self.max_block_size
+        )
+
+    def blocks(self) -> Iterator[Tuple[_BlockKey, List[Hashable]]]:
+        """Yield the blocks.
+
+        Yields
+        ------
+        tuple
+            The block key, an (encoder position, code) pair, and the keys of
+            the records in the block, in the order they were inserted
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert_many(enumerate(['Niall', 'Neil', 'Nigel']))
+        >>> list(index.blocks())
+        [((0, 'N400'), [0, 1]), ((0, 'N240'), [2])]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        keys = self._keys
+        for block_key, members in zip(self._block_keys, self._members):
+            yield block_key, [keys[rec_id] for rec_id in members]
+
+    def block_stats(self) -> BlockStats:
+        """Return statistics of the block sizes.
+
+        Returns
+        -------
+        BlockStats
+            The numbers of records & blocks, the size of the largest block,
+            the mean block size, the number of comparisons within the blocks
+            from which pairs are generated (an upper bound on the number of
+            distinct candidate pairs), and the reduction ratio: the proportion
+            of all pairs of records that those comparisons avoid
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert_many(enumerate(['Niall', 'Neil', 'Nigel', 'Neal']))
+        >>> index.block_stats()
+        BlockStats(records=4, blocks=2, largest=3, mean_size=2.0, \
+comparisons=3, reduction_ratio=0.5)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        sizes = [len(members) for members in self._members]
+        records = len(self._keys)
+        comparisons = sum(
+            size * (size - 1) // 2
+            for block_id, size in enumerate(sizes)
+            if self._eligible(block_id)
+        )
+        all_pairs = records * (records - 1) // 2
+        return BlockStats(
+            records,
+            len(sizes),
+            max(sizes, default=0),
+            sum(sizes) / len(sizes) if sizes else 0.0,
+            comparisons,
+            1.0 - comparisons / all_pairs if all_pairs else 0.0,
+        )
+
+    def _first_shared(self, first: int, second: int, block_id: int) -> bool:
+        """Return whether a block is the first eligible one two records share.
+
+        Parameters
+        ----------
+        first : int
+            A record id
+        second : int
+            Another record id
+        block_id : int
+            The id of a block both records are in
+
+        Returns
+        -------
+        bool
+            True if the records share no eligible block with a lower id
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        others = self._blocks_of[second]
+        for other_id in self._blocks_of[first]:
+            if other_id >= block_id:
+                return True
+            if other_id in others and self._eligible(other_id):
+                return False
+        return True
+
+    def pairs(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        """Yield the distinct candidate pairs.
+
+        Yields
+        ------
+        tuple
+            The keys of two records that share at least one block, the
+            earlier-inserted first; pairs are grouped by the first block they
+            share
+
+        Examples
+        --------
+        >>> from abydos.phonetic import DoubleMetaphone
+        >>> index = PhoneticBlockIndex(DoubleMetaphone())
+        >>> index.insert_many(enumerate(['Schmidt', 'Smith', 'Schmitt']))
+        >>> list(index.pairs())
+        [(0, 1), (0, 2), (1, 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        keys = self._keys
+        blocks_of = self._blocks_of
+        for block_id, members in enumerate(self._members):
+            if len(members) < 2 or not self._eligible(block_id):
+                continue
+            for pos, first in enumerate(members):
+                single = len(blocks_of[first]) == 1
+                for second in members[pos + 1 :]:
+                    if (
+                        single
+                        or len(blocks_of[second]) == 1
+                        or self._first_shared(first, second, block_id)
+                    ):
+                        yield keys[first], keys[second]
+
+    def query(self, name: str) -> List[Hashable]:
+        """Return the keys of the records sharing a block with a name.
+
+        Parameters
+        ----------
+        name : str
+            The name
+
+        Returns
+        -------
+        list
+            The keys of the records in the name's blocks (skipping blocks
+            larger than the greatest block size), in the order they were
+            inserted
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticBlockIndex(Soundex())
+        >>> index.insert_many(enumerate(['Niall', 'Neil', 'Nigel']))
+        >>> index.query('Neal')
+        [0, 1]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        candidates = set()
+        for block_key in self.block_keys(name):
+            block_id = self._block_ids.get(block_key)
+            if block_id is not None and self._eligible(block_id):
+                candidates.update(self._members[block_id])
+        return [self._keys[rec_id] for rec_id in sorted(candidates)]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,543 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._qgram_index.
+
+Inverted q-gram index for set-similarity search
+"""
+
+from collections import defaultdict
+from heapq import heappush, heappushpop
+from math import ceil, sqrt
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from ..distance import Cosine, Dice, Jaccard, Overlap
+from ..distance._token_distance import _TokenDistance
+from ..tokenizer import QGrams, _Tokenizer
+from ..tokenizer._token_profile import _tokenizer_key
+
+__all__ = ['QGramIndex']
+
+# Tolerance for floating point error in the overlap bounds, which are only
+# ever loosened by it
+_EPSILON = 1e-9
+
+
+def _jaccard_overlap(t: float, n: int, m: int) -> float:
+    return t / (1 + t) * (n + m)
+
+
+def _dice_overlap(t: float, n: int, m: int) -> float:
+    return t * (n + m) / 2
+
+
+def _cosine_overlap(t: float, n: int, m: int) -> float:
+    return t * sqrt(n * m)
+
+
+def _overlap_overlap(t: float, n: int, m: int) -> float:
+    return t * min(n, m)
+
+
+def _jaccard_sim(c: int, n: int, m: int) -> float:
+    return c / (n + m - c)
+
+
+def _dice_sim(c: int, n: int, m: int) -> float:
+    return 2 * c / (n + m)
+
+
+def _cosine_sim(c: int, n: int, m: int) -> float:
+    return c / sqrt(n * m)
+
+
+def _overlap_sim(c: int, n: int, m: int) -> float:
+    return c / min(n, m)
+
+
+def _jaccard_size(t: float, n: int) -> float:
+    return t * n
+
+
+def _dice_size(t: float, n: int) -> float:
+    return t / (2 - t) * n
+
+
+def _cosine_size(t: float, n: int) -> float:
+    return t * t * n
+
+
+def _overlap_size(t: float, n: int) -> float:
+    return 1.0
+
+
+_Filters = Tuple[
+    Callable[[float, int, int], float],
+    Callable[[int, int, int], float],
+    Callable[[float, int], float],
+]
+
+# For each supported measure: the minimum overlap of two token sets of sizes
+# n & m with similarity at least t, the similarity of sets of sizes n & m
+# with an overlap of c, and the least size of a set with similarity at least t
+# to a set of size n
+_FILTERS = {
+    Jaccard: (_jaccard_overlap, _jaccard_sim, _jaccard_size),
+    Dice: (_dice_overlap, _dice_sim, _dice_size),
+    Cosine: (_cosine_overlap, _cosine_sim, _cosine_size),
+    Overlap: (_overlap_overlap, _overlap_sim, _overlap_size),
+}  # type: Dict[Type[_TokenDistance], _Filters]
+
+
+class QGramIndex:
+    """Inverted q-gram index.
+
+    The index keeps, for each q-gram (or other token), a posting list of the
+    indexed strings containing it, and answers top-k and range (similarity
+    threshold) queries for the Jaccard, Dice, Overlap, and Cosine measures.
+
+    Range query candidates are drawn only from the posting lists of the
+    query's rarest tokens (prefix filtering :cite:`Chaudhuri:2006`) and are
+    pruned by the number of tokens they can still share with the query (count
+    filtering). Top-k query candidates are ranked by the similarity implied by
+    their overlap with the query. In either case, only the surviving
+    candidates are compared using the measure itself, so results are exactly
+    those of a linear scan.
+
+    Repeated tokens are distinguished by their occurrence number, so
+    multiset (Counter) intersections, as used by the measures, are handled
+    exactly.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Iterable[str] = (),
+        tokenizer: Optional[_Tokenizer] = None,
+    ) -> None:
+        """Initialize QGramIndex.
+
+        Parameters
+        ----------
+        strings : Iterable
+            Strings to add to the index
+        tokenizer : _Tokenizer
+            A tokenizer instance from the :py:mod:`abydos.tokenizer` package,
+            defaulting to the bigram tokenizer used by the supported
+            measures. The tokenizer must not scale counts, other than by the
+            'set' scaler.
+
+        Raises
+        ------
+        ValueError
+            The tokenizer must not scale counts, except to sets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if tokenizer is None:
+            tokenizer = QGrams()
+        scaler = getattr(tokenizer, '_scaler', None)
+        if scaler is not None and scaler != 'set':
+            raise ValueError(
+                'The tokenizer must not scale counts, except to sets'
+            )
+        self._tokenizer = tokenizer
+        self._strings = []  # type: List[str]
+        self._sizes = []  # type: List[int]
+        self._postings = defaultdict(
+            list
+        )  # type: DefaultDict[Tuple[str, int], List[int]]
+        self._empty = defaultdict(list)  # type: DefaultDict[str, List[int]]
+
+        for string in strings:
+            self.insert(string)
+
+    def __len__(self) -> int:
+        """Return the number of indexed strings.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._strings)
+
+    def __getitem__(self, index: int) -> str:
+        """Return the indexed string with the given id.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._strings[index]
+
+    def _tokens(self, string: str) -> List[Tuple[str, int]]:
+        """Return the tokens of string, numbering repeated tokens.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        list
+            (token, occurrence) pairs
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counter = self._tokenizer.tokenize(string).get_counter()
+        return [
+            (token, occurrence)
+            for token, count in counter.items()
+            for occurrence in range(int(count))
+        ]
+
+    def insert(self, string: str) -> int:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add
+
+        Returns
+        -------
+        int
+            The id of the string in the index
+
+        Examples
+        --------
+        >>> index = QGramIndex()
+        >>> index.insert('Niall')
+        0
+        >>> index.insert('Neil')
+        1
+        >>> len(index)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rec_id = len(self._strings)
+        tokens = self._tokens(string)
+        self._strings.append(string)
+        self._sizes.append(len(tokens))
+        for token in tokens:
+            self._postings[token].append(rec_id)
+        if not tokens:
+            self._empty[string].append(rec_id)
+        return rec_id
+
+    def _check_metric(
+        self, metric: Optional[_TokenDistance]
+    ) -> _TokenDistance:
+        """Return the metric to use, checking that it is supported.
+
+        Parameters
+        ----------
+        metric : _TokenDistance or None
+            The requested metric
+
+        Returns
+        -------
+        _TokenDistance
+            The metric
+
+        Raises
+        ------
+        ValueError
+            Unsupported metric
+        ValueError
+            The metric's tokenizer must be configured like the index's
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            return Jaccard(tokenizer=self._tokenizer)
+        if type(metric) not in _FILTERS:
+            raise ValueError(
+                'Unsupported metric; metric must be a Jaccard, Dice, '
+                + 'Overlap, or Cosine instance'
+            )
+        if metric.params['intersection_type'] != 'crisp' or (
+            metric.params.get('normalizer') is not None
+        ):
+            raise ValueError(
+                'Unsupported metric; only crisp, unnormalized intersections '
+                + 'are supported'
+            )
+        tok_key = _tokenizer_key(self._tokenizer)
+        if tok_key is None or tok_key != _tokenizer_key(
+            metric.params['tokenizer']
+        ):
+            raise ValueError(
+                "The metric's tokenizer must be configured like the index's"
+            )
+        return metric
+
+    def _query_tokens(self, query: str) -> List[Tuple[str, int]]:
+        """Return the query's tokens, rarest first.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+
+        Returns
+        -------
+        list
+            The query's (token, occurrence) pairs, ordered by the length of
+            their posting lists
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        postings = self._postings
+        return sorted(
+            self._tokens(query),
+            key=lambda token: len(postings[token]) if token in postings else 0,
+        )
+
+    def range(
+        self,
+        query: str,
+        min_sim: float,
+        metric: Optional[_TokenDistance] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return the indexed strings at least min_sim similar to query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        min_sim : float
+            The minimum similarity of the results
+        metric : Jaccard, Dice, Overlap, or Cosine
+            The similarity measure, which must use a tokenizer configured like
+            the index's (Jaccard by default)
+
+        Returns
+        -------
+        list
+            (string, similarity) pairs, in order of decreasing similarity
+            (and in the order they were added for equal similarities)
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice
+        >>> index = QGramIndex(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> index.range('Niel', 0.25)
+        [('Nigel', 0.5714285714285714), ('Niall', 0.375), ('Neil', 0.25),
+        ('Neal', 0.25)]
+        >>> index.range('Niel', 0.5, Dice())
+        [('Nigel', 0.7272727272727273), ('Niall', 0.5454545454545454)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        metric = self._check_metric(metric)
+        query_profile = metric.prepare(query)
+
+        if min_sim <= 0:
+            # every string qualifies
+            candidates = range(len(self._strings))  # type: Iterable[int]
+        else:
+            candidates = self._range_candidates(
+                self._query_tokens(query), query, min_sim, type(metric)
+            )
+
+        results = []
+        for rec_id in candidates:
+            sim = metric.sim(query_profile, self._strings[rec_id])
+            if sim >= min_sim:
+                results.append((rec_id, sim))
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return [(self._strings[rec_id], sim) for rec_id, sim in results]
+
+    def _range_candidates(
+        self,
+        tokens: List[Tuple[str, int]],
+        query: str,
+        min_sim: float,
+        metric_type: Type[_TokenDistance],
+    ) -> List[int]:
+        """Return the candidates of a range query that survive filtering.
+
+        Parameters
+        ----------
+        tokens : list
+            The query's tokens, rarest first
+        query : str
+            The query string
+        min_sim : float
+            The minimum similarity, greater than 0
+        metric_type : type
+            The type of the similarity measure
+
+        Returns
+        -------
+        list
+            The ids of the surviving candidates
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        n = len(tokens)
+        if not n:
+            # only identical strings have non-zero similarity
+            return list(self._empty.get(query, ()))
+        min_overlap, _, min_size = _FILTERS[metric_type]
+
+        # The required overlap grows with the size of the indexed string, so
+        # every qualifying string shares at least min_alpha tokens with the
+        # query, hence at least one of its first n - min_alpha + 1 tokens.
+        smallest = max(1, ceil(min_size(min_sim, n) - _EPSILON))
+        min_alpha = max(1, ceil(min_overlap(min_sim, n, smallest) - _EPSILON))
+        prefix_len = max(0, n - min_alpha + 1)
+
+        counts = defaultdict(int)  # type: DefaultDict[int, int]
+        postings = self._postings
+        for token in tokens[:prefix_len]:
+            for rec_id in postings.get(token, ()):
+                counts[rec_id] += 1
+
+        # Count filtering: a candidate can share at most the tokens it shares
+        # in the prefix plus every token after it.
+        remaining = n - prefix_len
+        sizes = self._sizes
+        return [
+            rec_id
+            for rec_id, count in counts.items()
+            if count + min(remaining, sizes[rec_id] - count)
+            >= ceil(min_overlap(min_sim, n, sizes[rec_id]) - _EPSILON)
+        ]
+
+    def top_k(
+        self,
+        query: str,
+        k: int = 10,
+        metric: Optional[_TokenDistance] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return the k indexed strings most similar to query.
+
+        Only strings with non-zero similarity to the query are returned.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        k : int
+            The number of results to return
+        metric : Jaccard, Dice, Overlap, or Cosine
+            The similarity measure, which must use a tokenizer configured like
+            the index's (Jaccard by default)
+
+        Returns
+        -------
+        list
+            Up to k (string, similarity) pairs, in order of decreasing
+            similarity (and in the order they were added for equal
+            similarities)
+
+        Examples
+        --------
+        >>> from abydos.distance import Cosine
+        >>> index = QGramIndex(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> index.top_k('Nial', 2)
+        [('Niall', 0.8333333333333334), ('Neal', 0.42857142857142855)]
+        >>> index.top_k('Nial', 2, Cosine())
+        [('Niall', 0.9128709291752769), ('Neal', 0.6)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        metric = self._check_metric(metric)
+        if k < 1:
+            return []
+
+        tokens = self._query_tokens(query)
+        n = len(tokens)
+        query_profile = metric.prepare(query)
+        if not n:
+            # only identical strings can have non-zero similarity
+            return [
+                (self._strings[rec_id], sim)
+                for rec_id, sim in (
+                    (rec_id, metric.sim(query_profile, self._strings[rec_id]))
+                    for rec_id in self._empty.get(query, ())
+                )
+                if sim
+            ][:k]
+
+        _, overlap_sim, _ = _FILTERS[type(metric)]
+        sizes = self._sizes
+        strings = self._strings
+
+        # As repeated tokens are numbered, counting a string's occurrences in
+        # the query's posting lists gives the exact size of its intersection
+        # with the query, and so its similarity, which the measure need only
+        # confirm for the best candidates.
+        counts = defaultdict(int)  # type: DefaultDict[int, int]
+        for token in tokens:
+            for rec_id in self._postings.get(token, ()):
+                counts[rec_id] += 1
+        candidates = sorted(
+            (-overlap_sim(count, n, sizes[rec_id]), rec_id)
+            for rec_id, count in counts.items()
+        )
+
+        # a min-heap of the best (similarity, -id) pairs found so far
+        best = []  # type: List[Tuple[float, int]]
+        for neg_estimate, rec_id in candidates:
+            if len(best) == k and _EPSILON - neg_estimate < best[0][0]:
+                break
+            sim = metric.sim(query_profile, strings[rec_id])
+            if not sim:
+                continue
+            if len(best) < k:
+                heappush(best, (sim, -rec_id))
+            elif (sim, -rec_id) > best[0]:
+                heappushpop(best, (sim, -rec_id))
+
+        return [
+            (strings[-neg_id], sim)
+            for sim, neg_id in sorted(best, reverse=True)
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
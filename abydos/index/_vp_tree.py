@@ -0,0 +1,353 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._vp_tree.
+
+Vantage-point tree metric index
+"""
+
+from heapq import heappop, heappush
+from typing import Iterable, List, Optional, Tuple, Union
+
+from ._metric_tree import _MetricTree
+from ..distance._distance import _Distance
+
+__all__ = ['VPTree']
+
+
+class _VPNode:
+    """A vantage point & its two subtrees.
+
+    The inside subtree holds the strings at most mu from the vantage point;
+    the outside subtree holds the rest. Each subtree also records the least
+    and greatest distances of its strings from the vantage point.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = (
+        'rec_ids',
+        'mu',
+        'inside',
+        'outside',
+        'in_min',
+        'in_max',
+        'out_min',
+        'out_max',
+    )
+
+    def __init__(self, rec_ids: List[int], mu: float) -> None:
+        """Initialize _VPNode.
+
+        Parameters
+        ----------
+        rec_ids : list
+            The ids of the vantage point & its duplicates
+        mu : float
+            The greatest distance from the vantage point of the inside
+            subtree's strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.rec_ids = rec_ids
+        self.mu = mu
+        self.inside = []  # type: Union[_VPNode, List[int]]
+        self.outside = []  # type: Union[_VPNode, List[int]]
+        self.in_min = self.out_min = float('inf')
+        self.in_max = self.out_max = float('-inf')
+
+
+class VPTree(_MetricTree):
+    """Vantage-point tree.
+
+    A VP-tree :cite:`Yianilos:1993` indexes strings under any metric,
+    including real-valued ones. Each node picks a vantage point and splits
+    the remaining strings into those at most the median distance, mu, from it
+    and those further away, so that a search within a radius r of a query at
+    distance d from the vantage point can skip the inside when d-r > mu or
+    the outside when d+r <= mu.
+
+    Strings added after the tree is built descend to a leaf, which is split
+    once it holds more than leaf_size strings.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Iterable[str] = (),
+        metric: Optional[_Distance] = None,
+        leaf_size: int = 8,
+    ) -> None:
+        """Initialize VPTree.
+
+        Parameters
+        ----------
+        strings : Iterable
+            Strings to add to the index
+        metric : _Distance
+            A distance measure whose absolute distance is a metric, such as
+            :py:class:`abydos.distance.Levenshtein` (the default)
+        leaf_size : int
+            The greatest number of strings a leaf holds before it is split
+
+        Raises
+        ------
+        ValueError
+            The measure is not a metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(VPTree, self).__init__(metric)
+        self._leaf_size = max(1, leaf_size)
+        self._strings = list(strings)
+        self._root = self._build(
+            list(range(len(self._strings)))
+        )  # type: Union[_VPNode, List[int]]
+
+    def _build(self, rec_ids: List[int]) -> Union[_VPNode, List[int]]:
+        """Return a (sub)tree holding the given strings.
+
+        Parameters
+        ----------
+        rec_ids : list
+            The ids of the strings
+
+        Returns
+        -------
+        _VPNode or list
+            A node, or a leaf (a list of ids) if there are no more than
+            leaf_size strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(rec_ids) <= self._leaf_size:
+            return rec_ids
+
+        vantage = self._strings[rec_ids[0]]
+        dups = [rec_ids[0]]
+        others = []
+        for rec_id in rec_ids[1:]:
+            dist = self._distance(self._strings[rec_id], vantage)
+            if dist:
+                others.append((dist, rec_id))
+            else:
+                dups.append(rec_id)
+        others.sort()
+
+        if not others:
+            return _VPNode(dups, 0)
+
+        mu = others[(len(others) - 1) // 2][0]
+        if mu == others[-1][0] and others[0][0] < mu:
+            # keep the outside from being empty
+            mu = max(dist for dist, _ in others if dist < mu)
+        node = _VPNode(dups, mu)
+        inside = [rec_id for dist, rec_id in others if dist <= mu]
+        outside = [rec_id for dist, rec_id in others if dist > mu]
+        node.in_min = others[0][0]
+        node.in_max = others[len(inside) - 1][0]
+        if outside:
+            node.out_min = others[len(inside)][0]
+            node.out_max = others[-1][0]
+            node.outside = self._build(outside)
+        # Strings that are all equidistant from the vantage point are kept in
+        # a leaf, as no vantage point among them would split them.
+        node.inside = (
+            inside if node.in_min == node.in_max else self._build(inside)
+        )
+        return node
+
+    def insert(self, string: str) -> int:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add
+
+        Returns
+        -------
+        int
+            The id of the string in the index
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neil'])
+        >>> tree.insert('Nigel')
+        2
+        >>> len(tree)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rec_id = len(self._strings)
+        parent = None  # type: Optional[_VPNode]
+        is_inside = False
+        node = self._root
+        while isinstance(node, _VPNode):
+            dist = self._distance(string, self._strings[node.rec_ids[0]])
+            if not dist:
+                node.rec_ids.append(rec_id)
+                self._strings.append(string)
+                return rec_id
+            parent = node
+            is_inside = dist <= node.mu
+            if is_inside:
+                node.in_min = min(node.in_min, dist)
+                node.in_max = max(node.in_max, dist)
+                node = node.inside
+            else:
+                node.out_min = min(node.out_min, dist)
+                node.out_max = max(node.out_max, dist)
+                node = node.outside
+
+        self._strings.append(string)
+        node.append(rec_id)
+        if len(node) > self._leaf_size:
+            subtree = self._build(node)
+            if parent is None:
+                self._root = subtree
+            elif is_inside:
+                parent.inside = subtree
+            else:
+                parent.outside = subtree
+        return rec_id
+
+    def within(self, query: str, radius: float) -> List[Tuple[str, float]]:
+        """Return the indexed strings within radius of query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        radius : float
+            The greatest (absolute) distance of the results
+
+        Returns
+        -------
+        list
+            (string, distance) pairs, in order of increasing distance (and in
+            the order they were added for equal distances)
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> tree.within('Nell', 2)
+        [('Neil', 1), ('Neal', 1), ('Niall', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []  # type: List[Tuple[float, int]]
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, _VPNode):
+                for rec_id in node:
+                    dist = self._distance(query, self._strings[rec_id])
+                    if dist <= radius:
+                        found.append((dist, rec_id))
+                continue
+
+            dist = self._distance(query, self._strings[node.rec_ids[0]])
+            if dist <= radius:
+                found.extend((dist, rec_id) for rec_id in node.rec_ids)
+            if dist - radius <= node.in_max and dist + radius >= node.in_min:
+                stack.append(node.inside)
+            if dist - radius <= node.out_max and dist + radius >= node.out_min:
+                stack.append(node.outside)
+        return self._results(found)
+
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k indexed strings nearest to query.
+
+        Parameters
+        ----------
+        query : str
+            The query string
+        k : int
+            The number of results to return
+
+        Returns
+        -------
+        list
+            Up to k (string, distance) pairs, in order of increasing distance
+            (and in the order they were added for equal distances)
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Kneale'])
+        >>> tree.nearest('Nell', 3)
+        [('Neil', 1), ('Neal', 1), ('Niall', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if k < 1:
+            return []
+
+        # a heap of the k best (-distance, -id) pairs found so far
+        best = []  # type: List[Tuple[float, int]]
+        # subtrees to visit, by the least distance their strings may have
+        # from the query
+        queue = [
+            (0.0, 0, self._root)
+        ]  # type: List[Tuple[float, int, Union[_VPNode, List[int]]]]
+        pushed = 1
+        while queue:
+            bound, _, node = heappop(queue)
+            if len(best) == k and bound > -best[0][0]:
+                break
+            if not isinstance(node, _VPNode):
+                for rec_id in node:
+                    self._offer(
+                        best,
+                        k,
+                        self._distance(query, self._strings[rec_id]),
+                        (rec_id,),
+                    )
+                continue
+
+            dist = self._distance(query, self._strings[node.rec_ids[0]])
+            self._offer(best, k, dist, node.rec_ids)
+            for subtree, low, high in (
+                (node.inside, node.in_min, node.in_max),
+                (node.outside, node.out_min, node.out_max),
+            ):
+                if low > high:
+                    continue
+                bound = max(0.0, low - dist, dist - high)
+                if len(best) < k or bound <= -best[0][0]:
+                    heappush(queue, (bound, pushed, subtree))
+                    pushed += 1
+        return self._results((-dist, -rec_id) for dist, rec_id in best)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
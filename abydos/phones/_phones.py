@@ -20,9 +20,13 @@ The phones module implements phonetic feature coding, decoding, and comparison
 functions.
 """
 
-from typing import Dict, List, Optional, Sequence, Union
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from unicodedata import normalize
 
+import numpy as np
+
 __all__ = ['cmp_features', 'get_feature', 'ipa_to_features']
 
 
@@ -571,6 +575,28 @@ _FEATURE_MASK = {
     'delayed_release': 3,
 }
 
+# The length of the longest symbol in _PHONETIC_FEATURES
+_MAX_SYMLEN = max(len(_) for _ in _PHONETIC_FEATURES)
+
+# Segment ids: each distinct feature bundle in _PHONETIC_FEATURES is interned
+# as an id from 1; id 0 stands for an unknown segment (feature bundle -1)
+_SEGMENTS = np.array(
+    [-1] + sorted(set(_PHONETIC_FEATURES.values())), dtype=np.int64
+)
+_SEGMENT_IDS = {int(feat): seg_id for seg_id, feat in enumerate(_SEGMENTS)}
+
+# Feature comparison tables, keyed by normalized weights; only the most
+# recently used _FEATURE_TABLES_SIZE tables are kept
+_FEATURE_TABLES = (
+    OrderedDict()
+)  # type: OrderedDict[Optional[Tuple[float, ...]], np.ndarray]
+_FEATURE_TABLES_SIZE = 8
+_FEATURE_TABLES_LOCK = Lock()
+
+# Segment ids of recently tokenized IPA strings
+_SEGMENT_ID_CACHE = {}  # type: Dict[str, Tuple[int, ...]]
+_SEGMENT_ID_CACHE_SIZE = 65536
+
 
 def ipa_to_features(ipa: str) -> List[int]:
     """Convert IPA to features.
@@ -604,14 +630,13 @@ def ipa_to_features(ipa: str) -> List[int]:
     features = []
     pos = 0
     ipa = normalize('NFD', ipa.lower())
+    ipa_len = len(ipa)
 
-    maxsymlen = max(len(_) for _ in _PHONETIC_FEATURES)
-
-    while pos < len(ipa):
+    while pos < ipa_len:
         found_match = False
-        for i in range(maxsymlen, 0, -1):
+        for i in range(_MAX_SYMLEN, 0, -1):
             if (
-                pos + i - 1 <= len(ipa)
+                pos + i - 1 <= ipa_len
                 and ipa[pos : pos + i] in _PHONETIC_FEATURES
             ):
                 features.append(_PHONETIC_FEATURES[ipa[pos : pos + i]])
@@ -625,6 +650,47 @@ def ipa_to_features(ipa: str) -> List[int]:
     return features
 
 
+def _ipa_to_segment_ids(ipa: str) -> Tuple[int, ...]:
+    """Convert IPA to segment ids.
+
+    This tokenizes an IPA string exactly as :py:func:`ipa_to_features` does,
+    but returns the interned id of each segment's feature bundle, which
+    indexes the tables returned by :py:func:`_feature_table`. Results are
+    cached.
+
+    Parameters
+    ----------
+    ipa : str
+        The IPA representation of a phone or series of phones
+
+    Returns
+    -------
+    tuple of ints
+        The segment ids, with 0 for unknown segments
+
+    Examples
+    --------
+    >>> ids = _ipa_to_segment_ids('mut')
+    >>> [int(_SEGMENTS[_]) for _ in ids] == ipa_to_features('mut')
+    True
+    >>> _ipa_to_segment_ids('m?t')[1]
+    0
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    seg_ids = _SEGMENT_ID_CACHE.get(ipa)
+    if seg_ids is None:
+        seg_ids = tuple(
+            _SEGMENT_IDS.get(feat, 0) for feat in ipa_to_features(ipa)
+        )
+        if len(_SEGMENT_ID_CACHE) >= _SEGMENT_ID_CACHE_SIZE:
+            _SEGMENT_ID_CACHE.clear()
+        _SEGMENT_ID_CACHE[ipa] = seg_ids
+    return seg_ids
+
+
 def ipa_to_feature_dicts(ipa: str) -> List[Dict[str, str]]:
     """Convert IPA to a feature dict list.
 
@@ -889,6 +955,47 @@ def get_feature(vector: List[int], feature: str) -> List[Union[int, float]]:
     return retvec
 
 
+def _normalize_weights(
+    weights: Optional[
+        Union[Sequence[Union[int, float]], Dict[str, Union[int, float]]]
+    ],
+) -> Optional[Tuple[Union[int, float], ...]]:
+    """Return feature weights as a tuple, in the order of _FEATURE_MASK.
+
+    Parameters
+    ----------
+    weights : None or list or tuple or dict
+        Feature weights, as accepted by :py:func:`cmp_features`
+
+    Returns
+    -------
+    tuple or None
+        The weights, padded with 0s to the number of features, or None if
+        all features are of equal significance
+
+    Raises
+    ------
+    TypeError
+        weights must be a dist, list, or tuple.
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if weights is None:
+        return None
+    if isinstance(weights, dict):
+        return tuple(
+            weights[feature] if feature in weights else 0
+            for feature in sorted(
+                _FEATURE_MASK, key=_FEATURE_MASK.get, reverse=True
+            )
+        )
+    if isinstance(weights, (list, tuple)):
+        return tuple(weights) + (0,) * (len(_FEATURE_MASK) - len(weights))
+    raise TypeError('weights must be a dist, list, or tuple.')
+
+
 def cmp_features(
     feat1: int,
     feat2: int,
@@ -944,6 +1051,9 @@ def cmp_features(
     .. versionadded:: 0.1.0
     .. versionchanged:: 0.4.1
         Added weights parameter for modifiable feature weighting
+    .. versionchanged:: 0.6.0
+        Comparisons are looked up in the feature comparison table of the
+        weighting, if one has been built
 
     """
     if feat1 < 0 or feat2 < 0:
@@ -951,20 +1061,12 @@ def cmp_features(
     if feat1 == feat2:
         return 1.0
 
-    # This should be handled some other way since this will take a long time
-    # when done repeatedly. Maybe convert to a class & save the weights list.
-    if weights is not None:
-        if isinstance(weights, dict):
-            weights = [
-                weights[feature] if feature in weights else 0
-                for feature in sorted(
-                    _FEATURE_MASK, key=_FEATURE_MASK.get, reverse=True
-                )
-            ]
-        elif isinstance(weights, (list, tuple)):
-            weights = list(weights) + [0] * (len(_FEATURE_MASK) - len(weights))
-        else:
-            raise TypeError('weights must be a dist, list, or tuple.')
+    weights = _normalize_weights(weights)
+    # a table is only looked up, never built: building one costs far more
+    # than a single comparison
+    table = _cached_feature_table(weights)
+    if table is not None and feat1 in _SEGMENT_IDS and feat2 in _SEGMENT_IDS:
+        return float(table[_SEGMENT_IDS[feat1], _SEGMENT_IDS[feat2]])
 
     magnitude = sum(weights) if weights else len(_FEATURE_MASK)
 
@@ -1000,6 +1102,93 @@ def cmp_features(
     return 1 - (0 if not diffbits else (diffbits / (2 * magnitude)))
 
 
+def _cached_feature_table(
+    weights: Optional[Tuple[Union[int, float], ...]] = None
+) -> Optional[np.ndarray]:
+    """Return the feature comparison table for a weighting, if it is cached.
+
+    Parameters
+    ----------
+    weights : None or tuple
+        Feature weights, as returned by :py:func:`_normalize_weights`
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The table built by :py:func:`_feature_table`, or None if it is not
+        cached
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    with _FEATURE_TABLES_LOCK:
+        table = _FEATURE_TABLES.get(weights)
+        if table is not None:
+            _FEATURE_TABLES.move_to_end(weights)
+        return table
+
+
+def _feature_table(
+    weights: Optional[Tuple[Union[int, float], ...]] = None
+) -> np.ndarray:
+    """Return the feature comparison table for a weighting.
+
+    The table holds :py:func:`cmp_features` of every pair of segments, indexed
+    by the segment ids returned by :py:func:`_ipa_to_segment_ids`. It is built
+    by the same sequence of floating point operations as
+    :py:func:`cmp_features` uses, so lookups equal direct comparisons. Tables
+    are cached for the most recently used weightings.
+
+    Parameters
+    ----------
+    weights : None or tuple
+        Feature weights, as returned by :py:func:`_normalize_weights`
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only square table of comparisons
+
+    Examples
+    --------
+    >>> table = _feature_table()
+    >>> l, n = _ipa_to_segment_ids('ln')
+    >>> float(table[l, n]) == cmp_features(
+    ...     ipa_to_features('l')[0], ipa_to_features('n')[0])
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    table = _cached_feature_table(weights)
+    if table is not None:
+        return table
+
+    magnitude = sum(weights) if weights else len(_FEATURE_MASK)
+    featxor = _SEGMENTS[:, None] ^ _SEGMENTS[None, :]
+    diffbits = np.zeros(featxor.shape, dtype=float)
+    for i in range(len(_FEATURE_MASK)):
+        weight = weights[i] if weights else 1
+        for bit in (2 * i, 2 * i + 1):
+            diffbits = np.where(
+                (featxor >> bit) & 1, diffbits + weight, diffbits
+            )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table = np.where(diffbits == 0, 1.0, 1 - (diffbits / (2 * magnitude)))
+    # unknown segments are dissimilar to everything, including each other
+    table[0, :] = 0.0
+    table[:, 0] = 0.0
+    table.flags.writeable = False
+
+    with _FEATURE_TABLES_LOCK:
+        _FEATURE_TABLES[weights] = table
+        if len(_FEATURE_TABLES) > _FEATURE_TABLES_SIZE:
+            _FEATURE_TABLES.popitem(last=False)
+    return table
+
+
 if __name__ == '__main__':
     import doctest
 
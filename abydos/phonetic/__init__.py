@@ -97,6 +97,13 @@ encoding, as demonstrated below:
 >>> rus.encode_alpha('Abramson')
 'ABRMCN'
 
+To encode many words, ``encode_many`` streams the encodings of an iterable of
+words, in order, optionally dividing the words among a pool of worker
+processes:
+
+>>> list(rus.encode_many(['Abramson', 'Abrams', 'Abramson'], n_jobs=2))
+['128637', '1286', '128637']
+
 ----
 
 """
@@ -23,8 +23,8 @@
 Beider-Morse Phonetic Matching (BMPM) algorithm
 """
 
-from re import search
-from typing import Any, Optional, Tuple, Union
+from re import compile as re_compile
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 from unicodedata import normalize
 
 from ._beider_morse_data import (
@@ -121,6 +121,124 @@ _LCONTEXT_POS = 1
 _RCONTEXT_POS = 2
 _PHONETIC_POS = 3
 
+# A compiled rule: (pattern, pattern length, compiled left context or None,
+# compiled right context or None, phonetic value)
+_CompiledRule = Tuple[
+    str, int, Optional[Pattern[str]], Optional[Pattern[str]], str
+]
+# Compiled rules, in their original order, indexed by their first character
+_RuleIndex = Dict[str, Tuple[_CompiledRule, ...]]
+# The rules, the common final rules, and the language-specific final rules
+_Tables = Tuple[_RuleIndex, _RuleIndex, _RuleIndex]
+# A compiled language rule: (regex, languages, accept)
+_LanguageRule = Tuple[Pattern[str], int, bool]
+
+# Compiled tables by (name_mode, match_mode, language index)
+_COMPILED_TABLES = {}  # type: Dict[Tuple[str, str, int], _Tables]
+# Compiled language rules by name_mode
+_COMPILED_LANGUAGE_RULES = {}  # type: Dict[str, Tuple[_LanguageRule, ...]]
+
+
+def _compile_rules(rules: Tuple[Tuple[str, str, str, str], ...]) -> _RuleIndex:
+    """Compile a table of rules and index it by first pattern character.
+
+    The context regexes are compiled exactly as they are applied: the right
+    context prefixed with ^ and the left context suffixed with $.
+
+    Parameters
+    ----------
+    rules : tuple
+        A table of (pattern, left context, right context, phonetic) rules
+
+    Returns
+    -------
+    dict
+        The compiled rules whose patterns begin with each character, in the
+        order of the table
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    index = {}  # type: Dict[str, List[_CompiledRule]]
+    for rule in rules:
+        pattern = rule[_PATTERN_POS]
+        lcontext = rule[_LCONTEXT_POS]
+        rcontext = rule[_RCONTEXT_POS]
+        index.setdefault(pattern[:1], []).append(
+            (
+                pattern,
+                len(pattern),
+                re_compile(lcontext + '$') if lcontext else None,
+                re_compile('^' + rcontext) if rcontext else None,
+                rule[_PHONETIC_POS],
+            )
+        )
+    return {char: tuple(char_rules) for char, char_rules in index.items()}
+
+
+def _compiled_tables(
+    name_mode: str, match_mode: str, language: int
+) -> _Tables:
+    """Return the compiled rule tables for a mode & language.
+
+    The tables are compiled on first use and cached.
+
+    Parameters
+    ----------
+    name_mode : str
+        The name mode of the algorithm: ``gen``, ``ash``, or ``sep``
+    match_mode : str
+        Matching mode: ``approx`` or ``exact``
+    language : int
+        The language index
+
+    Returns
+    -------
+    tuple
+        The compiled rules, common final rules, and language-specific final
+        rules
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    key = (name_mode, match_mode, language)
+    if key not in _COMPILED_TABLES:
+        _COMPILED_TABLES[key] = (
+            _compile_rules(BMDATA[name_mode]['rules'][language]),
+            _compile_rules(BMDATA[name_mode][match_mode]['common']),
+            _compile_rules(BMDATA[name_mode][match_mode][language]),
+        )
+    return _COMPILED_TABLES[key]
+
+
+def _compiled_language_rules(name_mode: str) -> Tuple[_LanguageRule, ...]:
+    """Return the compiled language guessing rules for a name mode.
+
+    Parameters
+    ----------
+    name_mode : str
+        The name mode of the algorithm: ``gen``, ``ash``, or ``sep``
+
+    Returns
+    -------
+    tuple
+        (compiled regex, languages, accept) rules
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if name_mode not in _COMPILED_LANGUAGE_RULES:
+        _COMPILED_LANGUAGE_RULES[name_mode] = tuple(
+            (re_compile(letters), languages, accept)
+            for letters, languages, accept in BMDATA[name_mode][
+                'language_rules'
+            ]
+        )
+    return _COMPILED_LANGUAGE_RULES[name_mode]
+
 
 class BeiderMorse(_Phonetic):
     """Beider-Morse Phonetic Matching.
@@ -152,17 +270,19 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Use precompiled language rules
 
         """
         name = name.strip().lower()
-        rules = BMDATA[name_mode]['language_rules']
+        rules = _compiled_language_rules(name_mode)
         all_langs = (
             sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
         )
         choices_remaining = all_langs
         for rule in rules:
             letters, languages, accept = rule
-            if search(letters, name) is not None:
+            if letters.search(name) is not None:
                 if accept:
                     choices_remaining &= languages
                 else:
@@ -175,9 +295,9 @@ class BeiderMorse(_Phonetic):
         self,
         term: str,
         name_mode: str,
-        rules: Tuple[Any, ...],
-        final_rules1: Tuple[Any, ...],
-        final_rules2: Tuple[Any, ...],
+        rules: _RuleIndex,
+        final_rules1: _RuleIndex,
+        final_rules2: _RuleIndex,
         concat: bool,
     ) -> str:
         """Reassess the language of the terms and call the phonetic encoder.
@@ -191,12 +311,12 @@ class BeiderMorse(_Phonetic):
         name_mode : str
             The name mode of the algorithm: ``gen`` (default),
             ``ash`` (Ashkenazi), or ``sep`` (Sephardic)
-        rules : tuple
-            The set of initial phonetic transform regexps
-        final_rules1 : tuple
-            The common set of final phonetic transform regexps
-        final_rules2 : tuple
-            The specific set of final phonetic transform regexps
+        rules : dict
+            The compiled initial phonetic transform regexps
+        final_rules1 : dict
+            The compiled common final phonetic transform regexps
+        final_rules2 : dict
+            The compiled language-specific final phonetic transform regexps
         concat : bool
             A flag to indicate concatenation
 
@@ -209,6 +329,8 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Take compiled rule tables
 
         """
         language_arg = self._language(term, name_mode)
@@ -226,9 +348,9 @@ class BeiderMorse(_Phonetic):
         self,
         term: str,
         name_mode: str,
-        rules: Tuple[Any, ...],
-        final_rules1: Tuple[Any, ...],
-        final_rules2: Tuple[Any, ...],
+        rules: _RuleIndex,
+        final_rules1: _RuleIndex,
+        final_rules2: _RuleIndex,
         language_arg: int = 0,
         concat: bool = False,
     ) -> str:
@@ -241,12 +363,12 @@ class BeiderMorse(_Phonetic):
         name_mode : str
             The name mode of the algorithm: ``gen`` (default),
             ``ash`` (Ashkenazi), or ``sep`` (Sephardic)
-        rules : tuple
-            The set of initial phonetic transform regexps
-        final_rules1 : tuple
-            The common set of final phonetic transform regexps
-        final_rules2 : tuple
-            The specific set of final phonetic transform regexps
+        rules : dict
+            The compiled initial phonetic transform regexps
+        final_rules1 : dict
+            The compiled common final phonetic transform regexps
+        final_rules2 : dict
+            The compiled language-specific final phonetic transform regexps
         language_arg : int
             The language of the term
         concat : bool
@@ -261,6 +383,8 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Take compiled rule tables
 
         """
         term = term.replace('-', ' ').strip()
@@ -350,12 +474,9 @@ class BeiderMorse(_Phonetic):
                 skip -= 1
                 continue
             found = False
-            for rule in rules:
-                pattern = rule[_PATTERN_POS]
-                pattern_length = len(pattern)
-                lcontext = rule[_LCONTEXT_POS]
-                rcontext = rule[_RCONTEXT_POS]
-
+            for pattern, pattern_length, left, right, target in rules.get(
+                term[i], ()
+            ):
                 # check to see if next sequence in input matches the string in
                 # the rule
                 if (pattern_length > term_length - i) or (
@@ -363,22 +484,19 @@ class BeiderMorse(_Phonetic):
                 ):  # no match
                     continue
 
-                right = '^' + rcontext
-                left = lcontext + '$'
-
                 # check that right context is satisfied
-                if rcontext != '':
-                    if not search(right, term[i + pattern_length :]):
+                if right is not None:
+                    if not right.search(term[i + pattern_length :]):
                         continue
 
                 # check that left context is satisfied
-                if lcontext != '':
-                    if not search(left, term[:i]):
+                if left is not None:
+                    if not left.search(term[:i]):
                         continue
 
                 # check for incompatible attributes
                 candidate = self._apply_rule_if_compat(
-                    phonetic, rule[_PHONETIC_POS], language_arg
+                    phonetic, target, language_arg
                 )
                 # The below condition shouldn't ever be false
                 if candidate is not None:  # pragma: no branch
@@ -408,7 +526,7 @@ class BeiderMorse(_Phonetic):
     def _apply_final_rules(
         self,
         phonetic: str,
-        final_rules: Tuple[Any, ...],
+        final_rules: _RuleIndex,
         language_arg: int,
         strip: bool,
     ) -> str:
@@ -418,8 +536,8 @@ class BeiderMorse(_Phonetic):
         ----------
         phonetic : str
             The term to which to apply the final rules
-        final_rules : tuple
-            The set of final phonetic transform regexps
+        final_rules : dict
+            The compiled final phonetic transform regexps
         language_arg : int
             An integer representing the target language of the phonetic
             encoding
@@ -435,6 +553,8 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Take compiled rule tables
 
         """
         # optimization to save time
@@ -465,15 +585,13 @@ class BeiderMorse(_Phonetic):
                         i += 1
                     continue
 
-                for rule in final_rules:
-                    pattern = rule[_PATTERN_POS]
-                    pattern_length = len(pattern)
-                    lcontext = rule[_LCONTEXT_POS]
-                    rcontext = rule[_RCONTEXT_POS]
-
-                    right = '^' + rcontext
-                    left = lcontext + '$'
-
+                for (
+                    pattern,
+                    pattern_length,
+                    left,
+                    right,
+                    target,
+                ) in final_rules.get(phoneticx[i : i + 1], ()):
                     # check to see if next sequence in phonetic matches the
                     # string in the rule
                     if (pattern_length > len(phoneticx) - i) or phoneticx[
@@ -482,18 +600,18 @@ class BeiderMorse(_Phonetic):
                         continue
 
                     # check that right context is satisfied
-                    if rcontext != '':
-                        if not search(right, phoneticx[i + pattern_length :]):
+                    if right is not None:
+                        if not right.search(phoneticx[i + pattern_length :]):
                             continue
 
                     # check that left context is satisfied
-                    if lcontext != '':
-                        if not search(left, phoneticx[:i]):
+                    if left is not None:
+                        if not left.search(phoneticx[:i]):
                             continue
 
                     # check for incompatible attributes
                     candidate = self._apply_rule_if_compat(
-                        phonetic2, rule[_PHONETIC_POS], language_arg
+                        phonetic2, target, language_arg
                     )
                     # The below condition shouldn't ever be false
                     if candidate is not None:  # pragma: no branch
@@ -1002,9 +1120,9 @@ class BeiderMorse(_Phonetic):
             language_arg, self._name_mode
         )
 
-        rules = BMDATA[self._name_mode]['rules'][language_arg2]
-        final_rules1 = BMDATA[self._name_mode][self._match_mode]['common']
-        final_rules2 = BMDATA[self._name_mode][self._match_mode][language_arg2]
+        rules, final_rules1, final_rules2 = _compiled_tables(
+            self._name_mode, self._match_mode, language_arg2
+        )
 
         result = self._phonetic(
             word,
@@ -19,6 +19,10 @@
 Eudex phonetic hash
 """
 
+from typing import Iterable, Optional
+
+import numpy as np
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Eudex']
@@ -241,6 +245,59 @@ class Eudex(_Phonetic):
 
         return str(hash_value)
 
+    def encode_array(
+        self,
+        words: Iterable[str],
+        n_jobs: Optional[int] = None,
+        chunksize: int = 1000,
+    ) -> np.ndarray:
+        """Return the eudex hashes of a stream of words as an array.
+
+        The hashes are packed into a contiguous array of 64-bit unsigned
+        integers, which can be saved with numpy.save and later loaded with
+        numpy.load(path, mmap_mode='r'), to be compared against queries by
+        the vectorized methods of :py:class:`abydos.distance.Eudex` without
+        being read into memory.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to transform
+        n_jobs : int or None
+            The number of worker processes (-1 for one per CPU). By default,
+            the words are encoded in the calling process.
+        chunksize : int
+            The greatest number of words in a chunk
+
+        Returns
+        -------
+        numpy.ndarray
+            The eudex hash of each word, as numpy.uint64
+
+        Raises
+        ------
+        ValueError
+            Hashes of more than 8 characters do not fit in 64 bits
+
+        Examples
+        --------
+        >>> pe = Eudex()
+        >>> pe.encode_array(['Colin', 'Niall'])
+        array([432345564238053650, 648518346341351840], dtype=uint64)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._max_length > 8:
+            raise ValueError(
+                'Hashes of more than 8 characters do not fit in 64 bits'
+            )
+        return np.fromiter(
+            (int(code) for code in self.encode_many(words, n_jobs, chunksize)),
+            dtype=np.uint64,
+        )
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,9 +19,10 @@
 Michigan LEIN (Law Enforcement Information Network) encoding
 """
 
-from unicodedata import normalize as unicode_normalize
+from typing import List
 
 from ._phonetic import _Phonetic
+from ._transducer import _Transducer
 
 __all__ = ['LEIN']
 
@@ -61,6 +62,17 @@ class LEIN(_Phonetic):
         self._max_length = max_length
         self._zero_pad = zero_pad
 
+        codes = {chr(key): code for key, code in self._trans.items()}
+        codes.update((chr(key), '') for key in self._del_trans if key != 32)
+        self._transducer = _Transducer(
+            codes,
+            first='prefix',  # Rule 1
+            collapse='letters',  # Rules 2 & 3
+            drop=None,
+            max_length=max_length,
+            zero_pad=zero_pad,
+        )
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic LEIN code for a word.
 
@@ -122,21 +134,32 @@ class LEIN(_Phonetic):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Coded by a table-driven transducer
 
         """
-        # uppercase, normalize, decompose, and filter non-A-Z out
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        # uppercase, normalize, decompose, filter non-A-Z out, and apply
+        # rules 1-4
+        return self._transducer.encode(word)
 
-        code = word[:1]  # Rule 1
-        word = word[1:].translate(self._del_trans)  # Rule 2
-        word = self._delete_consecutive_repeats(word)  # Rule 3
-        code += word.translate(self._trans)  # Rule 4
+    def _encode_batch(self, words: List[str]) -> List[str]:
+        """Return the LEIN codes for a batch of distinct words.
 
-        if self._zero_pad:
-            code += '0' * self._max_length  # Rule 4
+        Parameters
+        ----------
+        words : list
+            The words to transform
 
-        return code[: self._max_length]
+        Returns
+        -------
+        list
+            The LEIN code of each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._transducer.encode_many(words)
 
 
 if __name__ == '__main__':
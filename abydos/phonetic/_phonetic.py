@@ -20,6 +20,9 @@ The phonetic._phonetic module implements abstract class Phonetic.
 """
 
 from itertools import groupby
+from typing import Iterable, Iterator, List, Optional
+
+from ..util._parallel import _map_unique
 
 __all__ = ['_Phonetic']
 
@@ -102,6 +105,78 @@ class _Phonetic:
         """
         return self.encode(word)
 
+    def encode_many(
+        self,
+        words: Iterable[str],
+        n_jobs: Optional[int] = None,
+        chunksize: int = 1000,
+    ) -> Iterator[str]:
+        """Encode a stream of words phonetically.
+
+        The words are read in chunks, and each distinct word in a chunk is
+        encoded once. If n_jobs is set, the chunks are divided among a pool of
+        worker processes, each of which receives a copy of this encoder once,
+        when it starts.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to transform
+        n_jobs : int or None
+            The number of worker processes (-1 for one per CPU). By default,
+            the words are encoded in the calling process.
+        chunksize : int
+            The greatest number of words in a chunk
+
+        Yields
+        ------
+        str
+            The encoding of each word, in the order of the words
+
+        Raises
+        ------
+        ValueError
+            chunksize must be at least 1
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> list(Soundex().encode_many(['Niall', 'Neil', 'Niall', 'Smith']))
+        ['N400', 'N400', 'N400', 'S530']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # checked here, since _map_unique checks only once it is iterated
+        if chunksize < 1:
+            raise ValueError('chunksize must be at least 1')
+        return _map_unique(
+            self, '_encode_batch', words, n_jobs, chunksize, batched=True
+        )
+
+    def _encode_batch(self, words: List[str]) -> List[str]:
+        """Encode a batch of distinct words phonetically.
+
+        Encoders that can encode a batch of words more quickly than one word
+        at a time override this.
+
+        Parameters
+        ----------
+        words : list
+            The words to transform
+
+        Returns
+        -------
+        list
+            The encoding of each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [self.encode(word) for word in words]
+
 
 if __name__ == '__main__':
     import doctest
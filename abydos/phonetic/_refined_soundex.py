@@ -19,9 +19,10 @@
 Refined Soundex
 """
 
-from unicodedata import normalize as unicode_normalize
+from typing import List
 
 from ._phonetic import _Phonetic
+from ._transducer import _Transducer
 
 __all__ = ['RefinedSoundex']
 
@@ -70,6 +71,14 @@ class RefinedSoundex(_Phonetic):
         self._zero_pad = zero_pad
         self._retain_vowels = retain_vowels
 
+        self._transducer = _Transducer(
+            {chr(key): code for key, code in self._trans.items()},
+            first='prefix',
+            drop=None if retain_vowels else '0',  # Delete vowels, H, W, Y
+            max_length=max_length if max_length > 0 else None,
+            zero_pad=zero_pad,
+        )
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic Refined Soundex code for a word.
 
@@ -131,24 +140,32 @@ class RefinedSoundex(_Phonetic):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Coded by a table-driven transducer
+
+        """
+        # uppercase, normalize, decompose, filter non-A-Z out, and apply the
+        # Soundex algorithm
+        return self._transducer.encode(word)
+
+    def _encode_batch(self, words: List[str]) -> List[str]:
+        """Return the Refined Soundex codes for a batch of distinct words.
+
+        Parameters
+        ----------
+        words : list
+            The words to transform
+
+        Returns
+        -------
+        list
+            The Refined Soundex value of each word
+
+
+        .. versionadded:: 0.6.0
 
         """
-        # uppercase, normalize, decompose, and filter non-A-Z out
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
-
-        # apply the Soundex algorithm
-        sdx = word[:1] + word[1:].translate(self._trans)
-        sdx = self._delete_consecutive_repeats(sdx)
-        if not self._retain_vowels:
-            sdx = sdx.replace('0', '')  # Delete vowels, H, W, Y
-
-        if self._max_length > 0:
-            if self._zero_pad:
-                sdx += '0' * self._max_length
-            sdx = sdx[: self._max_length]
-
-        return sdx
+        return self._transducer.encode_many(words)
 
 
 if __name__ == '__main__':
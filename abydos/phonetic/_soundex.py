@@ -19,10 +19,11 @@
 American Soundex
 """
 
-from typing import Any
+from typing import Any, List
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._transducer import _Transducer
 
 __all__ = ['Soundex']
 
@@ -102,6 +103,19 @@ class Soundex(_Phonetic):
         self._reverse = reverse
         self._zero_pad = zero_pad
 
+        codes = {chr(key): code for key, code in self._trans.items()}
+        # H & W are vowels under the special rules, but otherwise separate
+        # consonants with the same code (rule 1)
+        hw_code = '0' if var == 'special' else ''
+        codes['H'] = codes['W'] = hw_code
+        self._transducer = _Transducer(
+            codes,
+            max_length=self._max_length,
+            zero_pad=zero_pad,
+            reverse=reverse,
+            empty=None if zero_pad else '0',
+        )
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic Soundex code for a word.
 
@@ -184,6 +198,8 @@ class Soundex(_Phonetic):
             Encapsulated in class
         .. versionchanged:: 0.6.0
             Made return a str only (comma-separated)
+        .. versionchanged:: 0.6.0
+            Coded by a table-driven transducer
 
         """
         # uppercase, normalize, decompose, and filter non-A-Z out
@@ -204,37 +220,31 @@ class Soundex(_Phonetic):
                 )
             # Otherwise, proceed as usual (var='American' mode, ostensibly)
 
-        word = ''.join(c for c in word if c in self._uc_set)
-
-        # Nothing to convert, return base case
-        if not word:
-            if self._zero_pad:
-                return '0' * self._max_length
-            return '0'
+        # filter non-A-Z out and apply the Soundex algorithm
+        return self._transducer.code(
+            self._transducer.letters(word, normalize=False)
+        )
 
-        # Reverse word if computing Reverse Soundex
-        if self._reverse:
-            word = word[::-1]
+    def _encode_batch(self, words: List[str]) -> List[str]:
+        """Return the Soundex codes for a batch of distinct words.
 
-        # apply the Soundex algorithm
-        sdx = word.translate(self._trans)
+        Parameters
+        ----------
+        words : list
+            The words to transform
 
-        if self._var == 'special':
-            sdx = sdx.replace('9', '0')  # special rule for 1880-1910 census
-        else:
-            sdx = sdx.replace('9', '')  # rule 1
-        sdx = self._delete_consecutive_repeats(sdx)  # rule 3
+        Returns
+        -------
+        list
+            The Soundex value of each word
 
-        if word[0] in 'HW':
-            sdx = word[0] + sdx
-        else:
-            sdx = word[0] + sdx[1:]
-        sdx = sdx.replace('0', '')  # rule 1
 
-        if self._zero_pad:
-            sdx += '0' * self._max_length  # rule 4
+        .. versionadded:: 0.6.0
 
-        return sdx[: self._max_length]
+        """
+        if self._var == 'Census':
+            return [self.encode(word) for word in words]
+        return self._transducer.encode_many(words)
 
 
 if __name__ == '__main__':
@@ -19,9 +19,10 @@
 SoundexBR
 """
 
-from unicodedata import normalize as unicode_normalize
+from typing import List, Tuple
 
 from ._phonetic import _Phonetic
+from ._transducer import _Transducer
 
 __all__ = ['SoundexBR']
 
@@ -61,6 +62,13 @@ class SoundexBR(_Phonetic):
         self._max_length = max_length
         self._zero_pad = zero_pad
 
+        self._transducer = _Transducer(
+            {chr(key): code for key, code in self._trans.items()},
+            first='prefix',
+            max_length=max_length,
+            zero_pad=zero_pad,
+        )
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic SoundexBR encoding of a word.
 
@@ -130,35 +138,67 @@ class SoundexBR(_Phonetic):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Coded by a table-driven transducer
+
+        """
+        return self._transducer.code(
+            *self._first(self._transducer.letters(word))
+        )
+
+    def _encode_batch(self, words: List[str]) -> List[str]:
+        """Return the SoundexBR encodings of a batch of distinct words.
+
+        Parameters
+        ----------
+        words : list
+            The words to transform
+
+        Returns
+        -------
+        list
+            The SoundexBR code of each word
+
+
+        .. versionadded:: 0.6.0
 
         """
-        word = unicode_normalize('NFKD', word.upper())
-        word = ''.join(c for c in word if c in self._uc_set)
+        rests, firsts = zip(
+            *(self._first(_) for _ in self._transducer.letters_many(words))
+        )
+        return self._transducer.code_many(list(rests), list(firsts))
+
+    @staticmethod
+    def _first(word: str) -> Tuple[str, str]:
+        """Return the letters of a word to code and its initial.
+
+        Parameters
+        ----------
+        word : str
+            The letters of a word (A-Z)
 
+        Returns
+        -------
+        tuple
+            The letters after the initial and the initial
+
+
+        .. versionadded:: 0.6.0
+
+        """
         if word[:2] == 'WA':
-            first = 'V'
-        elif word[:1] == 'K' and word[1:2] in {'A', 'O', 'U'}:
-            first = 'C'
-        elif word[:1] == 'C' and word[1:2] in {'I', 'E'}:
-            first = 'S'
-        elif word[:1] == 'G' and word[1:2] in {'E', 'I'}:
-            first = 'J'
-        elif word[:1] == 'Y':
-            first = 'I'
-        elif word[:1] == 'H':
-            first = word[1:2]
-            word = word[1:]
-        else:
-            first = word[:1]
-
-        sdx = first + word[1:].translate(self._trans)
-        sdx = self._delete_consecutive_repeats(sdx)
-        sdx = sdx.replace('0', '')
-
-        if self._zero_pad:
-            sdx += '0' * self._max_length
-
-        return sdx[: self._max_length]
+            return word[1:], 'V'
+        if word[:1] == 'K' and word[1:2] in {'A', 'O', 'U'}:
+            return word[1:], 'C'
+        if word[:1] == 'C' and word[1:2] in {'I', 'E'}:
+            return word[1:], 'S'
+        if word[:1] == 'G' and word[1:2] in {'E', 'I'}:
+            return word[1:], 'J'
+        if word[:1] == 'Y':
+            return word[1:], 'I'
+        if word[:1] == 'H':
+            return word[2:], word[1:2]
+        return word[1:], word[:1]
 
 
 if __name__ == '__main__':
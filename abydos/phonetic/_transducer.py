@@ -0,0 +1,368 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic._transducer.
+
+The phonetic._transducer module implements _Transducer, the table-driven core
+of the Soundex family of letter-class codes.
+"""
+
+from typing import Dict, List, Optional
+from unicodedata import normalize as unicode_normalize
+
+__all__ = ['_Transducer']
+
+# Joins the words of a batch, which are transduced together
+_SEP = '\x00'
+
+
+class _Transducer:
+    """Letter-class code transducer.
+
+    The Soundex family of codes normalize a word to its letters (A-Z), map
+    each letter to the code of its class, collapse runs of a repeated code,
+    handle the first letter specially, drop the code of vowels, and pad or
+    truncate the result. A _Transducer runs these steps with str.translate
+    and other bulk string operations, from tables that the encoders declare,
+    and does so for a whole batch of words at once, joining the words so that
+    each step is a single call over the batch.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        codes: Dict[str, str],
+        first: Optional[str] = 'replace',
+        collapse: str = 'codes',
+        drop: Optional[str] = '0',
+        max_length: Optional[int] = 4,
+        zero_pad: bool = True,
+        reverse: bool = False,
+        empty: Optional[str] = None,
+    ) -> None:
+        """Initialize _Transducer.
+
+        Parameters
+        ----------
+        codes : dict
+            The code of each letter (A-Z), which are the only characters
+            kept; letters with the code '' are deleted before runs are
+            collapsed
+        first : str or None
+            How the first letter is handled:
+
+                - ``replace`` -- the first letter replaces its own code,
+                  unless that code is deleted (as in Soundex)
+                - ``prefix`` -- the first letter precedes the codes of the
+                  remaining letters
+                - None -- every letter is coded
+
+        collapse : str
+            What runs are collapsed:
+
+                - ``codes`` -- runs of a repeated code
+                - ``letters`` -- runs of a repeated letter, before coding
+                - ``none`` -- nothing
+
+        drop : str or None
+            A code dropped after runs are collapsed (typically the vowels'
+            code, 0)
+        max_length : int or None
+            The length to which codes are padded (if zero_pad is set) and
+            truncated, or None to neither pad nor truncate
+        zero_pad : bool
+            Pad codes with 0s to max_length
+        reverse : bool
+            Reverse the letters of each word before coding them
+        empty : str or None
+            The code of a word with no letters (whose first letter is not
+            given separately), if it is not the code that the steps produce
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.first = first
+        self.collapse = collapse
+        self.drop = drop
+        self.max_length = max_length
+        self.zero_pad = zero_pad
+        self.reverse = reverse
+        self.empty = empty
+
+        self._deleted = {letter for letter, code in codes.items() if not code}
+        # the ASCII characters other than the letters, which are deleted
+        # after other characters are dropped by encoding to ASCII
+        self._others = bytes(
+            char for char in range(128) if chr(char) not in codes
+        )
+        self._others_joined = self._others.replace(_SEP.encode(), b'')
+        self._codes = {
+            ord(letter): code or None for letter, code in codes.items()
+        }
+        self._codes[ord(_SEP)] = _SEP
+        self._delete = {ord(letter): None for letter in self._deleted}
+        self._drop = {ord(drop): None} if drop else {}
+        self._pad = '0' * max_length if zero_pad and max_length else ''
+
+        if collapse == 'codes':
+            repeated = set(codes.values()) - {''}
+        elif collapse == 'letters':
+            repeated = set(codes) - self._deleted
+        else:
+            repeated = set()
+        self._runs = [(char * 2, char) for char in sorted(repeated)]
+
+    def _collapse(self, string: str) -> str:
+        """Collapse the runs of each repeated character in a string.
+
+        Parameters
+        ----------
+        string : str
+            Letters or codes, possibly of a batch of words joined by the
+            separator
+
+        Returns
+        -------
+        str
+            The string with each run replaced by a single character
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for double, single in self._runs:
+            while double in string:
+                string = string.replace(double, single)
+        return string
+
+    def _transduce(self, letters: str) -> str:
+        """Return the collapsed codes of a string of letters.
+
+        The string may be a single word's letters or a batch of words'
+        letters, joined by the separator.
+
+        Parameters
+        ----------
+        letters : str
+            Letters (A-Z)
+
+        Returns
+        -------
+        str
+            The codes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.collapse == 'letters':
+            letters = self._collapse(letters.translate(self._delete))
+            return letters.translate(self._codes)
+        return self._collapse(letters.translate(self._codes))
+
+    def letters(self, word: str, normalize: bool = True) -> str:
+        """Return the letters of a word, uppercased & decomposed.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        normalize : bool
+            Uppercase & decompose (NFKD) the word before keeping its letters;
+            set this to False if it has already been done
+
+        Returns
+        -------
+        str
+            Its letters (A-Z)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if normalize:
+            word = unicode_normalize('NFKD', word.upper())
+        return (
+            word.encode('ascii', 'ignore')
+            .translate(None, self._others)
+            .decode('ascii')
+        )
+
+    def letters_many(self, words: List[str]) -> List[str]:
+        """Return the letters of each of a batch of words.
+
+        Parameters
+        ----------
+        words : list
+            The words
+
+        Returns
+        -------
+        list
+            The letters of each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        joined = _SEP.join(words)
+        if joined.count(_SEP) != len(words) - 1:
+            # some word contains the separator
+            return [self.letters(word) for word in words]
+        return (
+            unicode_normalize('NFKD', joined.upper())
+            .encode('ascii', 'ignore')
+            .translate(None, self._others_joined)
+            .decode('ascii')
+            .split(_SEP)
+        )
+
+    def code(self, letters: str, first: Optional[str] = None) -> str:
+        """Return the code of a word's letters.
+
+        Parameters
+        ----------
+        letters : str
+            The letters of a word (A-Z)
+        first : str or None
+            The first letter, if it has been determined separately from the
+            letters, which then exclude it (under the ``prefix`` policy)
+
+        Returns
+        -------
+        str
+            The code
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.empty is not None and not letters and first is None:
+            return self.empty
+        if self.reverse:
+            letters = letters[::-1]
+        if first is None:
+            first = letters[:1] if self.first else ''
+            if self.first == 'prefix':
+                letters = letters[1:]
+        codes = self._transduce(letters)
+        if self.first == 'replace' and first not in self._deleted:
+            codes = codes[1:]
+        return (first + codes.translate(self._drop) + self._pad)[
+            : self.max_length
+        ]
+
+    def code_many(
+        self, letters: List[str], firsts: Optional[List[str]] = None
+    ) -> List[str]:
+        """Return the codes of a batch of words' letters.
+
+        Parameters
+        ----------
+        letters : list
+            The letters of each word (A-Z)
+        firsts : list or None
+            The first letter of each word, if they have been determined
+            separately from the letters, which then exclude them (under the
+            ``prefix`` policy)
+
+        Returns
+        -------
+        list
+            The codes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        empty = None  # type: Optional[List[bool]]
+        if self.empty is not None and firsts is None:
+            empty = [not _ for _ in letters]
+        if self.reverse:
+            letters = [_[::-1] for _ in letters]
+        if firsts is None:
+            firsts = [_[:1] for _ in letters] if self.first else None
+            if self.first == 'prefix':
+                letters = [_[1:] for _ in letters]
+        codes = self._transduce(_SEP.join(letters)).split(_SEP)
+        if self.first == 'replace':
+            deleted = self._deleted
+            codes = [
+                code if first in deleted else code[1:]
+                for first, code in zip(firsts, codes)  # type: ignore
+            ]
+        if self._drop:
+            codes = _SEP.join(codes).translate(self._drop).split(_SEP)
+        pad, max_length = self._pad, self.max_length
+        if firsts is None:
+            results = [(code + pad)[:max_length] for code in codes]
+        else:
+            results = [
+                (first + code + pad)[:max_length]
+                for first, code in zip(firsts, codes)
+            ]
+        if empty is not None:
+            return [
+                self.empty if is_empty else code
+                for is_empty, code in zip(empty, results)
+            ]
+        return results
+
+    def encode(self, word: str) -> str:
+        """Return the code of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word
+
+        Returns
+        -------
+        str
+            The code
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.code(self.letters(word))
+
+    def encode_many(self, words: List[str]) -> List[str]:
+        """Return the codes of a batch of words.
+
+        Parameters
+        ----------
+        words : list
+            The words
+
+        Returns
+        -------
+        list
+            The code of each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.code_many(self.letters_many(words))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
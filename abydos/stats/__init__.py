@@ -70,6 +70,10 @@ Two pairwise functions are provided:
       mean, and standard deviation of pairwise similarities between two
       collections
 
+Both can divide the pairs among a pool of worker processes (n_jobs) or a
+supplied executor, with each worker returning only summary statistics of its
+share.
+
 The confusion table class (:py:class:`.ConfusionTable`) can be constructed in
 a number of ways:
 
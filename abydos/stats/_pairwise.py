@@ -19,19 +19,474 @@
 The stats._pairwise module implements pairwise statistical algorithms.
 """
 
-from typing import Callable, Optional, Sequence, Set, Tuple, Union, cast
-
-from ._mean import amean, hmean, std
+from concurrent.futures import Executor, ProcessPoolExecutor
+from math import exp, inf
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from ._mean import amean, gmean, hmean, std
+from ..distance._distance import _Distance
 from ..distance._levenshtein import Levenshtein
+from ..util._parallel import _apply_in_worker, _init_worker, _n_workers
 
 __all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
 
 
+def _batch_metric(
+    metric: Callable[[str, str], float]
+) -> Optional[Callable[[str, Sequence[str]], np.ndarray]]:
+    """Return the one-to-many form of a metric, if it has one.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+
+    Returns
+    -------
+    function or None
+        The sim_many method of the _Distance instance, if metric is the sim
+        method of a _Distance instance, otherwise None
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(getattr(metric, '__self__', None), _Distance) and (
+        getattr(metric, '__name__', None) == 'sim'
+    ):
+        return cast(_Distance, metric.__self__).sim_many  # type: ignore
+    return None
+
+
+class _PairwiseAggregate:
+    """Streaming summary of a set of pairwise similarity values.
+
+    Besides the count, sum, sum of squares, minimum, and maximum, the
+    number of zeros and the sums of the reciprocals and logarithms of the
+    non-zero values are kept, so that the arithmetic, geometric, and
+    harmonic means can all be recovered from a merged summary.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty _PairwiseAggregate.
+
+        .. versionadded:: 0.6.0
+        """
+        self.count = 0
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self.min = inf
+        self.max = -inf
+        self.zeros = 0
+        self.recip_sum = 0.0
+        self.log_sum = 0.0
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add a batch of values to the summary.
+
+        Parameters
+        ----------
+        values : iterable
+            Similarity values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vals = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values),
+            dtype=np.float64,
+        )
+        if not vals.size:
+            return
+        self.count += int(vals.size)
+        self.sum += float(vals.sum())
+        self.sumsq += float(np.dot(vals, vals))
+        self.min = min(self.min, float(vals.min()))
+        self.max = max(self.max, float(vals.max()))
+        nonzero = vals[vals != 0]
+        self.zeros += int(vals.size - nonzero.size)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.recip_sum += float((1.0 / nonzero).sum())
+            self.log_sum += float(np.log(nonzero).sum())
+
+    def merge(self, other: '_PairwiseAggregate') -> None:
+        """Merge another summary into this one.
+
+        Parameters
+        ----------
+        other : _PairwiseAggregate
+            The summary to merge into this one
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.count += other.count
+        self.sum += other.sum
+        self.sumsq += other.sumsq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zeros += other.zeros
+        self.recip_sum += other.recip_sum
+        self.log_sum += other.log_sum
+
+    def mean(self, mean_func: Callable[[Sequence[float]], float]) -> float:
+        """Return the mean of the summarized values.
+
+        Parameters
+        ----------
+        mean_func : function
+            One of amean, gmean, or hmean
+
+        Returns
+        -------
+        float
+            The mean, computed as mean_func would compute it
+
+        Raises
+        ------
+        ValueError
+            no similarity values to aggregate
+        ValueError
+            mean_func must be amean, gmean, or hmean when computing in
+            parallel
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self.count:
+            raise ValueError('no similarity values to aggregate')
+        if mean_func is amean:
+            return self.sum / self.count
+        if mean_func is gmean:
+            if self.zeros:
+                return 0.0
+            return exp(self.log_sum / self.count)
+        if mean_func is hmean:
+            if self.count == 1 or self.min == self.max:
+                return self.min
+            if self.zeros:
+                return float('nan') if self.zeros > 1 else 0
+            return self.count / self.recip_sum
+        raise ValueError(
+            'mean_func must be amean, gmean, or hmean when computing in '
+            + 'parallel'
+        )
+
+    def std(self, mean_func: Callable[[Sequence[float]], float]) -> float:
+        """Return the population standard deviation about a mean.
+
+        Parameters
+        ----------
+        mean_func : function
+            One of amean, gmean, or hmean
+
+        Returns
+        -------
+        float
+            The standard deviation of the values about the mean given by
+            mean_func
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        x_bar = self.mean(mean_func)
+        variance = (
+            self.sumsq - 2 * x_bar * self.sum + self.count * x_bar * x_bar
+        ) / self.count
+        return max(variance, 0.0) ** 0.5
+
+
+def _shards(total: int, n_shards: int) -> List[Tuple[int, int]]:
+    """Split range(total) into up to n_shards contiguous (start, stop) pairs.
+
+    Parameters
+    ----------
+    total : int
+        The size of the index space
+    n_shards : int
+        The maximum number of shards
+
+    Returns
+    -------
+    list
+        The (start, stop) pairs
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    n_shards = max(1, min(n_shards, total))
+    bounds = [total * k // n_shards for k in range(n_shards + 1)]
+    return [
+        (bounds[k], bounds[k + 1])
+        for k in range(n_shards)
+        if bounds[k] < bounds[k + 1]
+    ]
+
+
+def _aggregate_row(
+    agg: _PairwiseAggregate,
+    metric: Callable[[str, str], float],
+    src: str,
+    tars: Sequence[str],
+    symmetric: bool,
+) -> None:
+    """Add the similarities of src to each of tars to an aggregate.
+
+    Parameters
+    ----------
+    agg : _PairwiseAggregate
+        The aggregate to update
+    metric : function
+        A similarity metric function
+    src : str
+        The source string
+    tars : list
+        The target strings
+    symmetric : bool
+        Set to True to also add the similarities of each of tars to src
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    sim_many = _batch_metric(metric)
+    if sim_many is not None:
+        agg.update(sim_many(src, tars))
+    else:
+        agg.update(metric(src, tar) for tar in tars)
+    if symmetric:
+        agg.update(metric(tar, src) for tar in tars)
+
+
+def _mean_pairwise_shard(
+    collection: Sequence[str],
+    metric: Callable[[str, str], float],
+    symmetric: bool,
+    start: int,
+    stop: int,
+) -> _PairwiseAggregate:
+    """Aggregate a slice of the upper triangle of pairwise similarities.
+
+    The pairs (i, j), i < j, are numbered in row-major order, and those
+    numbered from start up to (but not including) stop are aggregated.
+
+    Parameters
+    ----------
+    collection : list
+        The collection of terms
+    metric : function
+        A similarity metric function
+    symmetric : bool
+        Set to True if similarities should be calculated in both directions
+    start : int
+        The index of the first pair
+    stop : int
+        The index after the last pair
+
+    Returns
+    -------
+    _PairwiseAggregate
+        The aggregate of the slice
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    agg = _PairwiseAggregate()
+    n = len(collection)
+    i = 0
+    pos = start
+    while pos >= n - 1 - i:
+        pos -= n - 1 - i
+        i += 1
+    j = i + 1 + pos
+    remaining = stop - start
+    while remaining > 0:
+        row_stop = min(n, j + remaining)
+        _aggregate_row(
+            agg, metric, collection[i], collection[j:row_stop], symmetric
+        )
+        remaining -= row_stop - j
+        i += 1
+        j = i + 1
+    return agg
+
+
+def _statistics_shard(
+    src_collection: Sequence[str],
+    tar_collection: Sequence[str],
+    metric: Callable[[str, str], float],
+    symmetric: bool,
+    start: int,
+    stop: int,
+) -> _PairwiseAggregate:
+    """Aggregate the similarities of a slice of sources to all targets.
+
+    Parameters
+    ----------
+    src_collection : list
+        The source terms
+    tar_collection : list
+        The target terms
+    metric : function
+        A similarity metric function
+    symmetric : bool
+        Set to True if similarities should be calculated in both directions
+    start : int
+        The index of the first source term
+    stop : int
+        The index after the last source term
+
+    Returns
+    -------
+    _PairwiseAggregate
+        The aggregate of the slice
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    agg = _PairwiseAggregate()
+    for src in src_collection[start:stop]:
+        _aggregate_row(agg, metric, src, tar_collection, symmetric)
+    return agg
+
+
+class _ShardJob:
+    """A shard function with its leading arguments.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, shard_func: Callable[..., _PairwiseAggregate], args: Tuple
+    ) -> None:
+        """Initialize _ShardJob.
+
+        Parameters
+        ----------
+        shard_func : function
+            A picklable function taking args followed by start & stop indices
+            and returning a _PairwiseAggregate
+        args : tuple
+            The leading arguments to shard_func
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.shard_func = shard_func
+        self.args = args
+
+    def aggregate(self, bounds: Tuple[int, int]) -> _PairwiseAggregate:
+        """Return the aggregate of a shard.
+
+        Parameters
+        ----------
+        bounds : tuple
+            The start & stop indices of the shard
+
+        Returns
+        -------
+        _PairwiseAggregate
+            The aggregate of the shard
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.shard_func(*self.args, *bounds)
+
+
+def _run_shards(
+    shard_func: Callable[..., _PairwiseAggregate],
+    args: Tuple,
+    total: int,
+    n_jobs: Optional[int],
+    executor: Optional[Executor],
+) -> _PairwiseAggregate:
+    """Aggregate an index space by running shard_func over its shards.
+
+    When a new process pool is started, each worker receives args once, when
+    it starts, and each shard sends only its start & stop indices. A
+    supplied executor receives args with each shard.
+
+    Parameters
+    ----------
+    shard_func : function
+        A picklable function taking args followed by start & stop indices and
+        returning a _PairwiseAggregate
+    args : tuple
+        The leading arguments to shard_func
+    total : int
+        The size of the index space
+    n_jobs : int or None
+        The number of worker processes
+    executor : concurrent.futures.Executor or None
+        An executor to use in place of a new process pool
+
+    Returns
+    -------
+    _PairwiseAggregate
+        The merged aggregate
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    workers = _n_workers(n_jobs)
+    # A few shards per worker keeps the workers busy when rows (or metric
+    # calls) vary in cost.
+    shards = _shards(total, 4 * workers)
+    job = _ShardJob(shard_func, args)
+
+    agg = _PairwiseAggregate()
+    if executor is not None:
+        for future in [
+            executor.submit(job.aggregate, bounds) for bounds in shards
+        ]:
+            agg.merge(future.result())
+    elif workers == 1:
+        for bounds in shards:
+            agg.merge(job.aggregate(bounds))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(job,)
+        ) as pool:
+            for future in [
+                pool.submit(_apply_in_worker, 'aggregate', [bounds])
+                for bounds in shards
+            ]:
+                agg.merge(future.result()[0])
+    return agg
+
+
 def mean_pairwise_similarity(
     collection: Union[str, Sequence[str], Set[str]],
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = hmean,
     symmetric: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ) -> float:
     """Calculate the mean pairwise similarity of a collection of strings.
 
@@ -50,6 +505,21 @@ def mean_pairwise_similarity(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes across which to divide the pairs (-1
+        for one per CPU). By default, all similarities are calculated in the
+        calling process. When computing in parallel, each worker returns only
+        summary statistics of its share of the pairs, so mean_func must be one
+        of amean, gmean, or hmean, and metric must be picklable (e.g. the sim
+        method of a distance measure instance).
+
+        .. versionadded:: 0.6.0
+
+    executor : concurrent.futures.Executor
+        An executor to which the pairs are submitted, in place of a new
+        process pool
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -66,6 +536,8 @@ def mean_pairwise_similarity(
         collection is neither a string nor iterable type
     ValueError
         collection has fewer than two members
+    ValueError
+        mean_func must be amean, gmean, or hmean when computing in parallel
 
     Examples
     --------
@@ -74,6 +546,9 @@ def mean_pairwise_similarity(
     0.519801980198
     >>> round(mean_pairwise_similarity(['Niall', 'Neal', 'Neil']), 12)
     0.545454545455
+    >>> round(mean_pairwise_similarity(['Niall', 'Neal', 'Neil'],
+    ... n_jobs=2), 12)
+    0.545454545455
 
     .. versionadded:: 0.1.0
 
@@ -94,6 +569,37 @@ def mean_pairwise_similarity(
 
     collection = list(collection)
 
+    if n_jobs is not None or executor is not None:
+        n = len(collection)
+        return _run_shards(
+            _mean_pairwise_shard,
+            (collection, metric, symmetric),
+            n * (n - 1) // 2,
+            n_jobs,
+            executor,
+        ).mean(mean_func)
+
+    sim_many = _batch_metric(metric)
+    if sim_many is not None:
+        if symmetric:
+            sim_mat = np.array(
+                [sim_many(src, collection) for src in collection]
+            )
+            upper = np.triu_indices(len(collection), 1)
+            return mean_func(
+                np.stack((sim_mat[upper], sim_mat.T[upper]), axis=1)
+                .ravel()
+                .tolist()
+            )
+        return mean_func(
+            np.concatenate(
+                [
+                    sim_many(collection[i], collection[i + 1 :])
+                    for i in range(len(collection))
+                ]
+            ).tolist()
+        )
+
     pairwise_values = []
 
     for i in range(len(collection)):
@@ -111,6 +617,8 @@ def pairwise_similarity_statistics(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = amean,
     symmetric: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
 ) -> Tuple[float, float, float, float]:
     """Calculate the pairwise similarity statistics a collection of strings.
 
@@ -132,6 +640,21 @@ def pairwise_similarity_statistics(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes across which to divide the pairs (-1
+        for one per CPU). By default, all similarities are calculated in the
+        calling process. When computing in parallel, each worker returns only
+        summary statistics of its share of the pairs, so mean_func must be one
+        of amean, gmean, or hmean, and metric must be picklable (e.g. the sim
+        method of a distance measure instance).
+
+        .. versionadded:: 0.6.0
+
+    executor : concurrent.futures.Executor
+        An executor to which the pairs are submitted, in place of a new
+        process pool
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -148,6 +671,8 @@ def pairwise_similarity_statistics(
         src_collection is neither a string nor iterable
     ValueError
         tar_collection is neither a string nor iterable
+    ValueError
+        mean_func must be amean, gmean, or hmean when computing in parallel
 
     Example
     -------
@@ -178,13 +703,43 @@ def pairwise_similarity_statistics(
     src_collection = list(src_collection)
     tar_collection = list(tar_collection)
 
-    pairwise_values = []
-
-    for src in src_collection:
-        for tar in tar_collection:
-            pairwise_values.append(metric(src, tar))
-            if symmetric:
-                pairwise_values.append(metric(tar, src))
+    if n_jobs is not None or executor is not None:
+        agg = _run_shards(
+            _statistics_shard,
+            (src_collection, tar_collection, metric, symmetric),
+            len(src_collection),
+            n_jobs,
+            executor,
+        )
+        return (agg.max, agg.min, agg.mean(mean_func), agg.std(mean_func))
+
+    pairwise_values = []  # type: List[float]
+
+    sim_many = _batch_metric(metric)
+    if sim_many is not None:
+        sim_mat = np.array(
+            [sim_many(src, tar_collection) for src in src_collection]
+        )
+        if symmetric:
+            sim_mat = np.stack(
+                (
+                    sim_mat,
+                    np.array(
+                        [
+                            sim_many(tar, src_collection)
+                            for tar in tar_collection
+                        ]
+                    ).T,
+                ),
+                axis=-1,
+            )
+        pairwise_values = sim_mat.ravel().tolist()
+    else:
+        for src in src_collection:
+            for tar in tar_collection:
+                pairwise_values.append(metric(src, tar))
+                if symmetric:
+                    pairwise_values.append(metric(tar, src))
 
     return (
         max(pairwise_values),
@@ -19,10 +19,11 @@
 Lovins stemmer.
 """
 
-from typing import Callable, Dict, Optional, Tuple, Union, cast
+from typing import Callable, Dict, Optional, Tuple, Union
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['Lovins']
 
@@ -1171,6 +1172,11 @@ class Lovins(_Stemmer):
             ('yz', 'ys'),
         )
 
+        self._suffix_trie = _SuffixTrie(self._suffix)
+        self._recode_trie = _SuffixTrie(
+            {ending: index for index, (ending, _) in enumerate(self._recode)}
+        )
+
     def stem(self, word: str) -> str:
         """Return Lovins stem.
 
@@ -1198,23 +1204,17 @@ class Lovins(_Stemmer):
         .. versionadded:: 0.2.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Endings are found by a walk through a reversed-suffix trie
 
         """
         # lowercase, normalize, and compose
         word = normalize('NFC', word.lower())
 
-        for suffix_len in range(11, 0, -1):
-            ending = word[-suffix_len:]
-            if (
-                ending in self._suffix
-                and len(word) - suffix_len >= 2
-                and (
-                    self._suffix[ending] is None
-                    or cast(Callable[[str, int], bool], self._suffix[ending])(
-                        word, suffix_len
-                    )
-                )
-            ):
+        for suffix_len, condition in self._suffix_trie.matches(
+            word, min_stem=2
+        ):
+            if condition is None or condition(word, suffix_len):
                 word = word[:-suffix_len]
                 break
 
@@ -1232,12 +1232,24 @@ class Lovins(_Stemmer):
         }:
             word = word[:-1]
 
-        for ending, replacement in self._recode:
-            if word.endswith(ending):
-                if callable(replacement):
-                    word = replacement(word)
-                else:
-                    word = word[: -len(ending)] + replacement
+        # apply the recoding rules in order, each to the word as recoded by
+        # the rules before it
+        index = 0
+        while True:
+            following = [
+                rule
+                for _, rule in self._recode_trie.matches(word)
+                if rule >= index
+            ]
+            if not following:
+                break
+            index = min(following)
+            ending, replacement = self._recode[index]
+            if callable(replacement):
+                word = replacement(word)
+            else:
+                word = word[: -len(ending)] + replacement
+            index += 1
 
         return word
 
@@ -22,6 +22,7 @@ Paice-Husk Stemmer
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['PaiceHusk']
 
@@ -165,6 +166,8 @@ class PaiceHusk(_Stemmer):
         },
     }  # type: Dict[int, Dict[str, Tuple[Tuple[bool, int, Optional[str], bool], ...]]]  # noqa: E501
 
+    _rule_trie = _SuffixTrie.from_table(_rule_table)
+
     def _has_vowel(self, word: str) -> bool:
         for char in word:
             if char in {'a', 'e', 'i', 'o', 'u', 'y'}:
@@ -231,23 +234,24 @@ class PaiceHusk(_Stemmer):
         .. versionadded:: 0.3.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Endings are found by a walk through a reversed-suffix trie
 
         """
         terminate = False
         intact = True
         while not terminate:
-            for n in range(6, 0, -1):
-                if word[-n:] in self._rule_table[n]:
-                    accept = False
-                    for rule in self._rule_table[n][word[-n:]]:
-                        (word, accept, intact, terminate,) = self._apply_rule(
-                            word, rule, intact, terminate
-                        )
-                        if accept:
-                            break
-
+            for _, rules in self._rule_trie.matches(word):
+                accept = False
+                for rule in rules:
+                    (word, accept, intact, terminate,) = self._apply_rule(
+                        word, rule, intact, terminate
+                    )
                     if accept:
                         break
+
+                if accept:
+                    break
             else:
                 break
 
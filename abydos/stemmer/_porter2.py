@@ -22,6 +22,7 @@ Porter2 (Snowball English) stemmer
 from unicodedata import normalize
 
 from ._snowball import _Snowball
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['Porter2']
 
@@ -73,6 +74,31 @@ class Porter2(_Snowball):
         'exceed',
         'succeed',
     }
+    # The suffixes of step 4 other than -ion
+    _step4_trie = _SuffixTrie(
+        dict.fromkeys(
+            (
+                'ement',
+                'ance',
+                'ence',
+                'able',
+                'ible',
+                'ment',
+                'ant',
+                'ent',
+                'ism',
+                'ate',
+                'iti',
+                'ous',
+                'ive',
+                'ize',
+                'al',
+                'er',
+                'ic',
+            ),
+            True,
+        )
+    )
 
     def __init__(self, early_english: bool = False) -> None:
         """Initialize Porter2 instance.
@@ -120,6 +146,9 @@ class Porter2(_Snowball):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            R1 & R2 are found together, by a compiled pattern, and suffixes
+            are tested against the regions' lengths
 
         """
         # lowercase, normalize, and compose
@@ -147,14 +176,16 @@ class Porter2(_Snowball):
                 return word
 
         # Re-map vocalic Y to y (Y will be C, y will be V)
-        if word[0] == 'y':
-            word = 'Y' + word[1:]
-        for i in range(1, len(word)):
-            if word[i] == 'y' and word[i - 1] in self._vowels:
-                word = word[:i] + 'Y' + word[i + 1 :]
+        if 'y' in word:
+            letters = list(word)
+            if letters[0] == 'y':
+                letters[0] = 'Y'
+            for i in range(1, len(letters)):
+                if letters[i] == 'y' and letters[i - 1] in self._vowels:
+                    letters[i] = 'Y'
+            word = ''.join(letters)
 
-        r1_start = self._sb_r1(word, self._r1_prefixes)
-        r2_start = self._sb_r2(word, self._r1_prefixes)
+        r1_start, r2_start = self._sb_regions(word, self._r1_prefixes)
 
         # Step 0
         if word[-3:] == "'s'":
@@ -188,7 +219,7 @@ class Porter2(_Snowball):
         # Step 1b
         step1b_flag = False
         if word[-5:] == 'eedly':
-            if len(word[r1_start:]) >= 5:
+            if len(word) - r1_start >= 5:
                 word = word[:-3]
         elif word[-5:] == 'ingly':
             if self._sb_has_vowel(word[:-5]):
@@ -199,7 +230,7 @@ class Porter2(_Snowball):
                 word = word[:-4]
                 step1b_flag = True
         elif word[-3:] == 'eed':
-            if len(word[r1_start:]) >= 3:
+            if len(word) - r1_start >= 3:
                 word = word[:-1]
         elif word[-3:] == 'ing':
             if self._sb_has_vowel(word[:-3]):
@@ -238,129 +269,110 @@ class Porter2(_Snowball):
         # Step 2
         if word[-2] == 'a':
             if word[-7:] == 'ational':
-                if len(word[r1_start:]) >= 7:
+                if len(word) - r1_start >= 7:
                     word = word[:-5] + 'e'
             elif word[-6:] == 'tional':
-                if len(word[r1_start:]) >= 6:
+                if len(word) - r1_start >= 6:
                     word = word[:-2]
         elif word[-2] == 'c':
             if word[-4:] in {'enci', 'anci'}:
-                if len(word[r1_start:]) >= 4:
+                if len(word) - r1_start >= 4:
                     word = word[:-1] + 'e'
         elif word[-2] == 'e':
             if word[-4:] == 'izer':
-                if len(word[r1_start:]) >= 4:
+                if len(word) - r1_start >= 4:
                     word = word[:-1]
         elif word[-2] == 'g':
             if word[-3:] == 'ogi':
                 if (
                     r1_start >= 1
-                    and len(word[r1_start:]) >= 3
+                    and len(word) - r1_start >= 3
                     and word[-4] == 'l'
                 ):
                     word = word[:-1]
         elif word[-2] == 'l':
             if word[-6:] == 'lessli':
-                if len(word[r1_start:]) >= 6:
+                if len(word) - r1_start >= 6:
                     word = word[:-2]
             elif word[-5:] in {'entli', 'fulli', 'ousli'}:
-                if len(word[r1_start:]) >= 5:
+                if len(word) - r1_start >= 5:
                     word = word[:-2]
             elif word[-4:] == 'abli':
-                if len(word[r1_start:]) >= 4:
+                if len(word) - r1_start >= 4:
                     word = word[:-1] + 'e'
             elif word[-4:] == 'alli':
-                if len(word[r1_start:]) >= 4:
+                if len(word) - r1_start >= 4:
                     word = word[:-2]
             elif word[-3:] == 'bli':
-                if len(word[r1_start:]) >= 3:
+                if len(word) - r1_start >= 3:
                     word = word[:-1] + 'e'
             elif word[-2:] == 'li':
                 if (
                     r1_start >= 1
-                    and len(word[r1_start:]) >= 2
+                    and len(word) - r1_start >= 2
                     and word[-3] in self._li
                 ):
                     word = word[:-2]
         elif word[-2] == 'o':
             if word[-7:] == 'ization':
-                if len(word[r1_start:]) >= 7:
+                if len(word) - r1_start >= 7:
                     word = word[:-5] + 'e'
             elif word[-5:] == 'ation':
-                if len(word[r1_start:]) >= 5:
+                if len(word) - r1_start >= 5:
                     word = word[:-3] + 'e'
             elif word[-4:] == 'ator':
-                if len(word[r1_start:]) >= 4:
+                if len(word) - r1_start >= 4:
                     word = word[:-2] + 'e'
         elif word[-2] == 's':
             if word[-7:] in {'fulness', 'ousness', 'iveness'}:
-                if len(word[r1_start:]) >= 7:
+                if len(word) - r1_start >= 7:
                     word = word[:-4]
             elif word[-5:] == 'alism':
-                if len(word[r1_start:]) >= 5:
+                if len(word) - r1_start >= 5:
                     word = word[:-3]
         elif word[-2] == 't':
             if word[-6:] == 'biliti':
-                if len(word[r1_start:]) >= 6:
+                if len(word) - r1_start >= 6:
                     word = word[:-5] + 'le'
             elif word[-5:] == 'aliti':
-                if len(word[r1_start:]) >= 5:
+                if len(word) - r1_start >= 5:
                     word = word[:-3]
             elif word[-5:] == 'iviti':
-                if len(word[r1_start:]) >= 5:
+                if len(word) - r1_start >= 5:
                     word = word[:-3] + 'e'
 
         # Step 3
         if word[-7:] == 'ational':
-            if len(word[r1_start:]) >= 7:
+            if len(word) - r1_start >= 7:
                 word = word[:-5] + 'e'
         elif word[-6:] == 'tional':
-            if len(word[r1_start:]) >= 6:
+            if len(word) - r1_start >= 6:
                 word = word[:-2]
         elif word[-5:] in {'alize', 'icate', 'iciti'}:
-            if len(word[r1_start:]) >= 5:
+            if len(word) - r1_start >= 5:
                 word = word[:-3]
         elif word[-5:] == 'ative':
-            if len(word[r2_start:]) >= 5:
+            if len(word) - r2_start >= 5:
                 word = word[:-5]
         elif word[-4:] == 'ical':
-            if len(word[r1_start:]) >= 4:
+            if len(word) - r1_start >= 4:
                 word = word[:-2]
         elif word[-4:] == 'ness':
-            if len(word[r1_start:]) >= 4:
+            if len(word) - r1_start >= 4:
                 word = word[:-4]
         elif word[-3:] == 'ful':
-            if len(word[r1_start:]) >= 3:
+            if len(word) - r1_start >= 3:
                 word = word[:-3]
 
         # Step 4
-        for suffix in (
-            'ement',
-            'ance',
-            'ence',
-            'able',
-            'ible',
-            'ment',
-            'ant',
-            'ent',
-            'ism',
-            'ate',
-            'iti',
-            'ous',
-            'ive',
-            'ize',
-            'al',
-            'er',
-            'ic',
-        ):
-            if word[-len(suffix) :] == suffix:
-                if len(word[r2_start:]) >= len(suffix):
-                    word = word[: -len(suffix)]
-                break
+        suffix_len = self._step4_trie.longest(word)[0]
+        if suffix_len:
+            if len(word) - r2_start >= suffix_len:
+                word = word[:-suffix_len]
         else:
             if word[-3:] == 'ion':
                 if (
-                    len(word[r2_start:]) >= 3
+                    len(word) - r2_start >= 3
                     and len(word) >= 4
                     and word[-4] in tuple('st')
                 ):
@@ -368,21 +380,17 @@ class Porter2(_Snowball):
 
         # Step 5
         if word[-1] == 'e':
-            if len(word[r2_start:]) >= 1 or (
-                len(word[r1_start:]) >= 1
+            if len(word) - r2_start >= 1 or (
+                len(word) - r1_start >= 1
                 and not self._sb_ends_in_short_syllable(word[:-1])
             ):
                 word = word[:-1]
         elif word[-1] == 'l':
-            if len(word[r2_start:]) >= 1 and word[-2] == 'l':
+            if len(word) - r2_start >= 1 and word[-2] == 'l':
                 word = word[:-1]
 
         # Change 'Y' back to 'y' if it survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
-
-        return word
+        return word.replace('Y', 'y')
 
 
 if __name__ == '__main__':
@@ -23,6 +23,7 @@ from typing import Dict
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['Schinke']
 
@@ -129,6 +130,14 @@ class Schinke(_Stemmer):
         1: {},
     }
 
+    _n_trie = _SuffixTrie(dict.fromkeys(set().union(*_n_endings.values())))
+    _v_trie = _SuffixTrie(
+        dict(
+            dict.fromkeys(set().union(*_v_endings_alter.values()), 'alter'),
+            **dict.fromkeys(set().union(*_v_endings_strip.values()), 'strip')
+        )
+    )
+
     def stem(self, word: str) -> str:
         """Return the stem of a word according to the Schinke stemmer.
 
@@ -250,45 +259,35 @@ class Schinke(_Stemmer):
         verb = word
 
         # Rule 4
-        for endlen in range(4, 0, -1):
-            if word[-endlen:] in self._n_endings[endlen]:
-                if len(word) - 2 >= endlen:
-                    noun = word[:-endlen]
-                else:
-                    noun = word
-                break
-
-        for endlen in range(6, 0, -1):
-            if word[-endlen:] in self._v_endings_strip[endlen]:
-                if len(word) - 2 >= endlen:
-                    verb = word[:-endlen]
-                else:
-                    verb = word
-                break
-            if word[-endlen:] in self._v_endings_alter[endlen]:
-                if word[-endlen:] in {
-                    'iuntur',
-                    'erunt',
-                    'untur',
-                    'iunt',
-                    'unt',
-                }:
-                    new_word = word[:-endlen] + 'i'
-                    addlen = 1
-                elif word[-endlen:] in {'beris', 'bor', 'bo'}:
-                    new_word = word[:-endlen] + 'bi'
-                    addlen = 2
-                else:
-                    new_word = word[:-endlen] + 'eri'
-                    addlen = 3
-
-                # Technically this diverges from the paper by considering the
-                # length of the stem without the new suffix
-                if len(new_word) >= 2 + addlen:
-                    verb = new_word
-                else:
-                    verb = word
-                break
+        endlen = self._n_trie.longest(word)[0]
+        if endlen and len(word) - 2 >= endlen:
+            noun = word[:-endlen]
+
+        endlen, action = self._v_trie.longest(word)
+        if action == 'strip':
+            if len(word) - 2 >= endlen:
+                verb = word[:-endlen]
+        elif action == 'alter':
+            if word[-endlen:] in {
+                'iuntur',
+                'erunt',
+                'untur',
+                'iunt',
+                'unt',
+            }:
+                new_word = word[:-endlen] + 'i'
+                addlen = 1
+            elif word[-endlen:] in {'beris', 'bor', 'bo'}:
+                new_word = word[:-endlen] + 'bi'
+                addlen = 2
+            else:
+                new_word = word[:-endlen] + 'eri'
+                addlen = 3
+
+            # Technically this diverges from the paper by considering the
+            # length of the stem without the new suffix
+            if len(new_word) >= 2 + addlen:
+                verb = new_word
 
         return {'n': noun, 'v': verb}
 
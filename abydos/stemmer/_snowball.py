@@ -19,13 +19,40 @@
 Snowball Stemmer base class
 """
 
-from typing import Iterable, Optional, cast
+from re import compile as re_compile, escape as re_escape
+from typing import AbstractSet, Iterable, Optional, Pattern, Tuple, cast
 
 from ._stemmer import _Stemmer
 
 __all__ = ['_Snowball']
 
 
+def _vowel_consonant(vowels: AbstractSet[str]) -> Pattern[str]:
+    """Return a pattern matching a vowel followed by a non-vowel.
+
+    Parameters
+    ----------
+    vowels : set
+        The vowels
+
+    Returns
+    -------
+    Pattern
+        The compiled pattern
+
+    Examples
+    --------
+    >>> _vowel_consonant(set('aeiouy')).search('beautiful').end()
+    5
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    vowels_class = re_escape(''.join(sorted(vowels)))
+    return re_compile('[{0}][^{0}]'.format(vowels_class))
+
+
 class _Snowball(_Stemmer):
     """Snowball stemmer base class.
 
@@ -34,6 +61,78 @@ class _Snowball(_Stemmer):
 
     _vowels = set('aeiouy')
     _codanonvowels = set("'bcdfghjklmnpqrstvz")
+    # The vowels and the pattern of a vowel followed by a non-vowel, which
+    # is compiled again if an instance or subclass sets other vowels
+    _vowel_consonant = (_vowels, _vowel_consonant(_vowels))
+
+    def _sb_vowel_consonant(self) -> Pattern[str]:
+        """Return the pattern of a vowel followed by a non-vowel.
+
+        Returns
+        -------
+        Pattern
+            The compiled pattern, for the stemmer's vowels
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vowels, pattern = self._vowel_consonant
+        if vowels is not self._vowels:
+            pattern = _vowel_consonant(self._vowels)
+            self._vowel_consonant = (self._vowels, pattern)
+        return pattern
+
+    def _sb_regions(
+        self, term: str, r1_prefixes: Optional[Iterable[str]] = None
+    ) -> Tuple[int, int]:
+        """Return the R1 & R2 regions, as defined in the Porter2 specification.
+
+        Each region starts after the first non-vowel that follows a vowel in
+        the preceding one; both are found with a single compiled pattern. As
+        the regions are offsets from the start of the word, they remain valid
+        while suffixes are removed from it.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+        r1_prefixes : iterable
+            Prefixes to consider
+
+        Returns
+        -------
+        tuple
+            The starts of the R1 & R2 regions
+
+        Examples
+        --------
+        >>> _Snowball()._sb_regions('beautiful')
+        (5, 7)
+        >>> _Snowball()._sb_regions('generous', ('gener',))
+        (5, 8)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        search = self._sb_vowel_consonant().search
+        length = len(term)
+
+        r1_start = -1
+        if hasattr(r1_prefixes, '__iter__'):
+            for prefix in cast(Iterable[str], r1_prefixes):
+                if term.startswith(prefix):
+                    r1_start = len(prefix)
+                    break
+        if r1_start < 0:
+            match = search(term)
+            if match is None:
+                return length, length
+            r1_start = match.end()
+
+        match = search(term, r1_start)
+        return r1_start, length if match is None else match.end()
 
     def _sb_r1(
         self, term: str, r1_prefixes: Optional[Iterable[str]] = None
@@ -56,20 +155,17 @@ class _Snowball(_Stemmer):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Found with a compiled pattern
 
         """
-        vowel_found = False
         if hasattr(r1_prefixes, '__iter__'):
             for prefix in cast(Iterable[str], r1_prefixes):
-                if term[: len(prefix)] == prefix:
+                if term.startswith(prefix):
                     return len(prefix)
 
-        for i in range(len(term)):
-            if not vowel_found and term[i] in self._vowels:
-                vowel_found = True
-            elif vowel_found and term[i] not in self._vowels:
-                return i + 1
-        return len(term)
+        match = self._sb_vowel_consonant().search(term)
+        return len(term) if match is None else match.end()
 
     def _sb_r2(
         self, term: str, r1_prefixes: Optional[Iterable[str]] = None
@@ -92,10 +188,11 @@ class _Snowball(_Stemmer):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Found with R1 by a compiled pattern
 
         """
-        r1_start = self._sb_r1(term, r1_prefixes)
-        return r1_start + self._sb_r1(term[r1_start:])
+        return self._sb_regions(term, r1_prefixes)[1]
 
     def _sb_ends_in_short_syllable(self, term: str) -> bool:
         """Return True iff term ends in a short syllable.
@@ -186,10 +283,7 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        for letter in term:
-            if letter in self._vowels:
-                return True
-        return False
+        return not self._vowels.isdisjoint(term)
 
 
 if __name__ == '__main__':
@@ -22,6 +22,7 @@ Snowball Danish stemmer
 from unicodedata import normalize
 
 from ._snowball import _Snowball
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['SnowballDanish']
 
@@ -58,6 +59,60 @@ class SnowballDanish(_Snowball):
         'z',
         'å',
     }
+    # The number of characters removed with each step 1 suffix; -s is only
+    # removed after a valid s-ending
+    _step1_trie = _SuffixTrie(
+        dict(
+            {
+                suffix: len(suffix)
+                for suffix in (
+                    'erendes',
+                    'erende',
+                    'hedens',
+                    'ethed',
+                    'erede',
+                    'heden',
+                    'heder',
+                    'endes',
+                    'ernes',
+                    'erens',
+                    'erets',
+                    'ered',
+                    'ende',
+                    'erne',
+                    'eren',
+                    'erer',
+                    'heds',
+                    'enes',
+                    'eres',
+                    'eret',
+                    'hed',
+                    'ene',
+                    'ere',
+                    'ens',
+                    'ers',
+                    'ets',
+                    'en',
+                    'er',
+                    'es',
+                    'et',
+                    'e',
+                )
+            },
+            s=None,
+        )
+    )
+    # The number of characters removed with each step 3 suffix, and whether
+    # step 2 is then repeated
+    _step3_trie = _SuffixTrie(
+        {
+            'elig': (4, True),
+            'løst': (1, False),
+            'lig': (3, True),
+            'els': (3, True),
+            'ig': (2, True),
+        }
+    )
 
     def stem(self, word: str) -> str:
         """Return Snowball Danish stem.
@@ -86,6 +141,8 @@ class SnowballDanish(_Snowball):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Suffixes in R1 are found in a single backwards walk
 
         """
         # lowercase, normalize, and compose
@@ -94,73 +151,37 @@ class SnowballDanish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'erendes':
-            word = word[:-7]
-        elif _r1[-6:] in {'erende', 'hedens'}:
-            word = word[:-6]
-        elif _r1[-5:] in {
-            'ethed',
-            'erede',
-            'heden',
-            'heder',
-            'endes',
-            'ernes',
-            'erens',
-            'erets',
-        }:
-            word = word[:-5]
-        elif _r1[-4:] in {
-            'ered',
-            'ende',
-            'erne',
-            'eren',
-            'erer',
-            'heds',
-            'enes',
-            'eres',
-            'eret',
-        }:
-            word = word[:-4]
-        elif _r1[-3:] in {'hed', 'ene', 'ere', 'ens', 'ers', 'ets'}:
-            word = word[:-3]
-        elif _r1[-2:] in {'en', 'er', 'es', 'et'}:
-            word = word[:-2]
-        elif _r1[-1:] == 'e':
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix_len, removed = self._step1_trie.longest(word, r1_start)
+        if removed:
+            word = word[:-removed]
+        elif suffix_len:
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+        if word[-2:] in {'gd', 'dt', 'gt', 'kt'} and len(word) - r1_start >= 2:
             word = word[:-1]
 
         # Step 3
         if word[-4:] == 'igst':
             word = word[:-2]
 
-        _r1 = word[r1_start:]
         repeat_step2 = False
-        if _r1[-4:] == 'elig':
-            word = word[:-4]
-            repeat_step2 = True
-        elif _r1[-4:] == 'løst':
-            word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
-            word = word[:-3]
-            repeat_step2 = True
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
-            repeat_step2 = True
+        rule = self._step3_trie.longest(word, r1_start)[1]
+        if rule:
+            removed, repeat_step2 = rule
+            word = word[:-removed]
 
         if repeat_step2:
-            if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+            if (
+                word[-2:] in {'gd', 'dt', 'gt', 'kt'}
+                and len(word) - r1_start >= 2
+            ):
                 word = word[:-1]
 
         # Step 4
         if (
-            len(word[r1_start:]) >= 1
+            len(word) - r1_start >= 1
             and len(word) >= 2
             and word[-1] == word[-2]
             and word[-1] not in self._vowels
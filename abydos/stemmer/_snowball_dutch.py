@@ -38,6 +38,7 @@ class SnowballDutch(_Snowball):
     _vowels = {'a', 'e', 'i', 'o', 'u', 'y', 'è'}
     _not_s_endings = {'a', 'e', 'i', 'j', 'o', 'u', 'y', 'è'}
     _accented = dict(zip((ord(_) for _ in 'äëïöüáéíóú'), 'aeiouaeiou'))
+    _lowercase = {ord('Y'): 'y', ord('I'): 'i'}
 
     def _undouble(self, word: str) -> str:
         """Undouble endings -kk, -dd, and -tt.
@@ -93,6 +94,9 @@ class SnowballDutch(_Snowball):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            R1 & R2 are found together, by a compiled pattern, and suffixes
+            are tested against the regions' lengths
 
         """
         # lowercase, normalize, decompose, filter umlauts & acutes out, and
@@ -100,45 +104,48 @@ class SnowballDutch(_Snowball):
         word = normalize('NFC', word.lower())
         word = word.translate(self._accented)
 
-        for i in range(len(word)):
-            if i == 0 and word[0] == 'y':
-                word = 'Y' + word[1:]
-            elif word[i] == 'y' and word[i - 1] in self._vowels:
-                word = word[:i] + 'Y' + word[i + 1 :]
-            elif (
-                word[i] == 'i'
-                and word[i - 1] in self._vowels
-                and i + 1 < len(word)
-                and word[i + 1] in self._vowels
-            ):
-                word = word[:i] + 'I' + word[i + 1 :]
+        if 'y' in word or 'i' in word:
+            letters = list(word)
+            for i in range(len(letters)):
+                if i == 0 and letters[0] == 'y':
+                    letters[0] = 'Y'
+                elif letters[i] == 'y' and letters[i - 1] in self._vowels:
+                    letters[i] = 'Y'
+                elif (
+                    letters[i] == 'i'
+                    and letters[i - 1] in self._vowels
+                    and i + 1 < len(letters)
+                    and letters[i + 1] in self._vowels
+                ):
+                    letters[i] = 'I'
+            word = ''.join(letters)
 
-        r1_start = max(3, self._sb_r1(word))
-        r2_start = self._sb_r2(word)
+        r1_start, r2_start = self._sb_regions(word)
+        r1_start = max(3, r1_start)
 
         # Step 1
         if word[-5:] == 'heden':
-            if len(word[r1_start:]) >= 5:
+            if len(word) - r1_start >= 5:
                 word = word[:-3] + 'id'
         elif word[-3:] == 'ene':
-            if len(word[r1_start:]) >= 3 and (
+            if len(word) - r1_start >= 3 and (
                 word[-4] not in self._vowels and word[-6:-3] != 'gem'
             ):
                 word = self._undouble(word[:-3])
         elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2 and (
+            if len(word) - r1_start >= 2 and (
                 word[-3] not in self._vowels and word[-5:-2] != 'gem'
             ):
                 word = self._undouble(word[:-2])
         elif word[-2:] == 'se':
             if (
-                len(word[r1_start:]) >= 2
+                len(word) - r1_start >= 2
                 and word[-3] not in self._not_s_endings
             ):
                 word = word[:-2]
         elif word[-1:] == 's':
             if (
-                len(word[r1_start:]) >= 1
+                len(word) - r1_start >= 1
                 and word[-2] not in self._not_s_endings
             ):
                 word = word[:-1]
@@ -146,50 +153,50 @@ class SnowballDutch(_Snowball):
         # Step 2
         e_removed = False
         if word[-1:] == 'e':
-            if len(word[r1_start:]) >= 1 and word[-2] not in self._vowels:
+            if len(word) - r1_start >= 1 and word[-2] not in self._vowels:
                 word = self._undouble(word[:-1])
                 e_removed = True
 
         # Step 3a
         if word[-4:] == 'heid':
-            if len(word[r2_start:]) >= 4 and word[-5] != 'c':
+            if len(word) - r2_start >= 4 and word[-5] != 'c':
                 word = word[:-4]
                 if word[-2:] == 'en':
-                    if len(word[r1_start:]) >= 2 and (
+                    if len(word) - r1_start >= 2 and (
                         word[-3] not in self._vowels and word[-5:-2] != 'gem'
                     ):
                         word = self._undouble(word[:-2])
 
         # Step 3b
         if word[-4:] == 'lijk':
-            if len(word[r2_start:]) >= 4:
+            if len(word) - r2_start >= 4:
                 word = word[:-4]
                 # Repeat step 2
                 if word[-1:] == 'e':
                     if (
-                        len(word[r1_start:]) >= 1
+                        len(word) - r1_start >= 1
                         and word[-2] not in self._vowels
                     ):
                         word = self._undouble(word[:-1])
         elif word[-4:] == 'baar':
-            if len(word[r2_start:]) >= 4:
+            if len(word) - r2_start >= 4:
                 word = word[:-4]
         elif word[-3:] in ('end', 'ing'):
-            if len(word[r2_start:]) >= 3:
+            if len(word) - r2_start >= 3:
                 word = word[:-3]
                 if (
                     word[-2:] == 'ig'
-                    and len(word[r2_start:]) >= 2
+                    and len(word) - r2_start >= 2
                     and word[-3] != 'e'
                 ):
                     word = word[:-2]
                 else:
                     word = self._undouble(word)
         elif word[-3:] == 'bar':
-            if len(word[r2_start:]) >= 3 and e_removed:
+            if len(word) - r2_start >= 3 and e_removed:
                 word = word[:-3]
         elif word[-2:] == 'ig':
-            if len(word[r2_start:]) >= 2 and word[-3] != 'e':
+            if len(word) - r2_start >= 2 and word[-3] != 'e':
                 word = word[:-2]
 
         # Step 4
@@ -203,14 +210,8 @@ class SnowballDutch(_Snowball):
         ):
             word = word[:-2] + word[-1]
 
-        # Change 'Y' and 'U' back to lowercase if survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
-            elif word[i] == 'I':
-                word = word[:i] + 'i' + word[i + 1 :]
-
-        return word
+        # Change 'Y' and 'I' back to lowercase if survived stemming
+        return word.translate(self._lowercase)
 
 
 if __name__ == '__main__':
@@ -22,6 +22,7 @@ Snowball Norwegian stemmer
 from unicodedata import normalize
 
 from ._snowball import _Snowball
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['SnowballNorwegian']
 
@@ -55,6 +56,65 @@ class SnowballNorwegian(_Snowball):
         'y',
         'z',
     }
+    # The number of characters removed with each step 1 suffix; -s is only
+    # removed after a valid s-ending
+    _step1_trie = _SuffixTrie(
+        dict(
+            {
+                suffix: len(suffix)
+                for suffix in (
+                    'hetenes',
+                    'hetene',
+                    'hetens',
+                    'heten',
+                    'heter',
+                    'endes',
+                    'ande',
+                    'ende',
+                    'edes',
+                    'enes',
+                    'ede',
+                    'ane',
+                    'ene',
+                    'ens',
+                    'ers',
+                    'ets',
+                    'het',
+                    'ast',
+                    'en',
+                    'ar',
+                    'er',
+                    'as',
+                    'es',
+                    'et',
+                    'a',
+                    'e',
+                )
+            },
+            erte=2,
+            ert=1,
+            s=None,
+        )
+    )
+    # The number of characters removed with each step 3 suffix
+    _step3_trie = _SuffixTrie(
+        {
+            suffix: len(suffix)
+            for suffix in (
+                'hetslov',
+                'eleg',
+                'elig',
+                'elov',
+                'slov',
+                'leg',
+                'eig',
+                'lig',
+                'els',
+                'lov',
+                'ig',
+            )
+        }
+    )
 
     def stem(self, word: str) -> str:
         """Return Snowball Norwegian stem.
@@ -83,6 +143,8 @@ class SnowballNorwegian(_Snowball):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Suffixes in R1 are found in a single backwards walk
 
         """
         # lowercase, normalize, and compose
@@ -91,38 +153,10 @@ class SnowballNorwegian(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetenes':
-            word = word[:-7]
-        elif _r1[-6:] in {'hetene', 'hetens'}:
-            word = word[:-6]
-        elif _r1[-5:] in {'heten', 'heter', 'endes'}:
-            word = word[:-5]
-        elif _r1[-4:] in {'ande', 'ende', 'edes', 'enes', 'erte'}:
-            if word[-4:] == 'erte':
-                word = word[:-2]
-            else:
-                word = word[:-4]
-        elif _r1[-3:] in {
-            'ede',
-            'ane',
-            'ene',
-            'ens',
-            'ers',
-            'ets',
-            'het',
-            'ast',
-            'ert',
-        }:
-            if word[-3:] == 'ert':
-                word = word[:-1]
-            else:
-                word = word[:-3]
-        elif _r1[-2:] in {'en', 'ar', 'er', 'as', 'es', 'et'}:
-            word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix_len, removed = self._step1_trie.longest(word, r1_start)
+        if removed:
+            word = word[:-removed]
+        elif suffix_len:
             if (len(word) > 1 and word[-2] in self._s_endings) or (
                 len(word) > 2
                 and word[-2] == 'k'
@@ -131,19 +165,13 @@ class SnowballNorwegian(_Snowball):
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dt', 'vt'}:
+        if word[-2:] in {'dt', 'vt'} and len(word) - r1_start >= 2:
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetslov':
-            word = word[:-7]
-        elif _r1[-4:] in {'eleg', 'elig', 'elov', 'slov'}:
-            word = word[:-4]
-        elif _r1[-3:] in {'leg', 'eig', 'lig', 'els', 'lov'}:
-            word = word[:-3]
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
+        removed = self._step3_trie.longest(word, r1_start)[1]
+        if removed:
+            word = word[:-removed]
 
         return word
 
@@ -22,6 +22,7 @@ Snowball Swedish stemmer
 from unicodedata import normalize
 
 from ._snowball import _Snowball
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['SnowballSwedish']
 
@@ -55,6 +56,58 @@ class SnowballSwedish(_Snowball):
         'v',
         'y',
     }
+    # The number of characters removed with each step 1 suffix; -s is only
+    # removed after a valid s-ending
+    _step1_trie = _SuffixTrie(
+        dict(
+            {
+                suffix: len(suffix)
+                for suffix in (
+                    'heterna',
+                    'hetens',
+                    'anden',
+                    'heten',
+                    'heter',
+                    'arnas',
+                    'ernas',
+                    'ornas',
+                    'andes',
+                    'arens',
+                    'andet',
+                    'arna',
+                    'erna',
+                    'orna',
+                    'ande',
+                    'arne',
+                    'aste',
+                    'aren',
+                    'ades',
+                    'erns',
+                    'ade',
+                    'are',
+                    'ern',
+                    'ens',
+                    'het',
+                    'ast',
+                    'ad',
+                    'en',
+                    'ar',
+                    'er',
+                    'or',
+                    'as',
+                    'es',
+                    'at',
+                    'a',
+                    'e',
+                )
+            },
+            s=None,
+        )
+    )
+    # The number of characters removed with each step 3 suffix
+    _step3_trie = _SuffixTrie(
+        {'fullt': 1, 'löst': 1, 'lig': 3, 'els': 3, 'ig': 2}
+    )
 
     def stem(self, word: str) -> str:
         """Return Snowball Swedish stem.
@@ -83,6 +136,8 @@ class SnowballSwedish(_Snowball):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Suffixes in R1 are found in a single backwards walk
 
         """
         # lowercase, normalize, and compose
@@ -91,59 +146,24 @@ class SnowballSwedish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'heterna':
-            word = word[:-7]
-        elif _r1[-6:] == 'hetens':
-            word = word[:-6]
-        elif _r1[-5:] in {
-            'anden',
-            'heten',
-            'heter',
-            'arnas',
-            'ernas',
-            'ornas',
-            'andes',
-            'arens',
-            'andet',
-        }:
-            word = word[:-5]
-        elif _r1[-4:] in {
-            'arna',
-            'erna',
-            'orna',
-            'ande',
-            'arne',
-            'aste',
-            'aren',
-            'ades',
-            'erns',
-        }:
-            word = word[:-4]
-        elif _r1[-3:] in {'ade', 'are', 'ern', 'ens', 'het', 'ast'}:
-            word = word[:-3]
-        elif _r1[-2:] in {'ad', 'en', 'ar', 'er', 'or', 'as', 'es', 'at'}:
-            word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix_len, removed = self._step1_trie.longest(word, r1_start)
+        if removed:
+            word = word[:-removed]
+        elif suffix_len:
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'}:
+        if (
+            word[-2:] in {'dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'}
+            and len(word) - r1_start >= 2
+        ):
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-5:] == 'fullt':
-            word = word[:-1]
-        elif _r1[-4:] == 'löst':
-            word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
-            word = word[:-3]
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
+        removed = self._step3_trie.longest(word, r1_start)[1]
+        if removed:
+            word = word[:-removed]
 
         return word
 
@@ -19,6 +19,10 @@
 abstract class _Stemmer
 """
 
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
 __all__ = ['_Stemmer']
 
 
@@ -47,6 +51,103 @@ class _Stemmer:
         """
         return word
 
+    def stem_many(
+        self,
+        tokens: Iterable[str],
+        lazy: bool = False,
+        return_index: bool = False,
+    ) -> Union[List[str], Iterator[str], Tuple[List[str], np.ndarray]]:
+        """Return the stems of a stream of tokens.
+
+        Each distinct token is stemmed once per call; repeated tokens reuse
+        its stem.
+
+        Parameters
+        ----------
+        tokens : Iterable[str]
+            The tokens to stem
+        lazy : bool
+            Yield the stems as the tokens are read, rather than returning a
+            list of them
+        return_index : bool
+            Return the distinct stems and an array of the index of each
+            token's stem among them, rather than the stems themselves
+
+        Returns
+        -------
+        list or Iterator[str] or tuple
+            The stem of each token, in the order of the tokens; if
+            return_index is set, the distinct stems, in the order they first
+            occur, and a numpy.ndarray of the index of each token's stem
+
+        Raises
+        ------
+        ValueError
+            The stems cannot be both yielded lazily and indexed
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter
+        >>> stmr = Porter()
+        >>> stmr.stem_many(['running', 'runs', 'running', 'ran'])
+        ['run', 'run', 'run', 'ran']
+        >>> vocab, index = stmr.stem_many(
+        ...     ['running', 'runs', 'running', 'ran'], return_index=True
+        ... )
+        >>> vocab
+        ['run', 'ran']
+        >>> index.tolist()
+        [0, 0, 0, 1]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if lazy and return_index:
+            raise ValueError('The stems cannot be both lazy and indexed')
+        if lazy:
+            return self._stem_iter(tokens)
+        if not return_index:
+            return list(self._stem_iter(tokens))
+
+        stem = self.stem
+        stem_ids = {}  # type: Dict[str, int]
+        token_ids = {}  # type: Dict[str, int]
+        index = []
+        for token in tokens:
+            token_id = token_ids.get(token)
+            if token_id is None:
+                token_id = token_ids[token] = stem_ids.setdefault(
+                    stem(token), len(stem_ids)
+                )
+            index.append(token_id)
+        return list(stem_ids), np.array(index, dtype=np.int64)
+
+    def _stem_iter(self, tokens: Iterable[str]) -> Iterator[str]:
+        """Yield the stems of a stream of tokens, stemming each token once.
+
+        Parameters
+        ----------
+        tokens : Iterable[str]
+            The tokens to stem
+
+        Yields
+        ------
+        str
+            The stem of each token, in the order of the tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        stem = self.stem
+        stems = {}  # type: Dict[str, str]
+        for token in tokens:
+            token_stem = stems.get(token)
+            if token_stem is None:
+                token_stem = stems[token] = stem(token)
+            yield token_stem
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,185 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stemmer._suffix_trie.
+
+The stemmer._suffix_trie module implements _SuffixTrie, a trie of reversed
+suffixes, which rule-based stemmers compile from their suffix tables.
+"""
+
+from typing import Any, Dict, List, Mapping, Tuple
+
+__all__ = ['_SuffixTrie']
+
+# The key under which a node holds the value of the suffix that ends there;
+# as it is not a character, it never collides with a child's key
+_VALUE = ''
+
+
+class _SuffixTrie:
+    """Reversed-suffix trie.
+
+    Each suffix of a table is stored from its last character to its first, so
+    that a single walk backwards from the end of a word finds every suffix in
+    the table that the word ends with.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, suffixes: Mapping[str, Any]) -> None:
+        """Initialize _SuffixTrie.
+
+        Parameters
+        ----------
+        suffixes : dict
+            A table of suffixes and their values (such as rules)
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3})
+        >>> trie.matches('flies')
+        [(3, 3), (2, 2), (1, 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._root = {}  # type: Dict[str, Any]
+        for suffix, value in suffixes.items():
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[_VALUE] = value
+
+    @classmethod
+    def from_table(
+        cls, table: Mapping[int, Mapping[str, Any]]
+    ) -> '_SuffixTrie':
+        """Return a trie of a table of suffixes grouped by their lengths.
+
+        Parameters
+        ----------
+        table : dict
+            A dict of suffix lengths and the suffixes of each length and
+            their values
+
+        Returns
+        -------
+        _SuffixTrie
+            The trie of the suffixes
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie.from_table({2: {'ed': 1}, 3: {'ing': 2}})
+        >>> trie.matches('bring')
+        [(3, 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return cls(
+            {
+                suffix: value
+                for suffixes in table.values()
+                for suffix, value in suffixes.items()
+            }
+        )
+
+    def matches(self, word: str, min_stem: int = 0) -> List[Tuple[int, Any]]:
+        """Return the suffixes in the trie that a word ends with.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        min_stem : int
+            The minimum length of the stem that remains before a suffix;
+            longer suffixes are not returned
+
+        Returns
+        -------
+        list of tuples
+            The length & value of each suffix, longest first
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3})
+        >>> trie.matches('flies', min_stem=3)
+        [(2, 2), (1, 1)]
+        >>> trie.matches('fly')
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []
+        node = self._root
+        length = len(word)
+        for pos in range(length - 1, min_stem - 1, -1):
+            node = node.get(word[pos])
+            if node is None:
+                break
+            if _VALUE in node:
+                found.append((length - pos, node[_VALUE]))
+        found.reverse()
+        return found
+
+    def longest(self, word: str, min_stem: int = 0) -> Tuple[int, Any]:
+        """Return the longest suffix in the trie that a word ends with.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        min_stem : int
+            The minimum length of the stem that remains before the suffix
+
+        Returns
+        -------
+        tuple
+            The length & value of the suffix, or (0, None) if the word ends
+            with none of the suffixes
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3})
+        >>> trie.longest('flies')
+        (3, 3)
+        >>> trie.longest('fly')
+        (0, None)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        longest = (0, None)  # type: Tuple[int, Any]
+        node = self._root
+        length = len(word)
+        for pos in range(length - 1, min_stem - 1, -1):
+            node = node.get(word[pos])
+            if node is None:
+                break
+            if _VALUE in node:
+                longest = (length - pos, node[_VALUE])
+        return longest
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,10 +19,11 @@
 UEA-Lite stemmer
 """
 
-from re import match as re_match
+from re import compile as re_compile
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['UEALite']
 
@@ -609,6 +610,16 @@ class UEALite(_Stemmer):
         'Perl': _perl_rule_table,
     }  # type: Dict[str, Dict[int, Dict[str, Tuple[float, int, Optional[str]]]]]
 
+    _rule_tries = {
+        var: _SuffixTrie.from_table(table) for var, table in _rules.items()
+    }  # type: Dict[str, _SuffixTrie]
+
+    _double_final = re_compile(r'.*(\w)\1$')
+    _two_capitals = re_compile(r'^.*[A-Z].*[A-Z].*$')
+    _adams_short = re_compile(r'^[a-z](|[rl])(ing|ed)$')
+    _ing_ending = re_compile(r'.*\w\wings?$')
+    _ed_ending = re_compile(r'.*\w\weds?$')
+
     def __init__(
         self,
         max_word_length: int = 20,
@@ -713,7 +724,7 @@ class UEALite(_Stemmer):
             if word[-1] == 's':
                 del_len += 1
             stemmed_word = word[:-del_len]
-            if re_match(r'.*(\w)\1$', stemmed_word):
+            if self._double_final.match(stemmed_word):
                 stemmed_word = stemmed_word[:-1]
             return stemmed_word
 
@@ -769,35 +780,30 @@ class UEALite(_Stemmer):
                     ):
                         return word, 96
                     return word, 91
-                elif re_match(r'^.*[A-Z].*[A-Z].*$', word):
+                elif self._two_capitals.match(word):
                     return word, 92
                 elif word[0].isupper():
                     return word, 93
-                elif self._var == 'Adams' and re_match(
-                    r'^[a-z](|[rl])(ing|ed)$', word
-                ):
+                elif self._var == 'Adams' and self._adams_short.match(word):
                     return word, 97
 
-            for n in range(7, 1, -1):
-                if word[-n:] in self._rules[self._var][n]:
-                    rule_no, del_len, add_str = self._rules[self._var][n][
-                        word[-n:]
-                    ]
-                    if del_len:
-                        stemmed_word = word[:-del_len]
-                    else:
-                        stemmed_word = word
-                    if add_str:
-                        stemmed_word += add_str
-                    break
+            rule = self._rule_tries[self._var].longest(word)[1]
+            if rule is not None:
+                rule_no, del_len, add_str = rule
+                if del_len:
+                    stemmed_word = word[:-del_len]
+                else:
+                    stemmed_word = word
+                if add_str:
+                    stemmed_word += add_str
 
             if not rule_no:
-                if re_match(r'.*\w\wings?$', word):  # rule 58
+                if self._ing_ending.match(word):  # rule 58
                     stemmed_word = _stem_with_duplicate_character_check(
                         word, 3
                     )
                     rule_no = 58
-                elif re_match(r'.*\w\weds?$', word):  # rule 62
+                elif self._ed_ending.match(word):  # rule 62
                     stemmed_word = _stem_with_duplicate_character_check(
                         word, 2
                     )
@@ -83,6 +83,11 @@ Finally, an NLTK tokenizer is provided:
     - :py:class:`.NLTKTokenizer` does tokenization using an instantiated NLTK
       tokenizer. Accordingly, NLTK_ needs to be installed.
 
+The tokens of a string can also be kept as a :py:class:`.TokenProfile`, an
+immutable Counter that also records the string, its ordered tokens, and their
+cardinality & norm. Token-based distance measures create these with their
+prepare method and accept them in place of strings.
+
 .. _SyllabiPy: https://pypi.org/project/syllabipy/
 .. _NLTK: https://www.nltk.org/
 
@@ -101,6 +106,7 @@ from ._q_skipgrams import QSkipgrams
 from ._regexp import RegexpTokenizer
 from ._saps import SAPSTokenizer
 from ._sonoripy import SonoriPyTokenizer
+from ._token_profile import TokenProfile
 from ._tokenizer import _Tokenizer
 from ._vc_cluster import VCClusterTokenizer
 from ._whitespace import WhitespaceTokenizer
@@ -121,6 +127,7 @@ __all__ = [
     'SonoriPyTokenizer',
     'LegaliPyTokenizer',
     'NLTKTokenizer',
+    'TokenProfile',
 ]
 
 
@@ -19,8 +19,9 @@
 LegaliPy tokenizer class
 """
 
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Union
 
+from ._syllable_cache import _SyllableCache
 from ._tokenizer import _Tokenizer
 
 try:
@@ -40,7 +41,9 @@ class LegaliPyTokenizer(_Tokenizer):
     """
 
     def __init__(
-        self, scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        self,
+        scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        cache_size: int = 65536,
     ) -> None:
         """Initialize Tokenizer.
 
@@ -60,9 +63,14 @@ class LegaliPyTokenizer(_Tokenizer):
                   in the Counter. Some useful functions include math.exp,
                   math.log1p, math.sqrt, and indexes into interesting integer
                   sequences such as the Fibonacci sequence.
+        cache_size : int
+            The maximum number of words whose syllables are cached, so that
+            repeated words are syllabified only once; if 0, nothing is cached
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size
 
         """
         if LegaliPy is None:
@@ -73,7 +81,8 @@ class LegaliPyTokenizer(_Tokenizer):
 
         super(LegaliPyTokenizer, self).__init__(scaler)
 
-        self._onsets = ['']
+        self._onsets = frozenset([''])
+        self._syllable_cache = _SyllableCache(cache_size)
 
     def train_onsets(
         self,
@@ -93,17 +102,108 @@ class LegaliPyTokenizer(_Tokenizer):
         clean : bool
             If True, the text is stripped of numerals and punctuation
         append : bool
-            If True, the current onset list is extended
+            If True, the current onset set is extended
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Onsets are kept as a set
+
+        """
+        self._set_onsets(gen_onsets(text, threshold, clean), append)
+
+    def save_onsets(self, filename: str) -> None:
+        """Save the onsets to a file.
+
+        The onsets are saved as UTF-8 text, one per line.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the onsets to
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, 'w', encoding='utf-8', newline='\n') as ons:
+            ons.writelines(onset + '\n' for onset in sorted(self._onsets))
+
+    def load_onsets(self, filename: str, append: bool = False) -> None:
+        """Load the onsets from a file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the onsets from, as saved by save_onsets
+        append : bool
+            If True, the current onset set is extended
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> tok = LegaliPyTokenizer()
+        >>> tok.train_onsets('the charter of tercentenary christmas carols',
+        ...                  threshold=0.0)
+        >>> filename = os.path.join(tempfile.mkdtemp(), 'onsets.txt')
+        >>> tok.save_onsets(filename)
+        >>> with open(filename) as ons:
+        ...     ons.read().split()
+        ['c', 'ch', 'chr', 't', 'th']
+
+        >>> tok = LegaliPyTokenizer()
+        >>> tok.load_onsets(filename)
+        >>> tok.tokenize('spectacular')
+        LegaliPyTokenizer({'sp': 1, 'ec': 1, 'ta': 1, 'cul': 1, 'ar': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, encoding='utf-8', newline='\n') as ons:
+            self._set_onsets(ons.read().splitlines(), append)
+
+    def _set_onsets(self, onsets: List[str], append: bool) -> None:
+        """Set or extend the onsets.
+
+        The syllables of cached words are dropped, since they depend on the
+        onsets.
+
+        Parameters
+        ----------
+        onsets : list
+            The new onsets
+        append : bool
+            If True, the current onset set is extended
+
+
+        .. versionadded:: 0.6.0
 
         """
-        new_onsets = gen_onsets(text, threshold, clean)
         if append:
-            self._onsets = list(set(self._onsets + new_onsets))
+            self._onsets = self._onsets.union(onsets)
         else:
-            self._onsets = new_onsets
+            self._onsets = frozenset(onsets)
+        self._syllable_cache.clear()
+
+    def _syllabify(self, word: str) -> List[str]:
+        """Return the syllables of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to syllabify
+
+        Returns
+        -------
+        list
+            The syllables of the word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return LegaliPy(word, self._onsets)
 
     def tokenize(self, string: str, ipa: bool = False) -> 'LegaliPyTokenizer':
         """Tokenize the term and store it.
@@ -127,13 +227,17 @@ class LegaliPyTokenizer(_Tokenizer):
         LegaliPyTokenizer({'ch': 1, 'ar': 1, 'act': 1, 'er': 1})
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Syllables of words are cached
 
         """
         self._string = string
 
         self._ordered_tokens = []
         for word in string.split():
-            self._ordered_tokens += LegaliPy(word, self._onsets)
+            self._ordered_tokens += self._syllable_cache.syllables(
+                word, self._syllabify
+            )
         if not self._ordered_tokens:
             self._ordered_tokens = [self._string]
 
@@ -0,0 +1,228 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._q_gram_codes.
+
+The tokenizer._q_gram_codes module packs q-grams & q-skipgrams into integer
+codes, computed over whole arrays of a string's characters.
+
+The code of a q-gram is a number in base 2**21 (which exceeds the greatest
+Unicode code point), with one digit per character: its code point plus 1.
+Since no digit is 0, q-grams of different lengths have different codes, and
+the codes of q-grams of up to 3 characters fit in a numpy.int64.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+__all__ = []  # type: List[str]
+
+_BITS = 21
+_MASK = (1 << _BITS) - 1
+_MAX_QVAL = 63 // _BITS
+
+
+def _check_qval(qval: int) -> None:
+    """Raise a ValueError if q-grams of length qval do not fit in a code.
+
+    Parameters
+    ----------
+    qval : int
+        The q-gram length
+
+    Raises
+    ------
+    ValueError
+        Integer codes hold q-grams of up to 3 characters
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if qval > _MAX_QVAL:
+        raise ValueError(
+            'Integer codes hold q-grams of up to {} characters'.format(
+                _MAX_QVAL
+            )
+        )
+
+
+def _char_codes(string: str) -> np.ndarray:
+    """Return the digit of each character of a string.
+
+    Parameters
+    ----------
+    string : str
+        The string
+
+    Returns
+    -------
+    numpy.ndarray
+        The code point + 1 of each character, as numpy.int64
+
+    Examples
+    --------
+    >>> _char_codes('AT')
+    array([66, 85])
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return (
+        np.frombuffer(
+            string.encode('utf-32-le', 'surrogatepass'), dtype='<u4'
+        ).astype(np.int64)
+        + 1
+    )
+
+
+def _qgram_codes(chars: np.ndarray, qval: int, step: int = 1) -> np.ndarray:
+    """Return the codes of the q-grams of a string.
+
+    As with the slices string[i : i + qval * step : step], the q-grams that
+    start near the end of the string are truncated at its end.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        The digits of the string's characters
+    qval : int
+        The q-gram length
+    step : int
+        The distance between the characters of a q-gram (1 plus the skip)
+
+    Returns
+    -------
+    numpy.ndarray
+        The code of the q-gram that starts at each of the first
+        len(chars) - (qval - 1) characters
+
+    Examples
+    --------
+    >>> _decode_codes(_qgram_codes(_char_codes('AACTA'), 2, 2))
+    ['AC', 'AT', 'CA', 'T']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    count = max(len(chars) - (qval - 1), 0)
+    codes = chars[:count].copy()
+    for k in range(1, qval):
+        # only the q-grams whose kth character is within the string extend
+        extended = max(min(count, len(chars) - k * step), 0)
+        codes[:extended] <<= _BITS
+        codes[:extended] |= chars[k * step : k * step + extended]
+    return codes
+
+
+def _skipgram_codes(
+    chars: np.ndarray, qval: int, max_span: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the codes of the q-skipgrams of a string.
+
+    The q-skipgrams are built a character at a time: each partial q-skipgram
+    is extended by every character after its last one. Only the code, first
+    and last position of each partial q-skipgram are kept, not its
+    characters' positions.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        The digits of the string's characters
+    qval : int
+        The q-skipgram length
+    max_span : int or None
+        If set, the greatest number of consecutive characters that a
+        q-skipgram's characters may lie within
+
+    Returns
+    -------
+    tuple
+        The code of each combination of qval of the string's characters,
+        and the distance between its first & last characters
+
+    Examples
+    --------
+    >>> codes, spans = _skipgram_codes(_char_codes('ABC'), 2)
+    >>> _decode_codes(codes)
+    ['AB', 'AC', 'BC']
+    >>> spans
+    array([1, 2, 1])
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    length = len(chars)
+    codes = chars.copy()
+    firsts = np.arange(length)
+    lasts = firsts
+    for _ in range(1, qval):
+        follow = length - 1 - lasts
+        if max_span is not None:
+            follow = np.maximum(
+                np.minimum(follow, firsts + max_span - 1 - lasts), 0
+            )
+        parents = np.repeat(np.arange(len(codes)), follow)
+        offsets = np.arange(len(parents)) - np.repeat(
+            np.cumsum(follow) - follow, follow
+        )
+        lasts = lasts[parents] + 1 + offsets
+        codes = (codes[parents] << _BITS) | chars[lasts]
+        firsts = firsts[parents]
+    return codes, lasts - firsts
+
+
+def _decode_codes(codes: Iterable[int]) -> List[str]:
+    """Return the q-grams of a sequence of codes.
+
+    Parameters
+    ----------
+    codes : Iterable[int]
+        The codes
+
+    Returns
+    -------
+    list
+        The q-gram of each code
+
+    Examples
+    --------
+    >>> _decode_codes([66, (66 << 21) | 85])
+    ['A', 'AT']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    qgrams = []
+    for code in codes:
+        code = int(code)
+        chars = []
+        while code:
+            chars.append(chr((code & _MASK) - 1))
+            code >>= _BITS
+        qgrams.append(''.join(reversed(chars)))
+    return qgrams
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
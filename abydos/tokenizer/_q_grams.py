@@ -20,8 +20,24 @@ QGrams multi-set class
 """
 
 from collections.abc import Iterable
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
-
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from ._q_gram_codes import (
+    _char_codes,
+    _check_qval,
+    _decode_codes,
+    _qgram_codes,
+)
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QGrams']
@@ -127,11 +143,11 @@ class QGrams(_Tokenizer):
         super(QGrams, self).__init__(scaler)
 
         # Save parameters
-        self.qval = qval
+        self.qval = qval if isinstance(qval, Iterable) else (qval,)
         self.start_stop = start_stop
         if qval == 1:
             self.start_stop = ''
-        self.skip = skip
+        self.skip = skip if isinstance(skip, Iterable) else (skip,)
 
         self._string_ss = self._string
 
@@ -190,6 +206,110 @@ class QGrams(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def tokenize_codes(self, string: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the integer codes of the q-grams of a string & their counts.
+
+        Each q-gram is packed into an integer, computed over an array of the
+        string's characters, so no q-gram is sliced out as a str and no
+        Counter is built. The codes are sorted, so the q-grams that two
+        strings share may be found with numpy.intersect1d. The codes of
+        q-grams that are equal are equal, whichever tokenizer produced them,
+        and decode_codes returns their q-grams.
+
+        Integer codes hold q-grams of up to 3 characters. The counts are not
+        scaled, and the tokenizer's state (as returned by get_counter, etc.)
+        is not changed.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple
+            The sorted, distinct codes of the q-grams and the count of each,
+            as numpy.ndarrays of numpy.int64
+
+        Raises
+        ------
+        ValueError
+            Integer codes hold q-grams of up to 3 characters
+
+        Examples
+        --------
+        >>> qg = QGrams()
+        >>> codes, counts = qg.tokenize_codes('AATTATAT')
+        >>> qg.decode_codes(codes)
+        ['$A', 'AA', 'AT', 'T#', 'TA', 'TT']
+        >>> counts
+        array([1, 1, 3, 1, 2, 1])
+
+        >>> import numpy as np
+        >>> other_codes, _ = qg.tokenize_codes('TATA')
+        >>> qg.decode_codes(np.intersect1d(codes, other_codes))
+        ['AT', 'TA']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        codes = []  # type: List[np.ndarray]
+
+        if string:
+            for qval_i in cast(TIterable[int], self.qval):
+                if qval_i < 1:
+                    continue
+                if self.start_stop:
+                    padded = (
+                        self.start_stop[0] * (qval_i - 1)
+                        + string
+                        + self.start_stop[-1] * (qval_i - 1)
+                    )
+                else:
+                    padded = string
+                if qval_i > 1 and len(padded) < qval_i:
+                    continue
+
+                _check_qval(qval_i)
+                chars = _char_codes(padded)
+                for skip_i in cast(TIterable[int], self.skip):
+                    codes.append(_qgram_codes(chars, qval_i, skip_i + 1))
+
+        if not codes:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        unique, counts = np.unique(
+            np.concatenate(codes) if len(codes) > 1 else codes[0],
+            return_counts=True,
+        )
+        return unique, counts.astype(np.int64)
+
+    @staticmethod
+    def decode_codes(codes: TIterable[int]) -> List[str]:
+        """Return the q-grams of a sequence of integer codes.
+
+        Parameters
+        ----------
+        codes : Iterable[int]
+            Codes, as returned by tokenize_codes
+
+        Returns
+        -------
+        list
+            The q-gram of each code
+
+        Examples
+        --------
+        >>> qg = QGrams(qval=3)
+        >>> qg.decode_codes(qg.tokenize_codes('ATA')[0])
+        ['$$A', '$AT', 'A##', 'ATA', 'TA#']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _decode_codes(codes)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,10 +19,28 @@
 Q-Skipgrams multi-set class
 """
 
+from collections import Counter
 from collections.abc import Iterable
 from itertools import combinations
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
-
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from ._q_gram_codes import (
+    _char_codes,
+    _check_qval,
+    _decode_codes,
+    _skipgram_codes,
+)
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QSkipgrams']
@@ -45,6 +63,7 @@ class QSkipgrams(_Tokenizer):
         start_stop: str = '$#',
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
         ssk_lambda: Union[float, TIterable[float]] = 0.9,
+        max_span: Optional[int] = None,
     ) -> None:
         """Initialize QSkipgrams.
 
@@ -83,6 +102,10 @@ class QSkipgrams(_Tokenizer):
             characters according to the method described in :cite:`Lodhi:2002`.
             To supply multiple values of lambda, provide an Iterable of numeric
             values, such as (0.5, 0.05) or np.arange(0.05, 0.5, 0.05)
+        max_span : int or None
+            If set, only the q-skipgrams whose characters lie within this many
+            consecutive characters of the string are produced (so that
+            max_span=qval produces only contiguous q-grams)
 
         Raises
         ------
@@ -137,13 +160,19 @@ class QSkipgrams(_Tokenizer):
         'TC': 0.531441, 'T#': 0.4782969000000001, 'GA': 1.5390000000000001,
         'GC': 0.6561, 'G#': 0.5904900000000001})
 
+        >>> QSkipgrams(qval=3, start_stop='', max_span=4).tokenize('ABCDE')
+        QSkipgrams({'ABC': 1, 'ABD': 1, 'ACD': 1, 'BCD': 1, 'BCE': 1,
+        'BDE': 1, 'CDE': 1})
+
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_span
 
         """
         super(QSkipgrams, self).__init__(scaler)
 
         # Save parameters
-        self.qval = qval
+        self.qval = qval if isinstance(qval, Iterable) else (qval,)
         self.start_stop = start_stop
         if qval == 1:
             self.start_stop = ''
@@ -153,67 +182,421 @@ class QSkipgrams(_Tokenizer):
             self._lambda = (ssk_lambda,)  # type: TIterable[float]
         else:
             self._lambda = tuple(ssk_lambda)
+        self.max_span = max_span
 
-    def tokenize(self, string: str) -> 'QSkipgrams':
-        """Tokenize the term and store it.
+    def _padded(self, string: str) -> Iterator[Tuple[int, str]]:
+        """Yield each q-skipgram length and the string padded for it.
 
-        The tokenized term is stored as an ordered list and as a Counter
-        object.
+        Lengths less than 1, and those that exceed the length of the padded
+        string, are skipped.
 
         Parameters
         ----------
         string : str
             The string to tokenize
 
+        Yields
+        ------
+        tuple
+            A q-skipgram length and the string, with start & stop symbols if
+            it is not empty
 
-        .. versionadded:: 0.4.0
 
-        """
-        self._string = string
-        self._ordered_tokens = []
-        self._ordered_weights = []
+        .. versionadded:: 0.6.0
 
+        """
         if not isinstance(self.qval, Iterable):
             self.qval = (self.qval,)
 
         for qval_i in cast(TIterable[int], self.qval):
             if qval_i < 1:
                 continue
-
-            if self.start_stop and self._string:
-                string = (
+            if self.start_stop and string:
+                padded = (
                     self.start_stop[0] * (qval_i - 1)
-                    + self._string
+                    + string
                     + self.start_stop[-1] * (qval_i - 1)
                 )
             else:
-                string = self._string
-
-            if len(string) < qval_i:
+                padded = string
+            if len(padded) < qval_i:
                 continue
+            yield qval_i, padded
+
+    def _positions(self, length: int, qval: int) -> Iterator[Tuple[int, ...]]:
+        """Yield the positions of the characters of each q-skipgram.
+
+        Parameters
+        ----------
+        length : int
+            The length of the (padded) string
+        qval : int
+            The q-skipgram length
+
+        Yields
+        ------
+        tuple
+            The positions of the characters of a q-skipgram, in the order of
+            itertools.combinations
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.max_span is None:
+            yield from combinations(range(length), qval)
+            return
+        for first in range(length):
+            last = min(length, first + self.max_span)
+            for rest in combinations(range(first + 1, last), qval - 1):
+                yield (first,) + rest
+
+    def tokenize(self, string: str) -> 'QSkipgrams':
+        """Tokenize the term and store it.
+
+        The tokenized term is stored as an ordered list and as a Counter
+        object.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
 
+
+        .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            The combinations of characters are no longer collected in a list
+
+        """
+        self._string = string
+        self._ordered_tokens = []
+        self._ordered_weights = []
+
+        for qval_i, string in self._padded(self._string):
             # Having appended start & stop symbols (or not), save the
             # result, but only for the longest valid qval_i
             if len(string) > len(self._string_ss):
                 self._string_ss = string
 
-            combs = list(combinations(enumerate(string), qval_i))
-            self._ordered_tokens += [''.join(l[1] for l in t) for t in combs]
+            if self.max_span is None:
+                tokens = list(map(''.join, combinations(string, qval_i)))
+            else:
+                tokens = [
+                    ''.join([string[i] for i in positions])
+                    for positions in self._positions(len(string), qval_i)
+                ]
+            self._ordered_tokens += tokens
 
             if self._scaler == 'SSK':
+                # The weight of a q-skipgram depends only on the distance
+                # between its first & last characters
+                span_weights = self._ssk_weights(len(string), qval_i)
                 self._ordered_weights += [
-                    sum(
-                        l ** (t[-1][0] - t[0][0] + len(t) - 1)
-                        for l in self._lambda
-                    )
-                    for t in combs
+                    span_weights[positions[-1] - positions[0]]
+                    for positions in self._positions(len(string), qval_i)
                 ]
             else:
-                self._ordered_weights += [1] * len(combs)
+                self._ordered_weights += [1] * len(tokens)
 
         self._scale_and_counterize()
         return self
 
+    def _ssk_weights(self, length: int, qval: int) -> List[float]:
+        """Return the SSK weight of each span of a q-skipgram.
+
+        Parameters
+        ----------
+        length : int
+            The length of the string
+        qval : int
+            The q-skipgram length
+
+        Returns
+        -------
+        list
+            The weight of a q-skipgram whose first & last characters are each
+            distance apart
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [
+            sum(l ** (span + qval - 1) for l in self._lambda)
+            for span in range(length)
+        ]
+
+    def tokenize_codes(self, string: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the integer codes of the q-skipgrams of a string & counts.
+
+        Each q-skipgram is packed into an integer, and the q-skipgrams are
+        built over arrays of the codes, so no q-skipgram is joined as a str
+        and no Counter is built. The codes are sorted, so the q-skipgrams
+        that two strings share may be found with numpy.intersect1d, and
+        decode_codes returns their q-skipgrams.
+
+        Integer codes hold q-skipgrams of up to 3 characters. The counts are
+        summed SSK weights if the scaler is 'SSK', and otherwise are not
+        scaled. The tokenizer's state (as returned by get_counter, etc.) is
+        not changed.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple
+            The sorted, distinct codes of the q-skipgrams, as a numpy.ndarray
+            of numpy.int64, and the count (numpy.int64) or SSK weight
+            (numpy.float64) of each
+
+        Raises
+        ------
+        ValueError
+            Integer codes hold q-grams of up to 3 characters
+
+        Examples
+        --------
+        >>> qs = QSkipgrams(start_stop='')
+        >>> codes, counts = qs.tokenize_codes('ABCB')
+        >>> qs.decode_codes(codes)
+        ['AB', 'AC', 'BB', 'BC', 'CB']
+        >>> counts
+        array([2, 1, 1, 1, 1])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        codes = []  # type: List[np.ndarray]
+        weights = []  # type: List[np.ndarray]
+
+        for qval_i, padded in self._padded(string):
+            _check_qval(qval_i)
+            qval_codes, spans = _skipgram_codes(
+                _char_codes(padded), qval_i, self.max_span
+            )
+            codes.append(qval_codes)
+            if self._scaler == 'SSK':
+                span_weights = np.array(
+                    self._ssk_weights(len(padded), qval_i), dtype=np.float64
+                )
+                weights.append(span_weights[spans])
+
+        if not codes:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        all_codes = np.concatenate(codes)
+        if self._scaler != 'SSK':
+            unique, counts = np.unique(all_codes, return_counts=True)
+            return unique, counts.astype(np.int64)
+        unique, inverse = np.unique(all_codes, return_inverse=True)
+        return unique, np.bincount(inverse, weights=np.concatenate(weights))
+
+    @staticmethod
+    def decode_codes(codes: TIterable[int]) -> List[str]:
+        """Return the q-skipgrams of a sequence of integer codes.
+
+        Parameters
+        ----------
+        codes : Iterable[int]
+            Codes, as returned by tokenize_codes
+
+        Returns
+        -------
+        list
+            The q-skipgram of each code
+
+        Examples
+        --------
+        >>> qs = QSkipgrams()
+        >>> qs.decode_codes(qs.tokenize_codes('AT')[0])
+        ['$#', '$A', '$T', 'A#', 'AT', 'T#']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _decode_codes(codes)
+
+    def iter_skipgrams(self, string: str) -> Iterator[Tuple[str, float]]:
+        """Yield the q-skipgrams of a string and their weights.
+
+        The q-skipgrams are produced one at a time, in the order of
+        get_list, so that they may be counted or filtered without holding
+        all of them in memory. The tokenizer's state (as returned by
+        get_counter, etc.) is not changed, and the weights are not scaled,
+        except by the 'SSK' scaler.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Yields
+        ------
+        tuple
+            A q-skipgram and its weight
+
+        Examples
+        --------
+        >>> qs = QSkipgrams(start_stop='', scaler='SSK', ssk_lambda=0.5)
+        >>> list(qs.iter_skipgrams('ABC'))
+        [('AB', 0.25), ('AC', 0.125), ('BC', 0.25)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for qval_i, padded in self._padded(string):
+            if self._scaler == 'SSK':
+                span_weights = self._ssk_weights(len(padded), qval_i)
+            for positions in self._positions(len(padded), qval_i):
+                skipgram = ''.join([padded[i] for i in positions])
+                if self._scaler == 'SSK':
+                    yield skipgram, span_weights[positions[-1] - positions[0]]
+                else:
+                    yield skipgram, 1
+
+    def ssk_kernel(self, src: str, tar: str) -> float:
+        """Return the SSK inner product of two strings' q-skipgram weights.
+
+        This is the sum, over the q-skipgrams of both strings, of the
+        product of their 'SSK' weights in each, as computed by the dynamic
+        programme of :cite:`Lodhi:2002` in O(n * m) memory, without
+        enumerating the q-skipgrams. Each of its q steps is a pair of dense
+        matrix products, over all positions in both strings at once, for
+        O(q * n * m * (n + m)) time. Where more than one lambda is supplied,
+        the programme is run once for each pair of them.
+
+        Parameters
+        ----------
+        src : str
+            Source string
+        tar : str
+            Target string
+
+        Returns
+        -------
+        float
+            The sum of the products of the strings' q-skipgram weights
+
+        Raises
+        ------
+        ValueError
+            The SSK kernel requires the 'SSK' scaler and no max_span
+
+        Examples
+        --------
+        >>> qs = QSkipgrams(start_stop='', scaler='SSK')
+        >>> round(qs.ssk_kernel('cat', 'car'), 12)
+        0.6561
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler != 'SSK' or self.max_span is not None:
+            raise ValueError(
+                'The SSK kernel requires the SSK scaler and no max_span'
+            )
+
+        # a q-value repeated k times multiplies each weight of its
+        # q-skipgrams by k, in both strings
+        src_padded = Counter(self._padded(src))
+        tar_padded = Counter(self._padded(tar))
+        kernel = 0.0
+        for (qval_i, src_i), src_count in src_padded.items():
+            for (tar_qval, tar_i), tar_count in tar_padded.items():
+                if tar_qval != qval_i:
+                    continue
+                matches = (
+                    _char_codes(src_i)[:, None] == _char_codes(tar_i)[None, :]
+                ).astype(np.float64)
+                for src_lambda in self._lambda:
+                    for tar_lambda in self._lambda:
+                        kernel += (
+                            src_count
+                            * tar_count
+                            * (src_lambda * tar_lambda) ** (qval_i - 2)
+                            * _lodhi_kernel(
+                                matches, qval_i, src_lambda, tar_lambda
+                            )
+                        )
+        return kernel
+
+
+def _decay_matrix(length: int, decay: float) -> np.ndarray:
+    """Return the upper triangular matrix of decay ** (col - row).
+
+    Parameters
+    ----------
+    length : int
+        The number of rows & columns
+    decay : float
+        The decay factor
+
+    Returns
+    -------
+    numpy.ndarray
+        The matrix
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    distances = np.arange(length)[None, :] - np.arange(length)[:, None]
+    return np.where(distances >= 0, decay ** np.maximum(distances, 0), 0.0)
+
+
+def _lodhi_kernel(
+    matches: np.ndarray, qval: int, src_lambda: float, tar_lambda: float
+) -> float:
+    """Return the subsequence kernel of two strings.
+
+    Parameters
+    ----------
+    matches : numpy.ndarray
+        A matrix that is 1 where the source string's character (row) is the
+        target string's character (column) and 0 elsewhere
+    qval : int
+        The subsequence length
+    src_lambda : float
+        The decay factor of gaps in the source string
+    tar_lambda : float
+        The decay factor of gaps in the target string
+
+    Returns
+    -------
+    float
+        The sum, over the pairs of equal subsequences of length qval in the
+        strings, of src_lambda & tar_lambda raised to the lengths they span
+        in each string
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # The decay of the rest of each string after a position, in the target
+    # string from each position (row) to each (column), & in the source
+    # string from each (column) to each (row)
+    tar_decay = _decay_matrix(matches.shape[1], tar_lambda) * tar_lambda
+    src_decay = _decay_matrix(matches.shape[0], src_lambda).T
+
+    # prefix_kernel[a, b] is K'_i of the source string's first a characters
+    # & the target string's first b characters, which starts as K'_0 = 1
+    prefix_kernel = np.ones((matches.shape[0] + 1, matches.shape[1] + 1))
+    for _ in range(1, qval):
+        # The subsequences that end with a matched pair, each extending a
+        # subsequence of the prefixes before it
+        ending = src_lambda * (matches * prefix_kernel[:-1, :-1]) @ tar_decay
+        prefix_kernel = np.zeros_like(prefix_kernel)
+        prefix_kernel[1:, 1:] = src_decay @ ending
+    return float(
+        src_lambda * tar_lambda * np.sum(matches * prefix_kernel[:-1, :-1])
+    )
+
 
 if __name__ == '__main__':
     import doctest
@@ -21,6 +21,7 @@ SonoriPy class
 
 from typing import Callable, Optional, Union
 
+from ._syllable_cache import _SyllableCache
 from ._tokenizer import _Tokenizer
 
 try:
@@ -38,7 +39,9 @@ class SonoriPyTokenizer(_Tokenizer):
     """
 
     def __init__(
-        self, scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        self,
+        scaler: Optional[Union[str, Callable[[float], float]]] = None,
+        cache_size: int = 65536,
     ) -> None:
         """Initialize Tokenizer.
 
@@ -58,9 +61,14 @@ class SonoriPyTokenizer(_Tokenizer):
                   in the Counter. Some useful functions include math.exp,
                   math.log1p, math.sqrt, and indexes into interesting integer
                   sequences such as the Fibonacci sequence.
+        cache_size : int
+            The maximum number of words whose syllables are cached, so that
+            repeated words are syllabified only once; if 0, nothing is cached
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size
 
         """
         if SonoriPy is None:
@@ -71,6 +79,8 @@ class SonoriPyTokenizer(_Tokenizer):
 
         super(SonoriPyTokenizer, self).__init__(scaler)
 
+        self._syllable_cache = _SyllableCache(cache_size)
+
     def tokenize(self, string: str) -> 'SonoriPyTokenizer':
         """Tokenize the term and store it.
 
@@ -92,13 +102,17 @@ class SonoriPyTokenizer(_Tokenizer):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Syllables of words are cached
 
         """
         self._string = string
 
         self._ordered_tokens = []
         for word in string.split():
-            self._ordered_tokens += SonoriPy(word)
+            self._ordered_tokens += self._syllable_cache.syllables(
+                word, SonoriPy
+            )
         if not self._ordered_tokens:
             self._ordered_tokens = [self._string]
 
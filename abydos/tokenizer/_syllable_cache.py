@@ -0,0 +1,142 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._syllable_cache.
+
+The tokenizer._syllable_cache module implements _SyllableCache, a bounded
+cache of the syllables of words, which the syllabifying tokenizers keep so
+that repeated words are syllabified only once.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+__all__ = ['_SyllableCache']
+
+
+class _SyllableCache:
+    """Bounded cache of the syllables of words.
+
+    When the cache is full, it is emptied before the next word is added.
+
+    A cache only saves work: the syllables of a word are the same whether or
+    not they are cached. So caches of the same size compare equal, and a
+    cache is pickled without its contents, which keeps tokenizers that hold
+    one comparable and compact.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """Initialize _SyllableCache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of words to cache; if 0, nothing is cached
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.maxsize = maxsize
+        self._syllables = {}  # type: Dict[str, Tuple[str, ...]]
+
+    def syllables(
+        self, word: str, syllabify: Callable[[str], List[str]]
+    ) -> Tuple[str, ...]:
+        """Return the (possibly cached) syllables of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to syllabify
+        syllabify : function
+            The function that returns the syllables of a word, called if the
+            word is not cached
+
+        Returns
+        -------
+        tuple
+            The syllables of the word
+
+        Examples
+        --------
+        >>> cache = _SyllableCache()
+        >>> cache.syllables('nelson', lambda word: [word[:3], word[3:]])
+        ('nel', 'son')
+        >>> cache.syllables('nelson', lambda word: [word])
+        ('nel', 'son')
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        syllables = self._syllables.get(word)
+        if syllables is None:
+            syllables = tuple(syllabify(word))
+            if self.maxsize > 0:
+                if len(self._syllables) >= self.maxsize:
+                    self._syllables.clear()
+                self._syllables[word] = syllables
+        return syllables
+
+    def clear(self) -> None:
+        """Remove all words from the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._syllables.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached words.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._syllables)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other is a _SyllableCache of the same size.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(other, _SyllableCache):
+            return NotImplemented
+        return self.maxsize == other.maxsize
+
+    def __hash__(self) -> int:
+        """Return the hash of the size of the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return hash((_SyllableCache, self.maxsize))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Return the arguments needed to pickle an empty _SyllableCache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (_SyllableCache, (self.maxsize,))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,329 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._token_profile.
+
+Token profiles: immutable, pre-tokenized strings
+"""
+
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Counter as TCounter,
+    Hashable,
+    Iterable,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+)
+
+from ._tokenizer import _Tokenizer
+
+__all__ = ['TokenProfile']
+
+
+class TokenProfile(Counter):
+    """An immutable, pre-tokenized string.
+
+    A TokenProfile is a Counter of the tokens of a string that also records
+    the string itself, its tokens in order, their cardinality (the sum of the
+    absolute values of the counts), and their norm (the square root of the
+    sum of the squared counts). Token-based distance measures accept a
+    TokenProfile anywhere they accept a string, so a string that is compared
+    many times need only be tokenized once.
+
+    TokenProfiles are normally created by the prepare method of a token-based
+    distance measure, which caches them.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = ('string', 'ordered_tokens', 'cardinality', 'norm')
+
+    def __init__(
+        self,
+        string: str,
+        tokens: Mapping[str, float],
+        ordered_tokens: Iterable[str] = (),
+    ) -> None:
+        """Initialize TokenProfile.
+
+        Parameters
+        ----------
+        string : str
+            The string that was tokenized
+        tokens : Mapping
+            The tokens of the string and their counts
+        ordered_tokens : Iterable
+            The tokens of the string, in order
+
+        Examples
+        --------
+        >>> profile = TokenProfile('aa', {'a': 2}, ('a', 'a'))
+        >>> profile
+        TokenProfile('aa', {'a': 2})
+        >>> profile.cardinality, profile.norm
+        (2, 2.0)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        dict.update(self, tokens)
+        object.__setattr__(self, 'string', string)
+        object.__setattr__(self, 'ordered_tokens', tuple(ordered_tokens))
+        object.__setattr__(
+            self, 'cardinality', sum(abs(val) for val in self.values())
+        )
+        object.__setattr__(
+            self, 'norm', sum(val * val for val in self.values()) ** 0.5
+        )
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError('TokenProfile objects are immutable')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __setattr__ = _immutable
+    __delattr__ = _immutable
+    __iadd__ = _immutable
+    __isub__ = _immutable
+    __iand__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    subtract = _immutable
+    update = _immutable
+
+    def __eq__(self, other: Any) -> bool:
+        """Return whether the profile equals other.
+
+        A profile equals a string if it is the profile of that string, and
+        another profile if they are profiles of the same string with the same
+        tokens; otherwise, profiles compare as Counters.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(other, str):
+            return self.string == other
+        if isinstance(other, TokenProfile) and self.string != other.string:
+            return False
+        return super(TokenProfile, self).__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        """Return whether the profile differs from other.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def copy(self) -> TCounter[str]:
+        """Return a mutable copy of the tokens as a Counter.
+
+        Returns
+        -------
+        Counter
+            The tokens and their counts
+
+        Examples
+        --------
+        >>> TokenProfile('aa', {'a': 2}).copy()
+        Counter({'a': 2})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return Counter(dict(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Return the arguments needed to pickle a TokenProfile.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            TokenProfile,
+            (self.string, dict(self), self.ordered_tokens),
+        )
+
+    def __repr__(self) -> str:
+        """Return representation of the TokenProfile.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 'TokenProfile({!r}, {})'.format(
+            self.string, str(dict(self.most_common()))
+        )
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable representation of a tokenizer setting.
+
+    Parameters
+    ----------
+    value : Any
+        The setting
+
+    Returns
+    -------
+    Hashable
+        A hashable representation of the setting
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(value, (str, bytes, int, float)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(val)) for key, val in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(val) for val in value)
+    if isinstance(value, (list, tuple, range)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def _tokenizer_key(tokenizer: _Tokenizer) -> Optional[Hashable]:
+    """Return a hashable key for the configuration of a tokenizer.
+
+    The key is built from the tokenizer's settings on each call, so a
+    tokenizer whose settings are changed, even in place, gets a new key.
+
+    Parameters
+    ----------
+    tokenizer : _Tokenizer
+        The tokenizer
+
+    Returns
+    -------
+    Hashable or None
+        The key, or None if some setting of the tokenizer is not hashable
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    key = (
+        type(tokenizer),
+        tuple(
+            (name, _freeze(value))
+            for name, value in vars(tokenizer).items()
+            if name != '_state'
+        ),
+    )  # type: Optional[Hashable]
+    try:
+        hash(key)
+    except TypeError:
+        key = None
+    return key
+
+
+class _ProfileCache:
+    """A thread-safe, bounded, least-recently-used cache of TokenProfiles.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize _ProfileCache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of profiles to keep
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.maxsize = maxsize
+        self._profiles = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[Hashable, str], TokenProfile]
+        self._lock = Lock()
+
+    def profile(self, tokenizer: _Tokenizer, string: str) -> TokenProfile:
+        """Return the (possibly cached) profile of a string.
+
+        Parameters
+        ----------
+        tokenizer : _Tokenizer
+            The tokenizer with which to tokenize the string
+        string : str
+            The string to profile
+
+        Returns
+        -------
+        TokenProfile
+            The profile of the string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tok_key = _tokenizer_key(tokenizer)
+        if tok_key is None or self.maxsize <= 0:
+            tokenizer.tokenize(string)
+            return TokenProfile(
+                string, tokenizer.get_counter(), tokenizer.get_list()
+            )
+
+        key = (tok_key, string)
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                return profile
+
+        tokenizer.tokenize(string)
+        profile = TokenProfile(
+            string, tokenizer.get_counter(), tokenizer.get_list()
+        )
+
+        with self._lock:
+            self._profiles[key] = profile
+            if len(self._profiles) > self.maxsize:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def clear(self) -> None:
+        """Remove all profiles from the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            self._profiles.clear()
+
+
+_profile_cache = _ProfileCache(65536)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
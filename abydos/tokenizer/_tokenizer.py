@@ -21,11 +21,14 @@ _Tokenizer base class
 
 from collections import Counter, defaultdict
 from math import exp, log1p, log2
+from operator import attrgetter
+from threading import local
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
     DefaultDict,
+    Dict,
     List,
     Optional,
     Set,
@@ -36,12 +39,63 @@ from typing import (
 __all__ = ['_Tokenizer']
 
 
+class _TokenizerState(local):
+    """The most recently tokenized string & its tokens, kept per thread.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize _TokenizerState.
+
+        .. versionadded:: 0.6.0
+        """
+        self.string = ''
+        self.string_ss = ''
+        self.tokens = defaultdict(int)  # type: DefaultDict[str, float]
+        self.ordered_tokens = []  # type: List[str]
+        self.ordered_weights = []  # type: List[float]
+
+
+def _state_attribute(name: str) -> Any:
+    """Return a property that reads & writes an attribute of _state.
+
+    Parameters
+    ----------
+    name : str
+        The name of the _TokenizerState attribute
+
+
+    .. versionadded:: 0.6.0
+
+    """
+
+    get_value = attrgetter(name)
+
+    def _get(self: '_Tokenizer') -> Any:
+        return get_value(self._state)
+
+    def _set(self: '_Tokenizer', value: Any) -> None:
+        setattr(self._state, name, value)
+
+    return property(_get, _set)
+
+
 class _Tokenizer:
     """Abstract _Tokenizer class.
 
+    The result of the last call to tokenize is kept separately for each
+    thread, so a single tokenizer may be shared among threads.
+
     .. versionadded:: 0.4.0
     """
 
+    _string = _state_attribute('string')
+    _string_ss = _state_attribute('string_ss')
+    _tokens = _state_attribute('tokens')
+    _ordered_tokens = _state_attribute('ordered_tokens')
+    _ordered_weights = _state_attribute('ordered_weights')
+
     def __init__(
         self,
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
@@ -76,10 +130,28 @@ class _Tokenizer:
         super(_Tokenizer, self).__init__()
 
         self._scaler = scaler
-        self._tokens = defaultdict(int)  # type: DefaultDict[str, float]
-        self._string = ''
-        self._ordered_tokens = []  # type: List[str]
-        self._ordered_weights = []  # type: List[float]
+        self._state = _TokenizerState()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the tokenizer's configuration for pickling.
+
+        The per-thread tokenization state is not pickled.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_state']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the tokenizer's configuration from a pickle.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._state = _TokenizerState()
 
     def tokenize(self, string: str) -> '_Tokenizer':
         """Tokenize the term and store it.
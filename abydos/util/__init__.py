@@ -20,8 +20,21 @@ The util module defines various utility functions for other modules within
 Abydos, including:
 
     - _prod -- computes the product of a collection of numbers (akin to sum)
+    - _parallel -- applies a method to a stream of inputs in batches, in the
+      calling process or across a pool of worker processes
 
 These functions are not intended for use by users.
+
+It also defines Memoizer (:py:class:`.Memoizer`), which wraps a phonetic
+algorithm, stemmer, or fingerprint and caches its outputs in memory and,
+optionally, in an SQLite database shared by several processes:
+
+>>> from abydos.phonetic import DoubleMetaphone
+>>> dm = Memoizer(DoubleMetaphone(), maxsize=10000)
+>>> dm.encode('Schmidt'), dm.encode('Schmidt')
+('XMT,SMT', 'XMT,SMT')
+>>> dm.cache_info().hits
+1
 """
 
 from ._data import (
@@ -31,8 +44,10 @@ from ._data import (
     list_installed_packages,
     package_path,
 )
+from ._memoizer import Memoizer
 
 __all__ = [
+    'Memoizer',
     'data_path',
     'download_package',
     'list_available_packages',
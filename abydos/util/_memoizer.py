@@ -0,0 +1,539 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._memoizer.
+
+The util._memoizer module defines Memoizer, which caches the outputs of a
+phonetic algorithm, stemmer, or fingerprint.
+"""
+
+import json
+import os
+import sqlite3
+from collections import OrderedDict, namedtuple
+from functools import partial
+from hashlib import sha1
+from threading import Lock
+from types import (
+    BuiltinFunctionType,
+    BuiltinMethodType,
+    FunctionType,
+    MethodType,
+    ModuleType,
+)
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .. import __version__
+
+__all__ = ['Memoizer']
+
+# The methods of phonetic algorithms, stemmers, and fingerprints that are
+# memoized
+_METHODS = ('encode', 'encode_alpha', 'stem', 'fingerprint')
+
+# The number of new outputs written to the database before a commit
+_COMMIT_EVERY = 1000
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'disk_hits', 'maxsize', 'currsize']
+)
+
+
+def _canonical(value: Any, _active: FrozenSet[int] = frozenset()) -> str:
+    """Return a canonical string representation of a setting.
+
+    Unlike repr, the representation does not depend on the iteration order of
+    sets & dicts, nor on the memory addresses of objects, so it is the same in
+    every process. Functions & classes are represented by their qualified
+    names and bound methods by their instances & names; an object that
+    refers back to one being represented is shown as '...'.
+
+    Parameters
+    ----------
+    value : Any
+        The setting
+
+    Returns
+    -------
+    str
+        The representation
+
+    Raises
+    ------
+    TypeError
+        The setting has no representation that is the same in every process,
+        such as a lambda or a nested function
+
+    Examples
+    --------
+    >>> _canonical({'b': {3, 1, 2}, 'a': (1.5, None)})
+    "{'a':(1.5,None),'b':{1,2,3}}"
+    >>> _canonical([len, 'ab'.upper])
+    "(builtins.len,'ab'.upper)"
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return repr(value)
+    if isinstance(value, dict):
+        return (
+            '{'
+            + ','.join(
+                sorted(
+                    _canonical(key, _active) + ':' + _canonical(val, _active)
+                    for key, val in value.items()
+                )
+            )
+            + '}'
+        )
+    if isinstance(value, (set, frozenset)):
+        return (
+            '{'
+            + ','.join(sorted(_canonical(val, _active) for val in value))
+            + '}'
+        )
+    if isinstance(value, (list, tuple)):
+        return '(' + ','.join(_canonical(val, _active) for val in value) + ')'
+    if hasattr(value, 'pattern') and hasattr(value, 'flags'):
+        # a compiled regular expression
+        return 're({!r},{})'.format(value.pattern, value.flags)
+    if isinstance(value, (MethodType, BuiltinMethodType)) and not isinstance(
+        value.__self__, ModuleType
+    ):
+        # a bound method
+        return _canonical(value.__self__, _active) + '.' + value.__name__
+    if isinstance(value, (FunctionType, BuiltinFunctionType, type)):
+        name = '{}.{}'.format(value.__module__, value.__qualname__)
+        if '<' in name:
+            raise TypeError('{} has no canonical representation'.format(name))
+        return name
+    if isinstance(value, partial):
+        return 'functools.partial{}'.format(
+            _canonical((value.func, value.args, value.keywords), _active)
+        )
+    if hasattr(value, '__dict__'):
+        if id(value) in _active:
+            return '...'
+        return '{}.{}{}'.format(
+            type(value).__module__,
+            type(value).__qualname__,
+            _canonical(vars(value), _active | {id(value)}),
+        )
+    representation = repr(value)
+    if ' at 0x' in representation:
+        raise TypeError(
+            '{} has no canonical representation'.format(representation)
+        )
+    return representation
+
+
+def _config_key(transformer: Any) -> str:
+    """Return a key identifying the class, settings, & version of an instance.
+
+    Parameters
+    ----------
+    transformer : object
+        A phonetic algorithm, stemmer, or fingerprint instance
+
+    Returns
+    -------
+    str
+        The key: a hexadecimal digest
+
+    Raises
+    ------
+    TypeError
+        A setting of the instance has no canonical representation
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return sha1(  # noqa: S303
+        (__version__ + _canonical(transformer)).encode('utf-8')
+    ).hexdigest()
+
+
+def _loads(output: str) -> Any:
+    """Return an output stored in the database.
+
+    Outputs are stored as JSON, in which tuples become lists.
+
+    Parameters
+    ----------
+    output : str
+        The stored output
+
+    Returns
+    -------
+    Any
+        The output
+
+    Examples
+    --------
+    >>> _loads(json.dumps(('N400', ('A', 'B'))))
+    ('N400', ('A', 'B'))
+
+
+    .. versionadded:: 0.6.0
+
+    """
+
+    def _tuples(value: Any) -> Any:
+        if isinstance(value, list):
+            return tuple(_tuples(val) for val in value)
+        return value
+
+    return _tuples(json.loads(output))
+
+
+class Memoizer:
+    """Memoizer.
+
+    A Memoizer wraps a phonetic algorithm, stemmer, or fingerprint instance
+    and caches the outputs of its encode, encode_alpha, stem, and fingerprint
+    methods (whichever it has) in a bounded least-recently-used cache, which
+    suits inputs, such as names and words, that follow a Zipf distribution.
+
+    Optionally, outputs are also stored in an SQLite database, which several
+    processes can share and which persists between runs. Stored outputs are
+    keyed on the class, settings, and Abydos version of the wrapped instance,
+    so one database can serve many instances. Outputs are stored as JSON.
+    New outputs are committed in batches; call flush or close to commit the
+    rest.
+
+    The wrapped instance should not be modified after it is wrapped.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        transformer: Any,
+        maxsize: Optional[int] = 65536,
+        path: Optional[str] = None,
+    ) -> None:
+        """Initialize Memoizer.
+
+        Parameters
+        ----------
+        transformer : object
+            A phonetic algorithm, stemmer, or fingerprint instance
+        maxsize : int or None
+            The greatest number of outputs to keep in memory (None for no
+            limit, 0 to keep none in memory)
+        path : str or None
+            The path of an SQLite database in which to store outputs, which is
+            created if it does not exist
+
+        Raises
+        ------
+        ValueError
+            The transformer has none of the memoized methods
+        TypeError
+            A setting of the transformer has no canonical representation, so
+            its outputs cannot be stored in the database
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> soundex = Memoizer(Soundex())
+        >>> soundex.encode('Niall'), soundex.encode('Niall')
+        ('N400', 'N400')
+        >>> soundex.cache_info()
+        CacheInfo(hits=1, misses=1, disk_hits=0, maxsize=65536, currsize=1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        methods = [name for name in _METHODS if hasattr(transformer, name)]
+        if not methods:
+            raise ValueError(
+                '{} has none of the methods {}'.format(
+                    type(transformer).__name__, ', '.join(_METHODS)
+                )
+            )
+        self.transformer = transformer
+        self.maxsize = maxsize
+        self.path = path
+        self._methods = methods
+        # settings are keyed only to store outputs in the database
+        self._config = (
+            _config_key(transformer) if path is not None else None
+        )  # type: Optional[str]
+        self._cache = OrderedDict()  # type: OrderedDict[Tuple[str, str], Any]
+        self._lock = Lock()
+        self._db = None  # type: Optional[sqlite3.Connection]
+        self._db_pid = None  # type: Optional[int]
+        self._uncommitted = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def __getattr__(self, name: str) -> Callable[[str], Any]:
+        """Return the memoized form of a method of the wrapped instance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if name in _METHODS and name in self.__dict__.get('_methods', ()):
+            method = partial(self._lookup, name)
+            # later look-ups find the method without calling __getattr__
+            setattr(self, name, method)
+            return method
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(
+                type(self).__name__, name
+            )
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state for pickling, without the lock & connection.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = {
+            key: val
+            for key, val in self.__dict__.items()
+            if key not in _METHODS
+        }
+        state['_lock'] = None
+        state['_db'] = None
+        state['_db_pid'] = None
+        state['_uncommitted'] = 0
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state from pickling.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return a connection to the database, opening it if needed.
+
+        Connections are not shared with forked processes.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._db is None or self._db_pid != os.getpid():
+            self._db = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False
+            )
+            self._db_pid = os.getpid()
+            self._uncommitted = 0
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS memo (config TEXT, method TEXT, '
+                'input TEXT, output TEXT, '
+                'PRIMARY KEY (config, method, input)) WITHOUT ROWID'
+            )
+            self._db.commit()
+        return self._db
+
+    def _lookup(self, method: str, word: str) -> Any:
+        """Return the (possibly cached) output of a method for a word.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method
+        word : str
+            The input
+
+        Returns
+        -------
+        Any
+            The output of the wrapped instance's method
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = (method, word)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+
+            if self.path is not None:
+                row = (
+                    self._connection()
+                    .execute(
+                        'SELECT output FROM memo WHERE config=? AND method=? '
+                        'AND input=?',
+                        (self._config, method, word),
+                    )
+                    .fetchone()
+                )
+                if row is not None:
+                    self.disk_hits += 1
+                    output = _loads(row[0])
+                    self._store(key, output)
+                    return output
+
+            self.misses += 1
+
+        output = getattr(self.transformer, method)(word)
+
+        with self._lock:
+            self._store(key, output)
+            if self.path is not None:
+                self._connection().execute(
+                    'INSERT OR IGNORE INTO memo VALUES (?, ?, ?, ?)',
+                    (self._config, method, word, json.dumps(output)),
+                )
+                self._uncommitted += 1
+                if self._uncommitted >= _COMMIT_EVERY:
+                    self._db.commit()  # type: ignore
+                    self._uncommitted = 0
+        return output
+
+    def _store(self, key: Tuple[str, str], output: Any) -> None:
+        """Add an output to the in-memory cache, evicting the oldest if full.
+
+        Parameters
+        ----------
+        key : tuple
+            The method name & input
+        output : Any
+            The output
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.maxsize is not None and self.maxsize <= 0:
+            return
+        self._cache[key] = output
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def warm(self, limit: Optional[int] = None) -> int:
+        """Load stored outputs for the wrapped instance from the database.
+
+        Parameters
+        ----------
+        limit : int or None
+            The greatest number of outputs to load (by default, up to the
+            size of the in-memory cache)
+
+        Returns
+        -------
+        int
+            The number of outputs loaded
+
+        Raises
+        ------
+        ValueError
+            The Memoizer has no database
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.path is None:
+            raise ValueError('The Memoizer has no database')
+        if limit is None:
+            limit = -1 if self.maxsize is None else self.maxsize
+        loaded = 0
+        with self._lock:
+            for method, word, output in self._connection().execute(
+                'SELECT method, input, output FROM memo WHERE config=? '
+                'LIMIT ?',
+                (self._config, limit),
+            ):
+                self._store((method, word), _loads(output))
+                loaded += 1
+        return loaded
+
+    def flush(self) -> None:
+        """Commit the outputs not yet written to the database.
+
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            if self._db is not None and self._db_pid == os.getpid():
+                self._db.commit()
+                self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit outstanding outputs and close the database connection.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.flush()
+        with self._lock:
+            if self._db is not None and self._db_pid == os.getpid():
+                self._db.close()
+            self._db = None
+            self._db_pid = None
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            The numbers of in-memory hits, misses, and database hits, the
+            greatest number of outputs kept in memory, and the number kept now
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.disk_hits,
+            self.maxsize,
+            len(self._cache),
+        )
+
+    def cache_clear(self) -> None:
+        """Clear the in-memory cache and the statistics.
+
+        Outputs stored in the database are kept.
+
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,268 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._parallel.
+
+The util._parallel module defines helpers for applying a method of an
+instance to a stream of inputs, in batches, in the calling process or across
+a pool of worker processes.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Deque,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+__all__ = []  # type: List[str]
+
+# The instance used by the methods applied in a worker process, set once per
+# worker by _init_worker
+_WORKER_INSTANCE = None  # type: Any
+
+# A batch submitted to a worker: the batch, its distinct items, and the future
+# of their results
+_Submitted = Tuple[List[Any], List[Any], Future]
+
+
+def _n_workers(n_jobs: Optional[int]) -> int:
+    """Return the number of workers requested by n_jobs.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The requested number of jobs; None or a negative value means one per
+        CPU
+
+    Returns
+    -------
+    int
+        The number of workers
+
+    Examples
+    --------
+    >>> _n_workers(2)
+    2
+    >>> _n_workers(0)
+    1
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    return max(n_jobs, 1)
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items.
+
+    Parameters
+    ----------
+    items : Iterable
+        The items to batch
+    size : int
+        The greatest number of items in a batch
+
+    Yields
+    ------
+    list
+        The next batch of items
+
+    Examples
+    --------
+    >>> list(_batches('abcde', 2))
+    [['a', 'b'], ['c', 'd'], ['e']]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    items = iter(items)
+    batch = list(islice(items, size))
+    while batch:
+        yield batch
+        batch = list(islice(items, size))
+
+
+def _init_worker(instance: Any) -> None:
+    """Set the instance used in a worker process.
+
+    Parameters
+    ----------
+    instance : object
+        The instance whose methods are applied
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    global _WORKER_INSTANCE
+    _WORKER_INSTANCE = instance
+
+
+def _apply_in_worker(
+    method: str, items: List[Any], batched: bool = False
+) -> List[Any]:
+    """Apply a method of the worker's instance to each of a list of items.
+
+    Parameters
+    ----------
+    method : str
+        The name of the method
+    items : list
+        The items
+    batched : bool
+        The method takes the list of items and returns a list of values
+
+    Returns
+    -------
+    list
+        The method's return values
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    func = getattr(_WORKER_INSTANCE, method)
+    if batched:
+        return func(items)
+    return [func(item) for item in items]
+
+
+def _collect(submitted: _Submitted) -> Iterator[Any]:
+    """Yield the results of a submitted batch, in the order of the batch.
+
+    Parameters
+    ----------
+    submitted : tuple
+        The batch, its distinct items, and the future of their results
+
+    Yields
+    ------
+    object
+        The return value for each item of the batch
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    batch, unique, future = submitted
+    values = dict(zip(unique, future.result()))
+    yield from (values[item] for item in batch)
+
+
+def _map_unique(
+    instance: Any,
+    method: str,
+    items: Iterable[Hashable],
+    n_jobs: Optional[int] = None,
+    batch_size: int = 1000,
+    batched: bool = False,
+) -> Iterator[Any]:
+    """Yield the return value of a method applied to each item, in order.
+
+    The items are read in batches, and each distinct item in a batch is
+    passed to the method once. If n_jobs is set, the batches are divided
+    among a pool of worker processes, each of which receives a copy of the
+    instance once, when it starts; only a few batches per worker are in
+    flight at a time, so the items may be an unbounded stream.
+
+    Parameters
+    ----------
+    instance : object
+        A picklable instance
+    method : str
+        The name of the method of instance to apply to each item
+    items : Iterable
+        Hashable items
+    n_jobs : int or None
+        The number of worker processes (-1 for one per CPU). By default, the
+        method is applied in the calling process.
+    batch_size : int
+        The greatest number of items in a batch
+    batched : bool
+        The method takes a list of distinct items and returns a list of their
+        values, rather than taking a single item
+
+    Yields
+    ------
+    object
+        The return value for each item, in the order of the items
+
+    Raises
+    ------
+    ValueError
+        batch_size must be at least 1
+
+    Examples
+    --------
+    >>> list(_map_unique('-', 'join', ['ab', 'cd', 'ab'], batch_size=2))
+    ['a-b', 'c-d', 'a-b']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+
+    batches = _batches(items, batch_size)
+    if n_jobs is None or _n_workers(n_jobs) == 1:
+        func = getattr(instance, method)
+        for batch in batches:
+            unique = list(dict.fromkeys(batch))
+            if batched:
+                values = dict(zip(unique, func(unique)))
+                yield from (values[item] for item in batch)
+            elif len(unique) == len(batch):
+                yield from (func(item) for item in batch)
+            else:
+                values = dict(zip(unique, (func(item) for item in unique)))
+                yield from (values[item] for item in batch)
+        return
+
+    workers = _n_workers(n_jobs)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(instance,)
+    ) as pool:
+        pending = deque()  # type: Deque[_Submitted]
+        for batch in batches:
+            unique = list(dict.fromkeys(batch))
+            future = pool.submit(_apply_in_worker, method, unique, batched)
+            pending.append((batch, unique, future))
+            # Keep a couple of batches per worker queued, so that the workers
+            # stay busy without reading ahead through the whole stream
+            if len(pending) >= 2 * workers:
+                yield from _collect(pending.popleft())
+        while pending:
+            yield from _collect(pending.popleft())
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
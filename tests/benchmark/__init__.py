@@ -0,0 +1,431 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.benchmark.
+
+This module contains benchmarks for Abydos
+
+Every public class of the distance, phonetic, stemmer, fingerprint, and
+tokenizer packages is timed on strings from the test corpora, in short,
+medium, and long buckets. To run the benchmarks, writing the results to
+bench_results.json and comparing them to the stored baseline, call::
+
+    python -m tests.benchmark
+
+Call ``python -m tests.benchmark --help`` for further options.
+"""
+
+import csv
+import gc
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from inspect import getdoc, getmembers, isabstract, isclass
+from itertools import cycle
+
+import abydos
+import abydos.distance
+import abydos.fingerprint
+import abydos.phonetic
+import abydos.stemmer
+import abydos.tokenizer
+
+from .. import _corpus_file
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+PACKAGES = ('distance', 'phonetic', 'stemmer', 'fingerprint', 'tokenizer')
+
+# Buckets of string lengths: (name, least length, greatest length)
+BUCKETS = (('short', 1, 5), ('medium', 6, 10), ('long', 11, None))
+
+# The methods timed for the instances in each package, the first of which
+# that is not disabled is used, and whether they take a pair of strings
+METHODS = {
+    'distance': (('dist', 'sim', 'dist_abs'), True),
+    'phonetic': (('encode',), False),
+    'stemmer': (('stem',), False),
+    'fingerprint': (('fingerprint',), False),
+    'tokenizer': (('tokenize',), False),
+}
+
+# Classes needing their inputs adapted
+ADAPTERS = {
+    # SPFC encodes a first name & a last name
+    'SPFC': lambda name: '{0} {0}'.format(name),
+}
+
+# Classes whose default instances cannot be benchmarked as they are
+SKIP = {
+    # requires a corpus or a model to be supplied
+    'Corpus',
+    # tokenizers requiring external packages
+    'NLTKTokenizer',
+    'SAPSTokenizer',
+}
+
+
+def _bucket(length):
+    """Return the name of the bucket of strings of a given length.
+
+    Parameters
+    ----------
+    length : int
+        The string length
+
+    Returns
+    -------
+    str
+        The bucket name, or None if the length is 0
+
+    """
+    for name, least, greatest in BUCKETS:
+        if length >= least and (greatest is None or length <= greatest):
+            return name
+    return None
+
+
+def _read_column(name, column):
+    """Return the values in one column of a corpus CSV file.
+
+    Parameters
+    ----------
+    name : str
+        Corpus file
+    column : int
+        The column number
+
+    Returns
+    -------
+    list
+        The non-empty values in the column
+
+    """
+    with open(_corpus_file(name), encoding='utf-8') as corpus:
+        return [row[column] for row in csv.reader(corpus) if row[column]]
+
+
+def load_inputs(per_bucket=200):
+    """Return the benchmark strings & string pairs, by bucket.
+
+    Single strings are drawn from the German surnames in nachnamen.csv and
+    the English words in misspellings.csv & homophones.csv. Pairs are the
+    misspellings & their corrections and the homophone pairs, bucketed by the
+    length of the longer string.
+
+    Parameters
+    ----------
+    per_bucket : int
+        The greatest number of strings or pairs in each bucket
+
+    Returns
+    -------
+    dict
+        Maps (bucket, is_pair) to a list of strings or pairs
+
+    """
+    strings = _read_column('nachnamen.csv', 0)
+    pairs = []
+    for name in ('misspellings.csv', 'homophones.csv'):
+        src = _read_column(name, 0)[1:]
+        tar = _read_column(name, 1)[1:]
+        strings.extend(tar)
+        pairs.extend(zip(src, tar))
+
+    inputs = {}
+    for bucket, _, _ in BUCKETS:
+        inputs[(bucket, False)] = []
+        inputs[(bucket, True)] = []
+    for string in strings:
+        bucket = _bucket(len(string))
+        if bucket and len(inputs[(bucket, False)]) < per_bucket:
+            inputs[(bucket, False)].append(string)
+    for pair in pairs:
+        bucket = _bucket(max(len(pair[0]), len(pair[1])))
+        if bucket and len(inputs[(bucket, True)]) < per_bucket:
+            inputs[(bucket, True)].append(pair)
+    return inputs
+
+
+def targets(packages=PACKAGES, pattern=None):
+    """Yield the benchmarked classes of the given packages.
+
+    Parameters
+    ----------
+    packages : tuple
+        The names of the packages
+    pattern : str
+        A regular expression that class names must match
+
+    Yields
+    ------
+    tuple
+        The package name and the class
+
+    """
+    for package in packages:
+        module = getattr(abydos, package)
+        for name, obj in getmembers(module, isclass):
+            if (
+                name[0] == '_'
+                or name in SKIP
+                or isabstract(obj)
+                or not hasattr(obj, METHODS[package][0][0])
+                or (pattern and not re.search(pattern, name))
+            ):
+                continue
+            yield package, obj
+
+
+def _function(instance, package):
+    """Return a function applying the benchmarked method to one input.
+
+    Parameters
+    ----------
+    instance : object
+        The instance of the benchmarked class
+    package : str
+        The name of its package
+
+    Returns
+    -------
+    callable
+        The function
+
+    """
+    method_names, is_pair = METHODS[package]
+    for method_name in method_names:
+        method = getattr(instance, method_name)
+        if 'Method disabled' not in (getdoc(method) or ''):
+            break
+    adapter = ADAPTERS.get(type(instance).__name__)
+    if is_pair:
+        return lambda pair: method(pair[0], pair[1])
+    if adapter is not None:
+        return lambda string: method(adapter(string))
+    return method
+
+
+def measure(func, inputs, budget=0.2, max_ops=5000, min_ops=3):
+    """Time a function on a list of inputs.
+
+    The inputs are cycled through until the time budget or the greatest
+    number of operations is reached. Peak memory is measured on a separate
+    pass over the inputs, so that tracing does not slow the timed calls.
+
+    Parameters
+    ----------
+    func : callable
+        The function to time
+    inputs : list
+        Its inputs
+    budget : float
+        The time budget, in seconds
+    max_ops : int
+        The greatest number of calls to time
+    min_ops : int
+        The least number of calls to time
+
+    Returns
+    -------
+    dict
+        The number of operations, operations per second, the median and 99th
+        percentile latencies in microseconds, and the peak memory allocated,
+        in KiB
+
+    """
+    timer = time.perf_counter
+    # warm up caches & lazy initialization
+    func(inputs[0])
+
+    latencies = []
+    started = timer()
+    for arg in cycle(inputs):
+        start = timer()
+        func(arg)
+        latencies.append(timer() - start)
+        if len(latencies) >= max_ops or (
+            len(latencies) >= min_ops and start - started > budget
+        ):
+            break
+    latencies.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    for arg in inputs[: len(latencies)]:
+        func(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': round(len(latencies) / sum(latencies), 1),
+        'p50_us': round(latencies[len(latencies) // 2] * 1e6, 2),
+        'p99_us': round(latencies[len(latencies) * 99 // 100] * 1e6, 2),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def run(packages=PACKAGES, pattern=None, budget=0.2, per_bucket=200, log=None):
+    """Run the benchmarks.
+
+    Parameters
+    ----------
+    packages : tuple
+        The names of the packages to benchmark
+    pattern : str
+        A regular expression that class names must match
+    budget : float
+        The time budget for each class & bucket, in seconds
+    per_bucket : int
+        The greatest number of strings or pairs in each bucket
+    log : file
+        A file to which to report progress
+
+    Returns
+    -------
+    dict
+        Metadata about the run and the results, a list of dicts, each of which
+        identifies the package, class, & bucket and gives the measurements
+        (or the error raised)
+
+    """
+    inputs = load_inputs(per_bucket)
+    results = []
+    for package, cls in targets(packages, pattern):
+        is_pair = METHODS[package][1]
+        try:
+            func = _function(cls(), package)
+        except Exception as inst:  # noqa: B902
+            results.append(
+                {
+                    'package': package,
+                    'class': cls.__name__,
+                    'bucket': None,
+                    'error': repr(inst),
+                }
+            )
+            continue
+        for bucket, _, _ in BUCKETS:
+            record = {
+                'package': package,
+                'class': cls.__name__,
+                'bucket': bucket,
+            }
+            try:
+                record.update(measure(func, inputs[(bucket, is_pair)], budget))
+            except Exception as inst:  # noqa: B902
+                record['error'] = repr(inst)
+            results.append(record)
+            if log is not None:
+                log.write(format_record(record) + '\n')
+                log.flush()
+
+    return {
+        'abydos': abydos.__version__,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'budget': budget,
+        'per_bucket': per_bucket,
+        'results': results,
+    }
+
+
+def format_record(record):
+    """Return a one-line summary of a result.
+
+    Parameters
+    ----------
+    record : dict
+        A result
+
+    Returns
+    -------
+    str
+        The summary
+
+    """
+    name = '{}.{} [{}]'.format(
+        record['package'], record['class'], record['bucket']
+    )
+    if 'error' in record:
+        return '{:<52} ERROR {}'.format(name, record['error'])
+    return (
+        '{:<52} {:>12.1f} ops/s  p50 {:>10.1f} us  p99 {:>10.1f} us  '
+        'peak {:>9.1f} KiB'.format(
+            name,
+            record['ops_per_sec'],
+            record['p50_us'],
+            record['p99_us'],
+            record['peak_kib'],
+        )
+    )
+
+
+def compare(current, baseline, tolerance=0.25):
+    """Compare results to a baseline.
+
+    Parameters
+    ----------
+    current : dict
+        The results of a run
+    baseline : dict
+        The results of an earlier run
+    tolerance : float
+        The proportional change in operations per second below which changes
+        are not reported
+
+    Returns
+    -------
+    tuple
+        Lists of the regressions and the improvements, as (package, class,
+        bucket, baseline ops/sec, current ops/sec, ratio) tuples, worst or
+        best first
+
+    """
+
+    def _key(record):
+        return record['package'], record['class'], record['bucket']
+
+    before = {
+        _key(record): record
+        for record in baseline['results']
+        if 'ops_per_sec' in record
+    }
+    regressions = []
+    improvements = []
+    for record in current['results']:
+        old = before.get(_key(record))
+        if old is None or 'ops_per_sec' not in record:
+            continue
+        ratio = record['ops_per_sec'] / old['ops_per_sec']
+        change = _key(record) + (
+            old['ops_per_sec'],
+            record['ops_per_sec'],
+            ratio,
+        )
+        if ratio < 1 - tolerance:
+            regressions.append(change)
+        elif ratio > 1 / (1 - tolerance):
+            improvements.append(change)
+    regressions.sort(key=lambda change: change[-1])
+    improvements.sort(key=lambda change: -change[-1])
+    return regressions, improvements
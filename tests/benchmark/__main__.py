@@ -0,0 +1,171 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.benchmark.__main__.
+
+This module runs the benchmarks for Abydos from the command line
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from . import BASELINE, PACKAGES, compare, run
+
+
+def _write(results, path):
+    """Write results as JSON, one result per line.
+
+    Parameters
+    ----------
+    results : dict
+        The results of a run
+    path : str
+        The output file path
+
+    """
+    meta = {key: val for key, val in results.items() if key != 'results'}
+    with open(path, 'w', encoding='utf-8') as output:
+        output.write('{\n')
+        for key, val in meta.items():
+            output.write(
+                '  {}: {},\n'.format(json.dumps(key), json.dumps(val))
+            )
+        output.write('  "results": [\n')
+        output.write(
+            ',\n'.join(
+                '    ' + json.dumps(record, sort_keys=True)
+                for record in results['results']
+            )
+        )
+        output.write('\n  ]\n}\n')
+
+
+def main(argv=None):
+    """Run the benchmarks, write the results, and compare to a baseline.
+
+    Parameters
+    ----------
+    argv : list
+        Command line arguments
+
+    Returns
+    -------
+    int
+        1 if there were regressions relative to the baseline, otherwise 0
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m tests.benchmark',
+        description='Benchmark the classes of Abydos.',
+    )
+    parser.add_argument(
+        '-p',
+        '--packages',
+        nargs='+',
+        choices=PACKAGES,
+        default=PACKAGES,
+        help='the packages to benchmark (default: all)',
+    )
+    parser.add_argument(
+        '-k',
+        '--filter',
+        help='only benchmark classes whose names match this regex',
+    )
+    parser.add_argument(
+        '-b',
+        '--budget',
+        type=float,
+        default=0.2,
+        help='seconds to spend timing each class & bucket (default: 0.2)',
+    )
+    parser.add_argument(
+        '-n',
+        '--per-bucket',
+        type=int,
+        default=200,
+        help='strings or pairs in each bucket (default: 200)',
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='bench_results.json',
+        help='results file (default: bench_results.json)',
+    )
+    parser.add_argument(
+        '--baseline',
+        default=BASELINE,
+        help='baseline file to compare to (default: tests/benchmark/'
+        'baseline.json)',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='also write the results to the baseline file',
+    )
+    parser.add_argument(
+        '-t',
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='proportional change in ops/sec to report (default: 0.25)',
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true', help='do not report progress'
+    )
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.packages,
+        args.filter,
+        args.budget,
+        args.per_bucket,
+        None if args.quiet else sys.stdout,
+    )
+    _write(results, args.output)
+    print('Results written to {}'.format(args.output))
+    if args.save_baseline:
+        _write(results, args.baseline)
+        print('Baseline written to {}'.format(args.baseline))
+        return 0
+
+    if not os.path.isfile(args.baseline):
+        print('No baseline at {}'.format(args.baseline))
+        return 0
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions, improvements = compare(results, baseline, args.tolerance)
+    for title, changes in (
+        ('Regressions', regressions),
+        ('Improvements', improvements),
+    ):
+        print(
+            '\n{} (ops/sec changed by more than {:.0%}): {}'.format(
+                title, args.tolerance, len(changes)
+            )
+        )
+        for package, cls, bucket, old, new, ratio in changes:
+            print(
+                '  {:<52} {:>12.1f} -> {:>12.1f} ops/s  x{:.2f}'.format(
+                    '{}.{} [{}]'.format(package, cls, bucket), old, new, ratio
+                )
+            )
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
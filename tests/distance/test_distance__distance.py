@@ -19,15 +19,20 @@
 This module contains unit tests for abydos.distance._Distance
 """
 
+import inspect
 import unittest
 
-from abydos.distance import Dice, Levenshtein
+import numpy as np
+
+import abydos.distance
+from abydos.distance import Dice, Levenshtein, _Distance
 
 
 class DistanceTestCases(unittest.TestCase):
     """Test _Distance base class.
 
-    abydos.distance._Distance.sim, .dist, & .dist_abs
+    abydos.distance._Distance.sim, .dist, .dist_abs, .sim_many, .dist_many,
+    .sim_cdist, .dist_cdist, & .is_metric
     """
 
     lev = Levenshtein()
@@ -62,6 +67,78 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_sim_many(self):
+        """Test abydos.distance._Distance.sim_many."""
+        choices = ['Neil', 'Nigel', 'Niall', '']
+        for cmp in (self.lev, self.dice):
+            self.assertEqual(
+                _Distance.sim_many(cmp, 'Niall', choices).tolist(),
+                [cmp.sim('Niall', tar) for tar in choices],
+            )
+        self.assertEqual(len(_Distance.sim_many(self.lev, 'Niall', [])), 0)
+
+    def test_dist_many(self):
+        """Test abydos.distance._Distance.dist_many."""
+        choices = ['Neil', 'Nigel', 'Niall', '']
+        for cmp in (self.lev, self.dice):
+            self.assertEqual(
+                _Distance.dist_many(cmp, 'Niall', choices).tolist(),
+                [cmp.dist('Niall', tar) for tar in choices],
+            )
+
+    def test_sim_cdist(self):
+        """Test abydos.distance._Distance.sim_cdist."""
+        srcs = ['Niall', 'Neil', '']
+        tars = ['Nigel', 'Niall']
+        for cmp in (self.lev, self.dice):
+            matrix = _Distance.sim_cdist(cmp, srcs, tars)
+            self.assertEqual(matrix.shape, (3, 2))
+            self.assertEqual(
+                matrix.tolist(),
+                [[cmp.sim(src, tar) for tar in tars] for src in srcs],
+            )
+        self.assertEqual(_Distance.sim_cdist(self.lev, [], tars).shape, (0, 2))
+
+    def test_dist_cdist(self):
+        """Test abydos.distance._Distance.dist_cdist."""
+        srcs = ['Niall', 'Neil', '']
+        tars = ['Nigel', 'Niall']
+        for cmp in (self.lev, self.dice):
+            self.assertEqual(
+                _Distance.dist_cdist(cmp, srcs, tars).tolist(),
+                [[cmp.dist(src, tar) for tar in tars] for src in srcs],
+            )
+
+    def test_cdist_subclasses(self):
+        """Test that every measure's sim_cdist & dist_cdist return matrices."""
+        srcs = ['ab', 'cd']
+        tars = ['ab']
+        for name in abydos.distance.__all__:
+            measure = getattr(abydos.distance, name)
+            if (
+                name.startswith('_')
+                or not inspect.isclass(measure)
+                or not issubclass(measure, _Distance)
+            ):
+                continue
+            cmp = measure()
+            try:
+                cmp.sim(srcs[1], tars[0])
+            except (NotImplementedError, ValueError, RecursionError):
+                # measures with sim disabled or dependencies missing
+                continue
+            for matrix in (
+                cmp.sim_cdist(srcs, tars),
+                cmp.dist_cdist(srcs, tars),
+            ):
+                self.assertIsInstance(matrix, np.ndarray, name)
+                self.assertEqual(matrix.shape, (2, 1), name)
+
+    def test_is_metric(self):
+        """Test abydos.distance._Distance.is_metric."""
+        self.assertFalse(self.dice.is_metric())
+        self.assertTrue(self.lev.is_metric())
+
 
 if __name__ == '__main__':
     unittest.main()
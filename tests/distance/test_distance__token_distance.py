@@ -19,20 +19,27 @@
 This module contains unit tests for abydos.distance._TokenDistance
 """
 
+import pickle
 import unittest
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from abydos.distance import (
     AverageLinkage,
+    Bag,
     DamerauLevenshtein,
+    FellegiSunter,
+    FuzzyWuzzyTokenSet,
     Jaccard,
     JaroWinkler,
     SokalMichener,
+    TFIDF,
 )
 from abydos.stats import ConfusionTable
 from abydos.tokenizer import (
     CharacterTokenizer,
     QSkipgrams,
+    TokenProfile,
     WhitespaceTokenizer,
 )
 
@@ -433,6 +440,111 @@ class TokenDistanceTestCases(unittest.TestCase):
             Counter({'#': 0.5, 'e#': -1, 'e': -0.5}),
         )
 
+    def test_token_distance_matrix(self):
+        """Test abydos.distance._TokenDistance.sim_cdist & .dist_cdist."""
+        srcs = ['Niall', 'Neil', '', 'abcdefg']
+        tars = ['Nigel', 'Niall', 'NULL', 'gfedcba', '']
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            self.cmp_j_linkage,
+            SokalMichener(),
+            Jaccard(tokenizer=WhitespaceTokenizer()),
+        ):
+            self.assertEqual(
+                cmp.sim_cdist(srcs, tars).tolist(),
+                [[cmp.sim(src, tar) for tar in tars] for src in srcs],
+            )
+            self.assertEqual(
+                cmp.dist_cdist(srcs, tars).tolist(),
+                [[cmp.dist(src, tar) for tar in tars] for src in srcs],
+            )
+            self.assertEqual(
+                cmp.sim_many('Niall', tars).tolist(),
+                [cmp.sim('Niall', tar) for tar in tars],
+            )
+            self.assertEqual(
+                cmp.dist_many('Niall', tars).tolist(),
+                [cmp.dist('Niall', tar) for tar in tars],
+            )
+
+        cmp = AverageLinkage()
+        self.assertEqual(
+            cmp.sim_cdist(srcs, tars).tolist(),
+            [[cmp.sim(src, tar) for tar in tars] for src in srcs],
+        )
+
+    def test_token_distance_threads(self):
+        """Test sharing _TokenDistance instances among threads."""
+        words = [
+            'Niall',
+            'Neal',
+            'Neil',
+            'Njall',
+            'Nigel',
+            'Neel',
+            'Nele',
+            'Nigelli',
+            'Kneale',
+            'MacNeil',
+        ]
+        pairs = [(src, tar) for src in words for tar in words]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            self.cmp_j_linkage,
+            SokalMichener(normalizer='proportional'),
+        ):
+            expected = [cmp.sim(src, tar) for src, tar in pairs]
+            with ThreadPoolExecutor(4) as executor:
+                self.assertEqual(
+                    list(executor.map(lambda pair: cmp.sim(*pair), pairs)),
+                    expected,
+                )
+
+            cmp_copy = pickle.loads(pickle.dumps(cmp))
+            self.assertEqual(
+                [cmp_copy.sim(src, tar) for src, tar in pairs], expected
+            )
+
+    def test_token_distance_prepare(self):
+        """Test abydos.distance._TokenDistance.prepare."""
+        profile = self.cmp_j_crisp.prepare('Niall')
+        self.assertIsInstance(profile, TokenProfile)
+        self.assertEqual(profile.string, 'Niall')
+        self.assertEqual(profile.cardinality, 6)
+        self.assertIs(self.cmp_j_crisp.prepare('Niall'), profile)
+        self.assertIs(self.cmp_j_crisp.prepare(profile), profile)
+        self.assertIs(Jaccard().prepare('Niall'), profile)
+
+        words = ['Niall', 'Neil', 'Nigel', '', 'aluminum', 'Catalan']
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            self.cmp_j_linkage,
+            SokalMichener(normalizer='proportional'),
+            AverageLinkage(),
+            FellegiSunter(),
+            FuzzyWuzzyTokenSet(),
+            TFIDF(),
+        ):
+            for src in words:
+                for tar in words:
+                    self.assertEqual(
+                        cmp.sim(cmp.prepare(src), cmp.prepare(tar)),
+                        cmp.sim(src, tar),
+                    )
+                    self.assertEqual(
+                        cmp.dist(src, cmp.prepare(tar)), cmp.dist(src, tar)
+                    )
+        self.assertEqual(
+            Bag().dist_abs(Bag().prepare('Niall'), ''),
+            Bag().dist_abs('Niall', ''),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.ALINE
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import ALINE
 
 
@@ -622,6 +624,83 @@ class ALINETestCases(unittest.TestCase):
             185.0,
         )
 
+    def test_aline_segments(self):
+        """Test abydos.distance.ALINE._segments."""
+        cmp = ALINE()
+        # supplemental marks modify the preceding phone; leading marks and
+        # unknown symbols are dropped
+        self.assertEqual(
+            cmp._segments('AtAa?kH'),  # noqa: SF01
+            (('tA', 'a', 'kH'), (0, 1, 2)),
+        )
+        self.assertEqual(
+            cmp._segments('katA'), (('k', 'a', 'tA'), (3, 1, 0))  # noqa: SF01
+        )
+        self.assertEqual(cmp._segments(''), ((), ()))  # noqa: SF01
+        self.assertEqual(
+            cmp._segment_feats[0]['aspirated'],  # noqa: SF01
+            ALINE.feature_weights['plus'],
+        )
+        self.assertEqual(cmp._segment_vwl[1], 10)  # noqa: SF01
+        self.assertEqual(cmp._segment_vwl[0], 0.0)  # noqa: SF01
+        self.assertEqual(cmp._delta(0, 2), cmp._delta(2, 0))  # noqa: SF01
+        self.assertEqual(cmp._delta(1, 1), 0.0)  # noqa: SF01
+        deltas = cmp._delta_matrix((0, 1), (2, 0, 1))  # noqa: SF01
+        self.assertEqual(deltas.shape, (2, 3))
+        self.assertEqual(deltas[0, 0], cmp._delta(0, 2))  # noqa: SF01
+        self.assertEqual(deltas[1, 2], 0.0)
+
+    def test_aline_score_matrix(self):
+        """Test abydos.distance.ALINE._score_matrix."""
+
+        def _cell_by_cell(cmp, sub, expand, contract):
+            src_len, tar_len = sub.shape
+            s_mat = np.zeros((src_len + 1, tar_len + 1))
+            if cmp._mode == 'global':  # noqa: SF01
+                for i in range(1, src_len + 1):
+                    s_mat[i, 0] = s_mat[i - 1, 0] + cmp._c_skip  # noqa: SF01
+                for j in range(1, tar_len + 1):
+                    s_mat[0, j] = s_mat[0, j - 1] + cmp._c_skip  # noqa: SF01
+            for i in range(1, src_len + 1):
+                for j in range(1, tar_len + 1):
+                    s_mat[i, j] = max(
+                        s_mat[i - 1, j] + cmp._c_skip,  # noqa: SF01
+                        s_mat[i, j - 1] + cmp._c_skip,  # noqa: SF01
+                        s_mat[i - 1, j - 1] + sub[i - 1, j - 1],
+                        s_mat[i - 1, j - 2] + expand[i - 1, j - 1]
+                        if j > 1
+                        else -np.inf,
+                        s_mat[i - 2, j - 1] + contract[i - 1, j - 1]
+                        if i > 1
+                        else -np.inf,
+                        0
+                        if cmp._mode in {'local', 'half-local'}  # noqa: SF01
+                        else -np.inf,
+                    )
+            return s_mat
+
+        pairs = (
+            ('driy', 'tres'),
+            ('kalara', 'makebela'),
+            ('atcaacgagt', 'aacgattag'),
+            ('bhAratAH', 'brother'),
+            ('a', 'aluminum'),
+            ('xyz', ''),
+        )
+        for mode in ('local', 'global', 'half-local', 'semi-global'):
+            for c_skip in (-10, 0, 2.5):
+                cmp = ALINE(mode=mode, c_skip=c_skip)
+                for src, tar in pairs:
+                    matrices = cmp._score_matrices(  # noqa: SF01
+                        cmp._segments(src)[1],  # noqa: SF01
+                        cmp._segments(tar)[1],  # noqa: SF01
+                    )
+                    for score, expected in zip(
+                        cmp._score_matrix(*matrices).ravel(),  # noqa: SF01
+                        _cell_by_cell(cmp, *matrices).ravel(),
+                    ):
+                        self.assertAlmostEqual(score, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
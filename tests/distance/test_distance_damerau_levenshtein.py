@@ -104,6 +104,40 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp55105.sim('cab', 'cba'), 2 / 3)
         self.assertRaises(ValueError, self.cmp1010105.sim, 'ab', 'ba')
 
+    def test_damerau_levenshtein_max_distance(self):
+        """Test abydos.distance.DamerauLevenshtein with max_distance."""
+        cmp2 = DamerauLevenshtein(max_distance=2)
+        self.assertEqual(cmp2.dist_abs('cat', 'hat'), 1)
+        self.assertEqual(cmp2.dist_abs('ATCG', 'TAGC'), 2)
+        self.assertEqual(cmp2.dist_abs('ca', 'abc'), 2)
+        self.assertEqual(cmp2.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp2.dist_abs('aluminum', 'Catalan'), 3)
+        self.assertEqual(cmp2.dist_abs('abcdef', 'badcfe'), 3)
+        self.assertEqual(cmp2.dist_abs('', 'abc'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abc'), 0)
+        self.assertAlmostEqual(cmp2.dist('cat', 'hat'), 1 / 3)
+        self.assertEqual(cmp2.dist('Niall', 'Neil'), 1.0)
+        self.assertEqual(cmp2.sim('Niall', 'Neil'), 0.0)
+
+        cmp_wt = DamerauLevenshtein(cost=(5, 7, 10, 10), max_distance=10)
+        self.assertEqual(cmp_wt.dist_abs('cat', 'hat'), 10)
+        self.assertEqual(cmp_wt.dist_abs('ab', 'ba'), 10)
+        self.assertEqual(cmp_wt.dist_abs('Niall', 'Neil'), 11)
+        self.assertEqual(cmp_wt.dist_abs('ab', ''), 11)
+        with self.assertRaises(ValueError):
+            DamerauLevenshtein(cost=(10, 10, 10, 5), max_distance=2).dist_abs(
+                'ab', 'ba'
+            )
+
+    def test_damerau_levenshtein_is_metric(self):
+        """Test abydos.distance.DamerauLevenshtein.is_metric."""
+        self.assertTrue(self.cmp.is_metric())
+        self.assertTrue(self.cmp1010510.is_metric())
+        self.assertTrue(self.cmp55105.is_metric())
+        self.assertFalse(self.cmp571010.is_metric())
+        self.assertFalse(self.cmp1010105.is_metric())
+        self.assertFalse(DamerauLevenshtein(max_distance=2).is_metric())
+
 
 if __name__ == '__main__':
     unittest.main()
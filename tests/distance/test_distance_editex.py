@@ -98,6 +98,45 @@ class EditexTestCases(unittest.TestCase):
             self.cmp_taper.dist('nelson', 'neilsen'), 0.123376623
         )
 
+    def test_editex_max_distance(self):
+        """Test abydos.distance.Editex with max_distance."""
+        cmp3 = Editex(max_distance=3)
+        self.assertEqual(cmp3.dist_abs('cat', 'hat'), 2)
+        self.assertEqual(cmp3.dist_abs('Niall', 'Neal'), 1)
+        self.assertEqual(cmp3.dist_abs('aluminum', 'Catalan'), 4)
+        self.assertEqual(cmp3.dist_abs('ATCG', 'TAGC'), 4)
+        self.assertEqual(cmp3.dist_abs('', 'abc'), 4)
+        self.assertAlmostEqual(cmp3.dist('cat', 'hat'), 1 / 3)
+        self.assertEqual(cmp3.dist('aluminum', 'Catalan'), 1.0)
+        self.assertEqual(cmp3.sim('aluminum', 'Catalan'), 0.0)
+
+        # positive costs permit banding
+        cmp_banded = Editex(cost=(1, 2, 3), max_distance=6)
+        self.assertEqual(cmp_banded.dist_abs('Niall', 'Neal'), 6)
+        self.assertEqual(cmp_banded.dist_abs('Niall', 'Neil'), 7)
+        self.assertEqual(cmp_banded.dist_abs('cat', 'catalan'), 7)
+        self.assertEqual(cmp_banded.dist_abs('aluminum', 'Catalan'), 7)
+
+        # the default costs permit banding too, allowing for the free
+        # deletion of repeated letters
+        cmp1 = Editex(max_distance=1)
+        self.assertEqual(cmp1.dist_abs('ALLLLL', 'AL'), 0)
+        self.assertEqual(cmp1.dist_abs('AL', 'ALLLLLB'), 2)
+        self.assertEqual(cmp1.dist_abs('Niall', 'Neal'), 1)
+        self.assertEqual(cmp1.dist_abs('cat', 'catalan'), 2)
+        self.assertEqual(cmp1.dist_abs('Hannah', 'Anna'), 2)
+
+        cmp_local = Editex(local=True, max_distance=4)
+        self.assertEqual(cmp_local.dist_abs('Niall', 'Neil'), 2)
+        self.assertEqual(cmp_local.dist_abs('ATCG', 'TAGC'), 4)
+        self.assertEqual(cmp_local.dist_abs('aluminum', 'Catalan'), 5)
+
+        cmp_taper = Editex(taper=True, max_distance=3)
+        self.assertAlmostEqual(cmp_taper.dist_abs('Niall', 'Neal'), 1.6)
+        self.assertEqual(cmp_taper.dist_abs('cat', 'hat'), 4)
+        self.assertEqual(cmp_taper.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp_taper.dist_abs('ATCG', 'TAGC'), 4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,10 @@ This module contains unit tests for abydos.distance.Eudex
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import Eudex
+from abydos.phonetic import Eudex as EudexPhonetic
 
 
 def _yield_1():
@@ -123,6 +126,78 @@ class EudexTestCases(unittest.TestCase):
             Eudex('fibonacci').sim('Niall', 'Colin'), 0.79022989
         )
 
+    def test_eudex_many(self):
+        """Test abydos.distance.Eudex.dist_abs_many & its kin."""
+        names = ['Niall', 'Neil', 'Colin', 'Cuilen', 'ATCG', 'TAGC', '', 'cat']
+        for cmp in (
+            self.cmp,
+            Eudex(None),
+            Eudex('fibonacci'),
+            Eudex(weights=[1, 1, 2, 6, 24, 120, 720, 5040]),
+            Eudex(weights=[0.5, 2.5]),
+            Eudex(weights=_yield_1),
+            Eudex(max_length=4),
+        ):
+            hashes = EudexPhonetic(cmp._max_length).encode_array(  # noqa: SF01
+                names
+            )
+            for query in names:
+                expected = [cmp.dist_abs(query, name) for name in names]
+                self.assertEqual(
+                    list(cmp.dist_abs_many(query, names)), expected
+                )
+                self.assertEqual(
+                    list(cmp.dist_abs_many(query, hashes)), expected
+                )
+                self.assertEqual(
+                    list(
+                        cmp.dist_abs_many(
+                            int(EudexPhonetic(cmp._max_length).encode(query)),
+                            hashes,
+                        )
+                    ),
+                    expected,
+                )
+                np.testing.assert_allclose(
+                    cmp.dist_many(query, names),
+                    [cmp.dist(query, name) for name in names],
+                )
+                np.testing.assert_allclose(
+                    cmp.sim_many(query, hashes),
+                    [cmp.sim(query, name) for name in names],
+                )
+
+            self.assertEqual(
+                cmp.dist_abs_cdist(names, hashes).tolist(),
+                [[cmp.dist_abs(src, tar) for tar in names] for src in names],
+            )
+            np.testing.assert_allclose(
+                cmp.dist_cdist(hashes, names),
+                [[cmp.dist(src, tar) for tar in names] for src in names],
+            )
+            np.testing.assert_allclose(
+                cmp.sim_cdist(names[:3], names),
+                [[cmp.sim(src, tar) for tar in names] for src in names[:3]],
+            )
+
+        self.assertEqual(self.cmp.dist_abs_many('Niall', []).shape, (0,))
+        self.assertEqual(self.cmp.dist_abs_cdist([], names).shape, (0, 8))
+        self.assertEqual(self.cmp.dist_abs_many('Niall', []).dtype, np.int64)
+        self.assertEqual(
+            Eudex(weights=[0.5]).dist_abs_many('Niall', names).dtype,
+            np.float64,
+        )
+
+    def test_eudex_is_metric(self):
+        """Test abydos.distance.Eudex.is_metric."""
+        self.assertTrue(self.cmp.is_metric())
+        self.assertTrue(Eudex(weights='fibonacci').is_metric())
+        self.assertTrue(Eudex(weights=None).is_metric())
+        self.assertTrue(Eudex(weights=Eudex.gen_fibonacci).is_metric())
+        self.assertTrue(Eudex(weights=[1, 1, 2, 6, 24, 120]).is_metric())
+        self.assertFalse(Eudex(weights=[1, -1]).is_metric())
+        self.assertFalse(Eudex(weights='linear').is_metric())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -105,6 +105,56 @@ class HammingTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('1011101', '1001001'), 5 / 7)
         self.assertAlmostEqual(self.cmp.sim('2173896', '2233796'), 4 / 7)
 
+    def test_hamming_max_distance(self):
+        """Test abydos.distance.Hamming with max_distance."""
+        cmp2 = Hamming(max_distance=2)
+        self.assertEqual(cmp2.dist_abs('cat', 'hat'), 1)
+        self.assertEqual(cmp2.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abcdef'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abcd'), 1)
+        self.assertEqual(cmp2.dist_abs('abc', 'abc'), 0)
+        self.assertAlmostEqual(cmp2.dist('cat', 'hat'), 1 / 3)
+        self.assertEqual(cmp2.dist('Niall', 'Neil'), 1.0)
+        self.assertEqual(cmp2.sim('Niall', 'Neil'), 0.0)
+
+        cmp_no_diff = Hamming(diff_lens=False, max_distance=1)
+        self.assertEqual(cmp_no_diff.dist_abs('cat', 'hat'), 1)
+        self.assertEqual(cmp_no_diff.dist_abs('ATCG', 'TAGC'), 2)
+        self.assertRaises(ValueError, cmp_no_diff.dist_abs, 'abc', 'abcd')
+
+    def test_hamming_many(self):
+        """Test abydos.distance.Hamming batch methods."""
+        choices = ['karolin', 'kathrin', 'kerstin', 'karo', '', 'karolina']
+        for cmp in (self.cmp, Hamming(max_distance=2)):
+            for query in ('karolin', '', 'Ölçü'):
+                self.assertEqual(
+                    cmp.dist_abs_many(query, choices).tolist(),
+                    [cmp.dist_abs(query, tar) for tar in choices],
+                )
+                self.assertEqual(
+                    cmp.dist_many(query, choices).tolist(),
+                    [cmp.dist(query, tar) for tar in choices],
+                )
+                self.assertEqual(
+                    cmp.sim_many(query, choices).tolist(),
+                    [cmp.sim(query, tar) for tar in choices],
+                )
+        self.assertEqual(
+            self.cmp_no_diff.dist_abs_many(
+                'karolin', ['kathrin', 'kerstin']
+            ).tolist(),
+            [3, 3],
+        )
+        self.assertRaises(
+            ValueError, self.cmp_no_diff.dist_abs_many, 'karolin', ['karo']
+        )
+
+    def test_hamming_is_metric(self):
+        """Test abydos.distance.Hamming.is_metric."""
+        self.assertTrue(self.cmp.is_metric())
+        self.assertTrue(self.cmp_no_diff.is_metric())
+        self.assertFalse(Hamming(max_distance=2).is_metric())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -77,6 +77,18 @@ class IndelTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist_abs('Colin', 'Coiln'), 2)
         self.assertAlmostEqual(self.cmp.dist_abs('Coiln', 'Colin'), 2)
 
+    def test_indel_max_distance(self):
+        """Test abydos.distance.Indel with max_distance."""
+        cmp2 = Indel(max_distance=2)
+        self.assertEqual(cmp2.dist_abs('cat', 'hat'), 2)
+        self.assertEqual(cmp2.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abcdef'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abc'), 0)
+        self.assertEqual(cmp2.dist_abs('', 'ab'), 2)
+        self.assertAlmostEqual(cmp2.dist('cat', 'hat'), 1 / 3)
+        self.assertEqual(cmp2.dist('Niall', 'Neil'), 1.0)
+        self.assertEqual(cmp2.sim('Niall', 'Neil'), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -133,6 +133,28 @@ class JaroWinklerTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(self.jaro_winkler.dist('ABCD', 'EFGH'), 1.0)
 
+    def test_jaro_winkler_many(self):
+        """Test abydos.distance.JaroWinkler.sim_many & .dist_many."""
+        choices = ['DUANE', 'DICKSONX', 'DWAYNE', '', 'EFGH']
+        for cmp in (
+            self.jaro,
+            self.jaro_winkler,
+            JaroWinkler(qval=2),
+            JaroWinkler(long_strings=True),
+        ):
+            for query in ('DWAYNE', 'DIXON', ''):
+                self.assertEqual(
+                    cmp.sim_many(query, choices).tolist(),
+                    [cmp.sim(query, tar) for tar in choices],
+                )
+                self.assertEqual(
+                    cmp.dist_many(query, choices).tolist(),
+                    [cmp.dist(query, tar) for tar in choices],
+                )
+        self.assertRaises(
+            ValueError, JaroWinkler(scaling_factor=0.3).sim_many, 'ab', ['ba']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
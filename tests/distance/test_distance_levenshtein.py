@@ -206,6 +206,86 @@ class LevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('abbc', 'ac'), 1 / 2)
         self.assertAlmostEqual(self.cmp.sim('abbc', 'abc'), 3 / 4)
 
+    def test_levenshtein_bit_parallel(self):
+        """Test abydos.distance.Levenshtein._bit_parallel."""
+        cmp_osa = Levenshtein(mode='osa')
+        self.assertTrue(self.cmp._unit_cost())
+        self.assertTrue(cmp_osa._unit_cost())
+        self.assertTrue(Levenshtein(cost=(1, 1, 1, 2))._unit_cost())
+        self.assertFalse(self.cmp_taper._unit_cost())
+        self.assertFalse(Levenshtein(cost=(1, 2, 1, 1))._unit_cost())
+        self.assertFalse(
+            Levenshtein(mode='osa', cost=(1, 1, 1, 2))._unit_cost()
+        )
+
+        # compare against the DP, forced by disabling the unit cost check
+        cmp_dp = Levenshtein()
+        cmp_dp._unit_cost = lambda: False
+        cmp_osa_dp = Levenshtein(mode='osa')
+        cmp_osa_dp._unit_cost = lambda: False
+
+        self.assertEqual(self.cmp._bit_parallel('', 'abc'), 3)
+        self.assertEqual(self.cmp._bit_parallel('abc', ''), 3)
+        self.assertEqual(cmp_osa._bit_parallel('CA', 'ABC'), 3)
+        self.assertEqual(cmp_osa._bit_parallel('ATCG', 'TAGC'), 2)
+        self.assertEqual(cmp_osa._bit_parallel('ACTG', 'TAGC'), 4)
+
+        pairs = [
+            ('levenshtein', 'frankenstein'),
+            ('sturgeon', 'urgently'),
+            ('Niall', 'Naill'),
+            ('abcdefg', 'xabxcdxxefxgx'),
+            # strings longer than a 64-bit word
+            ('abcdefghij' * 10, 'bacdefhgij' * 9 + 'xyz'),
+            ('the quick brown fox ' * 5, 'teh quikc borwn fox ' * 4),
+        ]
+        for src, tar in pairs:
+            self.assertEqual(
+                self.cmp.dist_abs(src, tar), cmp_dp.dist_abs(src, tar)
+            )
+            self.assertEqual(
+                cmp_osa.dist_abs(src, tar), cmp_osa_dp.dist_abs(src, tar)
+            )
+            self.assertEqual(
+                cmp_osa.dist_abs(src, tar), cmp_osa.dist_abs(tar, src)
+            )
+
+    def test_levenshtein_max_distance(self):
+        """Test abydos.distance.Levenshtein with max_distance."""
+        cmp2 = Levenshtein(max_distance=2)
+        self.assertEqual(cmp2.dist_abs('cat', 'hat'), 1)
+        self.assertEqual(cmp2.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp2.dist_abs('aluminum', 'Catalan'), 3)
+        self.assertEqual(cmp2.dist_abs('', 'abc'), 3)
+        self.assertEqual(cmp2.dist_abs('abc', 'abc'), 0)
+        self.assertEqual(cmp2.dist_abs('a' * 100, 'a' * 99 + 'b'), 1)
+        self.assertEqual(cmp2.dist_abs('a' * 100, 'b' * 100), 3)
+        self.assertAlmostEqual(cmp2.dist('cat', 'hat'), 1 / 3)
+        self.assertEqual(cmp2.dist('Niall', 'Neil'), 1.0)
+        self.assertEqual(cmp2.sim('Niall', 'Neil'), 0.0)
+
+        cmp_osa = Levenshtein(mode='osa', max_distance=2)
+        self.assertEqual(cmp_osa.dist_abs('ATCG', 'TAGC'), 2)
+        self.assertEqual(cmp_osa.dist_abs('ACTG', 'TAGC'), 3)
+
+        # weighted & tapered variants use the banded DP
+        cmp_wt = Levenshtein(cost=(1, 1, 2, 1), max_distance=3)
+        self.assertEqual(cmp_wt.dist_abs('cat', 'hat'), 2)
+        self.assertEqual(cmp_wt.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp_wt.dist_abs('aluminum', 'Catalan'), 4)
+        self.assertEqual(cmp_wt.dist_abs('abc', ''), 3)
+        self.assertEqual(cmp_wt.dist_abs('abcd', ''), 4)
+        cmp_osa_wt = Levenshtein(
+            mode='osa', cost=(2, 3, 1.5, 1), max_distance=1
+        )
+        self.assertEqual(cmp_osa_wt.dist_abs('ca', 'ac'), 1)
+        self.assertEqual(cmp_osa_wt.dist_abs('cab', 'acb'), 1)
+        self.assertEqual(cmp_osa_wt.dist_abs('ca', 'abc'), 2)
+        cmp_taper = Levenshtein(taper=True, max_distance=2)
+        self.assertAlmostEqual(cmp_taper.dist_abs('abc', 'ac'), 1.33333333333)
+        self.assertEqual(cmp_taper.dist_abs('levenshtein', 'frankenstein'), 3)
+        self.assertEqual(cmp_taper.dist('levenshtein', 'frankenstein'), 1.0)
+
     def test_levenshtein_alignment(self):
         """Test abydos.distance.Levenshtein.alignment."""
         self.assertEqual(self.cmp.alignment('', ''), (0, '', ''))
@@ -229,6 +309,37 @@ class LevenshteinTestCases(unittest.TestCase):
             (1.0, 'Niall', 'Naill'),
         )
 
+    def test_levenshtein_many(self):
+        """Test abydos.distance.Levenshtein.dist_many & .sim_many."""
+        choices = ['Neil', 'Nigel', 'Niall', '', 'aluminum', 'a' * 80]
+        for cmp in (
+            self.cmp,
+            self.cmp_taper,
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(1, 1, 2, 1)),
+            Levenshtein(max_distance=2),
+        ):
+            for query in ('Niall', '', 'Catalan', 'a' * 70 + 'b'):
+                self.assertEqual(
+                    cmp.dist_many(query, choices).tolist(),
+                    [cmp.dist(query, tar) for tar in choices],
+                )
+                self.assertEqual(
+                    cmp.sim_many(query, choices).tolist(),
+                    [cmp.sim(query, tar) for tar in choices],
+                )
+        self.assertEqual(len(self.cmp.dist_many('Niall', [])), 0)
+
+    def test_levenshtein_is_metric(self):
+        """Test abydos.distance.Levenshtein.is_metric."""
+        self.assertTrue(self.cmp.is_metric())
+        self.assertTrue(Levenshtein(cost=(2, 2, 3, 1)).is_metric())
+        self.assertFalse(self.cmp_taper.is_metric())
+        self.assertFalse(Levenshtein(mode='osa').is_metric())
+        self.assertFalse(Levenshtein(cost=(1, 2, 1, 1)).is_metric())
+        self.assertFalse(Levenshtein(cost=(1, 1, 0, 1)).is_metric())
+        self.assertFalse(Levenshtein(max_distance=2).is_metric())
+
 
 if __name__ == '__main__':
     unittest.main()
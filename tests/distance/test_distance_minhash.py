@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.MinHash
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import MinHash
 
 
@@ -66,6 +68,40 @@ class MinHashTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('Coiln', 'Colin'), 0.5)
         self.assertAlmostEqual(self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 0.0)
 
+    def test_minhash_signature(self):
+        """Test abydos.distance.MinHash.signature & .sim_signatures."""
+        cmp = MinHash(k=256)
+        sig = cmp.signature('Niall')
+        self.assertEqual(sig.shape, (256,))
+        self.assertEqual(sig.dtype, np.uint32)
+        self.assertTrue((sig == cmp.signature('Niall')).all())
+        self.assertTrue((sig == MinHash(k=256).signature('Niall')).all())
+        self.assertFalse(
+            (sig == MinHash(k=256, seed=1).signature('Niall')).all()
+        )
+        self.assertEqual(len(self.cmp.signature('Niall')), 128)
+        self.assertTrue((cmp.signature('') == 0xFFFFFFFF).all())
+
+        tokenizer = cmp.params['tokenizer']
+        for src, tar in (
+            ('Niall', 'Neil'),
+            ('Christopher', 'Christophe'),
+            ('aluminum', 'Catalan'),
+            ('ATCAACGAGT', 'AACGATTAG'),
+        ):
+            src_set = set(tokenizer.tokenize(src).get_set())
+            tar_set = set(tokenizer.tokenize(tar).get_set())
+            self.assertAlmostEqual(
+                cmp.sim_signatures(cmp.signature(src), cmp.signature(tar)),
+                len(src_set & tar_set) / len(src_set | tar_set),
+                delta=0.1,
+            )
+
+        self.assertEqual(cmp.sim_signatures(sig, sig), 1.0)
+        self.assertEqual(cmp.sim_signatures(sig[:0], sig[:0]), 1.0)
+        with self.assertRaises(ValueError):
+            cmp.sim_signatures(sig, sig[:10])
+
 
 if __name__ == '__main__':
     unittest.main()
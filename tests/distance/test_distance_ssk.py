@@ -22,6 +22,7 @@ This module contains unit tests for abydos.distance.SSK
 import unittest
 
 from abydos.distance import SSK
+from abydos.tokenizer import QSkipgrams
 
 import numpy as np
 
@@ -112,6 +113,55 @@ class SSKTestCases(unittest.TestCase):
             0.07841429769736327,
         )
 
+    def test_ssk_dynamic_programming(self):
+        """Test abydos.distance.SSK by dynamic programming."""
+        # The similarity of strings' tokens (Counters) is computed from the
+        # tokens themselves, rather than by dynamic programming
+        for cmp in (
+            self.cmp,
+            self.cmp_05,
+            SSK(qval=3, ssk_lambda=(0.5, 0.05)),
+            SSK(tokenizer=QSkipgrams(qval=range(1, 4), scaler='SSK')),
+            SSK(tokenizer=QSkipgrams(qval=(2, 2), scaler='SSK')),
+        ):
+            tokenizer = cmp.params['tokenizer']
+            for src, tar in (
+                ('Nigel', 'Niall'),
+                ('aluminum', 'Catalan'),
+                ('ATCAACGAGT', 'AACGATTAG'),
+            ):
+                src_tokens = tokenizer.tokenize(src).get_counter()
+                tar_tokens = tokenizer.tokenize(tar).get_counter()
+                self.assertAlmostEqual(
+                    cmp.sim(src, tar), cmp.sim(src_tokens, tar_tokens)
+                )
+                self.assertAlmostEqual(
+                    cmp.sim_score(src, tar),
+                    cmp.sim_score(src_tokens, tar_tokens),
+                )
+
+        # Profiles of different strings with the same tokens are not
+        # identical
+        self.assertEqual(
+            self.cmp.sim(self.cmp.prepare('b'), self.cmp.prepare('')), 0.0
+        )
+
+        # Address-length strings
+        src = '1234 North Elm Street, Springfield, IL 62704'
+        tar = '1243 N. Elm St., Springfeld IL 62704'
+        self.assertAlmostEqual(SSK(qval=4).sim(src, tar), 0.5253702638853518)
+        self.assertTrue(
+            np.allclose(
+                SSK().sim_cdist([src, tar], [tar]),
+                [[SSK().sim(src, tar)], [1.0]],
+            )
+        )
+
+        # Tokenizers other than QSkipgrams with the SSK scaler are used to
+        # tokenize the strings
+        cmp = SSK(tokenizer=QSkipgrams(scaler='SSK', max_span=3))
+        self.assertAlmostEqual(cmp.sim('Nigel', 'Niall'), 0.4021347007)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,6 +22,7 @@ This module contains unit tests for abydos.distance.TullossT
 import unittest
 
 from abydos.distance import TullossT
+from abydos.tokenizer import WhitespaceTokenizer
 
 
 class TullossTTestCases(unittest.TestCase):
@@ -70,6 +71,23 @@ class TullossTTestCases(unittest.TestCase):
             self.cmp.dist('ATCAACGAGT', 'AACGATTAG'), 0.3260473665
         )
 
+    def test_tulloss_t_tokenizer(self):
+        """Test abydos.distance.TullossT with a non-default tokenizer."""
+        cmp = TullossT(tokenizer=WhitespaceTokenizer())
+        self.assertAlmostEqual(
+            cmp.sim('bd aa ce', 'aa ce bd x y'), 0.6780719051
+        )
+        self.assertEqual(cmp.sim('bd aa', 'aceaebaa'), 0.0)
+
+        # prepared input gives the same results as raw strings
+        for src, tar in (('bd aa ce', 'aa ce bd x y'), ('bd aa', 'aceaebaa')):
+            self.assertEqual(
+                cmp.sim(cmp.prepare(src), cmp.prepare(tar)), cmp.sim(src, tar)
+            )
+            self.assertEqual(
+                cmp.sim_many(src, [tar]).tolist(), [cmp.sim(src, tar)]
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index__metric_tree.
+
+This module contains unit tests for abydos.index._MetricTree
+"""
+
+import unittest
+
+from abydos.index._metric_tree import _MetricTree
+
+
+class MetricTreeTestCases(unittest.TestCase):
+    """Test abydos.index._MetricTree."""
+
+    def test_metric_tree_abstract(self):
+        """Test that _MetricTree subclasses must implement its methods."""
+        with self.assertRaises(TypeError):
+            _MetricTree()
+
+        class _InsertOnly(_MetricTree):
+            def insert(self, string):
+                self._strings.append(string)
+                return len(self._strings) - 1
+
+        with self.assertRaises(TypeError):
+            _InsertOnly()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_bk_tree.
+
+This module contains unit tests for abydos.index.BKTree
+"""
+
+import pickle
+import unittest
+
+from abydos.distance import (
+    DamerauLevenshtein,
+    Eudex,
+    Hamming,
+    Jaccard,
+    Levenshtein,
+)
+from abydos.index import BKTree
+
+from .. import _corpus_file
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test abydos.index.BKTree."""
+
+    with open(_corpus_file('nachnamen.csv'), encoding='utf-8') as nachnamen:
+        names = [line.split(',')[0] for line in nachnamen][:200]
+    names += names[:10]
+    queries = names[::50] + ['Meier', 'Schmitt', 'Zyx', 'a', '']
+
+    def _linear_scan(self, metric, query):
+        """Return the distances of query to every name, nearest first."""
+        dists = [
+            (metric.dist_abs(query, name), i)
+            for i, name in enumerate(self.names)
+        ]
+        dists.sort()
+        return [(self.names[i], dist) for dist, i in dists]
+
+    def test_bk_tree(self):
+        """Test abydos.index.BKTree."""
+        for metric in (
+            Levenshtein(),
+            DamerauLevenshtein(),
+            Hamming(),
+            Eudex(weights='fibonacci'),
+        ):
+            tree = BKTree(self.names, metric)
+            self.assertEqual(len(tree), len(self.names))
+            self.assertEqual(tree[1], self.names[1])
+            for query in self.queries:
+                expected = self._linear_scan(metric, query)
+                for radius in (0, 1, 2, 4):
+                    self.assertEqual(
+                        tree.within(query, radius),
+                        [result for result in expected if result[1] <= radius],
+                    )
+                for k in (1, 5, 20):
+                    self.assertEqual(tree.nearest(query, k), expected[:k])
+
+        tree = BKTree()
+        self.assertEqual(tree.within('Niall', 2), [])
+        self.assertEqual(tree.nearest('Niall', 2), [])
+        self.assertEqual(tree.insert('Niall'), 0)
+        self.assertEqual(tree.insert('Niall'), 1)
+        self.assertEqual(tree.insert('Neil'), 2)
+        self.assertEqual(tree.nearest('Niall', 0), [])
+        self.assertEqual(
+            tree.nearest('Nial', 5), [('Niall', 1), ('Niall', 1), ('Neil', 2)]
+        )
+
+        # pickling
+        tree = BKTree(self.names)
+        tree = pickle.loads(pickle.dumps(tree))
+        tree.insert('Meier')
+        self.assertEqual(tree.within('Meier', 0)[-1], ('Meier', 0))
+        self.assertEqual(tree.nearest('Meyer', 3)[0], ('Meyer', 0))
+
+        # errors
+        with self.assertRaises(ValueError):
+            BKTree(metric=Jaccard())
+        with self.assertRaises(ValueError):
+            BKTree(metric=Levenshtein(mode='osa'))
+        with self.assertRaises(ValueError):
+            BKTree(['Niall', 'Neil'], Levenshtein(cost=(0.5, 0.5, 1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_minhash_lsh.
+
+This module contains unit tests for abydos.index.MinHashLSH
+"""
+
+import pickle
+import unittest
+
+from abydos.distance import MinHash
+from abydos.index import MinHashLSH
+from abydos.tokenizer import QGrams
+
+from .. import _corpus_file
+
+
+class MinHashLSHTestCases(unittest.TestCase):
+    """Test abydos.index.MinHashLSH."""
+
+    with open(_corpus_file('nachnamen.csv'), encoding='utf-8') as nachnamen:
+        names = [line.split(',')[0] for line in nachnamen][:400]
+    queries = names[::20]
+
+    def _jaccard(self, src, tar):
+        """Return the Jaccard similarity of two bigram sets."""
+        return len(src & tar) / len(src | tar)
+
+    def test_minhash_lsh(self):
+        """Test abydos.index.MinHashLSH."""
+        lsh = MinHashLSH(0.6)
+        for key, name in enumerate(self.names):
+            lsh.insert(key, name)
+        self.assertEqual(len(lsh), len(self.names))
+        self.assertIn(5, lsh)
+        self.assertNotIn(len(self.names), lsh)
+
+        tokenizer = QGrams(start_stop='$#')
+        bigrams = [
+            set(tokenizer.tokenize(name).get_set()) for name in self.names
+        ]
+        found = missed = candidates = 0
+        for query in self.queries:
+            result = lsh.query(query)
+            self.assertEqual(result, sorted(result))
+            query_key = self.names.index(query)
+            self.assertIn(query_key, result)
+            candidates += len(result)
+            for key in range(len(self.names)):
+                if self._jaccard(bigrams[query_key], bigrams[key]) >= 0.8:
+                    if key in result:
+                        found += 1
+                    else:
+                        missed += 1
+        # Nearly all strings well above the threshold are found, while far
+        # fewer than all strings are candidates.
+        self.assertGreater(found, 20 * missed)
+        self.assertLess(
+            candidates, len(self.names) * len(self.queries) // 50
+        )
+
+        # signatures may be passed in place of strings
+        minhash = MinHash(k=64, seed=3)
+        lsh = MinHashLSH(0.5, minhash, bands=16, rows=4)
+        self.assertEqual((lsh.bands, lsh.rows), (16, 4))
+        lsh.insert('a', minhash.signature('Christopher'))
+        lsh.insert('b', 'Christophe')
+        lsh.insert('c', 'Nigel')
+        self.assertEqual(lsh.query(minhash.signature('Christoph')), ['a', 'b'])
+        self.assertEqual(lsh.query('Christoph'), ['a', 'b'])
+        self.assertEqual(lsh.query('Zyx'), [])
+
+        # pickling
+        lsh = pickle.loads(pickle.dumps(lsh))
+        lsh.insert('d', 'Christophen')
+        self.assertEqual(lsh.query('Christoph'), ['a', 'b', 'd'])
+
+        # errors
+        with self.assertRaises(ValueError):
+            lsh.insert('a', 'Christopher')
+        with self.assertRaises(ValueError):
+            MinHashLSH(1.5)
+        with self.assertRaises(ValueError):
+            MinHashLSH(0.5, minhash, bands=16, rows=5)
+        with self.assertRaises(ValueError):
+            MinHashLSH(0.5, minhash, bands=0, rows=5)
+
+    def test_minhash_lsh_bands(self):
+        """Test abydos.index.MinHashLSH band selection."""
+        previous = 0.0
+        for threshold in (0.2, 0.4, 0.6, 0.8, 0.95):
+            lsh = MinHashLSH(threshold)
+            self.assertLessEqual(lsh.bands * lsh.rows, 128)
+            # The steepest rise is near the threshold.
+            knee = (1 / lsh.bands) ** (1 / lsh.rows)
+            self.assertAlmostEqual(knee, threshold, delta=0.1)
+            self.assertGreater(knee, previous)
+            previous = knee
+
+        # Weighting false negatives more heavily lowers the knee.
+        lsh = MinHashLSH(0.7, weights=(0.1, 0.9))
+        self.assertLess(
+            (1 / lsh.bands) ** (1 / lsh.rows),
+            (1 / MinHashLSH(0.7).bands) ** (1 / MinHashLSH(0.7).rows),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
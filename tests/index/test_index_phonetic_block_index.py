@@ -0,0 +1,146 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_phonetic_block_index.
+
+This module contains unit tests for abydos.index.PhoneticBlockIndex
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from unittest import mock
+
+from abydos.index import PhoneticBlockIndex
+from abydos.phonetic import DaitchMokotoff, DoubleMetaphone, Soundex
+
+from .. import _corpus_file
+
+
+class PhoneticBlockIndexTestCases(unittest.TestCase):
+    """Test abydos.index.PhoneticBlockIndex."""
+
+    with open(_corpus_file('nachnamen.csv'), encoding='utf-8') as nachnamen:
+        names = [line.split(',')[0] for line in nachnamen][:1000]
+
+    def _expected_pairs(self, index, max_block_size=None):
+        """Return the pairs sharing an eligible block, by brute force."""
+        blocks = {}
+        for key, members in index.blocks():
+            if max_block_size is None or len(members) <= max_block_size:
+                for member in members:
+                    blocks.setdefault(member, set()).add(key)
+        return {
+            (first, second)
+            for first, second in combinations(range(len(self.names)), 2)
+            if blocks.get(first, set()) & blocks.get(second, set())
+        }
+
+    def test_phonetic_block_index(self):
+        """Test abydos.index.PhoneticBlockIndex."""
+        self.assertRaises(ValueError, PhoneticBlockIndex, [])
+
+        index = PhoneticBlockIndex(Soundex())
+        index.insert('a', 'Niall')
+        self.assertRaises(ValueError, index.insert, 'a', 'Neil')
+        index.insert('b', 'Neil')
+        index.insert('c', 'Smith')
+        self.assertEqual(len(index), 3)
+        self.assertIn('c', index)
+        self.assertNotIn('d', index)
+        self.assertEqual(list(index.pairs()), [('a', 'b')])
+        self.assertEqual(index.query('Neal'), ['a', 'b'])
+        self.assertEqual(index.query('Zyx'), [])
+        self.assertEqual(
+            list(index.blocks()),
+            [((0, 'N400'), ['a', 'b']), ((0, 'S530'), ['c'])],
+        )
+        stats = index.block_stats()
+        self.assertEqual(stats.records, 3)
+        self.assertEqual(stats.blocks, 2)
+        self.assertEqual(stats.largest, 2)
+        self.assertEqual(stats.comparisons, 1)
+        self.assertAlmostEqual(stats.reduction_ratio, 2 / 3)
+
+        empty = PhoneticBlockIndex(Soundex()).block_stats()
+        self.assertEqual(empty.records, 0)
+        self.assertEqual(empty.reduction_ratio, 0.0)
+
+        # multi-code encoders fan out, and codes of different encoders form
+        # separate blocks
+        index = PhoneticBlockIndex([Soundex(), DoubleMetaphone()])
+        self.assertEqual(index.block_keys('Niall'), [(0, 'N400'), (1, 'NL')])
+        self.assertEqual(
+            index.block_keys('Smith'), [(0, 'S530'), (1, 'SM0'), (1, 'XMT')]
+        )
+
+    def test_phonetic_block_index_pairs(self):
+        """Test abydos.index.PhoneticBlockIndex.pairs."""
+        for encoders in (
+            Soundex(),
+            [DoubleMetaphone(), DaitchMokotoff()],
+            [Soundex(), Soundex(var='special'), DoubleMetaphone()],
+        ):
+            index = PhoneticBlockIndex(encoders)
+            index.insert_many(enumerate(self.names), chunksize=100)
+            pairs = list(index.pairs())
+            # no pair is repeated
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(set(pairs), self._expected_pairs(index))
+            self.assertLessEqual(len(pairs), index.block_stats().comparisons)
+
+            # large blocks are skipped
+            index.max_block_size = 5
+            pairs = list(index.pairs())
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(set(pairs), self._expected_pairs(index, 5))
+
+        # queries skip large blocks too
+        index = PhoneticBlockIndex(Soundex(), max_block_size=5)
+        index.insert_many(enumerate(self.names))
+        sizes = {code: len(members) for (_, code), members in index.blocks()}
+        for key, name in enumerate(self.names[:50]):
+            if sizes[Soundex().encode(name)] > 5:
+                self.assertEqual(index.query(name), [])
+            else:
+                self.assertIn(key, index.query(name))
+
+        # inserting one at a time & in a stream give the same blocks
+        single = PhoneticBlockIndex(DoubleMetaphone())
+        for key, name in enumerate(self.names[:100]):
+            single.insert(key, name)
+        many = PhoneticBlockIndex(DoubleMetaphone())
+        many.insert_many(enumerate(self.names[:100]), n_jobs=2, chunksize=30)
+        self.assertEqual(list(single.blocks()), list(many.blocks()))
+
+        # each encoder starts a single pool of workers for the whole stream
+        encoders = [DoubleMetaphone(), DaitchMokotoff()]
+        single = PhoneticBlockIndex(encoders)
+        single.insert_many(enumerate(self.names[:100]), chunksize=30)
+        many = PhoneticBlockIndex(encoders)
+        with mock.patch(
+            'abydos.util._parallel.ProcessPoolExecutor',
+            wraps=ProcessPoolExecutor,
+        ) as pools:
+            many.insert_many(
+                enumerate(self.names[:100]), n_jobs=2, chunksize=30
+            )
+        self.assertEqual(pools.call_count, 2)
+        self.assertEqual(list(single.blocks()), list(many.blocks()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_qgram_index.
+
+This module contains unit tests for abydos.index.QGramIndex
+"""
+
+import unittest
+
+from abydos.distance import Cosine, Dice, Jaccard, Levenshtein, Overlap
+from abydos.index import QGramIndex
+from abydos.tokenizer import QGrams, QSkipgrams
+
+from .. import _corpus_file
+
+
+class QGramIndexTestCases(unittest.TestCase):
+    """Test abydos.index.QGramIndex."""
+
+    with open(_corpus_file('nachnamen.csv'), encoding='utf-8') as nachnamen:
+        names = [line.split(',')[0] for line in nachnamen][:40]
+    queries = names[::20] + ['Meier', 'Schmitt', 'Zyx', 'a', '']
+
+    def _linear_scan(self, metric, query):
+        """Return the similarities of query to every name, best first."""
+        sims = [
+            (metric.sim(query, name), i) for i, name in enumerate(self.names)
+        ]
+        sims.sort(key=lambda sim: (-sim[0], sim[1]))
+        return [(self.names[i], sim) for sim, i in sims]
+
+    def test_qgram_index_range(self):
+        """Test abydos.index.QGramIndex.range."""
+        index = QGramIndex(self.names)
+        self.assertEqual(len(index), len(self.names))
+        self.assertEqual(index[1], self.names[1])
+
+        for metric in (Jaccard(), Dice(), Overlap(), Cosine()):
+            for query in self.queries:
+                expected = self._linear_scan(metric, query)
+                for min_sim in (0.0, 0.2, 0.5, 0.8, 1.0):
+                    self.assertEqual(
+                        index.range(query, min_sim, metric),
+                        [
+                            result
+                            for result in expected
+                            if result[1] >= min_sim
+                        ],
+                    )
+
+    def test_qgram_index_top_k(self):
+        """Test abydos.index.QGramIndex.top_k."""
+        index = QGramIndex(self.names)
+
+        for metric in (Jaccard(), Dice(), Overlap(), Cosine()):
+            for query in self.queries:
+                expected = [
+                    result
+                    for result in self._linear_scan(metric, query)
+                    if result[1] > 0
+                ]
+                for k in (1, 3, 10):
+                    self.assertEqual(
+                        index.top_k(query, k, metric), expected[:k]
+                    )
+        self.assertEqual(index.top_k('Müller', 0), [])
+        self.assertEqual(index.top_k('Müller', 1), [('Müller', 1.0)])
+
+    def test_qgram_index_tokenizers(self):
+        """Test abydos.index.QGramIndex with other tokenizers."""
+        for tokenizer in (
+            QGrams(qval=3, start_stop=''),
+            QGrams(qval=(1, 2), scaler='set'),
+            QSkipgrams(qval=2),
+        ):
+            index = QGramIndex(self.names, tokenizer)
+            metric = Dice(tokenizer=tokenizer)
+            for query in self.queries:
+                expected = self._linear_scan(metric, query)
+                self.assertEqual(
+                    index.range(query, 0.4, metric),
+                    [result for result in expected if result[1] >= 0.4],
+                )
+                self.assertEqual(
+                    index.top_k(query, 5, metric),
+                    [result for result in expected if result[1] > 0][:5],
+                )
+
+        # strings without tokens
+        index = QGramIndex(['a', 'b', 'a'], QGrams(qval=3, start_stop=''))
+        metric = Jaccard(tokenizer=QGrams(qval=3, start_stop=''))
+        self.assertEqual(index.top_k('a', 5, metric), [('a', 1.0), ('a', 1.0)])
+        self.assertEqual(
+            index.range('a', 0.5, metric), [('a', 1.0), ('a', 1.0)]
+        )
+        self.assertEqual(index.top_k('c', 5, metric), [])
+
+    def test_qgram_index_errors(self):
+        """Test abydos.index.QGramIndex errors."""
+        index = QGramIndex(['Niall', 'Neil'])
+        with self.assertRaises(ValueError):
+            index.top_k('Niall', 1, Levenshtein())
+        with self.assertRaises(ValueError):
+            index.top_k('Niall', 1, Jaccard(qval=3))
+        with self.assertRaises(ValueError):
+            index.range('Niall', 0.5, Jaccard(intersection_type='soft'))
+        with self.assertRaises(ValueError):
+            QGramIndex(tokenizer=QGrams(scaler='log'))
+
+
+if __name__ == '__main__':
+    unittest.main()
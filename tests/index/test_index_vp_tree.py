@@ -0,0 +1,136 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_vp_tree.
+
+This module contains unit tests for abydos.index.VPTree
+"""
+
+import pickle
+import unittest
+
+from abydos.distance import (
+    DamerauLevenshtein,
+    Eudex,
+    Hamming,
+    Jaccard,
+    Levenshtein,
+)
+from abydos.index import VPTree
+
+from .. import _corpus_file
+
+
+class VPTreeTestCases(unittest.TestCase):
+    """Test abydos.index.VPTree."""
+
+    with open(_corpus_file('nachnamen.csv'), encoding='utf-8') as nachnamen:
+        names = [line.split(',')[0] for line in nachnamen][:200]
+    names += names[:10]
+    queries = names[::50] + ['Meier', 'Schmitt', 'Zyx', 'a', '']
+
+    def _linear_scan(self, metric, query, names=None):
+        """Return the distances of query to every name, nearest first."""
+        if names is None:
+            names = self.names
+        dists = [
+            (metric.dist_abs(query, name), i) for i, name in enumerate(names)
+        ]
+        dists.sort()
+        return [(names[i], dist) for dist, i in dists]
+
+    def test_vp_tree(self):
+        """Test abydos.index.VPTree."""
+        for metric in (
+            Levenshtein(),
+            DamerauLevenshtein(),
+            Hamming(),
+            Eudex(weights='fibonacci'),
+        ):
+            tree = VPTree(self.names, metric)
+            self.assertEqual(len(tree), len(self.names))
+            self.assertEqual(tree[1], self.names[1])
+            for query in self.queries:
+                expected = self._linear_scan(metric, query)
+                for radius in (0, 1, 2, 4):
+                    self.assertEqual(
+                        tree.within(query, radius),
+                        [result for result in expected if result[1] <= radius],
+                    )
+                for k in (1, 5, 20):
+                    self.assertEqual(tree.nearest(query, k), expected[:k])
+
+        tree = VPTree()
+        self.assertEqual(tree.within('Niall', 2), [])
+        self.assertEqual(tree.nearest('Niall', 2), [])
+        self.assertEqual(tree.insert('Niall'), 0)
+        self.assertEqual(tree.insert('Niall'), 1)
+        self.assertEqual(tree.insert('Neil'), 2)
+        self.assertEqual(tree.nearest('Niall', 0), [])
+        self.assertEqual(
+            tree.nearest('Nial', 5), [('Niall', 1), ('Niall', 1), ('Neil', 2)]
+        )
+
+        # pickling
+        tree = VPTree(self.names)
+        tree = pickle.loads(pickle.dumps(tree))
+        tree.insert('Meier')
+        self.assertEqual(tree.within('Meier', 0)[-1], ('Meier', 0))
+        self.assertEqual(tree.nearest('Meyer', 3)[0], ('Meyer', 0))
+
+        # errors
+        with self.assertRaises(ValueError):
+            VPTree(metric=Jaccard())
+        with self.assertRaises(ValueError):
+            VPTree(metric=Levenshtein(mode='osa'))
+
+    def test_vp_tree_real_metric(self):
+        """Test abydos.index.VPTree with real-valued metrics."""
+        names = self.names[:120]
+        for metric in (
+            Levenshtein(cost=(0.5, 0.5, 0.75, 1)),
+            Eudex(weights=[0.5, 0.25, 0.125, 1.5, 1, 1, 1, 1]),
+        ):
+            expected = {
+                query: self._linear_scan(metric, query, names)
+                for query in self.queries
+            }
+            for leaf_size in (1, 8):
+                tree = VPTree(names[:80], metric, leaf_size)
+                for name in names[80:]:
+                    tree.insert(name)
+                for query in self.queries:
+                    for radius in (0.5, 1.75):
+                        self.assertEqual(
+                            tree.within(query, radius),
+                            [
+                                result
+                                for result in expected[query]
+                                if result[1] <= radius
+                            ],
+                        )
+                    self.assertEqual(
+                        tree.nearest(query, 10), expected[query][:10]
+                    )
+
+        # equidistant strings
+        tree = VPTree('abcdefghijklmnopqrstuvwxyz', leaf_size=2)
+        self.assertEqual(tree.nearest('z', 2), [('z', 0), ('a', 1)])
+        self.assertEqual(len(tree.within('1', 1)), 26)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,15 @@ from abydos.phones import (
     ipa_to_feature_dicts,
     ipa_to_features,
 )
+from abydos.phones._phones import (
+    _FEATURE_TABLES,
+    _FEATURE_TABLES_SIZE,
+    _PHONETIC_FEATURES,
+    _SEGMENTS,
+    _feature_table,
+    _ipa_to_segment_ids,
+    _normalize_weights,
+)
 
 
 class PhonesTestCases(unittest.TestCase):
@@ -849,6 +858,70 @@ class PhonesTestCases(unittest.TestCase):
         with self.assertRaises(TypeError):
             cmp_features(cced, esh, 10)
 
+    def test_phones_segment_ids(self):
+        """Test abydos.phones._phones._ipa_to_segment_ids."""
+        for ipa in ('medçen', 't͡ʃa', 'ɪnɾənæʃɨnəɫ', 'a?b', ''):
+            self.assertEqual(
+                [int(_SEGMENTS[_]) for _ in _ipa_to_segment_ids(ipa)],
+                ipa_to_features(ipa),
+            )
+        self.assertEqual(_ipa_to_segment_ids('a?b')[1], 0)
+        # cached results are returned
+        self.assertIs(
+            _ipa_to_segment_ids('medçen'), _ipa_to_segment_ids('medçen')
+        )
+
+    def test_phones_feature_table(self):
+        """Test abydos.phones._phones._feature_table."""
+        feats = sorted(set(_PHONETIC_FEATURES.values()))[::7]
+        _FEATURE_TABLES.clear()
+        for weights in (
+            None,
+            {'syllabic': 1, 'voice': 0.5},
+            [1, 1, 1],
+            [0.1 * _ for _ in range(31)],
+        ):
+            # comparisons of weightings without a table are made directly,
+            # without building one
+            direct = [
+                [cmp_features(feat1, feat2, weights) for feat2 in feats]
+                for feat1 in feats
+            ]
+            self.assertNotIn(_normalize_weights(weights), _FEATURE_TABLES)
+
+            table = _feature_table(_normalize_weights(weights))
+            self.assertIs(table, _feature_table(_normalize_weights(weights)))
+            self.assertFalse(table.flags.writeable)
+            ids = _ipa_to_segment_ids('?')
+            self.assertEqual(table[ids[0], ids[0]], 0.0)
+            for feat1, direct_row in zip(feats, direct):
+                for feat2, direct_cmp in zip(feats, direct_row):
+                    id1 = int((_SEGMENTS == feat1).argmax())
+                    id2 = int((_SEGMENTS == feat2).argmax())
+                    self.assertEqual(table[id1, id2], direct_cmp)
+                    self.assertEqual(
+                        cmp_features(feat1, feat2, weights), direct_cmp
+                    )
+
+        # only the most recently used tables are kept
+        for i in range(_FEATURE_TABLES_SIZE + 2):
+            _feature_table(_normalize_weights([1] * i))
+        self.assertEqual(len(_FEATURE_TABLES), _FEATURE_TABLES_SIZE)
+        self.assertNotIn(_normalize_weights([]), _FEATURE_TABLES)
+        self.assertIn(
+            _normalize_weights([1] * (_FEATURE_TABLES_SIZE + 1)),
+            _FEATURE_TABLES,
+        )
+
+        self.assertEqual(
+            _normalize_weights({'syllabic': 2})[:2],
+            (2, 0),
+        )
+        self.assertEqual(len(_normalize_weights([1, 2])), 31)
+        self.assertIsNone(_normalize_weights(None))
+        with self.assertRaises(TypeError):
+            _normalize_weights(10)
+
 
 if __name__ == '__main__':
     unittest.main()
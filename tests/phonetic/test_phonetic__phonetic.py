@@ -21,7 +21,7 @@ This module contains unit tests for abydos.phonetic._Phonetic
 
 import unittest
 
-from abydos.phonetic import Davidson
+from abydos.phonetic import Davidson, Soundex
 
 # noinspection PyProtectedMember
 from abydos.phonetic._phonetic import _Phonetic
@@ -62,6 +62,29 @@ class PhoneticTestCases(unittest.TestCase):
             self.dav.encode_alpha('word'), self.dav.encode('word')
         )
 
+    def test_phonetic_encode_many(self):
+        """Test abydos.phonetic._Phonetic.encode_many."""
+        names = ['Niall', 'Neil', 'Smith', 'Niall', '', 'Schmidt', 'Neil']
+        soundex = Soundex()
+        expected = [soundex.encode(name) for name in names]
+
+        self.assertEqual(list(soundex.encode_many([])), [])
+        self.assertEqual(list(soundex.encode_many(names)), expected)
+        self.assertEqual(
+            list(soundex.encode_many(iter(names), chunksize=2)), expected
+        )
+        self.assertEqual(
+            list(soundex.encode_many(names, n_jobs=1, chunksize=1)), expected
+        )
+        self.assertEqual(
+            list(soundex.encode_many(names, n_jobs=2, chunksize=3)), expected
+        )
+        self.assertEqual(list(self.pa.encode_many(names)), names)
+
+        # chunksize is checked when encode_many is called, not iterated
+        with self.assertRaisesRegex(ValueError, 'chunksize'):
+            soundex.encode_many(names, chunksize=0)
+
 
 if __name__ == '__main__':
     unittest.main()
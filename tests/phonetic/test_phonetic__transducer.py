@@ -0,0 +1,131 @@
+# Copyright 2014-2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic__transducer.
+
+This module contains unit tests for abydos.phonetic._Transducer
+"""
+
+import unittest
+
+from abydos.phonetic import LEIN, RefinedSoundex, Soundex, SoundexBR
+
+# noinspection PyProtectedMember
+from abydos.phonetic._transducer import _Transducer
+
+
+class TransducerTestCases(unittest.TestCase):
+    """Test _Transducer class.
+
+    test cases for abydos.phonetic._Transducer
+    """
+
+    codes = dict(
+        zip('ABCDEFGHIJKLMNOPQRSTUVWXYZ', '01230120022455012623010202')
+    )
+    words = [
+        'Niall',
+        'Ashcroft',
+        'Tymczak',
+        '',
+        'Œdipe',
+        'a-b\x00c',
+        'Pfister',
+    ]
+
+    def test_transducer_letters(self):
+        """Test abydos.phonetic._Transducer.letters."""
+        trans = _Transducer(self.codes)
+        self.assertEqual(trans.letters('Gonçalves'), 'GONCALVES')
+        self.assertEqual(trans.letters("O'Brien-Smith"), 'OBRIENSMITH')
+        self.assertEqual(trans.letters('kg'), 'KG')
+        self.assertEqual(trans.letters('kg', normalize=False), '')
+        self.assertEqual(trans.letters(''), '')
+        self.assertEqual(
+            trans.letters_many(self.words),
+            [trans.letters(word) for word in self.words],
+        )
+        self.assertEqual(
+            trans.letters_many(['Niall', 'Neil']), ['NIALL', 'NEIL']
+        )
+
+    def test_transducer_encode(self):
+        """Test abydos.phonetic._Transducer.encode."""
+        trans = _Transducer(self.codes)
+        self.assertEqual(trans.encode('Niall'), 'N400')
+        self.assertEqual(trans.encode('Pfister'), 'P236')
+        self.assertEqual(trans.encode(''), '0000')
+
+        trans = _Transducer(self.codes, first='prefix', max_length=None)
+        self.assertEqual(trans.encode('Pfister'), 'P1236')
+        self.assertEqual(trans.encode('Niall'), 'N4')
+
+        trans = _Transducer(self.codes, first=None, drop=None, max_length=5)
+        self.assertEqual(trans.encode('Niall'), '50400')
+
+        trans = _Transducer(self.codes, collapse='none', max_length=None)
+        self.assertEqual(trans.encode('Niall'), 'N44')
+
+        trans = _Transducer(self.codes, collapse='letters', max_length=None)
+        self.assertEqual(trans.encode('Pfister'), 'P1236')
+        self.assertEqual(trans.encode('Lloyd'), 'L3')
+
+        trans = _Transducer(self.codes, reverse=True, zero_pad=False)
+        self.assertEqual(trans.encode('Niall'), 'L5')
+        trans = _Transducer(self.codes, zero_pad=False, empty='0')
+        self.assertEqual(trans.encode(''), '0')
+        self.assertEqual(trans.code('', first='A'), 'A')
+
+    def test_transducer_encode_many(self):
+        """Test abydos.phonetic._Transducer.encode_many."""
+        for kwargs in (
+            {},
+            {'first': 'prefix', 'collapse': 'letters'},
+            {'first': None, 'drop': None, 'max_length': None},
+            {'reverse': True, 'zero_pad': False, 'empty': '0'},
+        ):
+            trans = _Transducer(self.codes, **kwargs)
+            self.assertEqual(
+                trans.encode_many(self.words),
+                [trans.encode(word) for word in self.words],
+            )
+        trans = _Transducer(self.codes, first='prefix')
+        self.assertEqual(
+            trans.code_many(['IALL', 'EIL', ''], ['N', 'N', 'H']),
+            ['N400', 'N400', 'H000'],
+        )
+
+    def test_transducer_encoders(self):
+        """Test the encoders' batches against their single encodings."""
+        for encoder in (
+            Soundex(),
+            Soundex(var='special', reverse=True, zero_pad=False),
+            Soundex(var='Census'),
+            RefinedSoundex(retain_vowels=True),
+            LEIN(zero_pad=False),
+            SoundexBR(max_length=6),
+        ):
+            self.assertEqual(
+                list(encoder.encode_many(self.words + ['Hamel', 'Ceres'])),
+                [
+                    encoder.encode(word)
+                    for word in self.words + ['Hamel', 'Ceres']
+                ],
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
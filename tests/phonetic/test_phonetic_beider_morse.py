@@ -24,8 +24,12 @@ import unittest
 
 from abydos.phonetic import BeiderMorse
 
+# noinspection PyProtectedMember
+from abydos.phonetic._beider_morse import _compiled_tables
+
 # noinspection PyProtectedMember
 from abydos.phonetic._beider_morse_data import (
+    BMDATA,
     L_ANY,
     L_CYRILLIC,
     L_CZECH,
@@ -738,6 +742,35 @@ class BeiderMorseTestCases(unittest.TestCase):
             'abcdef[4]',
         )
 
+    def test_beider_morse_compiled_tables(self):
+        """Test abydos.phonetic._beider_morse._compiled_tables."""
+        tables = _compiled_tables('gen', 'approx', L_GERMAN)
+        self.assertIs(tables, _compiled_tables('gen', 'approx', L_GERMAN))
+        self.assertIsNot(tables, _compiled_tables('gen', 'exact', L_GERMAN))
+
+        for compiled, rules in zip(
+            tables,
+            (
+                BMDATA['gen']['rules'][L_GERMAN],
+                BMDATA['gen']['approx']['common'],
+                BMDATA['gen']['approx'][L_GERMAN],
+            ),
+        ):
+            self.assertEqual(
+                sum(len(_) for _ in compiled.values()), len(rules)
+            )
+            for char, char_rules in compiled.items():
+                self.assertEqual(
+                    [rule[0] for rule in char_rules],
+                    [rule[0] for rule in rules if rule[0][0] == char],
+                )
+
+        # contexts are compiled exactly as they are applied
+        rule = next(_ for _ in tables[0]['s'] if _[2] and _[3])
+        self.assertEqual(rule[1], len(rule[0]))
+        self.assertTrue(rule[2].pattern.endswith('$'))
+        self.assertTrue(rule[3].pattern.startswith('^'))
+
     def test_beider_morse_language(self):
         """Test abydos.phonetic.BeiderMorse._language.
 
@@ -19,8 +19,12 @@
 This module contains unit tests for abydos.phonetic.Eudex
 """
 
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import Eudex
 
 
@@ -84,6 +88,29 @@ class EudexTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('christopher'), '433648490138894409')
         self.assertEqual(self.pa.encode('colin'), '432345564238053650')
 
+    def test_eudex_encode_array(self):
+        """Test abydos.phonetic.Eudex.encode_array."""
+        words = ['', 'guillaume', 'niall', 'hello', 'niall', 'colin']
+        hashes = self.pa.encode_array(words)
+        self.assertEqual(hashes.dtype, np.uint64)
+        self.assertEqual(
+            [str(value) for value in hashes],
+            [self.pa.encode(word) for word in words],
+        )
+        self.assertEqual(len(self.pa.encode_array([])), 0)
+        self.assertEqual(
+            list(self.pa.encode_array(iter(words), chunksize=2)), list(hashes)
+        )
+        self.assertRaises(ValueError, Eudex(max_length=9).encode_array, words)
+
+        # the array can be saved and memory-mapped
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'hashes.npy')
+            np.save(path, hashes)
+            mapped = np.load(path, mmap_mode='r')
+            self.assertTrue(np.array_equal(mapped, hashes))
+            del mapped
+
 
 if __name__ == '__main__':
     unittest.main()
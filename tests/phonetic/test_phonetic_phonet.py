@@ -112,6 +112,37 @@ class PhonetTestCases(unittest.TestCase):
         self.assertEqual(self.pa_2none.encode('Brückmann'), 'BRUECKMAN')
         self.assertEqual(self.pa_2none.encode('Krauße'), 'KRAUSE')
 
+    def test_phonet_tables(self):
+        """Test abydos.phonetic.Phonet._initialize_phonet."""
+        # tables are shared by instances of the same language, of any mode
+        self.assertIs(
+            self.pa_1._initialize_phonet('de'),  # noqa: SF01
+            self.pa_2._initialize_phonet('de'),  # noqa: SF01
+        )
+        self.assertIs(
+            Phonet(lang='de')._initialize_phonet('de'),  # noqa: SF01
+            Phonet(lang='xx')._initialize_phonet('xx'),  # noqa: SF01
+        )
+        self.assertIsNot(
+            self.pa_1._initialize_phonet('de'),  # noqa: SF01
+            self.pa_1none._initialize_phonet('none'),  # noqa: SF01
+        )
+
+        tables = self.pa_1._initialize_phonet('de')  # noqa: SF01
+        alpha_pos, phonet_hash, phonet_hash_1, phonet_hash_2 = tables
+        self.assertEqual(alpha_pos['A'], 2)
+        self.assertEqual(alpha_pos['Ä'], 1)
+        self.assertEqual(phonet_hash[''], -1)
+        self.assertEqual(len(phonet_hash_1), 26 * 28)
+        self.assertEqual(len(phonet_hash_2), 26 * 28)
+        # the rules beginning 'SC' lie within the range for the pair
+        rules = self.pa_1._rules_german  # noqa: SF01
+        pair = (alpha_pos['S'] - 2) * 28 + alpha_pos['C']
+        first, last = phonet_hash_1[pair], phonet_hash_2[pair]
+        self.assertTrue(0 <= first <= last)
+        self.assertTrue(rules[first].startswith('SC'))
+        self.assertIn('SC(HZ)<', rules[first : last + 1 : 3])
+
     def test_phonet_nachnamen(self):
         """Test abydos.phonetic.Phonet (Nachnamen set)."""
         if not ALLOW_RANDOM:
@@ -20,6 +20,9 @@ This module contains unit tests for abydos.stats pairwise functions
 """
 
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from math import isnan
+from unittest import mock
 
 from abydos.distance import Jaccard, JaroWinkler
 from abydos.stats import (
@@ -148,6 +151,54 @@ class MPSTestCases(unittest.TestCase):
             mean_pairwise_similarity(set(NIALL)),
         )
 
+    def test_mean_pairwise_similarity_parallel(self):
+        """Test abydos.stats.mean_pairwise_similarity with n_jobs."""
+        for mean_func in (amean, gmean, hmean):
+            for symmetric in (False, True):
+                for metric in (None, Jaccard().sim, JaroWinkler().sim):
+                    serial = mean_pairwise_similarity(
+                        NIALL, metric, mean_func, symmetric
+                    )
+                    in_process = mean_pairwise_similarity(
+                        NIALL, metric, mean_func, symmetric, n_jobs=1
+                    )
+                    with ThreadPoolExecutor(2) as executor:
+                        threaded = mean_pairwise_similarity(
+                            NIALL,
+                            metric,
+                            mean_func,
+                            symmetric,
+                            executor=executor,
+                        )
+                    for parallel in (in_process, threaded):
+                        # hmean is NaN when several similarities are 0
+                        if isnan(serial):
+                            self.assertTrue(isnan(parallel))
+                        else:
+                            self.assertAlmostEqual(parallel, serial)
+        with mock.patch(
+            'abydos.stats._pairwise.ProcessPoolExecutor',
+            wraps=ProcessPoolExecutor,
+        ) as pool:
+            self.assertAlmostEqual(
+                mean_pairwise_similarity(NIALL, n_jobs=2),
+                mean_pairwise_similarity(NIALL),
+            )
+        # the collection is sent to each worker once, when it starts
+        (job,) = pool.call_args[1]['initargs']
+        self.assertEqual(job.args[0], list(NIALL))
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(['Niall', 'Niall'], n_jobs=1), 1.0
+        )
+
+        self.assertRaises(
+            ValueError,
+            mean_pairwise_similarity,
+            NIALL,
+            n_jobs=1,
+            mean_func=len,
+        )
+
 
 class PSSTestCases(unittest.TestCase):
     """Test pairwise similarity statistics functions.
@@ -251,6 +302,37 @@ class PSSTestCases(unittest.TestCase):
         self.assertRaises(ValueError, pairwise_similarity_statistics, 5, NIALL)
         self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL, 5)
 
+    def test_pairwise_similarity_statistics_parallel(self):
+        """Test abydos.stats.pairwise_similarity_statistics with n_jobs."""
+        for mean_func in (amean, hmean):
+            for symmetric in (False, True):
+                serial = pairwise_similarity_statistics(
+                    NIALL, NIALL_1WORD, None, mean_func, symmetric
+                )
+                with ThreadPoolExecutor(2) as executor:
+                    parallel = pairwise_similarity_statistics(
+                        NIALL,
+                        NIALL_1WORD,
+                        None,
+                        mean_func,
+                        symmetric,
+                        executor=executor,
+                    )
+                for pw_serial, pw_parallel in zip(serial, parallel):
+                    self.assertAlmostEqual(pw_serial, pw_parallel)
+
+        (pw_max, pw_min, pw_mean, pw_std) = pairwise_similarity_statistics(
+            NIALL, ('Kneal',), n_jobs=2
+        )
+        self.assertAlmostEqual(pw_max, 0.8333333333333334)
+        self.assertAlmostEqual(pw_min, 0.11764705882352944)
+        self.assertAlmostEqual(pw_mean, 0.30474877450980387)
+        self.assertAlmostEqual(pw_std, 0.1842666797571549)
+
+        self.assertRaises(
+            ValueError, pairwise_similarity_statistics, NIALL, (), n_jobs=1
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -97,6 +97,43 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr._sb_r2('sprinkled'), 9)  # noqa: SF01
         self.assertEqual(self.stmr._sb_r2('eucharist'), 6)  # noqa: SF01
 
+    def test_sb_regions(self):
+        """Test abydos.stemmer._Snowball._sb_regions."""
+        # base case
+        self.assertEqual(self.stmr._sb_regions(''), (0, 0))  # noqa: SF01
+
+        # examples from http://snowball.tartarus.org/texts/r1r2.html
+        for term in (
+            'beautiful',
+            'beauty',
+            'beau',
+            'animadversion',
+            'sprinkled',
+            'eucharist',
+        ):
+            self.assertEqual(
+                self.stmr._sb_regions(term),  # noqa: SF01
+                (
+                    self.stmr._sb_r1(term),  # noqa: SF01
+                    self.stmr._sb_r2(term),  # noqa: SF01
+                ),
+            )
+
+        self.assertEqual(
+            self.stmr._sb_regions('generous', ('gener',)),  # noqa: SF01
+            (5, 8),
+        )
+        self.assertEqual(
+            self.stmr._sb_regions('gen', ('gener',)), (3, 3)  # noqa: SF01
+        )
+
+        # other vowels
+        stmr = _Snowball()
+        stmr._vowels = set('ä')  # noqa: SF01
+        self.assertEqual(stmr._sb_regions('bäckäst'), (3, 6))  # noqa: SF01
+        self.assertEqual(stmr._sb_regions('beauty'), (6, 6))  # noqa: SF01
+        self.assertEqual(self.stmr._sb_regions('beauty'), (5, 6))  # noqa: SF01
+
     def test_sb_ends_in_short_syllable(self):
         """Test abydos.stemmer._Snowball._sb_ends_in_short_syllable."""
         # base case
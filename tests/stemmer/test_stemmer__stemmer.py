@@ -21,6 +21,25 @@ This module contains unit tests for abydos.stemmer._Stemmer
 
 import unittest
 
+from abydos.stemmer import (
+    CLEFGerman,
+    CLEFGermanPlus,
+    CLEFSwedish,
+    Caumanns,
+    Lovins,
+    PaiceHusk,
+    Porter,
+    Porter2,
+    SStemmer,
+    Schinke,
+    SnowballDanish,
+    SnowballDutch,
+    SnowballGerman,
+    SnowballNorwegian,
+    SnowballSwedish,
+    UEALite,
+)
+
 # noinspection PyProtectedMember
 from abydos.stemmer._stemmer import _Stemmer
 
@@ -39,6 +58,85 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem(''), '')
         self.assertEqual(self.stmr.stem('word'), 'word')
 
+    def test__stemmer_stem_many(self):
+        """Test abydos.stemmer._Stemmer.stem_many."""
+        tokens = [
+            'Häuser',
+            'running',
+            'runs',
+            'studies',
+            'running',
+            '',
+            'flickan',
+            'Häuser',
+            'geluk',
+            'runs',
+        ]
+
+        self.assertEqual(self.stmr.stem_many([]), [])
+        self.assertEqual(self.stmr.stem_many(tokens), tokens)
+        vocab, index = self.stmr.stem_many([], return_index=True)
+        self.assertEqual(vocab, [])
+        self.assertEqual(index.tolist(), [])
+
+        for stmr in (
+            Caumanns(),
+            CLEFGerman(),
+            CLEFGermanPlus(),
+            CLEFSwedish(),
+            Lovins(),
+            PaiceHusk(),
+            Porter(),
+            Porter2(),
+            Schinke(),
+            SnowballDanish(),
+            SnowballDutch(),
+            SnowballGerman(),
+            SnowballNorwegian(),
+            SnowballSwedish(),
+            SStemmer(),
+            UEALite(),
+        ):
+            expected = [stmr.stem(token) for token in tokens]
+            self.assertEqual(stmr.stem_many(tokens), expected)
+            self.assertEqual(
+                list(stmr.stem_many(iter(tokens), lazy=True)), expected
+            )
+
+            vocab, index = stmr.stem_many(iter(tokens), return_index=True)
+            self.assertEqual(vocab, list(dict.fromkeys(expected)))
+            self.assertEqual([vocab[i] for i in index], expected)
+
+        # each distinct token is stemmed once
+        calls = []
+
+        class _CountingStemmer(_Stemmer):
+            def stem(self, word):
+                calls.append(word)
+                return word.lower()
+
+        self.assertEqual(
+            _CountingStemmer().stem_many(tokens, return_index=True)[0],
+            [
+                'häuser',
+                'running',
+                'runs',
+                'studies',
+                '',
+                'flickan',
+                'geluk',
+            ],
+        )
+        self.assertEqual(calls, list(dict.fromkeys(tokens)))
+
+        self.assertRaises(
+            ValueError,
+            self.stmr.stem_many,
+            tokens,
+            lazy=True,
+            return_index=True,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
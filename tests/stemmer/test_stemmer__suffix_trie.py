@@ -0,0 +1,98 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stemmer.test_stemmer__suffix_trie.
+
+This module contains unit tests for abydos.stemmer._SuffixTrie
+"""
+
+import unittest
+
+from abydos.stemmer import Lovins, PaiceHusk, Schinke, UEALite
+
+# noinspection PyProtectedMember
+from abydos.stemmer._suffix_trie import _SuffixTrie
+
+
+class SuffixTrieTestCases(unittest.TestCase):
+    """Test _SuffixTrie class.
+
+    test cases for abydos.stemmer._SuffixTrie
+    """
+
+    trie = _SuffixTrie({'s': 1, 'es': 2, 'ies': 3, 'ing': 4, 'ings': 5})
+
+    def test_suffix_trie_matches(self):
+        """Test abydos.stemmer._SuffixTrie.matches."""
+        self.assertEqual(self.trie.matches(''), [])
+        self.assertEqual(self.trie.matches('fly'), [])
+        self.assertEqual(self.trie.matches('flies'), [(3, 3), (2, 2), (1, 1)])
+        self.assertEqual(self.trie.matches('things'), [(4, 5), (1, 1)])
+        self.assertEqual(self.trie.matches('ies'), [(3, 3), (2, 2), (1, 1)])
+
+        # suffixes that would leave too short a stem are not returned
+        self.assertEqual(
+            self.trie.matches('flies', min_stem=3), [(2, 2), (1, 1)]
+        )
+        self.assertEqual(self.trie.matches('flies', min_stem=5), [])
+        self.assertEqual(self.trie.matches('flies', min_stem=9), [])
+
+    def test_suffix_trie_longest(self):
+        """Test abydos.stemmer._SuffixTrie.longest."""
+        self.assertEqual(self.trie.longest(''), (0, None))
+        self.assertEqual(self.trie.longest('fly'), (0, None))
+        self.assertEqual(self.trie.longest('flies'), (3, 3))
+        self.assertEqual(self.trie.longest('things'), (4, 5))
+        self.assertEqual(self.trie.longest('things', min_stem=3), (1, 1))
+
+    def test_suffix_trie_from_table(self):
+        """Test abydos.stemmer._SuffixTrie.from_table."""
+        trie = _SuffixTrie.from_table({1: {'s': 'a'}, 3: {'ing': 'b'}})
+        self.assertEqual(trie.matches('rings'), [(1, 'a')])
+        self.assertEqual(trie.matches('ring'), [(3, 'b')])
+
+    def test_suffix_trie_stemmers(self):
+        """Test the suffix tries compiled by stemmers."""
+        # the tries hold the stemmers' whole suffix tables
+        for length, rules in PaiceHusk._rule_table.items():  # noqa: SF01
+            for suffix, rule in rules.items():
+                self.assertIn(
+                    (length, rule),
+                    PaiceHusk._rule_trie.matches(suffix),  # noqa: SF01
+                )
+        for var, table in UEALite._rules.items():  # noqa: SF01
+            for length, rules in table.items():
+                for suffix, rule in rules.items():
+                    self.assertEqual(
+                        UEALite._rule_tries[var].longest(suffix),  # noqa: SF01
+                        (length, rule),
+                    )
+        lovins = Lovins()
+        for suffix, condition in lovins._suffix.items():  # noqa: SF01
+            self.assertEqual(
+                lovins._suffix_trie.longest(suffix),  # noqa: SF01
+                (len(suffix), condition),
+            )
+        self.assertEqual(
+            Schinke._v_trie.longest('amabuntur'), (5, 'alter')  # noqa: SF01
+        )
+        self.assertEqual(
+            Schinke._v_trie.longest('amantur'), (4, 'strip')  # noqa: SF01
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
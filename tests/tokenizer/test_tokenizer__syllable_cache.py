@@ -0,0 +1,76 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer__syllable_cache.
+
+This module contains unit tests for abydos.tokenizer._SyllableCache
+"""
+
+import pickle
+import unittest
+
+from abydos.tokenizer._syllable_cache import _SyllableCache
+
+
+class SyllableCacheTestCases(unittest.TestCase):
+    """Test abydos.tokenizer._SyllableCache."""
+
+    def test_syllable_cache(self):
+        """Test abydos.tokenizer._SyllableCache."""
+        calls = []
+
+        def _syllabify(word):
+            calls.append(word)
+            return [word[:2], word[2:]]
+
+        cache = _SyllableCache(2)
+        self.assertEqual(cache.syllables('nelson', _syllabify), ('ne', 'lson'))
+        self.assertEqual(cache.syllables('nelson', _syllabify), ('ne', 'lson'))
+        self.assertEqual(calls, ['nelson'])
+        self.assertEqual(len(cache), 1)
+
+        # a full cache is emptied before the next word is added
+        cache.syllables('neilson', _syllabify)
+        self.assertEqual(len(cache), 2)
+        cache.syllables('nilsen', _syllabify)
+        self.assertEqual(len(cache), 1)
+        cache.syllables('nelson', _syllabify)
+        self.assertEqual(calls, ['nelson', 'neilson', 'nilsen', 'nelson'])
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        # nothing is cached with a size of 0
+        cache = _SyllableCache(0)
+        cache.syllables('nelson', _syllabify)
+        cache.syllables('nelson', _syllabify)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(calls[-2:], ['nelson', 'nelson'])
+
+        # caches compare by size & pickle without their contents
+        cache = _SyllableCache()
+        cache.syllables('nelson', _syllabify)
+        self.assertEqual(cache, _SyllableCache())
+        self.assertEqual(hash(cache), hash(_SyllableCache()))
+        self.assertNotEqual(cache, _SyllableCache(2))
+        self.assertNotEqual(cache, 65536)
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(copy, cache)
+        self.assertEqual(len(copy), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,9 +19,11 @@
 This module contains unit tests for abydos.tokenizer._Tokenizer
 """
 
+import pickle
 import sys
 import unittest
 from collections import Counter
+from threading import Thread
 from math import log1p
 
 from abydos.tokenizer import QGrams, QSkipgrams, _Tokenizer
@@ -180,6 +182,31 @@ class TokenizerTestCases(unittest.TestCase):
         nelson_entropy = QSkipgrams(scaler='entropy').tokenize('NELSON')
         self.assertAlmostEqual(nelson_entropy.count(), 4.6644977792)
 
+    def test__tokenizer_state(self):
+        """Test abydos.tokenizer._Tokenizer per-thread state & pickling."""
+        tok = QGrams().tokenize('NELSON')
+        other_thread = []
+        thread = Thread(
+            target=lambda: other_thread.append(
+                tok.tokenize('NEILSEN').get_list()
+            )
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(
+            other_thread[0], ['$N', 'NE', 'EI', 'IL', 'LS', 'SE', 'EN', 'N#']
+        )
+        self.assertEqual(
+            tok.get_list(), ['$N', 'NE', 'EL', 'LS', 'SO', 'ON', 'N#']
+        )
+
+        tok = pickle.loads(pickle.dumps(QGrams(qval=3, scaler='set')))
+        self.assertEqual(tok.get_list(), [])
+        self.assertEqual(
+            tok.tokenize('AAAA').get_counter(),
+            Counter({'$$A': 1, '$AA': 1, 'AAA': 1, 'AA#': 1, 'A##': 1}),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
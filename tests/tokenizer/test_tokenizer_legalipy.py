@@ -19,6 +19,10 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
 from abydos.tokenizer import LegaliPyTokenizer
@@ -29,6 +33,14 @@ from .. import _corpus_file
 class LegaliPyTokenizerTestCases(unittest.TestCase):
     """Test abydos.tokenizer.LegaliPyTokenizer."""
 
+    def setUp(self):
+        """Create a temporary directory for onset files."""
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmpdir)
+
     def test_legalipy_tokenizer(self):
         """Test abydos.tokenizer.LegaliPyTokenizer."""
         try:
@@ -89,6 +101,35 @@ class LegaliPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+        # onsets are saved & loaded
+        filename = os.path.join(self.tmpdir, 'onsets.txt')
+        tok.save_onsets(filename)
+        loaded = LegaliPyTokenizer()
+        loaded.load_onsets(filename)
+        self.assertEqual(loaded._onsets, tok._onsets)  # noqa: SF01
+        self.assertEqual(
+            loaded.tokenize('spectacular').get_list(),
+            tok.tokenize('spectacular').get_list(),
+        )
+
+        tok = LegaliPyTokenizer()
+        tok.load_onsets(filename, append=True)
+        self.assertEqual(tok._onsets, loaded._onsets | {''})  # noqa: SF01
+        tok.save_onsets(filename)
+        loaded.load_onsets(filename)
+        self.assertEqual(loaded._onsets, tok._onsets)  # noqa: SF01
+
+        # cached syllables are dropped when the onsets change
+        tok = LegaliPyTokenizer(cache_size=2)
+        self.assertEqual(tok.tokenize('nelson').get_list(), ['n', 'els', 'on'])
+        tok.load_onsets(filename)
+        self.assertEqual(tok.tokenize('nelson').get_list(), ['nel', 'son'])
+        tok.tokenize('neilson nilsen')
+        self.assertEqual(len(tok._syllable_cache), 1)  # noqa: SF01
+        tok = pickle.loads(pickle.dumps(tok))
+        self.assertEqual(len(tok._syllable_cache), 0)  # noqa: SF01
+        self.assertEqual(tok.tokenize('nelson').get_list(), ['nel', 'son'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -378,6 +378,28 @@ class QGramsTestCases(unittest.TestCase):
             ),
         )
 
+    def test_qgrams_tokenize_codes(self):
+        """Test abydos.tokenizer.QGrams.tokenize_codes & decode_codes."""
+        for tokenizer in (
+            QGrams(),
+            QGrams(qval=1),
+            QGrams(qval=3, start_stop=''),
+            QGrams(qval=range(4), skip=[0, 1]),
+            QGrams(start_stop='', skip=2),
+        ):
+            for string in ('', 'a', 'NELSON', 'interdisciplinarian', 'ǆö\x00'):
+                codes, counts = tokenizer.tokenize_codes(string)
+                self.assertEqual(
+                    dict(zip(tokenizer.decode_codes(codes), counts.tolist())),
+                    dict(Counter(tokenizer.tokenize(string).get_list())),
+                )
+                self.assertEqual(codes.tolist(), sorted(set(codes.tolist())))
+
+        codes, counts = QGrams().tokenize_codes('')
+        self.assertEqual((codes.tolist(), counts.tolist()), ([], []))
+
+        self.assertRaises(ValueError, QGrams(qval=4).tokenize_codes, 'NELSON')
+
 
 if __name__ == '__main__':
     unittest.main()
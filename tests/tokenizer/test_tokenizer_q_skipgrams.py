@@ -22,7 +22,7 @@ This module contains unit tests for abydos.tokenizer.QGrams
 import unittest
 from collections import Counter
 
-from abydos.tokenizer import QSkipgrams
+from abydos.tokenizer import QGrams, QSkipgrams
 
 
 class QSkipgramsTestCases(unittest.TestCase):
@@ -616,6 +616,117 @@ class QSkipgramsTestCases(unittest.TestCase):
         for key in gold_counter.keys():
             self.assertAlmostEqual(gold_counter[key], test_counter[key])
 
+    def test_qskipgrams_tokenize_codes(self):
+        """Test abydos.tokenizer.QSkipgrams.tokenize_codes & decode_codes."""
+        for tokenizer in (
+            QSkipgrams(),
+            QSkipgrams(qval=1),
+            QSkipgrams(qval=3, start_stop=''),
+            QSkipgrams(qval=range(4)),
+        ):
+            for string in ('', 'a', 'NELSON', 'interdisciplinarian', 'ǆö\x00'):
+                codes, counts = tokenizer.tokenize_codes(string)
+                self.assertEqual(
+                    dict(zip(tokenizer.decode_codes(codes), counts.tolist())),
+                    dict(Counter(tokenizer.tokenize(string).get_list())),
+                )
+
+        tokenizer = QSkipgrams(scaler='SSK', ssk_lambda=(0.5, 0.05))
+        codes, weights = tokenizer.tokenize_codes('AACTAGAAC')
+        expected = tokenizer.tokenize('AACTAGAAC').get_counter()
+        self.assertEqual(tokenizer.decode_codes(codes), sorted(expected))
+        for qgram, weight in zip(tokenizer.decode_codes(codes), weights):
+            self.assertAlmostEqual(weight, expected[qgram])
+
+        self.assertRaises(
+            ValueError, QSkipgrams(qval=4).tokenize_codes, 'NELSON'
+        )
+
+    def test_qskipgrams_max_span(self):
+        """Test abydos.tokenizer.QSkipgrams with max_span."""
+        self.assertEqual(
+            QSkipgrams(max_span=2).tokenize('NELSON').get_counter(),
+            QGrams().tokenize('NELSON').get_counter(),
+        )
+        self.assertEqual(
+            QSkipgrams(qval=3, max_span=3).tokenize('NELSON').get_counter(),
+            QGrams(qval=3).tokenize('NELSON').get_counter(),
+        )
+        self.assertEqual(
+            QSkipgrams(start_stop='', max_span=3).tokenize('ABCD').get_list(),
+            ['AB', 'AC', 'BC', 'BD', 'CD'],
+        )
+        self.assertEqual(
+            QSkipgrams(start_stop='', max_span=1).tokenize('ABCD').get_list(),
+            [],
+        )
+
+        tokenizer = QSkipgrams(qval=3, start_stop='', scaler='SSK', max_span=4)
+        unbounded = QSkipgrams(qval=3, start_stop='', scaler='SSK')
+        expected = Counter()
+        for token, weight in unbounded.iter_skipgrams('AACTAGAAC'):
+            if weight >= 0.9**5:
+                expected[token] += weight
+        counter = tokenizer.tokenize('AACTAGAAC').get_counter()
+        self.assertEqual(sorted(counter), sorted(expected))
+        for token in expected:
+            self.assertAlmostEqual(counter[token], expected[token])
+
+        codes, counts = QSkipgrams(max_span=3).tokenize_codes('NELSON')
+        self.assertEqual(
+            dict(zip(QSkipgrams.decode_codes(codes), counts.tolist())),
+            dict(QSkipgrams(max_span=3).tokenize('NELSON').get_counter()),
+        )
+
+    def test_qskipgrams_iter_skipgrams(self):
+        """Test abydos.tokenizer.QSkipgrams.iter_skipgrams."""
+        for tokenizer in (
+            QSkipgrams(),
+            QSkipgrams(qval=range(4), max_span=3),
+            QSkipgrams(scaler='SSK', ssk_lambda=(0.5, 0.05)),
+        ):
+            for string in ('', 'a', 'NELSON', 'AACTAGAAC'):
+                tokenizer.tokenize(string)
+                tokens, weights = (
+                    tokenizer.get_list(),
+                    tokenizer._ordered_weights,  # noqa: SF01
+                )
+                self.assertEqual(
+                    list(tokenizer.iter_skipgrams(string)),
+                    list(zip(tokens, weights)),
+                )
+
+    def test_qskipgrams_ssk_kernel(self):
+        """Test abydos.tokenizer.QSkipgrams.ssk_kernel."""
+        for tokenizer in (
+            QSkipgrams(start_stop='', scaler='SSK'),
+            QSkipgrams(scaler='SSK', ssk_lambda=0.5),
+            QSkipgrams(qval=range(4), scaler='SSK', ssk_lambda=(0.5, 0.05)),
+            QSkipgrams(qval=1, scaler='SSK'),
+            QSkipgrams(qval=(2, 3, 2), scaler='SSK', ssk_lambda=(0.5, 0.9)),
+        ):
+            for src, tar in (
+                ('', ''),
+                ('a', ''),
+                ('cat', 'car'),
+                ('Niall', 'Neil'),
+                ('ATCAACGAGT', 'AACGATTAG'),
+            ):
+                src_wts = tokenizer.tokenize(src).get_counter()
+                tar_wts = tokenizer.tokenize(tar).get_counter()
+                self.assertAlmostEqual(
+                    tokenizer.ssk_kernel(src, tar),
+                    sum(src_wts[tok] * tar_wts[tok] for tok in src_wts),
+                )
+
+        self.assertRaises(ValueError, QSkipgrams().ssk_kernel, 'a', 'b')
+        self.assertRaises(
+            ValueError,
+            QSkipgrams(scaler='SSK', max_span=3).ssk_kernel,
+            'a',
+            'b',
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -70,6 +70,21 @@ class SonoriPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+        # syllables of words are cached
+        self.assertEqual(len(tok._syllable_cache), 7)  # noqa: SF01
+        self.assertEqual(
+            tok.tokenize('nelson neilson nelson').get_list(),
+            ['nel', 'son', 'neil', 'son', 'nel', 'son'],
+        )
+        self.assertEqual(len(tok._syllable_cache), 7)  # noqa: SF01
+
+        tok = SonoriPyTokenizer(cache_size=0)
+        self.assertEqual(
+            tok.tokenize('nelson nelson').get_list(),
+            ['nel', 'son', 'nel', 'son'],
+        )
+        self.assertEqual(len(tok._syllable_cache), 0)  # noqa: SF01
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_token_profile.
+
+This module contains unit tests for abydos.tokenizer.TokenProfile
+"""
+
+import pickle
+import unittest
+from collections import Counter
+
+from abydos.tokenizer import QGrams, TokenProfile, WhitespaceTokenizer
+from abydos.tokenizer._token_profile import _ProfileCache
+
+
+class _StopwordTokenizer(WhitespaceTokenizer):
+    """A WhitespaceTokenizer that drops a list of stopwords."""
+
+    def __init__(self):
+        super().__init__()
+        self.stopwords = []
+
+    def tokenize(self, string):
+        return super().tokenize(
+            ' '.join(
+                word for word in string.split() if word not in self.stopwords
+            )
+        )
+
+
+class TokenProfileTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.TokenProfile."""
+
+    def test_token_profile(self):
+        """Test abydos.tokenizer.TokenProfile."""
+        profile = TokenProfile(
+            'NELSON', {'N': 2, 'E': 1, 'L': 1, 'S': 1, 'O': 1}, 'NELSON'
+        )
+        self.assertEqual(profile, Counter('NELSON'))
+        self.assertEqual(profile, 'NELSON')
+        self.assertNotEqual(profile, 'NEILSEN')
+        self.assertNotEqual(profile, Counter('NEILSEN'))
+        self.assertIsInstance(profile, Counter)
+        self.assertEqual(profile.string, 'NELSON')
+        self.assertEqual(profile.ordered_tokens, tuple('NELSON'))
+        self.assertEqual(profile.cardinality, 6)
+        self.assertAlmostEqual(profile.norm, 8**0.5)
+        self.assertEqual(profile['Z'], 0)
+        self.assertEqual(profile & Counter('NEIL'), Counter('NEL'))
+        self.assertEqual(type(profile - Counter('N')), Counter)
+        # profiles are equal only if their strings are
+        self.assertEqual(
+            profile, TokenProfile('NELSON', Counter('NELSON'), 'NELSON')
+        )
+        self.assertNotEqual(
+            profile, TokenProfile('NELSNO', Counter('NELSON'), 'NELSNO')
+        )
+        self.assertNotEqual(TokenProfile('a', {}), TokenProfile('', {}))
+
+        # Immutability
+        with self.assertRaises(TypeError):
+            profile['N'] = 3
+        with self.assertRaises(TypeError):
+            del profile['N']
+        with self.assertRaises(TypeError):
+            profile.update('N')
+        with self.assertRaises(TypeError):
+            profile.subtract('N')
+        with self.assertRaises(TypeError):
+            profile += Counter('N')
+        with self.assertRaises(TypeError):
+            profile.string = 'NEILSEN'
+        mutable = profile.copy()
+        mutable['N'] += 1
+        self.assertEqual(mutable['N'], 3)
+        self.assertEqual(profile['N'], 2)
+
+        profile = pickle.loads(pickle.dumps(profile))
+        self.assertIsInstance(profile, TokenProfile)
+        self.assertEqual(profile.string, 'NELSON')
+        self.assertEqual(profile.cardinality, 6)
+
+        self.assertEqual(repr(TokenProfile('', {})), "TokenProfile('', {})")
+
+    def test_profile_cache(self):
+        """Test abydos.tokenizer._token_profile._ProfileCache."""
+        cache = _ProfileCache(2)
+        qgrams = QGrams()
+        profile = cache.profile(qgrams, 'NELSON')
+        self.assertEqual(profile, QGrams().tokenize('NELSON').get_counter())
+        self.assertEqual(
+            profile.ordered_tokens,
+            ('$N', 'NE', 'EL', 'LS', 'SO', 'ON', 'N#'),
+        )
+        self.assertIs(cache.profile(qgrams, 'NELSON'), profile)
+        # an identically configured tokenizer shares cached profiles
+        self.assertIs(cache.profile(QGrams(), 'NELSON'), profile)
+        self.assertIsNot(cache.profile(QGrams(qval=3), 'NELSON'), profile)
+        self.assertEqual(
+            cache.profile(WhitespaceTokenizer(), 'NELSON'),
+            Counter({'NELSON': 1}),
+        )
+
+        # reconfiguring a tokenizer changes its key
+        qgrams.start_stop = ''
+        self.assertEqual(
+            cache.profile(qgrams, 'NELSON'),
+            QGrams(start_stop='').tokenize('NELSON').get_counter(),
+        )
+        # including when a setting is changed in place
+        stopwords = _StopwordTokenizer()
+        self.assertEqual(
+            cache.profile(stopwords, 'the cat'),
+            Counter({'the': 1, 'cat': 1}),
+        )
+        stopwords.stopwords.append('the')
+        self.assertEqual(
+            cache.profile(stopwords, 'the cat'), Counter({'cat': 1})
+        )
+
+        # least recently used profiles are evicted
+        self.assertLessEqual(len(cache._profiles), 2)  # noqa: SF01
+        cache.clear()
+        self.assertEqual(len(cache._profiles), 0)  # noqa: SF01
+
+        # unhashable settings & disabled caches skip the cache
+        self.assertEqual(
+            _ProfileCache(0).profile(QGrams(), 'NEIL'),
+            QGrams().tokenize('NEIL').get_counter(),
+        )
+        unhashable = QGrams()
+        unhashable.extra = [bytearray(b'x')]
+        cache = _ProfileCache(2)
+        cache.profile(unhashable, 'NEIL')
+        self.assertEqual(len(cache._profiles), 0)  # noqa: SF01
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_memoizer.
+
+This module contains unit tests for abydos.util.Memoizer
+"""
+
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from functools import partial
+
+from abydos.distance import Levenshtein
+from abydos.fingerprint import Phonetic, String
+from abydos.phonetic import NYSIIS, RussellIndex, Soundex
+from abydos.stemmer import Lovins, Porter
+from abydos.util import Memoizer
+
+# noinspection PyProtectedMember
+from abydos.util._memoizer import _canonical, _config_key
+
+
+class _Pairs:
+    """An encoder that returns tuples."""
+
+    def __init__(self, setting=None):
+        self.setting = setting
+
+    def encode(self, word):
+        return word[:1], word[1:]
+
+
+class MemoizerTestCases(unittest.TestCase):
+    """Test cases for abydos.util.Memoizer."""
+
+    names = ['Niall', 'Neil', 'Smith', 'Niall', 'Schmidt', 'Niall', 'Neil']
+
+    def setUp(self):
+        """Create a temporary directory for databases."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'memo.db')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmpdir)
+
+    def test_memoizer_methods(self):
+        """Test abydos.util.Memoizer methods."""
+        soundex = Soundex()
+        memo = Memoizer(soundex)
+        self.assertEqual(
+            [memo.encode(name) for name in self.names],
+            [soundex.encode(name) for name in self.names],
+        )
+        self.assertEqual(memo.cache_info(), (3, 4, 0, 65536, 4))
+
+        rus = RussellIndex()
+        memo = Memoizer(rus)
+        self.assertEqual(memo.encode('Abramson'), rus.encode('Abramson'))
+        self.assertEqual(
+            memo.encode_alpha('Abramson'), rus.encode_alpha('Abramson')
+        )
+        self.assertEqual(memo.cache_info().misses, 2)
+
+        memo = Memoizer(Porter())
+        self.assertEqual(memo.stem('running'), 'run')
+        self.assertEqual(memo.stem('running'), 'run')
+        self.assertEqual(memo.cache_info().hits, 1)
+        self.assertFalse(hasattr(memo, 'encode'))
+
+        memo = Memoizer(String())
+        self.assertEqual(
+            memo.fingerprint('The quick brown fox'), 'brown fox quick the'
+        )
+        self.assertRaises(AttributeError, getattr, memo, 'stem')
+        self.assertRaises(AttributeError, getattr, memo, 'tokenize')
+
+        self.assertRaises(ValueError, Memoizer, Levenshtein())
+
+    def test_memoizer_lru(self):
+        """Test abydos.util.Memoizer eviction."""
+        memo = Memoizer(Soundex(), maxsize=2)
+        for name in ('Niall', 'Neil', 'Niall', 'Smith', 'Neil', 'Niall'):
+            memo.encode(name)
+        # Neil was evicted by Smith, then Niall by Neil
+        self.assertEqual(memo.cache_info(), (1, 5, 0, 2, 2))
+
+        memo = Memoizer(Soundex(), maxsize=0)
+        for name in self.names:
+            memo.encode(name)
+        self.assertEqual(memo.cache_info(), (0, 7, 0, 0, 0))
+
+        memo = Memoizer(Soundex(), maxsize=None)
+        for name in self.names:
+            memo.encode(name)
+        self.assertEqual(memo.cache_info(), (3, 4, 0, None, 4))
+
+        memo.cache_clear()
+        self.assertEqual(memo.cache_info(), (0, 0, 0, None, 0))
+
+    def test_memoizer_database(self):
+        """Test abydos.util.Memoizer with a database."""
+        memo = Memoizer(NYSIIS(), path=self.path)
+        self.assertRaises(ValueError, Memoizer(NYSIIS()).warm)
+        codes = [memo.encode(name) for name in self.names]
+        self.assertEqual(memo.cache_info(), (3, 4, 0, 65536, 4))
+        memo.close()
+
+        # another instance shares the stored outputs
+        memo = Memoizer(NYSIIS(), path=self.path)
+        self.assertEqual([memo.encode(name) for name in self.names], codes)
+        self.assertEqual(memo.cache_info(), (3, 0, 4, 65536, 4))
+        memo.flush()
+
+        memo = Memoizer(NYSIIS(), path=self.path)
+        self.assertEqual(memo.warm(), 4)
+        self.assertEqual(memo.warm(limit=2), 2)
+        self.assertEqual([memo.encode(name) for name in self.names], codes)
+        self.assertEqual(memo.cache_info(), (7, 0, 0, 65536, 4))
+        memo.close()
+        memo.close()
+
+        # but not with instances of other settings or classes
+        memo = Memoizer(NYSIIS(max_length=8), path=self.path)
+        self.assertEqual(memo.warm(), 0)
+        memo.encode('Niall')
+        self.assertEqual(memo.cache_info().misses, 1)
+        memo.close()
+        self.assertEqual(Memoizer(Soundex(), path=self.path).warm(), 0)
+
+        # pickled copies reopen the database
+        memo = Memoizer(NYSIIS(), path=self.path)
+        memo.encode('Niall')
+        copy = pickle.loads(pickle.dumps(memo))
+        copy.cache_clear()
+        self.assertEqual(copy.encode('Niall'), codes[0])
+        self.assertEqual(copy.cache_info().disk_hits, 1)
+        copy.close()
+        memo.close()
+
+        # outputs are stored as JSON, and tuples are restored
+        memo = Memoizer(_Pairs(), path=self.path)
+        self.assertEqual(memo.encode('Niall'), ('N', 'iall'))
+        memo.close()
+        memo = Memoizer(_Pairs(), path=self.path)
+        self.assertEqual(memo.encode('Niall'), ('N', 'iall'))
+        self.assertEqual(memo.cache_info().disk_hits, 1)
+        memo.close()
+        db = sqlite3.connect(self.path)
+        self.assertEqual(
+            db.execute(
+                "SELECT output FROM memo WHERE input='Niall' AND "
+                "method='encode' ORDER BY output"
+            ).fetchall(),
+            [('"NAL"',), ('"NAL"',), ('["N", "iall"]',)],
+        )
+        db.close()
+
+        # settings without a canonical representation are not stored
+        self.assertRaises(
+            TypeError, Memoizer, _Pairs(lambda word: word), path=self.path
+        )
+        memo = Memoizer(_Pairs(lambda word: word))
+        self.assertEqual(memo.encode('Niall'), ('N', 'iall'))
+
+    def test_memoizer_config_key(self):
+        """Test abydos.util._memoizer._config_key."""
+        self.assertEqual(_config_key(Soundex()), _config_key(Soundex()))
+        self.assertNotEqual(
+            _config_key(Soundex()), _config_key(Soundex(max_length=6))
+        )
+        self.assertNotEqual(_config_key(Soundex()), _config_key(NYSIIS()))
+
+        self.assertEqual(_canonical({3, 2, 1}), '{1,2,3}')
+        self.assertEqual(_canonical([3, 2, 1]), '(3,2,1)')
+        self.assertEqual(_canonical({'b': 1, 'a': 2}), "{'a':2,'b':1}")
+        self.assertEqual(_canonical(len), 'builtins.len')
+        self.assertEqual(_canonical(str), 'builtins.str')
+
+        # functions & methods are distinguished
+        self.assertNotEqual(
+            _config_key(Phonetic(Soundex())), _config_key(Phonetic(NYSIIS()))
+        )
+        self.assertNotEqual(
+            _config_key(Phonetic(Soundex())),
+            _config_key(Phonetic(Soundex(max_length=6))),
+        )
+        self.assertEqual(_config_key(Lovins()), _config_key(Lovins()))
+        self.assertIn('._cond_b', _canonical(Lovins()))
+        self.assertEqual(
+            _canonical(partial(int, base=2)),
+            "functools.partial(builtins.int,(),{'base':2})",
+        )
+        self.assertRaises(TypeError, _canonical, lambda word: word)
+        self.assertRaises(TypeError, _canonical, object())
+
+
+if __name__ == '__main__':
+    unittest.main()
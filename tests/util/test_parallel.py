@@ -0,0 +1,118 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_parallel.
+
+This module contains unit tests for abydos.util._parallel
+"""
+
+import os
+import unittest
+
+from abydos.util._parallel import _batches, _map_unique, _n_workers
+
+
+class _Counter:
+    """Count the calls to its upper method."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def upper(self, word):
+        self.calls += 1
+        return word.upper()
+
+    def upper_batch(self, words):
+        self.calls += 1
+        return [word.upper() for word in words]
+
+
+class ParallelTestCases(unittest.TestCase):
+    """Test cases for abydos.util._parallel."""
+
+    def test_n_workers(self):
+        """Test abydos.util._parallel._n_workers."""
+        self.assertEqual(_n_workers(None), os.cpu_count() or 1)
+        self.assertEqual(_n_workers(-1), os.cpu_count() or 1)
+        self.assertEqual(_n_workers(0), 1)
+        self.assertEqual(_n_workers(1), 1)
+        self.assertEqual(_n_workers(3), 3)
+
+    def test_batches(self):
+        """Test abydos.util._parallel._batches."""
+        self.assertEqual(list(_batches([], 2)), [])
+        self.assertEqual(list(_batches(range(4), 2)), [[0, 1], [2, 3]])
+        self.assertEqual(
+            list(_batches(iter(range(5)), 2)), [[0, 1], [2, 3], [4]]
+        )
+        self.assertEqual(list(_batches('abc', 5)), [['a', 'b', 'c']])
+
+    def test_map_unique(self):
+        """Test abydos.util._parallel._map_unique."""
+        words = ['ab', 'cd', 'ab', 'ab', 'ef', 'cd', 'ab']
+        expected = [word.upper() for word in words]
+
+        counter = _Counter()
+        self.assertEqual(list(_map_unique(counter, 'upper', [])), [])
+        self.assertEqual(list(_map_unique(counter, 'upper', words)), expected)
+        # each distinct word is passed once per batch
+        self.assertEqual(counter.calls, 3)
+
+        counter = _Counter()
+        self.assertEqual(
+            list(_map_unique(counter, 'upper', words, batch_size=3)),
+            expected,
+        )
+        self.assertEqual(counter.calls, 2 + 3 + 1)
+
+        # worker processes each use their own copy of the instance
+        counter = _Counter()
+        for n_jobs in (1, 2, -1):
+            for batch_size in (1, 2, 100):
+                self.assertEqual(
+                    list(
+                        _map_unique(
+                            counter, 'upper', iter(words), n_jobs, batch_size
+                        )
+                    ),
+                    expected,
+                )
+
+        # batched methods are passed each batch's distinct words once
+        counter = _Counter()
+        self.assertEqual(
+            list(
+                _map_unique(
+                    counter, 'upper_batch', words, batch_size=3, batched=True
+                )
+            ),
+            expected,
+        )
+        self.assertEqual(counter.calls, 3)
+        self.assertEqual(
+            list(
+                _map_unique(counter, 'upper_batch', words, 2, 3, batched=True)
+            ),
+            expected,
+        )
+
+        self.assertRaises(
+            ValueError, list, _map_unique(counter, 'upper', words, None, 0)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()